@@ -0,0 +1,61 @@
+"""Add A/B test definitions table
+
+Test definitions are stored so every worker, and a restarted one, can
+serve assignments and events for tests created elsewhere.
+
+Revision ID: ab_test_definitions
+Revises: api_key_prefix
+Create Date: 2025-10-19 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ab_test_definitions"
+down_revision: str | Sequence[str] | None = "api_key_prefix"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the A/B test definitions table."""
+    op.create_table(
+        "ab_test_definitions",
+        sa.Column("id", sa.String(length=26), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("definition", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_ab_test_definitions_status"),
+        "ab_test_definitions",
+        ["status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the A/B test definitions table."""
+    op.drop_index(
+        op.f("ix_ab_test_definitions_status"),
+        table_name="ab_test_definitions",
+    )
+    op.drop_table("ab_test_definitions")
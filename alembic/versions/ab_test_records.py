@@ -0,0 +1,102 @@
+"""Add A/B test assignment and event tables
+
+Assignments are unique per (test, user) so every worker resolves a user
+to the same variant; events are append-only and written in batches.
+
+Revision ID: ab_test_records
+Revises: ab_test_stats
+Create Date: 2025-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ab_test_records"
+down_revision: str | Sequence[str] | None = "ab_test_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Create the A/B test assignment and event tables."""
+    op.create_table(
+        "ab_test_assignments",
+        sa.Column("id", sa.String(length=26), nullable=False),
+        *_timestamps(),
+        sa.Column("test_id", sa.String(length=26), nullable=False),
+        sa.Column("user_id", sa.String(length=255), nullable=False),
+        sa.Column("variant_id", sa.String(length=26), nullable=False),
+        sa.Column("session_id", sa.String(length=255), nullable=True),
+        sa.Column(
+            "assigned_at", sa.DateTime(timezone=True), nullable=False
+        ),
+        sa.Column("extra_metadata", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "test_id", "user_id", name="uq_ab_test_assignments_user"
+        ),
+    )
+    op.create_index(
+        op.f("ix_ab_test_assignments_test_id"),
+        "ab_test_assignments",
+        ["test_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "ab_test_events",
+        sa.Column("id", sa.String(length=26), nullable=False),
+        *_timestamps(),
+        sa.Column("test_id", sa.String(length=26), nullable=False),
+        sa.Column("variant_id", sa.String(length=26), nullable=False),
+        sa.Column("user_id", sa.String(length=255), nullable=False),
+        sa.Column("session_id", sa.String(length=255), nullable=True),
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("event_data", sa.JSON(), nullable=True),
+        sa.Column("metrics", sa.JSON(), nullable=True),
+        sa.Column(
+            "timestamp", sa.DateTime(timezone=True), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_ab_test_events_test_variant",
+        "ab_test_events",
+        ["test_id", "variant_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the A/B test assignment and event tables."""
+    op.drop_index(
+        "idx_ab_test_events_test_variant", table_name="ab_test_events"
+    )
+    op.drop_table("ab_test_events")
+    op.drop_index(
+        op.f("ix_ab_test_assignments_test_id"),
+        table_name="ab_test_assignments",
+    )
+    op.drop_table("ab_test_assignments")
@@ -0,0 +1,113 @@
+"""Add A/B test streaming statistics tables
+
+Stores per-variant event totals with a HyperLogLog sketch of distinct
+users, and per-(variant, metric) Welford accumulators, so A/B test
+results survive restarts and are combined across workers.
+
+Revision ID: ab_test_stats
+Revises: compact_vector_storage
+Create Date: 2025-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ab_test_stats"
+down_revision: str | Sequence[str] | None = "compact_vector_storage"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Create the A/B test statistics tables."""
+    op.create_table(
+        "ab_test_variant_stats",
+        sa.Column("id", sa.String(length=26), nullable=False),
+        *_timestamps(),
+        sa.Column("test_id", sa.String(length=26), nullable=False),
+        sa.Column("variant_id", sa.String(length=26), nullable=False),
+        sa.Column("event_count", sa.Integer(), nullable=False),
+        sa.Column("user_sketch", sa.LargeBinary(), nullable=True),
+        sa.CheckConstraint(
+            "event_count >= 0",
+            name="check_ab_variant_event_count_non_negative",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "test_id",
+            "variant_id",
+            name="uq_ab_test_variant_stats_variant",
+        ),
+    )
+    op.create_index(
+        op.f("ix_ab_test_variant_stats_test_id"),
+        "ab_test_variant_stats",
+        ["test_id"],
+        unique=False,
+    )
+
+    op.create_table(
+        "ab_test_metric_stats",
+        sa.Column("id", sa.String(length=26), nullable=False),
+        *_timestamps(),
+        sa.Column("test_id", sa.String(length=26), nullable=False),
+        sa.Column("variant_id", sa.String(length=26), nullable=False),
+        sa.Column("metric_name", sa.String(length=100), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("total", sa.Float(), nullable=False),
+        sa.Column("mean", sa.Float(), nullable=False),
+        sa.Column("m2", sa.Float(), nullable=False),
+        sa.CheckConstraint(
+            "count >= 0",
+            name="check_ab_metric_count_non_negative",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "test_id",
+            "variant_id",
+            "metric_name",
+            name="uq_ab_test_metric_stats_metric",
+        ),
+    )
+    op.create_index(
+        op.f("ix_ab_test_metric_stats_test_id"),
+        "ab_test_metric_stats",
+        ["test_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the A/B test statistics tables."""
+    op.drop_index(
+        op.f("ix_ab_test_metric_stats_test_id"),
+        table_name="ab_test_metric_stats",
+    )
+    op.drop_table("ab_test_metric_stats")
+    op.drop_index(
+        op.f("ix_ab_test_variant_stats_test_id"),
+        table_name="ab_test_variant_stats",
+    )
+    op.drop_table("ab_test_variant_stats")
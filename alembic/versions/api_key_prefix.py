@@ -0,0 +1,45 @@
+"""Add indexed API key lookup prefix to users
+
+Keys are looked up by their non-secret prefix so authentication needs a
+single indexed row and one hash verification. Existing keys get their
+prefix filled in the first time they authenticate.
+
+Revision ID: api_key_prefix
+Revises: ab_test_records
+Create Date: 2025-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "api_key_prefix"
+down_revision: str | Sequence[str] | None = "ab_test_records"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the api_key_prefix column."""
+    op.add_column(
+        "users",
+        sa.Column(
+            "api_key_prefix", sa.String(length=64), nullable=True
+        ),
+    )
+    op.create_index(
+        op.f("ix_users_api_key_prefix"),
+        "users",
+        ["api_key_prefix"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the api_key_prefix column."""
+    op.drop_index(op.f("ix_users_api_key_prefix"), table_name="users")
+    op.drop_column("users", "api_key_prefix")
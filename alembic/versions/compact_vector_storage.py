@@ -0,0 +1,85 @@
+"""Compact document chunk vector storage
+
+Converts existing chunks to a single indexed vector: ``embedding`` is
+backfilled from ``computed_embedding``, ``computed_embedding`` is
+cleared, and ``raw_embedding`` is only kept for vectors truncated to
+1536 dimensions. The halfvec and binary-quantized HNSW indexes used
+by ``VECTOR_SEARCH_PRECISION`` are built by the opt-in
+``quantized_vector_index`` migration.
+
+The table size before and after is logged. Cleared values leave dead
+tuples; run ``VACUUM (FULL, ANALYZE) document_chunks`` afterwards in a
+maintenance window to return the space to the operating system.
+
+Revision ID: compact_vector_storage
+Revises: document_chunk_search_vector
+Create Date: 2025-10-16 14:00:00.000000
+
+"""
+
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "compact_vector_storage"
+down_revision: str | Sequence[str] | None = "document_chunk_search_vector"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _log_table_size(label: str) -> None:
+    """Log the total size of document_chunks including TOAST and indexes."""
+    size = op.get_bind().execute(
+        sa.text(
+            "SELECT pg_size_pretty(pg_total_relation_size('document_chunks'))"
+        )
+    ).scalar()
+    logger.info("document_chunks size %s: %s", label, size)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _log_table_size("before compaction")
+
+    op.execute(
+        "UPDATE document_chunks "
+        "SET raw_dim = json_array_length(raw_embedding) "
+        "WHERE raw_dim IS NULL AND raw_embedding IS NOT NULL"
+    )
+    op.execute(
+        "UPDATE document_chunks SET embedding = computed_embedding "
+        "WHERE embedding IS NULL AND computed_embedding IS NOT NULL"
+    )
+    op.execute(
+        "UPDATE document_chunks "
+        "SET computed_embedding = NULL, "
+        "raw_embedding = CASE WHEN raw_dim > 1536 "
+        "THEN raw_embedding END "
+        "WHERE computed_embedding IS NOT NULL "
+        "OR (raw_embedding IS NOT NULL AND raw_dim <= 1536)"
+    )
+
+    op.execute("ANALYZE document_chunks")
+
+    _log_table_size("after compaction")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Restore the full-mode copies from the indexed vector
+    op.execute(
+        "UPDATE document_chunks "
+        "SET raw_embedding = to_json((embedding::real[])[1:raw_dim]) "
+        "WHERE raw_embedding IS NULL AND embedding IS NOT NULL "
+        "AND raw_dim IS NOT NULL AND raw_dim <= 1536"
+    )
+    op.execute(
+        "UPDATE document_chunks SET computed_embedding = embedding "
+        "WHERE computed_embedding IS NULL AND embedding IS NOT NULL"
+    )
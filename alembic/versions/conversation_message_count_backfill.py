@@ -0,0 +1,43 @@
+"""Backfill conversation message counts
+
+Message sequence numbers are taken from the row-locked message_count,
+which older code did not bump on every message. Counts behind the
+stored messages are raised past the highest sequence number.
+
+Revision ID: conversation_message_count_backfill
+Revises: ab_test_definitions
+Create Date: 2025-10-20 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "conversation_message_count_backfill"
+down_revision: str | Sequence[str] | None = "ab_test_definitions"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Raise message counts to at least the highest sequence + 1."""
+    op.execute(
+        """
+        UPDATE conversations
+        SET message_count = last.sequence_number + 1
+        FROM (
+            SELECT conversation_id,
+                   max(sequence_number) AS sequence_number
+            FROM messages
+            GROUP BY conversation_id
+        ) AS last
+        WHERE conversations.id = last.conversation_id
+          AND conversations.message_count <= last.sequence_number
+        """
+    )
+
+
+def downgrade() -> None:
+    """Counts are left as they are; the backfill loses nothing."""
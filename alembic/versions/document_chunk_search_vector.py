@@ -0,0 +1,55 @@
+"""Add full-text search vector to document chunks
+
+Adds a generated ``search_vector`` tsvector column with a GIN index on
+``document_chunks.content`` for the keyword leg of hybrid retrieval.
+
+Revision ID: document_chunk_search_vector
+Revises: fulltext_search_indexes
+Create Date: 2025-10-16 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "document_chunk_search_vector"
+down_revision: str | Sequence[str] | None = "fulltext_search_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "document_chunks",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english'::regconfig, "
+                "coalesce(content, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_document_chunks_search_vector",
+        "document_chunks",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.execute("ANALYZE document_chunks")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_document_chunks_search_vector", table_name="document_chunks"
+    )
+    op.drop_column("document_chunks", "search_vector")
@@ -0,0 +1,75 @@
+"""Add full-text search vectors for conversations, messages and prompts
+
+Adds generated, stored ``search_vector`` tsvector columns with GIN
+indexes so conversation, message and prompt search no longer falls back
+to ``ILIKE '%term%'`` sequential scans.
+
+Adding a stored generated column rewrites the table; on large
+``messages`` tables run this migration in a maintenance window.
+
+Revision ID: fulltext_search_indexes
+Revises: add_user_prefs_indexes
+Create Date: 2025-10-16 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "fulltext_search_indexes"
+down_revision: str | Sequence[str] | None = "add_user_prefs_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _tsvector(column: str, weight: str | None = None) -> str:
+    """Build the to_tsvector expression used by the models."""
+    vector = f"to_tsvector('english'::regconfig, coalesce({column}, ''))"
+    if weight:
+        return f"setweight({vector}, '{weight}')"
+    return vector
+
+
+SEARCH_VECTORS = {
+    "conversations": (
+        f"{_tsvector('title', 'A')} || {_tsvector('description', 'B')}"
+    ),
+    "messages": _tsvector("content"),
+    "prompts": (
+        f"{_tsvector('name', 'A')} || {_tsvector('description', 'B')} "
+        f"|| {_tsvector('content', 'C')}"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(
+            f"idx_{table}_search_vector",
+            table,
+            ["search_vector"],
+            postgresql_using="gin",
+        )
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(list(SEARCH_VECTORS)):
+        op.drop_index(f"idx_{table}_search_vector", table_name=table)
+        op.drop_column(table, "search_vector")
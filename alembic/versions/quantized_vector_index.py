@@ -0,0 +1,67 @@
+"""Build the HNSW index for quantized vector search
+
+Only the index for the configured ``VECTOR_SEARCH_PRECISION`` is kept:
+'half' needs the halfvec index, 'binary' the binary-quantized one and
+'full' neither. Each quantized index costs disk and an extra HNSW
+update on every chunk insert, so deployments searching at full
+precision do not build them, and indexes from earlier revisions that
+the setting does not use are dropped.
+
+To switch precision later, set ``VECTOR_SEARCH_PRECISION`` and run the
+matching statement from ``QUANTIZED_INDEXES`` below (``CREATE INDEX
+CONCURRENTLY`` avoids blocking writes), or downgrade past this
+revision and upgrade again.
+
+Revision ID: quantized_vector_index
+Revises: conversation_message_count_backfill
+Create Date: 2025-10-20 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from chatter.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "quantized_vector_index"
+down_revision: str | Sequence[str] | None = (
+    "conversation_message_count_backfill"
+)
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Index name and DDL per VECTOR_SEARCH_PRECISION
+QUANTIZED_INDEXES = {
+    "half": (
+        "idx_document_chunks_embedding_halfvec",
+        "CREATE INDEX IF NOT EXISTS "
+        "idx_document_chunks_embedding_halfvec ON document_chunks "
+        "USING hnsw "
+        "((embedding::halfvec(1536)) halfvec_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)",
+    ),
+    "binary": (
+        "idx_document_chunks_embedding_binary",
+        "CREATE INDEX IF NOT EXISTS "
+        "idx_document_chunks_embedding_binary ON document_chunks "
+        "USING hnsw "
+        "((binary_quantize(embedding)::bit(1536)) bit_hamming_ops) "
+        "WITH (m = 16, ef_construction = 64)",
+    ),
+}
+
+
+def upgrade() -> None:
+    """Keep only the quantized index the search precision uses."""
+    for precision, (name, create) in QUANTIZED_INDEXES.items():
+        if precision == settings.vector_search_precision:
+            op.execute(create)
+        else:
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    """Drop the quantized indexes."""
+    for name, _ in QUANTIZED_INDEXES.values():
+        op.execute(f"DROP INDEX IF EXISTS {name}")
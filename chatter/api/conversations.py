@@ -1,12 +1,13 @@
 """Conversations API endpoints - Direct access to conversations without /chat prefix."""
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chatter.api.auth import get_current_user
 from chatter.api.dependencies import (
     ConversationId,
     MessageId,
+    PaginationCursor,
     PaginationLimit,
     PaginationOffset,
 )
@@ -120,6 +121,7 @@ async def list_conversations(
     offset: int = Query(
         0, ge=0, description="Number of results to skip"
     ),
+    cursor: PaginationCursor = None,
     sort_by: str = Query("updated_at", description="Sort field"),
     sort_order: str = Query(
         "desc", pattern="^(asc|desc)$", description="Sort order"
@@ -139,6 +141,7 @@ async def list_conversations(
         enable_retrieval: Filter by retrieval enabled status
         limit: Maximum number of results
         offset: Number of results to skip
+        cursor: Cursor from a previous page's next_cursor
         sort_by: Sort field
         sort_order: Sort order (asc/desc)
         current_user: Current authenticated user
@@ -159,6 +162,7 @@ async def list_conversations(
         enable_retrieval=enable_retrieval,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
     )
 
 
@@ -226,14 +230,25 @@ async def delete_conversation(
 )
 async def get_conversation_messages(
     conversation_id: ConversationId,
+    response: Response,
     limit: PaginationLimit = 50,
     offset: PaginationOffset = 0,
+    cursor: PaginationCursor = None,
     current_user: User = Depends(get_current_user),
     handler: MessageResourceHandler = Depends(get_message_handler),
 ) -> list[MessageResponse]:
-    """Get messages from a conversation."""
+    """Get messages from a conversation.
+
+    Full pages carry an ``X-Next-Cursor`` header; pass it back as
+    ``cursor`` to fetch the next page.
+    """
     return await handler.get_conversation_messages(
-        conversation_id, current_user, limit, offset
+        conversation_id,
+        current_user,
+        limit,
+        offset,
+        cursor=cursor,
+        response=response,
     )
 
 
@@ -174,3 +174,12 @@ PaginationLimit = Annotated[
 PaginationOffset = Annotated[
     int, Query(ge=0, description="Number of results to skip")
 ]
+PaginationCursor = Annotated[
+    str | None,
+    Query(
+        description=(
+            "Cursor from a previous page; continues after it instead "
+            "of skipping offset results"
+        ),
+    ),
+]
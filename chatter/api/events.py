@@ -102,31 +102,19 @@ async def events_stream(
             yield f"data: {json.dumps(initial_event)}\n\n"
 
             # Stream events as they arrive
-            async for event in connection.get_events():
+            async for message in connection.get_messages():
                 # Check if client disconnected
                 if await request.is_disconnected():
                     logger.info("Client disconnected from SSE stream")
                     break
 
                 # Skip keepalive events for the client unless explicitly requested
-                if (
-                    event.type == EventType.SYSTEM_STATUS
-                    and event.data.get("keepalive", False)
-                ):
+                if message.is_keepalive:
                     yield ": keepalive\n\n"  # SSE comment format for keepalive
                     continue
 
-                event_data = {
-                    "id": event.id,
-                    "type": event.type.value,
-                    "data": event.data,
-                    "timestamp": event.timestamp.isoformat(),
-                    "metadata": event.metadata,
-                }
-
-                yield f"id: {event.id}\n"
-                yield f"event: {event.type.value}\n"
-                yield f"data: {json.dumps(event_data)}\n\n"
+                # Frames are encoded once and shared by all recipients
+                yield message.frame()
 
         except Exception as e:
             logger.error(
@@ -209,7 +197,7 @@ async def admin_events_stream(
             yield f"data: {json.dumps(initial_event)}\n\n"
 
             # Stream all system events
-            async for event in connection.get_events():
+            async for message in connection.get_messages():
                 # Check if client disconnected
                 if await request.is_disconnected():
                     logger.info(
@@ -218,25 +206,12 @@ async def admin_events_stream(
                     break
 
                 # Skip keepalive events for admin stream too
-                if (
-                    event.type == EventType.SYSTEM_STATUS
-                    and event.data.get("keepalive", False)
-                ):
+                if message.is_keepalive:
                     yield ": admin-keepalive\n\n"
                     continue
 
-                event_data = {
-                    "id": event.id,
-                    "type": event.type.value,
-                    "data": event.data,
-                    "timestamp": event.timestamp.isoformat(),
-                    "user_id": event.user_id,  # Include user_id for admin
-                    "metadata": event.metadata,
-                }
-
-                yield f"id: {event.id}\n"
-                yield f"event: {event.type.value}\n"
-                yield f"data: {json.dumps(event_data)}\n\n"
+                # Include user_id for admin
+                yield message.frame(include_user=True)
 
         except Exception as e:
             logger.error(
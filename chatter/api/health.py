@@ -170,6 +170,26 @@ async def get_metrics() -> MetricsResponse:
         except Exception as e:
             logger.warning(f"Failed to get endpoint stats: {e}")
 
+        try:
+            from chatter.core.langgraph import workflow_manager
+
+            performance_stats["checkpointer"] = (
+                workflow_manager.get_checkpointer_stats()
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get checkpointer stats: {e}")
+
+        try:
+            from chatter.services.ingest_scheduler import (
+                get_ingest_scheduler,
+            )
+
+            performance_stats["document_ingest"] = (
+                get_ingest_scheduler().get_stats()
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get ingest stats: {e}")
+
         return MetricsResponse(
             timestamp=current_timestamp,
             service="chatter",
@@ -5,6 +5,7 @@ NO backwards compatibility - completely new design.
 """
 
 from typing import Any
+from urllib.parse import quote
 
 from fastapi import (
     APIRouter,
@@ -15,10 +16,16 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import (
+    FileResponse,
+    Response,
+    StreamingResponse,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chatter.api.auth import get_current_user
+from chatter.api.dependencies import PaginationCursor
+from chatter.models.document import Document
 from chatter.models.user import User
 from chatter.schemas.document import (
     DocumentChunksResponse,
@@ -32,18 +39,30 @@ from chatter.schemas.document import (
     DocumentStatsResponse,
     SearchResultResponse,
 )
+from chatter.services.document_storage import get_document_storage
+from chatter.services.ingest_scheduler import IngestQueueFullError
 from chatter.services.new_document_service import (
     DocumentServiceError,
     NewDocumentService,
 )
 from chatter.utils.database import get_session_generator
 from chatter.utils.logging import get_logger
+from chatter.utils.pagination import InvalidCursorError
+from chatter.utils.problem import BadRequestProblem
 
 logger = get_logger(__name__)
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
 
+def _attachment_disposition(filename: str) -> str:
+    """Content-Disposition for a download, as FileResponse builds it."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
 @router.post("/upload", response_model=DocumentResponse)
 async def upload_document(
     file: UploadFile = File(...),
@@ -102,6 +121,11 @@ async def upload_document(
 
         return DocumentResponse.model_validate(document)
 
+    except IngestQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
     except DocumentServiceError as e:
         logger.error("Document upload failed", error=str(e))
         raise HTTPException(
@@ -152,10 +176,23 @@ async def get_document(
         ) from e
 
 
+def _next_cursor(
+    documents: list[Document], list_request: DocumentListRequest
+) -> str | None:
+    """Cursor for the page after ``documents``, if the ordering has one."""
+    keyset = NewDocumentService.keyset_for(
+        list_request.sort_by, list_request.sort_order
+    )
+    if keyset is None:
+        return None
+    return keyset.next_cursor(documents, list_request.limit)
+
+
 @router.get("", response_model=dict)
 async def list_documents_get(
     limit: int = 10,
     offset: int = 0,
+    cursor: PaginationCursor = None,
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session_generator),
 ) -> dict[str, Any]:
@@ -164,7 +201,9 @@ async def list_documents_get(
         from chatter.schemas.document import DocumentListRequest
 
         # Create request object from query parameters
-        list_request = DocumentListRequest(limit=limit, offset=offset)
+        list_request = DocumentListRequest(
+            limit=limit, offset=offset, cursor=cursor
+        )
 
         service = NewDocumentService(session)
         documents, total_count = await service.list_documents(
@@ -179,8 +218,11 @@ async def list_documents_get(
             "total_count": total_count,
             "offset": offset,
             "limit": limit,
+            "next_cursor": _next_cursor(documents, list_request),
         }
 
+    except InvalidCursorError as e:
+        raise BadRequestProblem(detail=e.message) from e
     except Exception as e:
         logger.error("Error listing documents", error=str(e))
         raise HTTPException(
@@ -210,8 +252,11 @@ async def list_documents_post(
             total_count=total_count,
             offset=list_request.offset,
             limit=list_request.limit,
+            next_cursor=_next_cursor(documents, list_request),
         )
 
+    except InvalidCursorError as e:
+        raise BadRequestProblem(detail=e.message) from e
     except Exception as e:
         logger.error("Error listing documents", error=str(e))
         raise HTTPException(
@@ -321,6 +366,11 @@ async def reprocess_document(
 
     except HTTPException:
         raise
+    except IngestQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
     except Exception as e:
         logger.error(
             "Error reprocessing document",
@@ -370,7 +420,13 @@ async def download_document(
     current_user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session_generator),
 ):
-    """Download original document file."""
+    """Download original document file.
+
+    Files on local disk are served with range request support and
+    without copying them through Python: by the proxy when an
+    ``X-Accel-Redirect`` prefix is configured, else by the server's
+    file sending.
+    """
     try:
         service = NewDocumentService(session)
 
@@ -395,9 +451,29 @@ async def download_document(
                 detail="Document file not found",
             )
 
-        return FileResponse(
-            path=file_path,
-            filename=document.original_filename,
+        storage = get_document_storage()
+        accel_uri = storage.accel_redirect_uri(file_path)
+        local_path = storage.local_path(file_path)
+        if local_path is not None and accel_uri is None:
+            return FileResponse(
+                path=local_path,
+                filename=document.original_filename,
+                media_type="application/octet-stream",
+            )
+
+        headers = {
+            "Content-Disposition": _attachment_disposition(
+                document.original_filename
+            )
+        }
+        if accel_uri is not None:
+            headers["X-Accel-Redirect"] = accel_uri
+            return Response(
+                headers=headers, media_type="application/octet-stream"
+            )
+        return StreamingResponse(
+            storage.read(file_path),
+            headers=headers,
             media_type="application/octet-stream",
         )
 
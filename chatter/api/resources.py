@@ -1,5 +1,7 @@
 """Resource-based handlers for conversation and message operations."""
 
+from fastapi import Response
+
 from chatter.api.dependencies import ConversationId, MessageId
 from chatter.core.exceptions import NotFoundError
 from chatter.models.conversation import ConversationStatus
@@ -17,8 +19,12 @@ from chatter.schemas.chat import (
     MessageResponse,
 )
 from chatter.services.conversation import ConversationService
-from chatter.services.message import MessageService
-from chatter.utils.problem import NotFoundProblem
+from chatter.services.message import MESSAGE_KEYSET, MessageService
+from chatter.utils.pagination import InvalidCursorError
+from chatter.utils.problem import BadRequestProblem, NotFoundProblem
+
+# Response header carrying the cursor for the next page of a list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 class ConversationResourceHandler:
@@ -57,24 +63,30 @@ class ConversationResourceHandler:
         enable_retrieval: bool | None = None,
         sort_by: str = "updated_at",
         sort_order: str = "desc",
+        cursor: str | None = None,
     ) -> ConversationListResponse:
         """List conversations for current user with filters."""
-        (
-            conversations,
-            total,
-        ) = await self.conversation_service.list_conversations(
-            user_id=current_user.id,
-            limit=limit,
-            offset=offset,
-            status=status,
-            llm_provider=llm_provider,
-            llm_model=llm_model,
-            tags=tags,
-            enable_retrieval=enable_retrieval,
-            sort_field=sort_by,
-            sort_order=sort_order,
-        )
+        try:
+            (
+                conversations,
+                total,
+            ) = await self.conversation_service.list_conversations(
+                user_id=current_user.id,
+                limit=limit,
+                offset=offset,
+                status=status,
+                llm_provider=llm_provider,
+                llm_model=llm_model,
+                tags=tags,
+                enable_retrieval=enable_retrieval,
+                sort_field=sort_by,
+                sort_order=sort_order,
+                cursor=cursor,
+            )
+        except InvalidCursorError as e:
+            raise BadRequestProblem(detail=e.message) from e
 
+        keyset = self.conversation_service.keyset_for(sort_by, sort_order)
         return ConversationListResponse(
             conversations=[
                 ConversationResponse.model_validate(conv)
@@ -83,6 +95,11 @@ class ConversationResourceHandler:
             total_count=total,
             limit=limit,
             offset=offset,
+            next_cursor=(
+                keyset.next_cursor(list(conversations), limit)
+                if keyset
+                else None
+            ),
         )
 
     async def get_conversation(
@@ -188,11 +205,30 @@ class MessageResourceHandler:
         current_user: User,
         limit: int,
         offset: int,
+        cursor: str | None = None,
+        response: Response | None = None,
     ) -> list[MessageResponse]:
-        """Get messages from a conversation."""
-        messages = await self.message_service.get_conversation_messages(
-            conversation_id, current_user.id, limit, offset
-        )
+        """Get messages from a conversation.
+
+        The cursor for the next page is sent in the ``X-Next-Cursor``
+        header of ``response`` when the page is full.
+        """
+        try:
+            messages = (
+                await self.message_service.get_conversation_messages(
+                    conversation_id,
+                    current_user.id,
+                    limit,
+                    offset,
+                    cursor=cursor,
+                )
+            )
+        except InvalidCursorError as e:
+            raise BadRequestProblem(detail=e.message) from e
+
+        next_cursor = MESSAGE_KEYSET.next_cursor(list(messages), limit)
+        if response is not None and next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
         return [
             MessageResponse.model_validate(msg)
             for msg in messages
@@ -14,6 +14,7 @@ from chatter.api.dependencies import (
     PaginationOffset,
     WorkflowId,
 )
+from chatter.config import settings
 from chatter.models.base import generate_ulid
 from chatter.models.user import User
 from chatter.schemas.chat import ChatResponse
@@ -45,6 +46,7 @@ from chatter.schemas.workflows import (
 from chatter.services.simplified_workflow_analytics import (
     SimplifiedWorkflowAnalyticsService,
 )
+from chatter.services.streaming import SSE_DONE, encode_sse_chunk
 from chatter.services.workflow_defaults import WorkflowDefaultsService
 from chatter.services.workflow_execution import WorkflowExecutionService
 from chatter.services.workflow_management import (
@@ -1186,21 +1188,30 @@ async def execute_chat_workflow_streaming(
     """Execute chat using dynamically built workflow with streaming."""
 
     async def generate_stream():
+        # Checking for a disconnect awaits the ASGI receive channel, so
+        # do it at most once per interval rather than once per chunk
+        check_interval = settings.streaming_disconnect_check_interval
+        next_check = 0.0
         try:
             async for (
                 chunk
             ) in workflow_service.execute_chat_workflow_streaming(
                 user_id=current_user.id, request=request
             ):
-                if await chat_request.is_disconnected():
-                    logger.info("Client disconnected during streaming")
-                    break
-                yield f"data: {json.dumps(chunk.model_dump())}\n\n"
+                now = time.monotonic()
+                if now >= next_check:
+                    if await chat_request.is_disconnected():
+                        logger.info(
+                            "Client disconnected during streaming"
+                        )
+                        break
+                    next_check = now + check_interval
+                yield encode_sse_chunk(chunk)
         except Exception as e:
             error_chunk = {"type": "error", "error": str(e)}
-            yield f"data: {json.dumps(error_chunk)}\n\n"
+            yield f"data: {json.dumps(error_chunk)}\n\n".encode()
         finally:
-            yield "data: [DONE]\n\n"
+            yield SSE_DONE
 
     return StreamingResponse(
         generate_stream(),
@@ -193,10 +193,152 @@ class Settings(BaseSettings):
         default=3072, description="PGVector embedding dimension"
     )
 
+    # Vector storage and search precision
+    vector_storage_mode: str = Field(
+        default="compact",
+        description=(
+            "Chunk embedding storage: 'compact' keeps one indexed vector "
+            "(raw vector only when truncated), 'full' also keeps "
+            "computed_embedding and raw_embedding copies"
+        ),
+    )
+    vector_search_precision: str = Field(
+        default="full",
+        description=(
+            "Vector candidate search precision: 'full', 'half' (halfvec) "
+            "or 'binary' (binary quantized), the latter two rescored at "
+            "full precision. Quantized modes need their own HNSW "
+            "index, built by the quantized_vector_index migration for "
+            "the precision set when it runs; it costs disk and an "
+            "extra index update per chunk insert"
+        ),
+    )
+    vector_rescore_factor: int = Field(
+        default=4,
+        description="Quantized candidates fetched per result for rescoring",
+    )
+    vector_hnsw_ef_search: int = Field(
+        default=100,
+        description=(
+            "HNSW candidate list size per search (raised to the "
+            "number of rows requested)"
+        ),
+    )
+    vector_iterative_scan: str = Field(
+        default="relaxed_order",
+        description=(
+            "pgvector 0.8+ iterative HNSW scans for filtered searches: "
+            "'off', 'strict_order' or 'relaxed_order'"
+        ),
+    )
+
+    # Hybrid retrieval (vector + keyword, reciprocal rank fusion)
+    retrieval_search_mode: str = Field(
+        default="vector",
+        description="Document retrieval mode: 'vector' or 'hybrid'",
+    )
+    retrieval_vector_weight: float = Field(
+        default=1.0,
+        description="Weight of the vector leg in hybrid retrieval",
+    )
+    retrieval_keyword_weight: float = Field(
+        default=1.0,
+        description="Weight of the keyword leg in hybrid retrieval",
+    )
+    retrieval_rrf_k: int = Field(
+        default=60,
+        description="Reciprocal rank fusion smoothing constant",
+    )
+    retrieval_candidate_multiplier: int = Field(
+        default=4,
+        description="Candidates fetched per leg as a multiple of k",
+    )
+    retrieval_cache_enabled: bool = Field(
+        default=True,
+        description="Cache retrieval results per query and scope",
+    )
+    retrieval_cache_max_size: int = Field(
+        default=1024,
+        description="Maximum number of cached retrieval results",
+    )
+    retrieval_cache_ttl: int = Field(
+        default=300,
+        description="Seconds a cached retrieval result stays valid",
+    )
+    retrieval_cache_similarity_threshold: float | None = Field(
+        default=None,
+        description=(
+            "Minimum cosine similarity for a near-duplicate query to "
+            "reuse cached results (unset: exact queries only)"
+        ),
+    )
+
     # Embedding settings
     embedding_batch_size: int = Field(
         default=10, description="Embedding batch size"
     )
+    embedding_max_concurrency: int = Field(
+        default=4,
+        description="Maximum in-flight embedding batches per provider",
+    )
+
+    # Streaming document ingestion
+    ingest_batch_size: int = Field(
+        default=32,
+        description="Chunks embedded and committed per ingest micro-batch",
+    )
+    ingest_max_pending_batches: int = Field(
+        default=2,
+        description="Chunk batches extracted ahead of embedding",
+    )
+    ingest_extracted_text_max_chars: int = Field(
+        default=100_000,
+        description="Characters of extracted text stored per document",
+    )
+    ingest_max_concurrent: int = Field(
+        default=2,
+        description="Documents processed concurrently per worker",
+    )
+    ingest_queue_size: int = Field(
+        default=100,
+        description="Maximum documents waiting for processing",
+    )
+    ingest_max_queued_per_user: int = Field(
+        default=20,
+        description="Maximum documents one user may have waiting",
+    )
+    ingest_process_workers: int = Field(
+        default=2,
+        description=(
+            "Processes extracting and chunking documents "
+            "(0: stream them in the API process)"
+        ),
+    )
+    ingest_shutdown_timeout: float = Field(
+        default=30.0,
+        description="Seconds shutdown waits for running ingests",
+    )
+
+    # Embedding cache (content-hash keyed)
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        description="Cache embeddings by provider, model and text hash",
+    )
+    embedding_cache_backend: str = Field(
+        default="memory",
+        description="Embedding cache backend: 'memory' or 'redis'",
+    )
+    embedding_cache_max_size: int = Field(
+        default=10000,
+        description=(
+            "Maximum cached embeddings (memory backend); a "
+            "1536-dimension vector takes about 6 KB"
+        ),
+    )
+    embedding_cache_ttl: int = Field(
+        default=604800,
+        description="Embedding cache TTL in seconds (7 days)",
+    )
 
     # =============================================================================
     # EMBEDDING DIMENSIONAL REDUCTION SETTINGS
@@ -245,6 +387,21 @@ class Settings(BaseSettings):
         default=7, description="Refresh token expiration days"
     )
     bcrypt_rounds: int = Field(default=12, description="Bcrypt rounds")
+    api_key_cache_ttl: int = Field(
+        default=60,
+        description="Seconds a verified API key is cached in memory",
+    )
+    api_key_legacy_lookup_limit: int = Field(
+        default=100,
+        description=(
+            "Maximum API keys without a stored prefix checked per "
+            "lookup (0 disables the legacy lookup)"
+        ),
+    )
+    auth_principal_cache_ttl: int = Field(
+        default=60,
+        description="Seconds an authenticated user is cached in Redis",
+    )
 
     # =============================================================================
     # REDIS SETTINGS
@@ -334,6 +491,18 @@ class Settings(BaseSettings):
     document_storage_path: str = Field(
         default="./data/documents", description="Document storage path"
     )
+    document_storage_backend: str = Field(
+        default="local",
+        description="Document file storage backend: 'local'",
+    )
+    document_accel_redirect_prefix: str | None = Field(
+        default=None,
+        description=(
+            "Internal proxy location mapped to the document storage "
+            "path; downloads are then sent by the proxy via "
+            "X-Accel-Redirect"
+        ),
+    )
 
     # Memory-efficient processing settings
     file_chunk_size: int = Field(
@@ -391,6 +560,25 @@ class Settings(BaseSettings):
         default=100,
         description="Maximum size of SSE event queue per connection",
     )
+    sse_overflow_policy: str = Field(
+        default="drop_oldest",
+        description=(
+            "What a full SSE queue does with a new event: "
+            "'drop_oldest', 'coalesce' (replace the queued event of "
+            "the same type) or 'disconnect' (close the slow client)"
+        ),
+    )
+    sse_pubsub_backend: str = Field(
+        default="local",
+        description=(
+            "SSE event transport: 'local' (single process) or 'redis' "
+            "(fan out across workers)"
+        ),
+    )
+    sse_pubsub_channel_prefix: str = Field(
+        default="chatter:sse",
+        description="Prefix of Redis pub/sub channels for SSE events",
+    )
 
     # =============================================================================
     # LOGGING SETTINGS
@@ -471,6 +659,28 @@ class Settings(BaseSettings):
         default=100, description="LangGraph recursion limit"
     )
 
+    # In-memory checkpointer bounds (used when Redis is unavailable)
+    langgraph_checkpoint_ttl: int = Field(
+        default=3600,
+        description="Seconds an idle checkpoint thread is kept in memory",
+    )
+    langgraph_checkpoint_max_bytes: int = Field(
+        default=268435456,
+        description="Memory budget for checkpoints in bytes (256 MB)",
+    )
+    langgraph_checkpoint_max_threads: int = Field(
+        default=10000,
+        description="Maximum checkpoint threads kept in memory",
+    )
+    langgraph_checkpoint_spill_path: str | None = Field(
+        default=None,
+        description="SQLite file for checkpoints evicted from memory",
+    )
+    langgraph_checkpoint_spill_ttl: int = Field(
+        default=86400,
+        description="Seconds spilled checkpoint threads are retained",
+    )
+
     # =============================================================================
     # MCP SETTINGS
     # =============================================================================
@@ -522,6 +732,14 @@ class Settings(BaseSettings):
         default=600, description="Maximum estimated execution time in seconds"
     )
 
+    # Compiled workflow graph cache
+    workflow_graph_cache_enabled: bool = Field(
+        default=True, description="Cache compiled workflow graphs"
+    )
+    workflow_graph_cache_max_size: int = Field(
+        default=128, description="Maximum cached compiled workflow graphs"
+    )
+
     # Token streaming settings
     streaming_chunk_size: int = Field(
         default=1, description="Number of tokens per streaming chunk"
@@ -533,6 +751,22 @@ class Settings(BaseSettings):
     streaming_buffer_size: int = Field(
         default=4096, description="Streaming buffer size"
     )
+    streaming_coalesce_tokens: bool = Field(
+        default=True,
+        description="Batch streamed tokens into larger chunks",
+    )
+    streaming_coalesce_interval_ms: int = Field(
+        default=30,
+        description="Milliseconds a token may be held for batching",
+    )
+    streaming_coalesce_max_chars: int = Field(
+        default=256,
+        description="Pending characters that flush a token batch",
+    )
+    streaming_disconnect_check_interval: float = Field(
+        default=0.5,
+        description="Seconds between client disconnect checks",
+    )
 
     # Circuit breaker settings for workflow reliability
     workflow_failure_threshold: int = Field(
@@ -672,6 +906,23 @@ class Settings(BaseSettings):
     analytics_cache_ttl: int = Field(
         default=300, description="Analytics cache TTL in seconds"
     )
+    analytics_dashboard_update_interval: float = Field(
+        default=30.0,
+        description="Seconds between real-time dashboard updates",
+    )
+    analytics_dashboard_delta_ratio: float = Field(
+        default=0.5,
+        description=(
+            "Send a dashboard update as a delta when at most this "
+            "fraction of its values changed"
+        ),
+    )
+    analytics_dashboard_full_every: int = Field(
+        default=10,
+        description=(
+            "Send a full dashboard snapshot at least every N updates"
+        ),
+    )
 
     # System monitoring intervals
     cpu_monitoring_interval: float = Field(
@@ -682,6 +933,20 @@ class Settings(BaseSettings):
         description="CPU average monitoring interval in seconds",
     )
 
+    # A/B test write-behind persistence
+    ab_test_flush_interval: float = Field(
+        default=5.0,
+        description="Seconds between A/B test write flushes",
+    )
+    ab_test_flush_batch_size: int = Field(
+        default=500,
+        description="Buffered A/B test writes that trigger a flush",
+    )
+    ab_test_max_buffered_writes: int = Field(
+        default=10000,
+        description="Buffered A/B test writes kept while unflushed",
+    )
+
     # =============================================================================
     # CLI SETTINGS
     # =============================================================================
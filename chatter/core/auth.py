@@ -1,9 +1,11 @@
 """Enhanced authentication service for user management with security features."""
 
+import asyncio
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import DateTime, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chatter.config import settings
@@ -18,10 +20,12 @@ from chatter.utils.problem import (
     NotFoundProblem,
 )
 from chatter.utils.security_enhanced import (
+    api_key_fingerprint,
     contains_personal_info,
     create_access_token,
     create_refresh_token,
     generate_secure_api_key,
+    get_api_key_prefix,
     hash_password,
     validate_email_advanced,
     validate_password_advanced,
@@ -33,6 +37,93 @@ from chatter.utils.security_enhanced import (
 
 logger = get_logger(__name__)
 
+# Recently verified API keys, keyed by their HMAC fingerprint:
+# fingerprint -> (user ID, expiry on the monotonic clock)
+_verified_api_keys: dict[str, tuple[str, float]] = {}
+_VERIFIED_API_KEYS_MAX = 10000
+
+# Recently rejected API keys: fingerprint -> expiry on the monotonic
+# clock. Repeating a bad key does not cost another bcrypt check.
+_rejected_api_keys: dict[str, float] = {}
+
+# Legacy API keys (issued before prefixes were stored) are checked in
+# batches of this size
+_LEGACY_API_KEY_BATCH = 100
+
+
+def _cache_verified_api_key(fingerprint: str, user_id: str) -> None:
+    """Remember that an API key was verified for a user."""
+    ttl = settings.api_key_cache_ttl
+    if ttl <= 0:
+        return
+    _rejected_api_keys.pop(fingerprint, None)
+    if len(_verified_api_keys) >= _VERIFIED_API_KEYS_MAX:
+        # Evict the oldest entry
+        _verified_api_keys.pop(next(iter(_verified_api_keys)))
+    _verified_api_keys[fingerprint] = (user_id, time.monotonic() + ttl)
+
+
+def _cache_rejected_api_key(fingerprint: str) -> None:
+    """Remember that an API key matched no user."""
+    ttl = settings.api_key_cache_ttl
+    if ttl <= 0:
+        return
+    if len(_rejected_api_keys) >= _VERIFIED_API_KEYS_MAX:
+        _rejected_api_keys.pop(next(iter(_rejected_api_keys)))
+    _rejected_api_keys[fingerprint] = time.monotonic() + ttl
+
+
+def _is_rejected_api_key(fingerprint: str) -> bool:
+    """Whether an API key was rejected within the cache TTL."""
+    expires_at = _rejected_api_keys.get(fingerprint)
+    if expires_at is None:
+        return False
+    if expires_at > time.monotonic():
+        return True
+    _rejected_api_keys.pop(fingerprint, None)
+    return False
+
+
+# Secrets that are never copied into cached principals
+_PRINCIPAL_EXCLUDED_FIELDS = frozenset({"hashed_password", "api_key"})
+
+
+def _principal_fields(user: User) -> dict[str, Any]:
+    """Serialize a user's columns for the principal cache."""
+    fields: dict[str, Any] = {}
+    for attr in inspect(User).column_attrs:
+        if attr.key in _PRINCIPAL_EXCLUDED_FIELDS:
+            continue
+        value = getattr(user, attr.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        fields[attr.key] = value
+    return fields
+
+
+def _user_from_principal(fields: dict[str, Any]) -> User:
+    """Rebuild a detached user from cached principal fields."""
+    values: dict[str, Any] = {}
+    for attr in inspect(User).column_attrs:
+        if attr.key not in fields:
+            continue
+        value = fields[attr.key]
+        if value is not None and isinstance(
+            attr.columns[0].type, DateTime
+        ):
+            value = datetime.fromisoformat(value)
+        values[attr.key] = value
+    return User(**values)
+
+
+def _forget_verified_api_keys(user_id: str) -> None:
+    """Drop a user's cached API key verifications."""
+    for fingerprint, (cached_user_id, _) in list(
+        _verified_api_keys.items()
+    ):
+        if cached_user_id == user_id:
+            _verified_api_keys.pop(fingerprint, None)
+
 
 def refresh_access_token(refresh_token: str) -> str | None:
     """Refresh an access token using a refresh token.
@@ -112,17 +203,11 @@ class AuthService:
             user_id: User ID to invalidate from cache
         """
         try:
-            from chatter.core.cache_factory import get_general_cache
+            from chatter.core.token_manager import get_token_manager
 
-            cache_service = get_general_cache()
-            if cache_service:
-                health = await cache_service.health_check()
-                if health.get("status") == "healthy":
-                    cache_key = f"user:{user_id}"
-                    await cache_service.delete(cache_key)
-                    logger.debug(
-                        "Invalidated user cache", user_id=user_id
-                    )
+            token_manager = await get_token_manager()
+            await token_manager.invalidate_principal(user_id)
+            logger.debug("Invalidated user cache", user_id=user_id)
         except Exception as cache_error:
             logger.debug(
                 "Failed to invalidate user cache",
@@ -130,6 +215,48 @@ class AuthService:
                 error=str(cache_error),
             )
 
+    async def _get_principal(
+        self, user_id: str, jti: str | None = None
+    ) -> User | None:
+        """Get the authenticated user, preferring the principal cache.
+
+        The presented token is checked against the blacklist on every
+        call, in the same cache round trip that fetches the principal.
+        On a miss the user is loaded from the database and cached for
+        the following requests.
+
+        Args:
+            user_id: User ID
+            jti: JWT ID of the presented token, if any
+
+        Returns:
+            User (detached when served from the cache), or None if the
+            user does not exist
+
+        Raises:
+            AuthenticationError: If the token has been revoked
+        """
+        from chatter.core.token_manager import get_token_manager
+
+        token_manager = await get_token_manager()
+        principal, revoked = await token_manager.get_principal(
+            user_id, jti
+        )
+        if revoked:
+            raise AuthenticationError(
+                "Token has been revoked"
+            ) from None
+        if principal:
+            return _user_from_principal(principal)
+
+        user = await self.get_user_by_id(user_id)
+        if not user:
+            return None
+        await token_manager.cache_principal(
+            user_id, _principal_fields(user)
+        )
+        return user
+
     async def create_user(self, user_data: UserCreate) -> User:
         """Create a new user with enhanced security validation.
 
@@ -276,11 +403,11 @@ class AuthService:
         Returns:
             True if user is superuser, False otherwise
         """
-        user = await self.get_user_by_id(user_id)
+        user = await self._get_principal(user_id)
         return user is not None and user.is_superuser
 
     async def get_user_by_id(self, user_id: str) -> User | None:
-        """Get user by ID with caching.
+        """Get user by ID.
 
         Args:
             user_id: User ID
@@ -288,61 +415,13 @@ class AuthService:
         Returns:
             User if found, None otherwise
         """
-        # Try cache first for performance
-        try:
-            from chatter.core.cache_factory import get_general_cache
-
-            cache_service = get_general_cache()
-
-            # Check cache health instead of is_connected for unified cache
-            health = await cache_service.health_check()
-            if health.get("status") == "healthy":
-                cache_key = f"user:{user_id}"
-                cached_user = await cache_service.get(cache_key)
-                if cached_user:
-                    # Convert back to User object (simplified caching)
-                    logger.debug("User found in cache", user_id=user_id)
-                    # For now, fall through to database - can enhance later
-        except Exception as cache_error:
-            logger.debug(
-                "Cache lookup failed, using database",
-                user_id=user_id,
-                error=str(cache_error),
-            )
-
+        # Overwrite any stale copy already in the session
         result = await self.session.execute(
-            select(User).where(User.id == user_id)
+            select(User)
+            .where(User.id == user_id)
+            .execution_options(populate_existing=True)
         )
-        user = result.scalar_one_or_none()
-
-        # Refresh to ensure all database-generated fields are loaded
-        if user:
-            await self.session.refresh(user)
-
-        # Cache the result for future lookups
-        if user:
-            try:
-                from chatter.core.cache_factory import get_general_cache
-
-                cache_service = get_general_cache()
-                health = await cache_service.health_check()
-                if health.get("status") == "healthy":
-                    cache_key = f"user:{user_id}"
-                    # Cache for 15 minutes
-                    await cache_service.set(
-                        cache_key,
-                        "cached",
-                        ttl=900,  # 15 minutes in seconds
-                    )
-                    logger.debug("User cached", user_id=user_id)
-            except Exception as cache_error:
-                logger.debug(
-                    "Cache storage failed",
-                    user_id=user_id,
-                    error=str(cache_error),
-                )
-
-        return user
+        return result.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
         """Get user by email.
@@ -383,26 +462,106 @@ class AuthService:
     async def get_user_by_api_key(self, api_key: str) -> User | None:
         """Get user by API key with enhanced security.
 
+        The key's non-secret prefix selects a single indexed row whose
+        hash is then verified off the event loop. Verified and rejected
+        keys are cached briefly so repeated requests skip the hash
+        verification.
+
         Args:
             api_key: API key (plaintext)
 
         Returns:
             User if found and API key is valid, None otherwise
         """
-        # Use indexed query for better performance
-        result = await self.session.execute(
-            select(User).where(User.api_key.isnot(None)).limit(100)
-        )
-        users_with_keys = result.scalars().all()
-
-        # Check each user's hashed API key using secure verification
-        for user in users_with_keys:
-            if user.api_key:
-                # Try new secure verification first
-                # Use secure API key verification
-                if verify_api_key_secure(api_key, user.api_key):
+        fingerprint = api_key_fingerprint(api_key)
+        prefix = get_api_key_prefix(api_key)
+
+        cached = _verified_api_keys.get(fingerprint)
+        if cached:
+            user_id, expires_at = cached
+            if expires_at > time.monotonic():
+                user = await self._get_principal(user_id)
+                # A key revoked by another worker no longer matches
+                if user and prefix and user.api_key_prefix == prefix:
+                    return user
+            _verified_api_keys.pop(fingerprint, None)
+
+        if _is_rejected_api_key(fingerprint):
+            return None
+
+        user = None
+        if prefix:
+            result = await self.session.execute(
+                select(User).where(User.api_key_prefix == prefix)
+            )
+            user = result.scalar_one_or_none()
+            if user is not None:
+                if not user.api_key or not await asyncio.to_thread(
+                    verify_api_key_secure, api_key, user.api_key
+                ):
+                    _cache_rejected_api_key(fingerprint)
+                    return None
+                _cache_verified_api_key(fingerprint, user.id)
+                return user
+
+        user = await self._get_user_by_legacy_api_key(api_key, prefix)
+        if user:
+            _cache_verified_api_key(fingerprint, user.id)
+        else:
+            _cache_rejected_api_key(fingerprint)
+        return user
+
+    async def _get_user_by_legacy_api_key(
+        self, api_key: str, prefix: str | None
+    ) -> User | None:
+        """Find the owner of an API key issued without a stored prefix.
+
+        Only keys whose prefix has not been recorded yet are checked,
+        and at most ``api_key_legacy_lookup_limit`` of them, since each
+        costs a bcrypt verification. A match records the prefix so
+        later lookups use the index.
+
+        Args:
+            api_key: API key (plaintext)
+            prefix: Lookup prefix of the key, if it has one
+
+        Returns:
+            User if found and API key is valid, None otherwise
+        """
+        remaining = settings.api_key_legacy_lookup_limit
+        last_id = ""
+        while remaining > 0:
+            result = await self.session.execute(
+                select(User)
+                .where(
+                    User.api_key.isnot(None),
+                    User.api_key_prefix.is_(None),
+                    User.id > last_id,
+                )
+                .order_by(User.id)
+                .limit(min(remaining, _LEGACY_API_KEY_BATCH))
+            )
+            users_with_keys = result.scalars().all()
+            if not users_with_keys:
+                return None
+            remaining -= len(users_with_keys)
+
+            for user in users_with_keys:
+                if await asyncio.to_thread(
+                    verify_api_key_secure, api_key, user.api_key
+                ):
+                    if prefix:
+                        user.api_key_prefix = prefix
+                        await self.session.commit()
+                        await self.session.refresh(user)
+                        logger.info(
+                            "Recorded prefix for legacy API key",
+                            user_id=user.id,
+                        )
                     return user
 
+            last_id = users_with_keys[-1].id
+
         return None
 
     async def update_user(
@@ -547,9 +706,10 @@ class AuthService:
         # Generate secure API key with proper hashing
         api_key, hashed_api_key = generate_secure_api_key()
 
-        # Store only the hash in the database
+        # Store only the hash and the non-secret lookup prefix
         user.api_key = hashed_api_key
         user.api_key_name = key_name
+        user.api_key_prefix = get_api_key_prefix(api_key)
 
         await self.session.commit()
         await self.session.refresh(user)
@@ -561,7 +721,7 @@ class AuthService:
             "Secure API key created",
             user_id=user.id,
             key_name=key_name,
-            key_prefix=api_key[:20] + "...",
+            key_prefix=user.api_key_prefix,
         )
 
         # Return the plaintext API key only once - it won't be stored
@@ -585,11 +745,13 @@ class AuthService:
 
         user.api_key = None
         user.api_key_name = None
+        user.api_key_prefix = None
         await self.session.commit()
         await self.session.refresh(user)
 
         # Invalidate user cache after API key revocation
         await self._invalidate_user_cache(user_id)
+        _forget_verified_api_keys(user_id)
 
         logger.info("API key revoked", user_id=user.id)
         return True
@@ -738,26 +900,15 @@ class AuthService:
         # Try JWT token validation first
         payload = verify_token(token)
         if payload:
-            # Enhanced token validation
-            jti = payload.get("jti")
-            if jti:
-                # Check if token is blacklisted
-                try:
-                    from chatter.core.token_manager import get_token_manager
-
-                    token_manager = await get_token_manager()
-                    if await token_manager.is_token_blacklisted(jti):
-                        raise AuthenticationError(
-                            "Token has been revoked"
-                        ) from None
-                except Exception as e:
-                    logger.debug(f"Token blacklist check failed: {e}")
-
             user_id = payload.get("sub")
             if not user_id:
                 raise AuthenticationError("Invalid token") from None
 
-            user = await self.get_user_by_id(user_id)
+            # One cache round trip covers both the user and the
+            # blacklist check
+            user = await self._get_principal(
+                user_id, payload.get("jti")
+            )
             if not user:
                 raise AuthenticationError("User not found") from None
 
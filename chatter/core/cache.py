@@ -349,6 +349,12 @@ class RedisCache(CacheInterface):
             self._connected = False
             return False
 
+    async def get_client(self) -> Redis | None:
+        """Get the connected Redis client for atomic operations."""
+        if not await self._ensure_connection():
+            return None
+        return self.redis
+
     async def get(self, key: str) -> Any:
         """Get value from Redis cache."""
         if not await self._ensure_connection():
@@ -551,6 +557,12 @@ class MultiTierCache(CacheInterface):
             l2_enabled=not self.config.disabled,
         )
 
+    async def get_client(self) -> Redis | None:
+        """Get the connected L2 Redis client for atomic operations."""
+        if self.config.disabled:
+            return None
+        return await self.l2_cache.get_client()
+
     async def get(self, key: str) -> Any:
         """Get value from multi-tier cache (L1 first, then L2)."""
         if self.config.disabled:
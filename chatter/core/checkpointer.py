@@ -0,0 +1,511 @@
+"""Bounded in-memory checkpointer for LangGraph workflows.
+
+The stock ``MemorySaver`` keeps every checkpoint forever. Since each
+workflow run uses its own thread ID, a long-running worker accumulates
+checkpoints without limit. ``BoundedMemorySaver`` caps that memory with
+a per-thread TTL and a global byte/thread budget enforced by LRU
+eviction, and can optionally spill evicted threads to a local SQLite
+file from which they are restored on next access.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+from chatter.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _ThreadUsage:
+    """Memory accounting for a single checkpoint thread."""
+
+    last_access: float
+    bytes: int = 0
+    checkpoints: int = 0
+    blob_keys: set[tuple[Any, ...]] = field(default_factory=set)
+    write_keys: set[tuple[str, str, str]] = field(default_factory=set)
+
+
+def _typed_size(value: tuple[str, bytes]) -> int:
+    """Size in bytes of a serialized (type, payload) pair."""
+    return len(value[1]) if value and value[1] else 0
+
+
+def _encode_typed(value: tuple[str, bytes]) -> list[str]:
+    """Encode a serialized (type, payload) pair for JSON."""
+    return [value[0], base64.b64encode(value[1]).decode("ascii")]
+
+
+def _decode_typed(value: list[str]) -> tuple[str, bytes]:
+    """Decode a JSON-encoded (type, payload) pair."""
+    return (value[0], base64.b64decode(value[1]))
+
+
+class SQLiteCheckpointSpillStore:
+    """Local SQLite store for checkpoint threads evicted from memory.
+
+    Threads older than the TTL are pruned as new threads are spilled, at
+    most once per ``prune_interval``, so the file stays bounded without
+    a background task.
+    """
+
+    prune_interval = 60.0
+
+    def __init__(self, path: str, ttl: int = 86400):
+        """Initialize spill store.
+
+        Args:
+            path: SQLite database file path
+            ttl: Seconds to keep spilled threads before pruning
+        """
+        self.path = path
+        self.ttl = ttl
+        self._next_prune = 0.0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoint_threads ("
+            "thread_id TEXT PRIMARY KEY, "
+            "payload TEXT NOT NULL, "
+            "spilled_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def save(self, thread_id: str, payload: str) -> None:
+        """Store a serialized thread."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO checkpoint_threads "
+            "(thread_id, payload, spilled_at) VALUES (?, ?, ?)",
+            (thread_id, payload, time.time()),
+        )
+        self._conn.commit()
+        if time.monotonic() >= self._next_prune:
+            self.prune()
+
+    def pop(self, thread_id: str) -> str | None:
+        """Remove and return a serialized thread, if present."""
+        row = self._conn.execute(
+            "SELECT payload FROM checkpoint_threads WHERE thread_id = ?",
+            (thread_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        self.delete(thread_id)
+        return row[0]
+
+    def delete(self, thread_id: str) -> None:
+        """Delete a serialized thread."""
+        self._conn.execute(
+            "DELETE FROM checkpoint_threads WHERE thread_id = ?",
+            (thread_id,),
+        )
+        self._conn.commit()
+
+    def prune(self) -> int:
+        """Delete threads spilled longer than the TTL ago."""
+        self._next_prune = time.monotonic() + self.prune_interval
+        cursor = self._conn.execute(
+            "DELETE FROM checkpoint_threads WHERE spilled_at < ?",
+            (time.time() - self.ttl,),
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def count(self) -> int:
+        """Number of spilled threads."""
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM checkpoint_threads"
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class BoundedMemorySaver(MemorySaver):
+    """MemorySaver with per-thread TTL and a global LRU budget."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_threads: int = 10000,
+        thread_ttl: int = 3600,
+        spill_store: SQLiteCheckpointSpillStore | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize bounded checkpointer.
+
+        Args:
+            max_bytes: Budget for serialized checkpoint data in memory
+            max_threads: Maximum number of threads kept in memory
+            thread_ttl: Seconds since last access before a thread expires
+            spill_store: Optional store for threads evicted by the budget
+            **kwargs: Passed through to MemorySaver
+        """
+        super().__init__(**kwargs)
+        self.max_bytes = max_bytes
+        self.max_threads = max_threads
+        self.thread_ttl = thread_ttl
+        self.spill_store = spill_store
+        self._threads: OrderedDict[str, _ThreadUsage] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._expired = 0
+        self._evicted = 0
+        self._spilled = 0
+        self._restored = 0
+
+    # Accounting helpers
+
+    def _touch(self, thread_id: str) -> _ThreadUsage:
+        """Mark a thread as most recently used."""
+        usage = self._threads.get(thread_id)
+        if usage is None:
+            usage = _ThreadUsage(last_access=time.monotonic())
+            self._threads[thread_id] = usage
+        else:
+            usage.last_access = time.monotonic()
+            self._threads.move_to_end(thread_id)
+        return usage
+
+    def _add_bytes(self, usage: _ThreadUsage, size: int) -> None:
+        usage.bytes += size
+        self._total_bytes += size
+
+    def _drop_thread(self, thread_id: str) -> None:
+        """Remove a thread from memory using its key index."""
+        usage = self._threads.pop(thread_id, None)
+        self.storage.pop(thread_id, None)
+        if usage is None:
+            return
+        for key in usage.write_keys:
+            self.writes.pop(key, None)
+        for key in usage.blob_keys:
+            self.blobs.pop(key, None)
+        self._total_bytes -= usage.bytes
+
+    def _serialize_thread(self, thread_id: str) -> str:
+        """Serialize a thread's checkpoints, writes and blobs."""
+        usage = self._threads[thread_id]
+        storage = {
+            ns: {
+                checkpoint_id: [
+                    _encode_typed(checkpoint),
+                    _encode_typed(metadata),
+                    parent,
+                ]
+                for checkpoint_id, (
+                    checkpoint,
+                    metadata,
+                    parent,
+                ) in checkpoints.items()
+            }
+            for ns, checkpoints in self.storage.get(thread_id, {}).items()
+        }
+        writes = [
+            [
+                list(key),
+                [
+                    [
+                        list(inner_key),
+                        [task_id, channel, _encode_typed(value), path],
+                    ]
+                    for inner_key, (
+                        task_id,
+                        channel,
+                        value,
+                        path,
+                    ) in self.writes[key].items()
+                ],
+            ]
+            for key in usage.write_keys
+            if key in self.writes
+        ]
+        blobs = [
+            [list(key), _encode_typed(self.blobs[key])]
+            for key in usage.blob_keys
+            if key in self.blobs
+        ]
+        return json.dumps(
+            {"storage": storage, "writes": writes, "blobs": blobs}
+        )
+
+    def _restore_thread(self, thread_id: str) -> bool:
+        """Load a spilled thread back into memory."""
+        if self.spill_store is None or thread_id in self._threads:
+            return False
+        try:
+            payload = self.spill_store.pop(thread_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to read spilled checkpoint thread",
+                thread_id=thread_id,
+                error=str(e),
+            )
+            return False
+        if payload is None:
+            return False
+
+        data = json.loads(payload)
+        usage = self._touch(thread_id)
+        for ns, checkpoints in data["storage"].items():
+            ns_storage = self.storage[thread_id][ns]
+            for checkpoint_id, (checkpoint, metadata, parent) in (
+                checkpoints.items()
+            ):
+                checkpoint = _decode_typed(checkpoint)
+                metadata = _decode_typed(metadata)
+                ns_storage[checkpoint_id] = (checkpoint, metadata, parent)
+                usage.checkpoints += 1
+                self._add_bytes(
+                    usage, _typed_size(checkpoint) + _typed_size(metadata)
+                )
+        for key, entries in data["writes"]:
+            outer_key = tuple(key)
+            usage.write_keys.add(outer_key)
+            for inner_key, (task_id, channel, value, path) in entries:
+                value = _decode_typed(value)
+                self.writes[outer_key][tuple(inner_key)] = (
+                    task_id,
+                    channel,
+                    value,
+                    path,
+                )
+                self._add_bytes(usage, _typed_size(value))
+        for key, value in data["blobs"]:
+            blob_key = tuple(key)
+            value = _decode_typed(value)
+            self.blobs[blob_key] = value
+            usage.blob_keys.add(blob_key)
+            self._add_bytes(usage, _typed_size(value))
+
+        self._restored += 1
+        return True
+
+    def _enforce_limits(self, keep: str | None = None) -> None:
+        """Expire idle threads, then evict LRU threads over budget."""
+        cutoff = time.monotonic() - self.thread_ttl
+        while self._threads:
+            thread_id, usage = next(iter(self._threads.items()))
+            if usage.last_access >= cutoff or thread_id == keep:
+                break
+            self._drop_thread(thread_id)
+            self._expired += 1
+
+        while self._threads and (
+            self._total_bytes > self.max_bytes
+            or len(self._threads) > self.max_threads
+        ):
+            thread_id = next(iter(self._threads))
+            if thread_id == keep:
+                if len(self._threads) == 1:
+                    break
+                self._threads.move_to_end(thread_id)
+                continue
+            if self.spill_store is not None:
+                try:
+                    self.spill_store.save(
+                        thread_id, self._serialize_thread(thread_id)
+                    )
+                    self._spilled += 1
+                except Exception as e:
+                    logger.warning(
+                        "Failed to spill checkpoint thread",
+                        thread_id=thread_id,
+                        error=str(e),
+                    )
+            self._drop_thread(thread_id)
+            self._evicted += 1
+
+    # BaseCheckpointSaver overrides (async variants delegate to these)
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get a checkpoint tuple, restoring a spilled thread if needed."""
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            if thread_id not in self._threads:
+                if not self._restore_thread(thread_id):
+                    return None
+            self._touch(thread_id)
+            return super().get_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints held in memory (restoring a spilled thread)."""
+        thread_id = (
+            config["configurable"].get("thread_id") if config else None
+        )
+        with self._lock:
+            if thread_id:
+                self._restore_thread(thread_id)
+                if thread_id in self._threads:
+                    self._touch(thread_id)
+            items = list(
+                super().list(
+                    config, filter=filter, before=before, limit=limit
+                )
+            )
+        yield from items
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint and enforce the memory budget."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        with self._lock:
+            self._restore_thread(thread_id)
+            result = super().put(config, checkpoint, metadata, new_versions)
+
+            usage = self._touch(thread_id)
+            stored = self.storage[thread_id][checkpoint_ns][checkpoint["id"]]
+            size = _typed_size(stored[0]) + _typed_size(stored[1])
+            for channel, version in new_versions.items():
+                blob_key = (thread_id, checkpoint_ns, channel, version)
+                if blob_key not in usage.blob_keys:
+                    usage.blob_keys.add(blob_key)
+                    size += _typed_size(self.blobs[blob_key])
+            usage.checkpoints += 1
+            self._add_bytes(usage, size)
+
+            self._enforce_limits(keep=thread_id)
+            return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Any,
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Save pending writes and enforce the memory budget."""
+        thread_id = config["configurable"]["thread_id"]
+        outer_key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        with self._lock:
+            self._restore_thread(thread_id)
+            before = sum(
+                _typed_size(entry[2])
+                for entry in self.writes.get(outer_key, {}).values()
+            )
+            super().put_writes(config, writes, task_id, task_path)
+            after = sum(
+                _typed_size(entry[2])
+                for entry in self.writes.get(outer_key, {}).values()
+            )
+
+            usage = self._touch(thread_id)
+            usage.write_keys.add(outer_key)
+            self._add_bytes(usage, after - before)
+
+            self._enforce_limits(keep=thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete a thread from memory and from the spill store."""
+        with self._lock:
+            self._drop_thread(thread_id)
+            if self.spill_store is not None:
+                self.spill_store.delete(thread_id)
+
+    def sweep(self) -> dict[str, Any]:
+        """Expire idle threads and prune the spill store.
+
+        Returns:
+            Occupancy statistics after the sweep
+        """
+        with self._lock:
+            self._enforce_limits()
+            if self.spill_store is not None:
+                try:
+                    self.spill_store.prune()
+                except Exception as e:
+                    logger.warning(
+                        "Failed to prune checkpoint spill store",
+                        error=str(e),
+                    )
+        return self.get_stats()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get occupancy metrics for sizing workers."""
+        with self._lock:
+            stats: dict[str, Any] = {
+                "backend": "bounded_memory",
+                "threads": len(self._threads),
+                "checkpoints": sum(
+                    u.checkpoints for u in self._threads.values()
+                ),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "max_threads": self.max_threads,
+                "thread_ttl": self.thread_ttl,
+                "utilization": self._total_bytes / max(1, self.max_bytes),
+                "expired_threads": self._expired,
+                "evicted_threads": self._evicted,
+                "spilled_threads": self._spilled,
+                "restored_threads": self._restored,
+                "spill_enabled": self.spill_store is not None,
+            }
+            if self.spill_store is not None:
+                try:
+                    stats["spill_store_threads"] = self.spill_store.count()
+                except Exception as e:
+                    stats["spill_store_error"] = str(e)
+            return stats
+
+
+def create_bounded_checkpointer(settings: Any) -> BoundedMemorySaver:
+    """Create a bounded checkpointer from application settings."""
+    spill_store = None
+    if settings.langgraph_checkpoint_spill_path:
+        try:
+            spill_store = SQLiteCheckpointSpillStore(
+                settings.langgraph_checkpoint_spill_path,
+                ttl=settings.langgraph_checkpoint_spill_ttl,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to open checkpoint spill store",
+                path=settings.langgraph_checkpoint_spill_path,
+                error=str(e),
+            )
+
+    return BoundedMemorySaver(
+        max_bytes=settings.langgraph_checkpoint_max_bytes,
+        max_threads=settings.langgraph_checkpoint_max_threads,
+        thread_ttl=settings.langgraph_checkpoint_ttl,
+        spill_store=spill_store,
+    )
+
@@ -5,6 +5,15 @@ from typing import Any
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 
+from chatter.config import settings
+from chatter.core.embedding_pipeline import SimpleVectorStore
+from chatter.core.retrieval_cache import (
+    ALL_DOCUMENTS_TAG,
+    PUBLIC_DOCUMENTS_TAG,
+    document_tag,
+    get_retrieval_cache,
+    owner_tag,
+)
 from chatter.utils.database import get_session_generator
 from chatter.utils.logging import get_logger
 
@@ -20,20 +29,78 @@ class DocumentChunkRetriever:
         user_id: str | None = None,
         document_ids: list[str] | None = None,
         k: int = 5,
+        search_mode: str | None = None,
+        vector_weight: float | None = None,
+        keyword_weight: float | None = None,
+        rrf_k: int | None = None,
     ):
         """Initialize the retriever.
         
         Args:
             embeddings: Embeddings provider to encode queries
-            user_id: Optional user ID filter
+            user_id: Only retrieve from documents this user owns or
+                that are public
             document_ids: Optional document IDs filter
             k: Number of documents to retrieve
+            search_mode: "vector" or "hybrid" (vector + keyword with
+                reciprocal rank fusion); defaults to settings
+            vector_weight: Hybrid weight of the vector leg
+            keyword_weight: Hybrid weight of the keyword leg
+            rrf_k: Reciprocal rank fusion smoothing constant
         """
         self.embeddings = embeddings
         self.user_id = user_id
         self.document_ids = document_ids
         self.k = k
-        
+        self.search_mode = search_mode or settings.retrieval_search_mode
+        self.vector_weight = (
+            settings.retrieval_vector_weight
+            if vector_weight is None
+            else vector_weight
+        )
+        self.keyword_weight = (
+            settings.retrieval_keyword_weight
+            if keyword_weight is None
+            else keyword_weight
+        )
+        self.rrf_k = settings.retrieval_rrf_k if rrf_k is None else rrf_k
+
+    def _cache_scope(self) -> str:
+        """Cache key of what results depend on besides the query."""
+        embeddings = self.embeddings
+        return get_retrieval_cache().make_scope(
+            owner_id=self.user_id,
+            document_ids=(
+                sorted(self.document_ids) if self.document_ids else None
+            ),
+            k=self.k,
+            search_mode=self.search_mode,
+            weights=(
+                [self.vector_weight, self.keyword_weight, self.rrf_k]
+                if self.search_mode == "hybrid"
+                else None
+            ),
+            embedding_model=[
+                type(embeddings).__qualname__,
+                getattr(embeddings, "model", None)
+                or getattr(embeddings, "model_name", None),
+            ],
+        )
+
+    def _cache_tags(self, documents: list[Document]) -> set[str]:
+        """Tags of the documents cached results depend on."""
+        if self.document_ids:
+            tags = {document_tag(d) for d in self.document_ids}
+        elif self.user_id:
+            tags = {owner_tag(self.user_id), PUBLIC_DOCUMENTS_TAG}
+        else:
+            tags = {ALL_DOCUMENTS_TAG}
+        tags.update(
+            document_tag(doc.metadata["document_id"])
+            for doc in documents
+        )
+        return tags
+
     async def ainvoke(self, query: str, **kwargs: Any) -> list[Document]:
         """Retrieve documents for the query.
         
@@ -52,6 +119,19 @@ class DocumentChunkRetriever:
                 document_ids=self.document_ids,
                 k=self.k,
             )
+
+            # Repeated questions are answered from the cache without
+            # embedding the query or searching again
+            cache = get_retrieval_cache()
+            scope = self._cache_scope() if cache.enabled else None
+            if scope is not None:
+                cached = cache.get(query, scope)
+                if cached is not None:
+                    logger.info(
+                        "DocumentChunkRetriever cache hit",
+                        doc_count=len(cached),
+                    )
+                    return cached
             
             # Generate query embedding
             query_embedding = await self.embeddings.aembed_query(query)
@@ -60,19 +140,43 @@ class DocumentChunkRetriever:
                 f"Generated query embedding",
                 embedding_dim=len(query_embedding),
             )
+
+            if scope is not None:
+                cached = cache.get_similar(query_embedding, scope)
+                if cached is not None:
+                    logger.info(
+                        "DocumentChunkRetriever near-duplicate hit",
+                        doc_count=len(cached),
+                    )
+                    return cached
             
             # Get database session
             async for session in get_session_generator():
                 # Use SimpleVectorStore to search
-                from chatter.core.embedding_pipeline import SimpleVectorStore
-                
                 vector_store = SimpleVectorStore(session)
-                results = await vector_store.search_similar(
-                    query_embedding=query_embedding,
-                    limit=self.k,
-                    document_ids=self.document_ids,
-                    prefer_exact_match=True,
-                )
+                if self.search_mode == "hybrid":
+                    results = await vector_store.hybrid_search(
+                        query_text=query,
+                        query_embedding=query_embedding,
+                        limit=self.k,
+                        document_ids=self.document_ids,
+                        owner_id=self.user_id,
+                        vector_weight=self.vector_weight,
+                        keyword_weight=self.keyword_weight,
+                        rrf_k=self.rrf_k,
+                        candidate_limit=(
+                            self.k
+                            * settings.retrieval_candidate_multiplier
+                        ),
+                    )
+                else:
+                    results = await vector_store.search_similar(
+                        query_embedding=query_embedding,
+                        limit=self.k,
+                        document_ids=self.document_ids,
+                        prefer_exact_match=True,
+                        owner_id=self.user_id,
+                    )
                 
                 logger.info(
                     f"SimpleVectorStore returned results",
@@ -88,6 +192,7 @@ class DocumentChunkRetriever:
                             "document_id": chunk.document_id,
                             "chunk_index": chunk.chunk_index,
                             "score": float(score),
+                            "search_mode": self.search_mode,
                             "user_id": self.user_id,
                         }
                     )
@@ -97,6 +202,15 @@ class DocumentChunkRetriever:
                     f"DocumentChunkRetriever returning documents",
                     doc_count=len(documents),
                 )
+
+                if scope is not None:
+                    cache.put(
+                        query,
+                        scope,
+                        documents,
+                        query_embedding=query_embedding,
+                        tags=self._cache_tags(documents),
+                    )
                 
                 return documents
                 
@@ -10,14 +10,40 @@ NO backwards compatibility - completely new implementation.
 """
 
 import asyncio
+import codecs
 import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from contextlib import aclosing, suppress
 from datetime import UTC, datetime
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import (
+    delete,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
 
+from chatter.config import settings
 from chatter.models.document import (
     Document,
     DocumentChunk,
@@ -26,10 +52,14 @@ from chatter.models.document import (
     HybridVectorSearchHelper,
 )
 from chatter.services.embeddings import EmbeddingService
+from chatter.utils import text_search
 from chatter.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Characters read per block when streaming plain text files
+TEXT_BLOCK_SIZE = 64 * 1024
+
 
 class EmbeddingPipelineError(Exception):
     """Error in the embedding pipeline."""
@@ -37,6 +67,15 @@ class EmbeddingPipelineError(Exception):
     pass
 
 
+class _CheckpointMismatchError(EmbeddingPipelineError):
+    """Committed chunks do not match the regenerated chunk stream."""
+
+
+def _content_hash(text: str) -> str:
+    """Hash chunk content for change detection and checkpoints."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
 class DocumentTextExtractor:
     """Handles text extraction from various document formats."""
 
@@ -98,6 +137,158 @@ class DocumentTextExtractor:
                 f"Failed to extract text from file: {e}"
             ) from e
 
+    async def iter_text_from_file(
+        self, document: Document, file_path: Path
+    ) -> AsyncIterator[str]:
+        """Extract text from a document file segment by segment.
+
+        PDFs are yielded page by page and plain text and Markdown files
+        in fixed-size blocks, so the whole text is never held at once.
+        Other formats are yielded as a single segment.
+
+        Args:
+            document: Document model instance
+            file_path: Path to the file on disk
+
+        Yields:
+            Extracted text segments in document order
+
+        Raises:
+            EmbeddingPipelineError: If text extraction fails
+        """
+        try:
+            if document.document_type == DocumentType.PDF:
+                segments = self._iter_pdf_pages_from_file(file_path)
+            elif document.document_type in [
+                DocumentType.TEXT,
+                DocumentType.MARKDOWN,
+            ]:
+                segments = self._iter_text_blocks_from_file(file_path)
+            else:
+                segments = None
+
+            if segments is None:
+                yield await self.extract_text_from_file(
+                    document, file_path
+                )
+                return
+
+            async for segment in segments:
+                yield segment
+
+        except EmbeddingPipelineError:
+            raise
+        except Exception as e:
+            logger.error(
+                "Streaming text extraction from file failed",
+                document_id=document.id,
+                file_path=str(file_path),
+                error=str(e),
+            )
+            raise EmbeddingPipelineError(
+                f"Failed to extract text from file: {e}"
+            ) from e
+
+    def iter_text_sync(
+        self, document_type: DocumentType, file_path: Path
+    ) -> Iterator[str]:
+        """Extract text segments synchronously, for worker processes.
+
+        Yields the same segments as ``iter_text_from_file`` so chunking
+        and ingest checkpoints agree whichever path extracted the file.
+
+        Args:
+            document_type: Type of the document
+            file_path: Path to the file on disk
+
+        Yields:
+            Extracted text segments in document order
+        """
+        if document_type == DocumentType.PDF:
+            yield from self._iter_pdf_pages_sync(file_path)
+        elif document_type in [
+            DocumentType.TEXT,
+            DocumentType.MARKDOWN,
+        ]:
+            encoding = self._detect_text_encoding(file_path)
+            with open(file_path, encoding=encoding) as f:
+                while block := f.read(TEXT_BLOCK_SIZE):
+                    yield block
+        elif document_type in [DocumentType.DOC, DocumentType.DOCX]:
+            yield self._extract_docx_sync_from_file(str(file_path))
+        elif document_type == DocumentType.HTML:
+            yield self._extract_html_sync_from_file(file_path)
+        elif document_type == DocumentType.JSON:
+            yield self._extract_json_sync_from_file(str(file_path))
+        else:
+            yield self._extract_unstructured_sync_from_file(
+                str(file_path)
+            )
+
+    def _iter_pdf_pages_sync(self, file_path: Path) -> Iterator[str]:
+        """Yield PDF text one page at a time."""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            raise EmbeddingPipelineError(
+                "pypdf not available for PDF extraction"
+            ) from None
+
+        separator = ""
+        for page in PdfReader(str(file_path)).pages:
+            text = page.extract_text()
+            if text:
+                yield separator + text
+                separator = "\n"
+
+    async def _iter_pdf_pages_from_file(
+        self, file_path: Path
+    ) -> AsyncIterator[str]:
+        """Yield PDF text one page at a time."""
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            raise EmbeddingPipelineError(
+                "pypdf not available for PDF extraction"
+            ) from None
+
+        reader = await asyncio.to_thread(PdfReader, str(file_path))
+        separator = ""
+        for page in reader.pages:
+            text = await asyncio.to_thread(page.extract_text)
+            if text:
+                yield separator + text
+                separator = "\n"
+
+    async def _iter_text_blocks_from_file(
+        self, file_path: Path
+    ) -> AsyncIterator[str]:
+        """Yield a text file in blocks, decoded as UTF-8 or Latin-1."""
+        encoding = await asyncio.to_thread(
+            self._detect_text_encoding, file_path
+        )
+        with open(file_path, encoding=encoding) as f:
+            while True:
+                block = await asyncio.to_thread(
+                    f.read, TEXT_BLOCK_SIZE
+                )
+                if not block:
+                    break
+                yield block
+
+    @staticmethod
+    def _detect_text_encoding(file_path: Path) -> str:
+        """Return 'utf-8' if the file decodes as UTF-8, else 'latin-1'."""
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            with open(file_path, "rb") as f:
+                while block := f.read(TEXT_BLOCK_SIZE):
+                    decoder.decode(block)
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return "latin-1"
+        return "utf-8"
+
     async def _extract_text_plain_from_file(
         self, file_path: Path
     ) -> str:
@@ -224,6 +415,26 @@ class DocumentTextExtractor:
                 f"HTML extraction failed: {e}"
             ) from e
 
+    def _extract_html_sync_from_file(self, file_path: Path) -> str:
+        """Sync HTML extraction from file path."""
+        try:
+            from unstructured.partition.html import partition_html
+
+            encoding = self._detect_text_encoding(file_path)
+            with open(file_path, encoding=encoding) as f:
+                elements = partition_html(text=f.read())
+            return "\n".join(
+                [e.text for e in elements if hasattr(e, 'text')]
+            )
+        except ImportError:
+            raise EmbeddingPipelineError(
+                "unstructured not available for HTML extraction"
+            ) from None
+        except Exception as e:
+            raise EmbeddingPipelineError(
+                f"HTML extraction failed: {e}"
+            ) from e
+
     async def _extract_text_markdown_from_file(
         self, file_path: Path
     ) -> str:
@@ -321,50 +532,11 @@ class DocumentChunker:
             List of text chunks
         """
         try:
-            from langchain_text_splitters import (
-                RecursiveCharacterTextSplitter,
-            )
-
-            # Choose separators based on document type
-            if document.document_type == DocumentType.MARKDOWN:
-                separators = [
-                    "\n# ",
-                    "\n## ",
-                    "\n### ",
-                    "\n\n",
-                    "\n",
-                    ".",
-                    " ",
-                ]
-            elif document.document_type == DocumentType.HTML:
-                separators = [
-                    "\n\n",
-                    "\n",
-                    "<p>",
-                    "<div>",
-                    "<br>",
-                    ".",
-                    " ",
-                ]
-            else:
-                separators = ["\n\n", "\n", ".", "!", "?", " "]
-
-            splitter = RecursiveCharacterTextSplitter(
-                chunk_size=document.chunk_size,
-                chunk_overlap=document.chunk_overlap,
-                separators=separators,
+            splitter = self._build_splitter(document)
+            filtered_chunks = self._filter_chunks(
+                document, splitter.split_text(text)
             )
 
-            chunks = splitter.split_text(text)
-
-            # Filter out very short chunks
-            min_length = max(50, document.chunk_size // 10)
-            filtered_chunks = [
-                chunk.strip()
-                for chunk in chunks
-                if len(chunk.strip()) >= min_length
-            ]
-
             logger.debug(
                 "Created text chunks",
                 document_id=document.id,
@@ -384,6 +556,262 @@ class DocumentChunker:
                 f"Failed to create chunks: {e}"
             ) from e
 
+    async def iter_chunks(
+        self, document: Document, segments: AsyncIterable[str]
+    ) -> AsyncIterator[str]:
+        """Create text chunks incrementally from streamed text segments.
+
+        Only the unsplit tail of the text is buffered between segments;
+        the last chunk of each split is carried over so chunks can span
+        segment boundaries. Chunking is deterministic for a given
+        segment sequence, which lets interrupted ingests resume.
+
+        Args:
+            document: Document model instance
+            segments: Extracted text segments in document order
+
+        Yields:
+            Text chunks in document order
+        """
+        try:
+            splitter = self._build_splitter(document)
+        except Exception as e:
+            raise EmbeddingPipelineError(
+                f"Failed to create chunks: {e}"
+            ) from e
+
+        buffer = ""
+        async for segment in segments:
+            chunks, buffer = self._split_buffer(
+                document, splitter, buffer + segment
+            )
+            for chunk in chunks:
+                yield chunk
+
+        if buffer:
+            for chunk in self._filter_chunks(
+                document, splitter.split_text(buffer)
+            ):
+                yield chunk
+
+    def split_segments(
+        self, document: Any, segments: Iterable[str]
+    ) -> Iterator[str]:
+        """Create text chunks from text segments synchronously.
+
+        Produces exactly the chunks ``iter_chunks`` would for the same
+        segments, for chunking in worker processes.
+
+        Args:
+            document: Document, or any object with its
+                ``document_type``, ``chunk_size`` and ``chunk_overlap``
+            segments: Extracted text segments in document order
+
+        Yields:
+            Text chunks in document order
+        """
+        splitter = self._build_splitter(document)
+        buffer = ""
+        for segment in segments:
+            chunks, buffer = self._split_buffer(
+                document, splitter, buffer + segment
+            )
+            yield from chunks
+
+        if buffer:
+            yield from self._filter_chunks(
+                document, splitter.split_text(buffer)
+            )
+
+    def _split_buffer(
+        self, document: Any, splitter: Any, buffer: str
+    ) -> tuple[list[str], str]:
+        """Split finished chunks off a buffer.
+
+        Returns:
+            Tuple of (finished chunks, unsplit tail to carry over)
+        """
+        if len(buffer) < 2 * document.chunk_size:
+            return [], buffer
+
+        pieces = splitter.split_text(buffer)
+        if len(pieces) < 2:
+            return [], buffer
+        return self._filter_chunks(document, pieces[:-1]), pieces[-1]
+
+    def _build_splitter(self, document: Document) -> Any:
+        """Build the text splitter for a document's type and settings."""
+        from langchain_text_splitters import (
+            RecursiveCharacterTextSplitter,
+        )
+
+        # Choose separators based on document type
+        if document.document_type == DocumentType.MARKDOWN:
+            separators = [
+                "\n# ",
+                "\n## ",
+                "\n### ",
+                "\n\n",
+                "\n",
+                ".",
+                " ",
+            ]
+        elif document.document_type == DocumentType.HTML:
+            separators = [
+                "\n\n",
+                "\n",
+                "<p>",
+                "<div>",
+                "<br>",
+                ".",
+                " ",
+            ]
+        else:
+            separators = ["\n\n", "\n", ".", "!", "?", " "]
+
+        return RecursiveCharacterTextSplitter(
+            chunk_size=document.chunk_size,
+            chunk_overlap=document.chunk_overlap,
+            separators=separators,
+        )
+
+    def _filter_chunks(
+        self, document: Document, chunks: list[str]
+    ) -> list[str]:
+        """Strip chunks and filter out very short ones."""
+        min_length = max(50, document.chunk_size // 10)
+        return [
+            chunk.strip()
+            for chunk in chunks
+            if len(chunk.strip()) >= min_length
+        ]
+
+
+class _TextPrefix:
+    """The first ``limit`` characters of a stream of text segments."""
+
+    def __init__(self, limit: int):
+        self.limit = max(0, limit)
+        self._parts: list[str] = []
+        self._length = 0
+
+    def add(self, segment: str) -> None:
+        if self._length < self.limit:
+            part = segment[: self.limit - self._length]
+            self._parts.append(part)
+            self._length += len(part)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+
+def extract_and_chunk(
+    file_path: str,
+    document_type: DocumentType,
+    chunk_size: int,
+    chunk_overlap: int,
+    chunks_path: str,
+    text_limit: int,
+) -> tuple[str, int]:
+    """Extract and chunk a file in an ingest worker process.
+
+    Chunks are written to ``chunks_path`` as they are produced, one
+    JSON string per line, so neither the worker nor the caller holds
+    all of them in memory. Takes plain arguments rather than a Document
+    so nothing bound to a database session crosses the process
+    boundary.
+
+    Returns:
+        Tuple of (first ``text_limit`` characters of the extracted
+        text, number of chunks written)
+
+    Raises:
+        EmbeddingPipelineError: If extraction or chunking fails
+    """
+    document = SimpleNamespace(
+        document_type=document_type,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+    )
+    prefix = _TextPrefix(text_limit)
+
+    def segments() -> Iterator[str]:
+        for segment in DocumentTextExtractor().iter_text_sync(
+            document_type, Path(file_path)
+        ):
+            prefix.add(segment)
+            yield segment
+
+    count = 0
+    try:
+        with open(chunks_path, "w", encoding="utf-8") as f:
+            for chunk in DocumentChunker().split_segments(
+                document, segments()
+            ):
+                f.write(json.dumps(chunk) + "\n")
+                count += 1
+    except EmbeddingPipelineError:
+        raise
+    except Exception as e:
+        raise EmbeddingPipelineError(
+            f"Failed to extract and chunk file: {e}"
+        ) from e
+    return prefix.text, count
+
+
+_ITERATIVE_SCAN_MODES = ("strict_order", "relaxed_order")
+
+# Largest hnsw.ef_search pgvector accepts
+_HNSW_MAX_EF_SEARCH = 1000
+
+# Whether the installed pgvector supports iterative index scans (0.8+),
+# looked up once per process
+_iterative_scan_supported: bool | None = None
+
+
+def _owner_filter(owner_id: str) -> Any:
+    """Restrict chunks to documents a user owns or that are public."""
+    return DocumentChunk.document_id.in_(
+        select(Document.id).where(
+            or_(Document.owner_id == owner_id, Document.is_public)
+        )
+    )
+
+
+async def _supports_iterative_scan(session: AsyncSession) -> bool:
+    """Whether pgvector is recent enough for iterative index scans."""
+    global _iterative_scan_supported
+    if _iterative_scan_supported is None:
+        result = await session.execute(
+            text(
+                "SELECT extversion FROM pg_extension "
+                "WHERE extname = 'vector'"
+            )
+        )
+        version = result.scalar_one_or_none()
+        try:
+            parts = tuple(int(p) for p in version.split(".")[:2])
+        except (AttributeError, ValueError):
+            parts = ()
+        _iterative_scan_supported = parts >= (0, 8)
+    return _iterative_scan_supported
+
+
+def _slim_chunk_load() -> Any:
+    """Load only the chunk columns search results need.
+
+    Keeps the embedding vectors, search vector and other metadata out of
+    result materialization.
+    """
+    return load_only(
+        DocumentChunk.id,
+        DocumentChunk.document_id,
+        DocumentChunk.chunk_index,
+        DocumentChunk.content,
+        DocumentChunk.extra_metadata,
+    )
+
 
 class SimpleVectorStore:
     """Simple vector store using direct PGVector."""
@@ -391,6 +819,49 @@ class SimpleVectorStore:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    async def _tune_vector_search(self, limit: int) -> None:
+        """Set HNSW search parameters for the current transaction.
+
+        ``hnsw.ef_search`` is raised to at least ``limit``, up to the
+        largest value pgvector accepts, so the index can return enough
+        rows, and iterative scans let filtered
+        searches keep walking the index until the limit is met instead
+        of returning short when most neighbours belong to other owners.
+
+        Args:
+            limit: Rows the search needs from the index
+        """
+        settings_sql = [
+            func.set_config(
+                "hnsw.ef_search",
+                str(
+                    min(
+                        max(settings.vector_hnsw_ef_search, limit),
+                        _HNSW_MAX_EF_SEARCH,
+                    )
+                ),
+                True,
+            )
+        ]
+        if settings.vector_iterative_scan in _ITERATIVE_SCAN_MODES and (
+            await _supports_iterative_scan(self.session)
+        ):
+            settings_sql.append(
+                func.set_config(
+                    "hnsw.iterative_scan",
+                    settings.vector_iterative_scan,
+                    True,
+                )
+            )
+        await self.session.execute(select(*settings_sql))
+
+    @staticmethod
+    def _index_rows(limit: int) -> int:
+        """Rows a search of ``limit`` results reads from the index."""
+        if settings.vector_search_precision in ("half", "binary"):
+            return limit * max(settings.vector_rescore_factor, 1)
+        return limit
+
     async def store_embeddings(
         self,
         chunks: list[DocumentChunk],
@@ -413,9 +884,6 @@ class SimpleVectorStore:
             )
             if success:
                 await self.session.commit()
-                # Refresh chunks to get updated data
-                for chunk in chunks:
-                    await self.session.refresh(chunk)
             return success
 
         except Exception as e:
@@ -456,11 +924,7 @@ class SimpleVectorStore:
                 chunk_count=len(chunks),
                 provider=metadata.get("provider"),
                 dimensions=metadata.get("dimensions"),
-                hybrid_columns=[
-                    "embedding",
-                    "raw_embedding",
-                    "computed_embedding",
-                ],
+                storage_mode=settings.vector_storage_mode,
             )
 
             return True
@@ -471,12 +935,55 @@ class SimpleVectorStore:
             )
             return False
 
+    async def find_embeddings(
+        self, content_hashes: Iterable[str], provider: str, model: str
+    ) -> dict[str, list[float]]:
+        """Find stored vectors for chunk contents.
+
+        Only vectors made by the given provider and model are returned,
+        so they can be copied in place of embedding the text again.
+
+        Args:
+            content_hashes: Content hashes of the chunks to embed
+            provider: Embedding provider name
+            model: Embedding model identity
+
+        Returns:
+            Vectors at their original dimension by content hash
+        """
+        hashes = set(content_hashes)
+        if not hashes:
+            return {}
+        result = await self.session.execute(
+            select(
+                DocumentChunk.content_hash,
+                DocumentChunk.embedding,
+                DocumentChunk.raw_embedding,
+                DocumentChunk.raw_dim,
+            )
+            .where(
+                DocumentChunk.content_hash.in_(hashes),
+                DocumentChunk.embedding_provider == provider,
+                DocumentChunk.embedding_model == model,
+                DocumentChunk.embedding.is_not(None),
+            )
+            .distinct(DocumentChunk.content_hash)
+        )
+        vectors = {}
+        for row in result:
+            # Rows carry the columns get_raw_embedding reads
+            vector = DocumentChunk.get_raw_embedding(row)
+            if vector is not None:
+                vectors[row.content_hash] = vector
+        return vectors
+
     async def search_similar(
         self,
         query_embedding: list[float],
         limit: int = 10,
         document_ids: list[str] | None = None,
         prefer_exact_match: bool = True,
+        owner_id: str | None = None,
     ) -> list[tuple[DocumentChunk, float]]:
         """Search for similar chunks using hybrid vector search.
 
@@ -485,6 +992,8 @@ class SimpleVectorStore:
             limit: Maximum results
             document_ids: Optional document ID filter
             prefer_exact_match: Whether to prefer exact dimension matches
+            owner_id: Only search documents this user owns or that are
+                public
 
         Returns:
             List of (chunk, similarity_score) tuples
@@ -506,143 +1015,344 @@ class SimpleVectorStore:
                 prepared_dim=len(prepared_query),
             )
 
-            # Build base query
-            query = select(DocumentChunk)
+            filters = []
 
             # Apply document filter if provided
             if document_ids:
-                query = query.where(
-                    DocumentChunk.document_id.in_(document_ids)
-                )
+                filters.append(DocumentChunk.document_id.in_(document_ids))
+            if owner_id:
+                filters.append(_owner_filter(owner_id))
 
             # Apply dimension filter for exact matches
             if prefer_exact_match and search_column == 'raw_embedding':
-                query = query.where(
+                filters.append(
                     DocumentChunk.raw_dim == len(query_embedding)
                 )
 
-            # Filter out chunks without the required embedding column
-            if search_column == 'embedding':
-                query = query.where(
-                    DocumentChunk.embedding.is_not(None)
-                )
-            elif search_column == 'computed_embedding':
-                query = query.where(
-                    DocumentChunk.computed_embedding.is_not(None)
+            if search_column == 'raw_embedding':
+                # raw_embedding is JSON and cannot be indexed; order by
+                # the normalized column, whose cosine distance matches
+                # the raw vectors' for dimensions up to 1536
+                order_column = search_helper.normalized_column()
+                logger.debug(
+                    "Falling back to normalized column for raw_embedding search",
+                    order_column=order_column,
                 )
-            elif search_column == 'raw_embedding':
-                query = query.where(
-                    DocumentChunk.raw_embedding.is_not(None)
+                prepared_query = search_helper.prepare_query_vector(
+                    query_embedding, order_column
                 )
-
-            # Add vector similarity ordering using the appropriate column
-            if search_column == 'embedding':
-                query = query.order_by(
-                    DocumentChunk.embedding.cosine_distance(
-                        prepared_query
-                    )
-                ).limit(limit)
-            elif search_column == 'computed_embedding':
-                query = query.order_by(
-                    DocumentChunk.computed_embedding.cosine_distance(
-                        prepared_query
-                    )
-                ).limit(limit)
             else:
-                # For raw_embedding, we need to use a different approach since it's JSON
-                # Fall back to computed_embedding for consistent indexing
-                logger.debug(
-                    "Falling back to computed_embedding for raw_embedding search"
+                order_column = search_column
+
+            nearest = self._vector_candidates(
+                getattr(DocumentChunk, order_column),
+                prepared_query,
+                filters,
+                limit,
+            )
+            query = (
+                select(DocumentChunk, nearest.c.distance)
+                .join(nearest, DocumentChunk.id == nearest.c.id)
+                .options(_slim_chunk_load())
+                .order_by(nearest.c.distance)
+            )
+
+            # Cosine similarity is computed in SQL; zero-padding keeps
+            # it equal to the raw vectors' similarity
+            await self._tune_vector_search(
+                self._index_rows(limit)
+            )
+            result = await self.session.execute(query)
+            results = [
+                (chunk, 1.0 - float(distance))
+                for chunk, distance in result.all()
+            ]
+
+            logger.debug(
+                "Hybrid vector search completed",
+                results_count=len(results),
+                search_column=search_column,
+            )
+            return results
+
+        except Exception as e:
+            logger.error("Hybrid vector search failed", error=str(e))
+            return []
+
+    def _vector_candidates(
+        self,
+        vector_column: Any,
+        query_vector: list[float],
+        filters: list[Any],
+        limit: int,
+        precision: str | None = None,
+        rescore_factor: int | None = None,
+        name: str = "nearest",
+    ) -> Any:
+        """Select the nearest chunk ids with full-precision cosine distance.
+
+        With 'half' or 'binary' precision the quantized HNSW index picks
+        ``limit * rescore_factor`` candidates, which are then reordered
+        by full-precision distance.
+
+        Args:
+            vector_column: 1536-dim vector column to search
+            query_vector: Query vector prepared for the column
+            filters: Extra WHERE clauses
+            limit: Number of rows to keep
+            precision: 'full', 'half' or 'binary'; defaults to settings
+            rescore_factor: Quantized candidates per row; defaults to
+                settings
+            name: Subquery name
+
+        Returns:
+            Subquery with ``id`` and ``distance`` columns
+        """
+        precision = precision or settings.vector_search_precision
+        distance = vector_column.cosine_distance(query_vector)
+        nearest = select(DocumentChunk.id, distance.label("distance")).where(
+            vector_column.is_not(None), *filters
+        )
+
+        if precision not in ("half", "binary"):
+            return nearest.order_by(distance).limit(limit).subquery(name)
+
+        rescore_factor = rescore_factor or settings.vector_rescore_factor
+        candidates = (
+            nearest.order_by(
+                HybridVectorSearchHelper.quantized_distance(
+                    vector_column, query_vector, precision
                 )
-                # Re-prepare query vector for computed_embedding (1536 dimensions)
-                prepared_query = search_helper.prepare_query_vector(
-                    query_embedding, 'computed_embedding'
+            )
+            .limit(limit * max(rescore_factor, 1))
+            .subquery(f"{name}_candidates")
+        )
+        return (
+            select(candidates.c.id, candidates.c.distance)
+            .order_by(candidates.c.distance)
+            .limit(limit)
+            .subquery(name)
+        )
+
+    def _build_hybrid_query(
+        self,
+        query_text: str,
+        query_embedding: list[float],
+        limit: int,
+        document_ids: list[str] | None = None,
+        vector_weight: float = 1.0,
+        keyword_weight: float = 1.0,
+        rrf_k: int = 60,
+        candidate_limit: int | None = None,
+        owner_id: str | None = None,
+    ) -> Select:
+        """Build the single-statement hybrid retrieval query.
+
+        The vector leg orders by cosine distance (HNSW), the keyword leg
+        by ts_rank over the GIN-indexed search vector. Each leg keeps its
+        top candidates and both are fused with reciprocal rank fusion:
+        ``score = sum(weight / (rrf_k + rank))``.
+        """
+        candidate_limit = candidate_limit or limit * 4
+
+        search_helper = HybridVectorSearchHelper()
+        search_column = search_helper.choose_search_column(
+            query_embedding, prefer_exact_match=False
+        )
+        vector_column = getattr(DocumentChunk, search_column)
+        query_vector = search_helper.prepare_query_vector(
+            query_embedding, search_column
+        )
+
+        filters = []
+        if document_ids:
+            filters.append(DocumentChunk.document_id.in_(document_ids))
+        if owner_id:
+            filters.append(_owner_filter(owner_id))
+
+        # Vector leg: nearest neighbours, ranked by distance
+        vector_hits = self._vector_candidates(
+            vector_column,
+            query_vector,
+            filters,
+            candidate_limit,
+            name="vector_hits",
+        )
+        vector_leg = select(
+            vector_hits.c.id,
+            func.row_number()
+            .over(order_by=vector_hits.c.distance)
+            .label("rank"),
+        ).cte("vector_leg")
+
+        vector_score = literal(vector_weight) / (
+            rrf_k + vector_leg.c.rank
+        )
+
+        tsquery = text_search.any_words_tsquery(query_text)
+        if tsquery is None or keyword_weight <= 0:
+            fused = select(
+                vector_leg.c.id.label("id"),
+                vector_score.label("score"),
+            ).cte("fused")
+        else:
+            # Keyword leg: full-text matches, ranked by ts_rank
+            keyword_rank = text_search.rank(
+                DocumentChunk.search_vector, tsquery
+            )
+            keyword_hits = (
+                select(DocumentChunk.id, keyword_rank.label("ts_rank"))
+                .where(
+                    text_search.matches(
+                        DocumentChunk.search_vector, tsquery
+                    ),
+                    *filters,
                 )
-                query = query.where(
-                    DocumentChunk.computed_embedding.is_not(None)
+                .order_by(keyword_rank.desc())
+                .limit(candidate_limit)
+                .subquery("keyword_hits")
+            )
+            keyword_leg = select(
+                keyword_hits.c.id,
+                func.row_number()
+                .over(order_by=keyword_hits.c.ts_rank.desc())
+                .label("rank"),
+            ).cte("keyword_leg")
+
+            keyword_score = literal(keyword_weight) / (
+                rrf_k + keyword_leg.c.rank
+            )
+            fused = (
+                select(
+                    func.coalesce(vector_leg.c.id, keyword_leg.c.id).label(
+                        "id"
+                    ),
+                    (
+                        func.coalesce(vector_score, 0.0)
+                        + func.coalesce(keyword_score, 0.0)
+                    ).label("score"),
                 )
-                query = query.order_by(
-                    DocumentChunk.computed_embedding.cosine_distance(
-                        prepared_query
+                .select_from(
+                    vector_leg.join(
+                        keyword_leg,
+                        vector_leg.c.id == keyword_leg.c.id,
+                        full=True,
                     )
-                ).limit(limit)
+                )
+                .cte("fused")
+            )
 
-            result = await self.session.execute(query)
-            chunks = result.scalars().all()
+        return (
+            select(DocumentChunk, fused.c.score)
+            .join(fused, DocumentChunk.id == fused.c.id)
+            .options(_slim_chunk_load())
+            .order_by(fused.c.score.desc(), DocumentChunk.id)
+            .limit(limit)
+        )
 
-            # Calculate similarity scores using the appropriate embedding
-            results = []
-            for chunk in chunks:
-                embedding_vector = None
-
-                if search_column == 'embedding' and chunk.embedding:
-                    embedding_vector = chunk.embedding
-                elif (
-                    search_column == 'computed_embedding'
-                    and chunk.computed_embedding
-                ):
-                    embedding_vector = chunk.computed_embedding
-                elif (
-                    search_column == 'raw_embedding'
-                    and chunk.raw_embedding
-                ):
-                    embedding_vector = chunk.raw_embedding
-                elif chunk.computed_embedding:
-                    # Fallback to computed_embedding
-                    embedding_vector = chunk.computed_embedding
-
-                if embedding_vector:
-                    # Calculate cosine similarity
-                    import numpy as np
-
-                    chunk_vec = np.array(embedding_vector)
-                    query_vec = np.array(prepared_query)
-
-                    # Ensure vectors have the same dimension for similarity calculation
-                    if len(chunk_vec) != len(query_vec):
-                        if search_column == 'raw_embedding':
-                            # Use original query for raw embedding comparison
-                            query_vec = np.array(query_embedding)
-                            if len(chunk_vec) != len(query_vec):
-                                continue  # Skip mismatched dimensions
-                        else:
-                            continue  # Skip mismatched dimensions
-
-                    # Cosine similarity
-                    similarity = np.dot(chunk_vec, query_vec) / (
-                        np.linalg.norm(chunk_vec)
-                        * np.linalg.norm(query_vec)
-                    )
+    async def hybrid_search(
+        self,
+        query_text: str,
+        query_embedding: list[float],
+        limit: int = 10,
+        document_ids: list[str] | None = None,
+        vector_weight: float = 1.0,
+        keyword_weight: float = 1.0,
+        rrf_k: int = 60,
+        candidate_limit: int | None = None,
+        owner_id: str | None = None,
+    ) -> list[tuple[DocumentChunk, float]]:
+        """Search chunks by vector similarity and keywords together.
 
-                    results.append((chunk, float(similarity)))
+        Both legs and the reciprocal rank fusion run in one SQL round
+        trip.
+
+        Args:
+            query_text: Query text for the keyword leg
+            query_embedding: Query embedding for the vector leg
+            limit: Maximum results
+            document_ids: Optional document ID filter
+            vector_weight: Weight of the vector leg
+            keyword_weight: Weight of the keyword leg (0 disables it)
+            rrf_k: Reciprocal rank fusion smoothing constant
+            candidate_limit: Candidates per leg (defaults to 4x limit)
+            owner_id: Only search documents this user owns or that are
+                public
+
+        Returns:
+            List of (chunk, fused_score) tuples, best first
+        """
+        try:
+            query = self._build_hybrid_query(
+                query_text,
+                query_embedding,
+                limit,
+                document_ids=document_ids,
+                vector_weight=vector_weight,
+                keyword_weight=keyword_weight,
+                rrf_k=rrf_k,
+                candidate_limit=candidate_limit,
+                owner_id=owner_id,
+            )
+            await self._tune_vector_search(
+                self._index_rows(candidate_limit or limit * 4)
+            )
+            result = await self.session.execute(query)
+            results = [
+                (chunk, float(score)) for chunk, score in result.all()
+            ]
 
             logger.debug(
-                "Hybrid vector search completed",
+                "Hybrid keyword/vector search completed",
                 results_count=len(results),
-                search_column=search_column,
+                vector_weight=vector_weight,
+                keyword_weight=keyword_weight,
             )
             return results
 
         except Exception as e:
-            logger.error("Hybrid vector search failed", error=str(e))
+            logger.error("Hybrid keyword/vector search failed", error=str(e))
             return []
 
 
 class EmbeddingPipeline:
     """Main embedding pipeline coordinator."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        offload: Callable[..., Awaitable[Any]] | None = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            session: Database session
+            offload: Runs a function and its arguments out of process,
+                e.g. ``IngestScheduler.run_in_pool``; when given, files
+                are extracted and chunked by ``extract_and_chunk``
+                through it, spooling chunks to a temporary file,
+                instead of being streamed in this process
+        """
         self.session = session
+        self.offload = offload
         self.text_extractor = DocumentTextExtractor()
         self.chunker = DocumentChunker()
         self.embedding_service = EmbeddingService(session)
         self.vector_store = SimpleVectorStore(session)
+        # Seconds spent per stage by the last processed document
+        self.stage_timings: dict[str, float] = {}
+        self._embedding_identity: tuple[str, str] | None = None
 
     async def process_document_from_file(
         self, document_id: str, file_path: Path
     ) -> bool:
         """Process a document through the complete embedding pipeline using file path.
 
+        Text is extracted and chunked as a stream; chunks are embedded and
+        inserted in micro-batches of ``ingest_batch_size``, each committed
+        on its own. Committed batches are the checkpoint: processing a
+        document that already has chunks resumes after the last one.
+
         Args:
             document_id: Document ID to process
             file_path: Path to the file on disk (memory efficient)
@@ -667,6 +1377,13 @@ class EmbeddingPipeline:
                     f"File not found: {file_path}"
                 )
 
+            resume_from, checkpoint_hash = await self._load_checkpoint(
+                document
+            )
+            self.stage_timings = dict.fromkeys(
+                ("extract", "embed", "store"), 0.0
+            )
+
             # Update status
             document.status = DocumentStatus.PROCESSING
             document.processing_started_at = datetime.now(UTC)
@@ -674,94 +1391,68 @@ class EmbeddingPipeline:
             await self.session.commit()
 
             logger.info(
-                "Starting memory-efficient document processing",
+                "Starting streaming document processing",
                 document_id=document_id,
                 file_path=str(file_path),
                 file_size=file_path.stat().st_size,
+                resume_from=resume_from,
             )
 
-            # Step 1: Extract text from file (memory efficient)
-            text = await self.text_extractor.extract_text_from_file(
-                document, file_path
-            )
-            if not text.strip():
-                raise EmbeddingPipelineError(
-                    "No text extracted from document"
-                )
+            copied = None
+            if not resume_from:
+                copied = await self._copy_duplicate_chunks(document)
 
-            document.extracted_text = text
-            await self.session.commit()
+            if copied is not None:
+                chunk_count, text = copied
+            else:
+                try:
+                    chunk_count, text = await self._ingest_stream(
+                        document,
+                        file_path,
+                        resume_from,
+                        checkpoint_hash,
+                    )
+                except _CheckpointMismatchError:
+                    logger.warning(
+                        "Ingest checkpoint does not match document, "
+                        "restarting",
+                        document_id=document_id,
+                        resume_from=resume_from,
+                    )
+                    await self._discard_chunks(document)
+                    chunk_count, text = await self._ingest_stream(
+                        document, file_path, 0, None
+                    )
 
-            # Step 2: Create chunks
-            chunk_texts = self.chunker.create_chunks(document, text)
-            if not chunk_texts:
+            # Chunks hold stripped text, so any chunk means text was
+            # found; the stored text is only a prefix
+            if not chunk_count:
                 raise EmbeddingPipelineError(
                     "No chunks created from text"
+                    if text.strip()
+                    else "No text extracted from document"
                 )
 
-            # Step 3: Store chunks in database
-            chunks = []
-            for i, chunk_text in enumerate(chunk_texts):
-                chunk = DocumentChunk(
-                    document_id=document.id,
-                    content=chunk_text,
-                    chunk_index=i,
-                    content_hash=hashlib.sha256(
-                        chunk_text.encode()
-                    ).hexdigest(),
-                    token_count=len(
-                        chunk_text.split()
-                    ),  # Simple approximation
-                )
-                chunks.append(chunk)
-                self.session.add(chunk)
-
-            # Flush to get chunk IDs but don't commit yet
-            await self.session.flush()
-
-            # Refresh chunks to get IDs
-            for chunk in chunks:
-                await self.session.refresh(chunk)
-
-            # Step 4: Generate embeddings
-            (
-                embeddings,
-                metadata,
-            ) = await self.embedding_service.generate_embeddings(
-                chunk_texts
-            )
-
-            # Step 5: Store embeddings (without committing in vector store)
-            success = (
-                await self.vector_store.store_embeddings_no_commit(
-                    chunks, embeddings, metadata
-                )
-            )
-            if not success:
-                raise EmbeddingPipelineError(
-                    "Failed to store embeddings"
-                )
-
-            # Update document status and commit everything at once
+            # Update document status
+            document.extracted_text = text
             document.status = DocumentStatus.PROCESSED
             document.processing_completed_at = datetime.now(UTC)
-            document.chunk_count = len(chunks)
-
-            # Single commit for all operations
+            document.chunk_count = chunk_count
             await self.session.commit()
 
             logger.info(
-                "Memory-efficient document processing completed",
+                "Streaming document processing completed",
                 document_id=document_id,
-                chunks=len(chunks),
-                text_length=len(text),
+                chunks=chunk_count,
+                resumed_chunks=resume_from,
+                stored_text_length=len(text),
                 file_size=file_path.stat().st_size,
             )
 
             return True
 
         except Exception as e:
-            # Mark as failed and rollback
+            # Mark as failed; committed batches are kept for resuming
             try:
                 # Rollback any pending changes first
                 await self.session.rollback()
@@ -785,18 +1476,387 @@ class EmbeddingPipeline:
                 )
 
             logger.error(
-                "Memory-efficient document processing failed",
+                "Streaming document processing failed",
                 document_id=document_id,
                 error=str(e),
             )
             return False
 
+    async def _ingest_stream(
+        self,
+        document: Document,
+        file_path: Path,
+        resume_from: int,
+        checkpoint_hash: str | None,
+    ) -> tuple[int, str]:
+        """Stream a file through extraction, chunking, embedding and storage.
+
+        A producer task extracts and chunks the file into batches on a
+        bounded queue; the consumer embeds and commits one batch at a
+        time, so extraction never runs more than
+        ``ingest_max_pending_batches`` batches ahead. With ``offload``
+        the file is extracted and chunked out of process into a spool
+        file first, which is then read back batch by batch.
+
+        Args:
+            document: Document being processed
+            file_path: Path to the file on disk
+            resume_from: Number of chunks already committed
+            checkpoint_hash: Content hash of the last committed chunk
+
+        Returns:
+            Tuple of (total chunk count, extracted text truncated to
+            ``ingest_extracted_text_max_chars``)
+
+        Raises:
+            _CheckpointMismatchError: If the committed chunks do not match
+                the regenerated ones
+        """
+        batch_size = max(1, settings.ingest_batch_size)
+        queue: asyncio.Queue[Any] = asyncio.Queue(
+            maxsize=max(1, settings.ingest_max_pending_batches)
+        )
+        # Only a bounded prefix of the text is kept for the document
+        prefix = _TextPrefix(settings.ingest_extracted_text_max_chars)
+
+        async def segments() -> AsyncIterator[str]:
+            async for segment in self.text_extractor.iter_text_from_file(
+                document, file_path
+            ):
+                prefix.add(segment)
+                yield segment
+
+        async def offloaded_chunks() -> AsyncIterator[str]:
+            import aiofiles
+
+            # The worker spools chunks to disk; they are read back
+            # one at a time as the consumer makes room
+            fd, chunks_path = tempfile.mkstemp(
+                prefix="chatter-chunks-", suffix=".jsonl"
+            )
+            os.close(fd)
+            try:
+                text, _ = await self.offload(
+                    extract_and_chunk,
+                    str(file_path),
+                    document.document_type,
+                    document.chunk_size,
+                    document.chunk_overlap,
+                    chunks_path,
+                    prefix.limit,
+                )
+                prefix.add(text)
+                async with aiofiles.open(
+                    chunks_path, encoding="utf-8"
+                ) as f:
+                    async for line in f:
+                        yield json.loads(line)
+            finally:
+                with suppress(FileNotFoundError):
+                    os.remove(chunks_path)
+
+        async def produce() -> None:
+            if self.offload is not None:
+                chunks = offloaded_chunks()
+            else:
+                chunks = self.chunker.iter_chunks(document, segments())
+
+            # Time spent waiting for queue space is not extraction
+            mark = time.perf_counter()
+
+            async def put(item: list[tuple[int, str]] | None) -> None:
+                nonlocal mark
+                self._add_stage_time(
+                    "extract", time.perf_counter() - mark
+                )
+                await queue.put(item)
+                mark = time.perf_counter()
+
+            try:
+                index = 0
+                batch: list[tuple[int, str]] = []
+                async with aclosing(chunks):
+                    async for chunk_text in chunks:
+                        if index < resume_from:
+                            # Already committed; verify the last one
+                            if (
+                                index == resume_from - 1
+                                and _content_hash(chunk_text)
+                                != checkpoint_hash
+                            ):
+                                raise _CheckpointMismatchError()
+                            index += 1
+                            continue
+
+                        batch.append((index, chunk_text))
+                        index += 1
+                        if len(batch) >= batch_size:
+                            await put(batch)
+                            batch = []
+
+                if index < resume_from:
+                    raise _CheckpointMismatchError()
+                if batch:
+                    await put(batch)
+                await put(None)
+            except Exception as e:
+                await queue.put(e)
+
+        producer = asyncio.create_task(produce())
+        chunk_count = resume_from
+        try:
+            while (batch := await queue.get()) is not None:
+                if isinstance(batch, Exception):
+                    raise batch
+                await self._store_chunk_batch(document, batch)
+                chunk_count += len(batch)
+        finally:
+            if not producer.done():
+                producer.cancel()
+                with suppress(asyncio.CancelledError):
+                    await producer
+
+        return chunk_count, prefix.text
+
+    async def _store_chunk_batch(
+        self, document: Document, batch: list[tuple[int, str]]
+    ) -> None:
+        """Embed and insert one micro-batch of chunks and commit it.
+
+        Chunks whose content is already stored with the current
+        embedding model copy that vector; only the rest are sent to the
+        provider. Embeddings are generated before anything is added to
+        the session, so no transaction is held open during provider
+        calls.
+        """
+        started = time.perf_counter()
+        chunks = [
+            DocumentChunk(
+                document_id=document.id,
+                content=chunk_text,
+                chunk_index=index,
+                content_hash=_content_hash(chunk_text),
+                token_count=len(
+                    chunk_text.split()
+                ),  # Simple approximation
+            )
+            for index, chunk_text in batch
+        ]
+
+        provider, model = await self._get_embedding_identity()
+        vectors = await self.vector_store.find_embeddings(
+            (chunk.content_hash for chunk in chunks), provider, model
+        )
+        missing = [
+            chunk
+            for chunk in chunks
+            if chunk.content_hash not in vectors
+        ]
+        metadata: dict[str, Any] = {
+            "provider": provider,
+            "model": model,
+        }
+        if missing:
+            (
+                embeddings,
+                metadata,
+            ) = await self.embedding_service.generate_embeddings(
+                [chunk.content for chunk in missing]
+            )
+            for chunk, embedding in zip(
+                missing, embeddings, strict=True
+            ):
+                vectors[chunk.content_hash] = embedding
+        if len(missing) < len(chunks):
+            logger.debug(
+                "Reused stored chunk embeddings",
+                document_id=document.id,
+                reused=len(chunks) - len(missing),
+                embedded=len(missing),
+            )
+        stored = time.perf_counter()
+        self._add_stage_time("embed", stored - started)
+
+        success = await self.vector_store.store_embeddings_no_commit(
+            chunks,
+            [vectors[chunk.content_hash] for chunk in chunks],
+            metadata,
+        )
+        if not success:
+            raise EmbeddingPipelineError("Failed to store embeddings")
+
+        self.session.add_all(chunks)
+        document.chunk_count = chunks[-1].chunk_index + 1
+        await self.session.commit()
+        self._add_stage_time("store", time.perf_counter() - stored)
+
+        # Committed rows are not needed again; keep the session small
+        for chunk in chunks:
+            self.session.expunge(chunk)
+
+    async def _get_embedding_identity(self) -> tuple[str, str]:
+        """Get the provider and model embedding this document."""
+        if self._embedding_identity is None:
+            self._embedding_identity = (
+                await self.embedding_service.get_model_identity()
+            )
+        return self._embedding_identity
+
+    async def _copy_duplicate_chunks(
+        self, document: Document
+    ) -> tuple[int, str] | None:
+        """Copy chunks and embeddings from an identical processed file.
+
+        A source must have the same file hash, type and chunking
+        settings, so its chunks are exactly what processing would
+        produce, and every chunk must be embedded with the current
+        model. Copies are committed in micro-batches like streamed
+        chunks, so an interrupted copy resumes through the checkpoint.
+
+        Returns:
+            Tuple of (chunk count, extracted text), or None if there is
+            no usable source
+        """
+        provider, model = await self._get_embedding_identity()
+        stale_chunks = select(DocumentChunk.id).where(
+            DocumentChunk.document_id == Document.id,
+            or_(
+                DocumentChunk.embedding_provider.is_distinct_from(
+                    provider
+                ),
+                DocumentChunk.embedding_model.is_distinct_from(model),
+            ),
+        )
+        result = await self.session.execute(
+            select(Document.id, Document.extracted_text)
+            .where(
+                Document.file_hash == document.file_hash,
+                Document.id != document.id,
+                Document.status == DocumentStatus.PROCESSED,
+                Document.document_type == document.document_type,
+                Document.chunk_size == document.chunk_size,
+                Document.chunk_overlap == document.chunk_overlap,
+                Document.chunk_count > 0,
+                Document.extracted_text.is_not(None),
+                ~exists(stale_chunks),
+            )
+            .limit(1)
+        )
+        source = result.first()
+        if source is None:
+            return None
+
+        started = time.perf_counter()
+        batch_size = max(1, settings.ingest_batch_size)
+        chunk_count = 0
+        while True:
+            result = await self.session.execute(
+                select(
+                    DocumentChunk.chunk_index,
+                    DocumentChunk.content,
+                    DocumentChunk.content_hash,
+                    DocumentChunk.token_count,
+                    DocumentChunk.embedding,
+                    DocumentChunk.raw_embedding,
+                    DocumentChunk.raw_dim,
+                )
+                .where(
+                    DocumentChunk.document_id == source.id,
+                    DocumentChunk.chunk_index >= chunk_count,
+                )
+                .order_by(DocumentChunk.chunk_index)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                break
+
+            chunks = []
+            for row in rows:
+                chunk = DocumentChunk(
+                    document_id=document.id,
+                    content=row.content,
+                    chunk_index=row.chunk_index,
+                    content_hash=row.content_hash,
+                    token_count=row.token_count,
+                )
+                chunk.set_embedding_vector(
+                    vector=DocumentChunk.get_raw_embedding(row),
+                    provider=provider,
+                    model=model,
+                )
+                chunks.append(chunk)
+
+            self.session.add_all(chunks)
+            chunk_count = chunks[-1].chunk_index + 1
+            document.chunk_count = chunk_count
+            await self.session.commit()
+            for chunk in chunks:
+                self.session.expunge(chunk)
+
+        self._add_stage_time("store", time.perf_counter() - started)
+        logger.info(
+            "Copied chunks from identical document",
+            document_id=document.id,
+            source_document_id=source.id,
+            chunks=chunk_count,
+        )
+        return chunk_count, source.extracted_text or ""
+
+    def _add_stage_time(self, stage: str, seconds: float) -> None:
+        self.stage_timings[stage] = (
+            self.stage_timings.get(stage, 0.0) + seconds
+        )
+
+    async def _load_checkpoint(
+        self, document: Document
+    ) -> tuple[int, str | None]:
+        """Find where a previous ingest of the document stopped.
+
+        Returns:
+            Tuple of (committed chunk count, content hash of the last
+            committed chunk); (0, None) when starting from scratch
+        """
+        result = await self.session.execute(
+            select(
+                func.count(DocumentChunk.id),
+                func.max(DocumentChunk.chunk_index),
+            ).where(DocumentChunk.document_id == document.id)
+        )
+        count, last_index = result.one()
+        if not count:
+            return 0, None
+
+        if last_index != count - 1:
+            # Not a contiguous prefix; cannot resume safely
+            await self._discard_chunks(document)
+            return 0, None
+
+        checkpoint_hash = await self.session.scalar(
+            select(DocumentChunk.content_hash).where(
+                DocumentChunk.document_id == document.id,
+                DocumentChunk.chunk_index == last_index,
+            )
+        )
+        return count, checkpoint_hash
+
+    async def _discard_chunks(self, document: Document) -> None:
+        """Delete all stored chunks of a document."""
+        await self.session.execute(
+            delete(DocumentChunk).where(
+                DocumentChunk.document_id == document.id
+            )
+        )
+        document.chunk_count = 0
+        await self.session.commit()
+
     async def search_documents(
         self,
         query: str,
         limit: int = 10,
         document_ids: list[str] | None = None,
         prefer_exact_match: bool = True,
+        owner_id: str | None = None,
     ) -> list[tuple[DocumentChunk, float]]:
         """Search documents using hybrid semantic similarity.
 
@@ -805,6 +1865,8 @@ class EmbeddingPipeline:
             limit: Maximum results
             document_ids: Optional document filter
             prefer_exact_match: Whether to prefer exact dimension matches
+            owner_id: Only search documents this user owns or that are
+                public
 
         Returns:
             List of (chunk, similarity_score) tuples
@@ -821,7 +1883,11 @@ class EmbeddingPipeline:
 
             # Search vector store using hybrid search
             results = await self.vector_store.search_similar(
-                query_embedding, limit, document_ids, prefer_exact_match
+                query_embedding,
+                limit,
+                document_ids,
+                prefer_exact_match,
+                owner_id=owner_id,
             )
 
             logger.info(
@@ -6,6 +6,7 @@ recursion detection, progress tracking, and per-tool type limits.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from collections import Counter, defaultdict
 from typing import Any
@@ -30,6 +31,9 @@ class ToolExecutionConfig:
         enable_recursion_detection: bool = True,
         recursion_strategy: str = "adaptive",  # "strict", "adaptive", "lenient"
         timeout_seconds: int = 30,
+        tool_timeouts: dict[str, float] | None = None,
+        parallel_execution: bool = True,
+        max_parallel_calls: int = 4,
     ):
         self.max_total_calls = max_total_calls
         self.max_calls_per_tool = max_calls_per_tool or {}
@@ -38,6 +42,13 @@ class ToolExecutionConfig:
         self.enable_recursion_detection = enable_recursion_detection
         self.recursion_strategy = recursion_strategy
         self.timeout_seconds = timeout_seconds
+        self.tool_timeouts = tool_timeouts or {}
+        self.parallel_execution = parallel_execution
+        self.max_parallel_calls = max(1, max_parallel_calls)
+
+    def get_timeout(self, tool_name: str) -> float:
+        """Get the timeout in seconds for a tool (0 disables it)."""
+        return self.tool_timeouts.get(tool_name, self.timeout_seconds)
 
 
 class ToolExecutionTracker:
@@ -281,33 +292,47 @@ class EnhancedToolExecutor:
                 context, tracker, reason
             )
 
+        tool_calls = list(last_message.tool_calls)
+        if self.config.parallel_execution and len(tool_calls) > 1:
+            outcomes = await self._run_tools_concurrently(
+                tool_calls, tools, user_id
+            )
+        else:
+            outcomes = []
+            for tool_call in tool_calls:
+                try:
+                    outcomes.append(
+                        await self._run_tool(tool_call, tools, user_id)
+                    )
+                except Exception as e:
+                    outcomes.append(e)
+
+        # Record in tool call order so the tracker sees the same
+        # history regardless of which call finished first
         tool_messages = []
         execution_results = []
 
-        for tool_call in last_message.tool_calls:
-            try:
-                result = await self._execute_single_tool(
-                    tool_call, tools, tracker, user_id
+        for tool_call, outcome in zip(tool_calls, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Tool execution error: {outcome}")
+                tool_messages.append(
+                    ToolMessage(
+                        content=f"Error executing tool: {str(outcome)}",
+                        tool_call_id=tool_call.get("id", ""),
+                    )
                 )
-                tool_messages.append(result["message"])
-                execution_results.append(result["execution_info"])
-
-            except Exception as e:
-                logger.error(f"Tool execution error: {e}")
-                error_message = ToolMessage(
-                    content=f"Error executing tool: {str(e)}",
-                    tool_call_id=tool_call.get("id", ""),
-                )
-                tool_messages.append(error_message)
-
-                # Record the error
                 tracker.record_tool_call(
                     tool_name=tool_call.get("name", "unknown"),
                     args=tool_call.get("args", {}),
-                    result=f"Error: {str(e)}",
+                    result=f"Error: {str(outcome)}",
                     execution_time_ms=0,
                     success=False,
                 )
+                continue
+
+            result = self._record_outcome(outcome, tracker)
+            tool_messages.append(result["message"])
+            execution_results.append(result["execution_info"])
 
         # Update context with tracker and execution info
         updated_metadata = {
@@ -335,6 +360,44 @@ class EnhancedToolExecutor:
         user_id: str | None = None,
     ) -> dict[str, Any]:
         """Execute a single tool call with timing and tracking."""
+        outcome = await self._run_tool(tool_call, tools, user_id)
+        return self._record_outcome(outcome, tracker)
+
+    async def _run_tools_concurrently(
+        self,
+        tool_calls: list[dict[str, Any]],
+        tools: list[Any],
+        user_id: str | None = None,
+    ) -> list[dict[str, Any] | Exception]:
+        """Run a turn's tool calls concurrently, bounded per turn.
+
+        Results are returned in the order of ``tool_calls``; unexpected
+        errors are returned in place rather than raised.
+        """
+        semaphore = asyncio.Semaphore(self.config.max_parallel_calls)
+
+        async def run(tool_call: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._run_tool(tool_call, tools, user_id)
+
+        results = await asyncio.gather(
+            *(run(tool_call) for tool_call in tool_calls),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, Exception
+            ):
+                raise result
+        return results
+
+    async def _run_tool(
+        self,
+        tool_call: dict[str, Any],
+        tools: list[Any],
+        user_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Invoke a tool call with timing, without touching the tracker."""
         tool_name = tool_call.get("name", "")
         tool_args = tool_call.get("args", {})
         tool_id = tool_call.get("id", "")
@@ -342,87 +405,78 @@ class EnhancedToolExecutor:
         # Find the tool
         tool_obj = self._find_tool(tool_name, tools)
         if not tool_obj:
-            error_msg = f"Tool '{tool_name}' not found"
-            tracker.record_tool_call(
-                tool_name, tool_args, error_msg, 0, False
-            )
             return {
-                "message": ToolMessage(
-                    content=error_msg, tool_call_id=tool_id
-                ),
-                "execution_info": {
-                    "tool_name": tool_name,
-                    "result": error_msg,
-                    "success": False,
-                },
+                "tool_name": tool_name,
+                "args": tool_args,
+                "tool_call_id": tool_id,
+                "result": f"Tool '{tool_name}' not found",
+                "execution_time_ms": 0,
+                "success": False,
             }
 
         # Execute with timing
         start_time = time.time()
+        timeout = self.config.get_timeout(tool_name)
         try:
-            # Add timeout if configured
-            if self.config.timeout_seconds > 0:
-                import asyncio
-
+            if timeout and timeout > 0:
                 result = await asyncio.wait_for(
                     self._invoke_tool(tool_obj, tool_args),
-                    timeout=self.config.timeout_seconds,
+                    timeout=timeout,
                 )
             else:
                 result = await self._invoke_tool(tool_obj, tool_args)
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
             result_str = (
                 str(result)
                 if result is not None
                 else f"Tool {tool_name} completed"
             )
+            success = True
 
-            # Record successful execution
-            tracker.record_tool_call(
-                tool_name,
-                tool_args,
-                result_str,
-                execution_time_ms,
-                True,
+        except TimeoutError:
+            result_str = (
+                f"Tool execution failed: {tool_name} timed out "
+                f"after {timeout}s"
             )
-
-            return {
-                "message": ToolMessage(
-                    content=result_str, tool_call_id=tool_id
-                ),
-                "execution_info": {
-                    "tool_name": tool_name,
-                    "result": result_str,
-                    "execution_time_ms": execution_time_ms,
-                    "success": True,
-                },
-            }
+            success = False
 
         except Exception as e:
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            error_msg = f"Tool execution failed: {str(e)}"
-
-            # Record failed execution
-            tracker.record_tool_call(
-                tool_name,
-                tool_args,
-                error_msg,
-                execution_time_ms,
-                False,
-            )
+            result_str = f"Tool execution failed: {str(e)}"
+            success = False
 
-            return {
-                "message": ToolMessage(
-                    content=error_msg, tool_call_id=tool_id
-                ),
-                "execution_info": {
-                    "tool_name": tool_name,
-                    "result": error_msg,
-                    "execution_time_ms": execution_time_ms,
-                    "success": False,
-                },
-            }
+        return {
+            "tool_name": tool_name,
+            "args": tool_args,
+            "tool_call_id": tool_id,
+            "result": result_str,
+            "execution_time_ms": int((time.time() - start_time) * 1000),
+            "success": success,
+        }
+
+    def _record_outcome(
+        self, outcome: dict[str, Any], tracker: ToolExecutionTracker
+    ) -> dict[str, Any]:
+        """Record a tool outcome and build its message."""
+        tracker.record_tool_call(
+            outcome["tool_name"],
+            outcome["args"],
+            outcome["result"],
+            outcome["execution_time_ms"],
+            outcome["success"],
+        )
+
+        return {
+            "message": ToolMessage(
+                content=outcome["result"],
+                tool_call_id=outcome["tool_call_id"],
+            ),
+            "execution_info": {
+                "tool_name": outcome["tool_name"],
+                "result": outcome["result"],
+                "execution_time_ms": outcome["execution_time_ms"],
+                "success": outcome["success"],
+            },
+        }
 
     async def _invoke_tool(
         self, tool_obj: Any, tool_args: dict[str, Any]
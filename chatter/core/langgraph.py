@@ -24,6 +24,7 @@ except ImportError:
 from langgraph.pregel import Pregel
 
 from chatter.config import settings
+from chatter.core.checkpointer import create_bounded_checkpointer
 from chatter.core.workflow_graph_builder import (
     WorkflowDefinition,
     WorkflowGraphBuilder,
@@ -78,11 +79,13 @@ class LangGraphWorkflowManager:
                     logger.warning(
                         f"Failed to initialize Redis checkpointer: {e}"
                     )
-                    self.checkpointer = MemorySaver()
-                    logger.info("Fallback to memory checkpointer")
+                    self.checkpointer = create_bounded_checkpointer(
+                        settings
+                    )
+                    logger.info("Fallback to bounded memory checkpointer")
             else:
-                self.checkpointer = MemorySaver()
-                logger.info("Using memory checkpointer")
+                self.checkpointer = create_bounded_checkpointer(settings)
+                logger.info("Using bounded memory checkpointer")
         except Exception as e:
             logger.error(f"Failed to initialize checkpointer: {e}")
             self.checkpointer = MemorySaver()
@@ -96,11 +99,60 @@ class LangGraphWorkflowManager:
         retriever: Any = None,
         tools: list[Any] | None = None,
         max_tool_calls: int = 10,
+        cache_tags: list[str] | None = None,
+        use_cache: bool = True,
         **kwargs,
     ) -> Pregel:
-        """Create a workflow from a flexible definition."""
+        """Create a workflow from a flexible definition.
+
+        Compiled graphs are cached by the definition's structural hash
+        plus the LLM, tool-set and retriever identity, so repeated
+        executions of the same workflow skip graph construction.
+
+        Args:
+            definition: Workflow definition to build
+            llm: Language model to use
+            retriever: Optional retriever for document search
+            tools: Optional tools for tool-calling
+            max_tool_calls: Maximum number of tool calls allowed
+            cache_tags: Template/definition IDs used to invalidate the
+                cached graph when the source row changes
+            use_cache: Whether to use the compiled graph cache
+            **kwargs: Additional arguments passed to the graph builder
+
+        Returns:
+            Compiled LangGraph workflow
+        """
+        from chatter.core.workflow_performance import get_workflow_cache
+
         await self._ensure_initialized()
 
+        compiled_graphs = get_workflow_cache().compiled_graphs
+        cache_key = None
+        if use_cache and compiled_graphs.enabled:
+            # user_id and conversation_id do not affect graph structure
+            build_params = {
+                k: v
+                for k, v in kwargs.items()
+                if k not in ("user_id", "conversation_id")
+            }
+            cache_key = compiled_graphs.make_key(
+                definition.structural_hash(),
+                llm=llm,
+                tools=tools,
+                retriever=retriever,
+                max_tool_calls=max_tool_calls,
+                **build_params,
+            )
+            cached_app = compiled_graphs.get(cache_key)
+            if cached_app is not None:
+                logger.debug(
+                    "Using cached compiled workflow",
+                    nodes=len(definition.nodes),
+                    edges=len(definition.edges),
+                )
+                return cached_app
+
         # Build the graph
         workflow = self.graph_builder.build_graph(
             definition=definition,
@@ -121,6 +173,9 @@ class LangGraphWorkflowManager:
         recursion_limit = max(max_tool_calls * 3 + 10, 25)
         app.recursion_limit = recursion_limit
 
+        if cache_key is not None:
+            compiled_graphs.put(cache_key, app, tags=cache_tags)
+
         logger.debug(
             "Created modern workflow",
             nodes=len(definition.nodes),
@@ -417,6 +472,14 @@ class LangGraphWorkflowManager:
             except Exception as e:
                 logger.warning(f"Error cleaning up Redis context: {e}")
 
+    def get_checkpointer_stats(self) -> dict[str, Any]:
+        """Get checkpointer occupancy metrics."""
+        if self.checkpointer is None:
+            return {"backend": "uninitialized"}
+        if hasattr(self.checkpointer, "get_stats"):
+            return self.checkpointer.get_stats()
+        return {"backend": type(self.checkpointer).__name__}
+
     def get_supported_node_types(self) -> list[str]:
         """Get list of supported node types."""
         from chatter.core.workflow_node_factory import (
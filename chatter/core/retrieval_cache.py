@@ -0,0 +1,306 @@
+"""In-process cache of document retrieval results.
+
+Busy channels ask the same questions over and over; caching what the
+retriever returned for a query skips embedding the query and running
+the vector search again.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from chatter.config import settings
+from chatter.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Tag of entries whose scope is not limited to an owner or documents
+ALL_DOCUMENTS_TAG = "all"
+# Tag of entries whose scope includes every public document
+PUBLIC_DOCUMENTS_TAG = "public"
+
+
+def owner_tag(owner_id: str) -> str:
+    """Tag of entries searching all of an owner's documents."""
+    return f"owner:{owner_id}"
+
+
+def document_tag(document_id: str) -> str:
+    """Tag of entries that depend on one document."""
+    return f"document:{document_id}"
+
+
+@dataclass(slots=True)
+class _CachedRetrieval:
+    scope: str
+    documents: list[Any]
+    vector: np.ndarray | None
+    expires_at: float
+    tags: frozenset[str]
+
+
+class RetrievalCache:
+    """LRU/TTL cache of retrieval results.
+
+    Entries are keyed by the normalized query text and a scope key
+    describing everything else the results depend on: the owner,
+    document filter, number of results, search mode and embedding
+    model. With a similarity threshold, a query whose embedding is at
+    least that similar to a cached query of the same scope also hits.
+
+    Entries carry tags for the owner and documents they depend on, so
+    adding, reprocessing or deleting a document drops exactly the
+    entries that could have included it. The cache lives in one
+    process; the TTL bounds how long other workers keep serving
+    results from before such a change.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300,
+        similarity_threshold: float | None = None,
+        enabled: bool = True,
+    ):
+        """Initialize the retrieval cache.
+
+        Args:
+            max_size: Maximum number of cached results
+            ttl: Seconds a result stays valid
+            similarity_threshold: Minimum cosine similarity for a
+                near-duplicate query to hit; None matches exact
+                queries only
+            enabled: Whether caching is enabled
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.enabled = enabled and max_size > 0
+        self._entries: OrderedDict[str, _CachedRetrieval] = (
+            OrderedDict()
+        )
+        self._scopes: dict[str, set[str]] = {}
+        self._tags: dict[str, set[str]] = {}
+        self._hits = 0
+        self._similar_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize case, whitespace and trailing punctuation."""
+        return " ".join(query.casefold().split()).rstrip("?!. ")
+
+    @staticmethod
+    def make_scope(**params: Any) -> str:
+        """Build a scope key from the parameters results depend on."""
+        data = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def _key(cls, query: str, scope: str) -> str:
+        return cls.make_scope(
+            scope=scope, query=cls.normalize_query(query)
+        )
+
+    def get(self, query: str, scope: str) -> list[Any] | None:
+        """Get the cached results of a query, or None on a miss."""
+        if not self.enabled:
+            return None
+        key = self._key(query, scope)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return list(entry.documents)
+
+    def get_similar(
+        self, query_embedding: list[float], scope: str
+    ) -> list[Any] | None:
+        """Get the results of the most similar cached query.
+
+        Returns:
+            Cached results if a query of the same scope is at least
+            ``similarity_threshold`` similar, else None
+        """
+        if not self.enabled or self.similarity_threshold is None:
+            return None
+        vector = self._unit_vector(query_embedding)
+        if vector is None:
+            return None
+
+        now = time.monotonic()
+        best_key, best_score = None, self.similarity_threshold
+        for key in list(self._scopes.get(scope, ())):
+            entry = self._entries[key]
+            if entry.expires_at <= now:
+                self._remove(key)
+                continue
+            if (
+                entry.vector is None
+                or entry.vector.shape != vector.shape
+            ):
+                continue
+            score = float(entry.vector @ vector)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        self._similar_hits += 1
+        return list(self._entries[best_key].documents)
+
+    def put(
+        self,
+        query: str,
+        scope: str,
+        documents: list[Any],
+        query_embedding: list[float] | None = None,
+        tags: set[str] | None = None,
+    ) -> None:
+        """Cache the results of a query.
+
+        Args:
+            query: Query text
+            scope: Scope key from ``make_scope``
+            documents: Retrieved documents
+            query_embedding: Query embedding for near-duplicate lookups
+            tags: Owner and document tags used for invalidation
+        """
+        self._misses += 1
+        if not self.enabled:
+            return
+        key = self._key(query, scope)
+        self._remove(key)
+        entry = _CachedRetrieval(
+            scope=scope,
+            documents=list(documents),
+            vector=(
+                self._unit_vector(query_embedding)
+                if self.similarity_threshold is not None
+                and query_embedding
+                else None
+            ),
+            expires_at=time.monotonic() + self.ttl,
+            tags=frozenset(tags or ()),
+        )
+        self._entries[key] = entry
+        self._scopes.setdefault(scope, set()).add(key)
+        for tag in entry.tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def invalidate(self, tag: str) -> int:
+        """Drop every entry carrying a tag.
+
+        Returns:
+            Number of entries removed
+        """
+        keys = self._tags.pop(tag, set())
+        for key in keys:
+            self._remove(key)
+        self._invalidations += len(keys)
+        return len(keys)
+
+    def invalidate_document(
+        self, document_id: str, owner_id: str, is_public: bool = False
+    ) -> int:
+        """Drop entries that a changed document could affect.
+
+        Args:
+            document_id: Added, reprocessed or deleted document
+            owner_id: Owner of the document
+            is_public: Whether every user can retrieve the document
+
+        Returns:
+            Number of entries removed
+        """
+        tags = [
+            document_tag(document_id),
+            owner_tag(owner_id),
+            ALL_DOCUMENTS_TAG,
+        ]
+        if is_public:
+            tags.append(PUBLIC_DOCUMENTS_TAG)
+        removed = sum(self.invalidate(tag) for tag in tags)
+        if removed:
+            logger.debug(
+                "Invalidated cached retrieval results",
+                document_id=document_id,
+                removed=removed,
+            )
+        return removed
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._scopes.clear()
+        self._tags.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        hits = self._hits + self._similar_hits
+        return {
+            "enabled": self.enabled,
+            "total_entries": len(self._entries),
+            "max_size": self.max_size,
+            "cache_hits": self._hits,
+            "similar_hits": self._similar_hits,
+            "cache_misses": self._misses,
+            "hit_rate": hits / max(1, hits + self._misses),
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+        }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its scope and tag references."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._scopes.get(entry.scope)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._scopes[entry.scope]
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    @staticmethod
+    def _unit_vector(embedding: list[float]) -> np.ndarray | None:
+        """Normalize an embedding so dot products are cosines."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if not norm:
+            return None
+        return vector / norm
+
+
+_retrieval_cache = RetrievalCache(
+    max_size=settings.retrieval_cache_max_size,
+    ttl=settings.retrieval_cache_ttl,
+    similarity_threshold=settings.retrieval_cache_similarity_threshold,
+    enabled=settings.retrieval_cache_enabled,
+)
+
+
+def get_retrieval_cache() -> RetrievalCache:
+    """Get the process-wide retrieval cache."""
+    return _retrieval_cache
@@ -1,5 +1,6 @@
 """Enhanced token management with proper security features."""
 
+import json
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -145,6 +146,10 @@ class TokenManager:
             if not self.cache:
                 return 0
 
+            # Reload the user on their next request, whatever tokens
+            # they still hold
+            await self.invalidate_principal(user_id)
+
             # Get all token metadata for user
             user_tokens = await self._get_user_tokens(user_id)
             revoked_count = 0
@@ -191,6 +196,116 @@ class TokenManager:
             # Fail secure - if check fails, consider token invalid
             return True
 
+    # Marker left by invalidate_principal so that a request which
+    # loaded the user before the invalidation cannot re-cache it
+    _PRINCIPAL_INVALIDATED = {"invalidated": True}
+
+    async def _get_principal_client(self):
+        """Get the Redis client principals are kept in, if any.
+
+        Principals live in Redis only: a copy in a worker's local cache
+        tier would outlive an invalidation made by another worker.
+        """
+        get_client = getattr(self.cache, "get_client", None)
+        if get_client is None or settings.auth_principal_cache_ttl <= 0:
+            return None
+        return await get_client()
+
+    async def get_principal(
+        self, user_id: str, jti: str | None = None
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Get a user's cached principal and whether a token is revoked.
+
+        The principal and the token's blacklist entry are fetched in one
+        round trip, so every request sees revocations made by any
+        worker.
+
+        Args:
+            user_id: User ID
+            jti: JWT ID of the presented token, if any
+
+        Returns:
+            Cached user fields (None if not cached) and whether ``jti``
+            is blacklisted
+        """
+        try:
+            client = await self._get_principal_client()
+            if client is None:
+                revoked = bool(jti) and await self.is_token_blacklisted(
+                    jti
+                )
+                return None, revoked
+
+            keys = [self.cache.make_key("principal", user_id)]
+            if jti:
+                keys.append(self.cache.make_key("blacklist", jti))
+            values = await client.mget(keys)
+
+            principal = json.loads(values[0]) if values[0] else None
+            if principal == self._PRINCIPAL_INVALIDATED:
+                principal = None
+            revoked = bool(jti) and values[1] is not None
+            return principal, revoked
+
+        except Exception as e:
+            logger.debug(
+                f"Principal cache lookup failed: {e}", user_id=user_id
+            )
+            # The blacklist check fails secure on its own
+            revoked = bool(jti) and await self.is_token_blacklisted(jti)
+            return None, revoked
+
+    async def cache_principal(
+        self, user_id: str, principal: dict[str, Any]
+    ) -> None:
+        """Cache a user's authenticated principal.
+
+        Nothing is written while an invalidation marker is present, so
+        a principal loaded before an invalidation is never cached.
+
+        Args:
+            user_id: User ID
+            principal: User fields
+        """
+        try:
+            client = await self._get_principal_client()
+            if client is None:
+                return
+
+            await client.set(
+                self.cache.make_key("principal", user_id),
+                json.dumps(principal),
+                ex=settings.auth_principal_cache_ttl,
+                nx=True,
+            )
+
+        except Exception as e:
+            logger.debug(
+                f"Failed to cache principal: {e}", user_id=user_id
+            )
+
+    async def invalidate_principal(self, user_id: str) -> None:
+        """Drop a user's cached principal.
+
+        Args:
+            user_id: User ID
+        """
+        try:
+            client = await self._get_principal_client()
+            if client is None:
+                return
+
+            await client.set(
+                self.cache.make_key("principal", user_id),
+                json.dumps(self._PRINCIPAL_INVALIDATED),
+                ex=settings.auth_principal_cache_ttl,
+            )
+
+        except Exception as e:
+            logger.debug(
+                f"Failed to invalidate principal: {e}", user_id=user_id
+            )
+
     async def validate_token_security(
         self, token_payload: dict
     ) -> bool:
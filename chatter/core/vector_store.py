@@ -24,6 +24,8 @@ except ImportError:
         pass
 
 
+from sqlalchemy.ext.asyncio import create_async_engine
+
 from chatter.config import settings
 from chatter.utils.logging import get_logger
 
@@ -164,13 +166,18 @@ class PGVectorStore(AbstractVectorStore):
                 "postgresql://", "postgresql+asyncpg://"
             )
 
-        # Set query-time accuracy/speed. Higher = more accurate, slower.
-        # (This should be made configurable per workflow.)
-        # Note: asyncpg doesn't support options in connection string, so skip for async mode
-        if "+asyncpg" not in self.connection_string:
-            self.connection_string += (
-                "?options=-c%20hnsw.ef_search%3D60"
-            )
+        # asyncpg ignores libpq "options" in the URL, so query-time
+        # accuracy/speed is set as a server setting on each connection
+        self._engine = create_async_engine(
+            self.connection_string,
+            connect_args={
+                "server_settings": {
+                    "hnsw.ef_search": str(
+                        settings.vector_hnsw_ef_search
+                    )
+                }
+            },
+        )
 
         self._store: PGVector | None = None
         self._initialize_store()
@@ -185,7 +192,7 @@ class PGVectorStore(AbstractVectorStore):
             self._store = PGVector(
                 embeddings=self.embeddings,
                 collection_name=self.collection_name,
-                connection=self.connection_string,
+                connection=self._engine,
                 use_jsonb=True,
                 async_mode=True,
                 create_extension=False,  # Prevent SQL concatenation issues
@@ -530,6 +537,9 @@ async def get_vector_store_retriever(
     user_id: str = None,
     collection_name: str = "documents",
     document_ids: list[str] | None = None,
+    search_mode: str | None = None,
+    vector_weight: float | None = None,
+    keyword_weight: float | None = None,
 ):
     """Get a retriever for vector search operations.
 
@@ -537,6 +547,9 @@ async def get_vector_store_retriever(
         user_id: User ID for personalized retrieval (optional)
         collection_name: Collection name for the vector store
         document_ids: Specific document IDs to filter retrieval (optional)
+        search_mode: "vector" or "hybrid" (defaults to settings)
+        vector_weight: Hybrid weight of the vector leg (optional)
+        keyword_weight: Hybrid weight of the keyword leg (optional)
 
     Returns:
         Retriever instance that can be used with LangChain workflows
@@ -566,11 +579,15 @@ async def get_vector_store_retriever(
             embeddings=embeddings,
             user_id=user_id,
             document_ids=document_ids,
+            search_mode=search_mode,
+            vector_weight=vector_weight,
+            keyword_weight=keyword_weight,
         )
         
         logger.info(
             "Custom document chunk retriever created successfully",
             retriever_type=type(retriever).__name__,
+            search_mode=retriever.search_mode,
         )
         return retriever
 
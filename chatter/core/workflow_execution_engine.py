@@ -15,6 +15,7 @@ from typing import Any
 from langchain_core.messages import HumanMessage
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chatter.config import settings
 from chatter.core.langgraph import workflow_manager
 from chatter.core.monitoring import get_monitoring_service
 from chatter.core.workflow_execution_context import (
@@ -32,6 +33,7 @@ from chatter.models.base import generate_ulid
 from chatter.schemas.chat import StreamingChatChunk
 from chatter.schemas.execution import ExecutionRequest
 from chatter.services.llm import LLMService
+from chatter.services.streaming import TokenCoalescer
 from chatter.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -326,6 +328,14 @@ class ExecutionEngine:
             retriever=context.retriever,
             tools=context.tools,
             max_tool_calls=context.config.max_tool_calls,
+            cache_tags=[
+                source_id
+                for source_id in (
+                    context.source_template_id,
+                    context.source_definition_id,
+                )
+                if source_id
+            ],
             user_id=context.user_id,
             conversation_id=context.conversation_id,
         )
@@ -500,7 +510,8 @@ class ExecutionEngine:
             context: Execution context
 
         Yields:
-            StreamingChatChunk for each token
+            StreamingChatChunk for each token, or for each batch of
+            tokens when token coalescing is enabled
         """
         start_time = time.time()
 
@@ -508,22 +519,40 @@ class ExecutionEngine:
         initial_state = self._create_initial_state(context)
 
         # Accumulate result data for final tracking
-        content_buffer = ""
+        content_parts: list[str] = []
         total_tokens = 0
         input_tokens = 0
         output_tokens = 0
 
+        coalescer = (
+            TokenCoalescer()
+            if settings.streaming_coalesce_tokens
+            else None
+        )
+        token_event = "on_chat_model_stream"
+
+        updates = workflow_manager.stream_workflow(
+            workflow=graph,
+            initial_state=initial_state,
+            thread_id=context.thread_id,
+            enable_llm_streaming=True,
+        )
+        if coalescer:
+            # Flushes held tokens once their time budget is spent, even
+            # if the model pauses before the next update
+            updates = coalescer.watch(updates)
+
         try:
             # Stream workflow execution
-            async for update in workflow_manager.stream_workflow(
-                workflow=graph,
-                initial_state=initial_state,
-                thread_id=context.thread_id,
-                enable_llm_streaming=True,
-            ):
+            async for update in updates:
+                if update is None:
+                    pending = coalescer.flush()
+                    if pending:
+                        yield self._token_chunk(pending, token_event)
+                    continue
+
                 # Process streaming updates
                 event_name = update.get("event")
-                print("EVENT", update)
                 # Handle chat model streaming events
                 if event_name in ["on_chat_model_stream", "on_llm_stream"]:
                     data = update.get("data", {})
@@ -537,16 +566,22 @@ class ExecutionEngine:
                         content = chunk.get("content", "")
 
                     if content:
-                        content_buffer += content
-                        yield StreamingChatChunk(
-                            type="token",
-                            content=content,
-                            metadata={"event": event_name},
-                        )
+                        content_parts.append(content)
+                        token_event = event_name
+                        if coalescer:
+                            content = coalescer.add(content)
+                        if content:
+                            yield self._token_chunk(content, event_name)
+                    continue
+
+                # Don't hold tokens back across other events
+                if coalescer:
+                    pending = coalescer.flush()
+                    if pending:
+                        yield self._token_chunk(pending, token_event)
 
                 # Handle completion event
-                elif event_name == "on_chat_model_end":
-                    print("=============================================")
+                if event_name == "on_chat_model_end":
                     data = update.get("data", {})
                     output = data.get("output", {})
 
@@ -561,8 +596,6 @@ class ExecutionEngine:
                     total_tokens = usage_metadata.get("total_tokens", 0)
                     input_tokens = usage_metadata.get("input_tokens", 0)
                     output_tokens = usage_metadata.get("output_tokens", 0)
-                    print("TOTAL", total_tokens)
-                    print("TOTAL", output_tokens)
 
                     yield StreamingChatChunk(
                         type="complete",
@@ -575,6 +608,11 @@ class ExecutionEngine:
                         },
                     )
 
+            if coalescer:
+                pending = coalescer.flush()
+                if pending:
+                    yield self._token_chunk(pending, token_event)
+
             # Calculate execution time
             execution_time_ms = int((time.time() - start_time) * 1000)
 
@@ -590,7 +628,7 @@ class ExecutionEngine:
 
             # Create result for tracking
             execution_result = ExecutionResult(
-                response=content_buffer,
+                response="".join(content_parts),
                 execution_time_ms=execution_time_ms,
                 tokens_used=total_tokens,
                 prompt_tokens=input_tokens,
@@ -606,6 +644,31 @@ class ExecutionEngine:
         except Exception as e:
             # Tracking of failure is done in execute() method
             raise
+        finally:
+            if coalescer:
+                await updates.aclose()
+
+    @staticmethod
+    def _token_chunk(
+        content: str, event_name: str
+    ) -> StreamingChatChunk:
+        """Build a token chunk.
+
+        Token chunks are built from trusted values on the hot path, so
+        validation is skipped.
+
+        Args:
+            content: Token text
+            event_name: Streaming event that produced the text
+
+        Returns:
+            StreamingChatChunk of type "token"
+        """
+        return StreamingChatChunk.model_construct(
+            type="token",
+            content=content,
+            metadata={"event": event_name},
+        )
 
     def _create_initial_state(
         self, context: ExecutionContext
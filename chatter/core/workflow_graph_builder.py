@@ -7,6 +7,8 @@ approach in the original LangGraphWorkflowManager.
 
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Any
 
 from langchain_core.language_models import BaseChatModel
@@ -65,6 +67,22 @@ class WorkflowDefinition:
         """Set the entry point for the workflow."""
         self.entry_point = node_id
 
+    def structural_hash(self) -> str:
+        """Hash the nodes, edges and entry point of the definition.
+
+        Two definitions with the same hash build identical graphs.
+        """
+        payload = json.dumps(
+            {
+                "nodes": self.nodes,
+                "edges": self.edges,
+                "entry_point": self.entry_point,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 class WorkflowGraphBuilder:
     """Builds LangGraph workflows from flexible definitions."""
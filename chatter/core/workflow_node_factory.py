@@ -672,13 +672,21 @@ class ToolsNode(BaseWorkflowNode):
         super().__init__(node_id, config, "ToolsNode")
         self.max_tool_calls = self._get_config("max_tool_calls", 10)
         self.tool_timeout_ms = self._get_config("tool_timeout_ms", 30000)
+        self.parallel_tool_calls = self._get_config(
+            "parallel_tool_calls", True
+        )
+        self.max_parallel_tool_calls = self._get_config(
+            "max_parallel_tool_calls", 4
+        )
         self.tools = []
     
     def validate_config(self) -> list[str]:
         """Validate tools node configuration."""
         return self._validate_field_types({
             "max_tool_calls": int,
-            "tool_timeout_ms": int
+            "tool_timeout_ms": int,
+            "parallel_tool_calls": bool,
+            "max_parallel_tool_calls": int,
         })
 
     def set_tools(self, tools: list) -> None:
@@ -714,6 +722,8 @@ class ToolsNode(BaseWorkflowNode):
         tool_config = ToolExecutionConfig(
             max_total_calls=self.max_tool_calls,
             timeout_seconds=self.tool_timeout_ms // 1000,
+            parallel_execution=self.parallel_tool_calls,
+            max_parallel_calls=self.max_parallel_tool_calls,
         )
 
         # Create tool executor
@@ -5,9 +5,13 @@ performance and reduce resource usage.
 """
 
 import asyncio
+import hashlib
+import json
 import time
+from collections import OrderedDict
 from typing import Any
 
+from chatter.config import settings
 from chatter.core.cache_factory import (
     get_general_cache,
     get_persistent_cache,
@@ -17,9 +21,203 @@ from chatter.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+class CompiledWorkflowCache:
+    """In-process LRU cache of compiled workflow graphs (Pregel apps).
+
+    Compiled graphs hold live LLM, tool and retriever objects, so they
+    cannot go through the serializing cache backends. Entries are keyed
+    by the structural hash of the workflow definition plus the identity
+    of the resources bound into the graph, and may carry tags (template
+    or definition IDs) used for targeted invalidation.
+    """
+
+    def __init__(self, max_size: int = 128, enabled: bool = True):
+        """Initialize compiled workflow cache.
+
+        Args:
+            max_size: Maximum number of compiled graphs to keep
+            enabled: Whether caching is enabled
+        """
+        self.max_size = max_size
+        self.enabled = enabled
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def _hash(payload: Any) -> str:
+        """Hash a JSON-compatible payload."""
+        data = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def llm_identity(llm: Any) -> Any:
+        """Describe an LLM by its class and identifying parameters."""
+        if llm is None:
+            return None
+        try:
+            params = getattr(llm, "_identifying_params", None)
+        except Exception:
+            params = None
+        if not isinstance(params, dict):
+            # Unknown model type: only the same instance may share a graph
+            return [type(llm).__qualname__, id(llm)]
+        params = dict(params)
+        for attr in ("base_url", "openai_api_base", "anthropic_api_url"):
+            value = getattr(llm, attr, None)
+            if value:
+                params[attr] = str(value)
+        return [type(llm).__module__, type(llm).__qualname__, params]
+
+    @staticmethod
+    def tools_identity(tools: list[Any] | None) -> Any:
+        """Describe a tool set by its tool names and types."""
+        if not tools:
+            return []
+        return sorted(
+            [
+                getattr(tool, "name", None)
+                or getattr(tool, "__name__", None)
+                or type(tool).__qualname__,
+                type(tool).__qualname__,
+            ]
+            for tool in tools
+        )
+
+    @staticmethod
+    def retriever_identity(retriever: Any) -> Any:
+        """Describe a retriever by its class and scope."""
+        if retriever is None:
+            return None
+        document_ids = getattr(retriever, "document_ids", None)
+        return [
+            type(retriever).__qualname__,
+            getattr(retriever, "user_id", None),
+            sorted(document_ids) if document_ids else None,
+            getattr(retriever, "k", None),
+        ]
+
+    def make_key(
+        self,
+        definition_hash: str,
+        llm: Any = None,
+        tools: list[Any] | None = None,
+        retriever: Any = None,
+        **params: Any,
+    ) -> str:
+        """Build a cache key for a compiled graph.
+
+        Args:
+            definition_hash: Structural hash of the workflow definition
+            llm: LLM bound into the graph
+            tools: Tools bound into the graph
+            retriever: Retriever bound into the graph
+            **params: Other build parameters that affect the graph
+
+        Returns:
+            Cache key
+        """
+        return self._hash(
+            {
+                "definition": definition_hash,
+                "llm": self.llm_identity(llm),
+                "tools": self.tools_identity(tools),
+                "retriever": self.retriever_identity(retriever),
+                "params": params,
+            }
+        )
+
+    def get(self, key: str) -> Any:
+        """Get a compiled graph, or None on a miss."""
+        if not self.enabled:
+            return None
+        app = self._entries.get(key)
+        if app is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return app
+
+    def put(
+        self, key: str, app: Any, tags: list[str] | None = None
+    ) -> None:
+        """Store a compiled graph, evicting the least recently used."""
+        if not self.enabled or self.max_size <= 0:
+            return
+        self._entries[key] = app
+        self._entries.move_to_end(key)
+        for tag in tags or []:
+            if tag:
+                self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_size:
+            oldest_key, _ = self._entries.popitem(last=False)
+            self._discard_tags(oldest_key)
+            self._evictions += 1
+
+    def _discard_tags(self, key: str) -> None:
+        """Remove a key from all tag sets."""
+        for tag in list(self._tags):
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def invalidate(self, tag: str) -> int:
+        """Drop all compiled graphs built from a template or definition.
+
+        Args:
+            tag: Template or definition ID
+
+        Returns:
+            Number of entries removed
+        """
+        keys = self._tags.pop(tag, set())
+        removed = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self._discard_tags(key)
+                removed += 1
+        self._invalidations += removed
+        if removed:
+            logger.debug(
+                "Invalidated compiled workflow graphs",
+                tag=tag,
+                removed=removed,
+            )
+        return removed
+
+    def clear(self) -> None:
+        """Drop all compiled graphs."""
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._tags.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "total_entries": len(self._entries),
+            "max_size": self.max_size,
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "hit_rate": self._hits / max(1, total),
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+        }
+
+
 # Global instances for easy access - using core cache system directly
 _workflow_cache = get_persistent_cache()
 _tool_cache = get_general_cache()
+_compiled_graph_cache = CompiledWorkflowCache(
+    max_size=settings.workflow_graph_cache_max_size,
+    enabled=settings.workflow_graph_cache_enabled,
+)
 
 
 class WorkflowCache:
@@ -35,6 +233,11 @@ class WorkflowCache:
         """Get the tool cache instance."""
         return _tool_cache
 
+    @property
+    def compiled_graphs(self) -> CompiledWorkflowCache:
+        """Get the compiled workflow graph cache."""
+        return _compiled_graph_cache
+
     async def get_cache_stats(self) -> dict[str, Any]:
         """Get combined cache statistics."""
         try:
@@ -44,6 +247,7 @@ class WorkflowCache:
             return {
                 "workflow_cache": workflow_stats,
                 "tool_cache": tool_stats,
+                "compiled_graph_cache": _compiled_graph_cache.get_stats(),
                 "combined_entries": workflow_stats.get(
                     "total_entries", 0
                 )
@@ -240,6 +240,41 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error("Failed to start SSE event service", error=str(e))
 
+    # Start document ingest workers
+    try:
+        from chatter.services.ingest_scheduler import (
+            get_ingest_scheduler,
+        )
+
+        await get_ingest_scheduler().start()
+        logger.info("Document ingest scheduler started")
+    except Exception as e:
+        logger.error("Failed to start ingest scheduler", error=str(e))
+
+    # Resume documents the last shutdown left unprocessed
+    try:
+        from chatter.services.new_document_service import (
+            NewDocumentService,
+        )
+        from chatter.utils.database import get_session_maker
+
+        async_session = get_session_maker()
+        async with async_session() as session:
+            await NewDocumentService(session).resume_interrupted()
+    except Exception as e:
+        logger.error(
+            "Failed to resume interrupted documents", error=str(e)
+        )
+
+    # Start A/B test write-behind flushing
+    try:
+        from chatter.services.ab_testing import ab_test_manager
+
+        await ab_test_manager.start()
+        logger.info("A/B test write-behind started")
+    except Exception as e:
+        logger.error("Failed to start A/B test flushing", error=str(e))
+
     # Initialize unified event system
     try:
         from chatter.core.events import initialize_event_system
@@ -286,6 +321,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error("Failed to stop job queue", error=str(e))
 
+    # Let running document ingests finish and record the rest for the
+    # next start
+    try:
+        from chatter.services.ingest_scheduler import (
+            get_ingest_scheduler,
+        )
+
+        report = await get_ingest_scheduler().stop()
+        logger.info("Document ingest scheduler stopped")
+
+        unprocessed = report["interrupted"] + report["queued"]
+        if unprocessed:
+            from chatter.services.new_document_service import (
+                NewDocumentService,
+            )
+            from chatter.utils.database import get_session_maker
+
+            async_session = get_session_maker()
+            async with async_session() as session:
+                await NewDocumentService(session).mark_interrupted(
+                    unprocessed
+                )
+    except Exception as e:
+        logger.error("Failed to stop ingest scheduler", error=str(e))
+
     # Stop SSE event service
     try:
         from chatter.services.sse_events import sse_service
@@ -304,6 +364,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error("Failed to shutdown event system", error=str(e))
 
+    # Stop A/B test write-behind and persist buffered writes
+    try:
+        from chatter.services.ab_testing import ab_test_manager
+
+        await ab_test_manager.stop()
+        logger.info("A/B test writes flushed")
+    except Exception as e:
+        logger.error("Failed to flush A/B test writes", error=str(e))
+
     await close_database()
     logger.info("Chatter application shutdown complete")
 
@@ -471,6 +540,7 @@ def create_app() -> FastAPI:
         expose_headers=[
             "x-correlation-id",
             "x-request-id",
+            "x-next-cursor",
         ],  # Expose additional headers
         max_age=86400,  # Cache preflight requests for 24 hours
     )
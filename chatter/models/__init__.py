@@ -1,5 +1,12 @@
 """Database models for Chatter application."""
 
+from chatter.models.ab_testing import (
+    ABTestAssignment,
+    ABTestDefinition,
+    ABTestEvent,
+    ABTestMetricStats,
+    ABTestVariantStats,
+)
 from chatter.models.agent_db import AgentDB, AgentInteractionDB
 from chatter.models.analytics import (
     ConversationStats,
@@ -66,4 +73,9 @@ __all__ = [
     "TemplateSpec",
     "TemplateCategory",
     "AuditLog",
+    "ABTestDefinition",
+    "ABTestAssignment",
+    "ABTestEvent",
+    "ABTestVariantStats",
+    "ABTestMetricStats",
 ]
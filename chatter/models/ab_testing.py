@@ -0,0 +1,194 @@
+"""Persisted A/B tests with their assignments, events and statistics."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    JSON,
+    CheckConstraint,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from chatter.models.base import Base
+
+
+class ABTestDefinition(Base):
+    """An A/B test's configuration and lifecycle state.
+
+    The row ID is the test ID; ``definition`` holds the serialized test.
+    """
+
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, index=True
+    )
+    definition: Mapped[dict[str, Any]] = mapped_column(
+        JSON, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation of test definition."""
+        return (
+            f"<ABTestDefinition(id={self.id}, name={self.name}, "
+            f"status={self.status})>"
+        )
+
+
+class ABTestAssignment(Base):
+    """A user's variant assignment for an A/B test."""
+
+    __table_args__ = (
+        UniqueConstraint(
+            "test_id",
+            "user_id",
+            name="uq_ab_test_assignments_user",
+        ),
+    )
+
+    test_id: Mapped[str] = mapped_column(
+        String(26), nullable=False, index=True
+    )
+    user_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    variant_id: Mapped[str] = mapped_column(String(26), nullable=False)
+    session_id: Mapped[str | None] = mapped_column(
+        String(255), nullable=True
+    )
+    assigned_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    extra_metadata: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON, nullable=True
+    )
+
+    def __repr__(self) -> str:
+        """String representation of assignment."""
+        return (
+            f"<ABTestAssignment(test_id={self.test_id}, "
+            f"user_id={self.user_id}, variant_id={self.variant_id})>"
+        )
+
+
+class ABTestEvent(Base):
+    """An event recorded for an A/B test variant."""
+
+    __table_args__ = (
+        Index(
+            "idx_ab_test_events_test_variant", "test_id", "variant_id"
+        ),
+    )
+
+    test_id: Mapped[str] = mapped_column(String(26), nullable=False)
+    variant_id: Mapped[str] = mapped_column(String(26), nullable=False)
+    user_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    session_id: Mapped[str | None] = mapped_column(
+        String(255), nullable=True
+    )
+    event_type: Mapped[str] = mapped_column(
+        String(100), nullable=False
+    )
+    event_data: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON, nullable=True
+    )
+    metrics: Mapped[dict[str, float] | None] = mapped_column(
+        JSON, nullable=True
+    )
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation of event."""
+        return (
+            f"<ABTestEvent(test_id={self.test_id}, "
+            f"variant_id={self.variant_id}, type={self.event_type})>"
+        )
+
+
+class ABTestVariantStats(Base):
+    """Running event totals for one variant of an A/B test."""
+
+    __table_args__ = (
+        CheckConstraint(
+            "event_count >= 0",
+            name="check_ab_variant_event_count_non_negative",
+        ),
+        UniqueConstraint(
+            "test_id",
+            "variant_id",
+            name="uq_ab_test_variant_stats_variant",
+        ),
+    )
+
+    test_id: Mapped[str] = mapped_column(
+        String(26), nullable=False, index=True
+    )
+    variant_id: Mapped[str] = mapped_column(String(26), nullable=False)
+
+    event_count: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    # HyperLogLog registers for the variant's distinct users
+    user_sketch: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True
+    )
+
+    def __repr__(self) -> str:
+        """String representation of variant stats."""
+        return (
+            f"<ABTestVariantStats(test_id={self.test_id}, "
+            f"variant_id={self.variant_id}, events={self.event_count})>"
+        )
+
+
+class ABTestMetricStats(Base):
+    """Running Welford statistics for one metric of a test variant."""
+
+    __table_args__ = (
+        CheckConstraint(
+            "count >= 0",
+            name="check_ab_metric_count_non_negative",
+        ),
+        UniqueConstraint(
+            "test_id",
+            "variant_id",
+            "metric_name",
+            name="uq_ab_test_metric_stats_metric",
+        ),
+    )
+
+    test_id: Mapped[str] = mapped_column(
+        String(26), nullable=False, index=True
+    )
+    variant_id: Mapped[str] = mapped_column(String(26), nullable=False)
+    metric_name: Mapped[str] = mapped_column(
+        String(100), nullable=False
+    )
+
+    count: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    total: Mapped[float] = mapped_column(
+        Float, default=0.0, nullable=False
+    )
+    mean: Mapped[float] = mapped_column(
+        Float, default=0.0, nullable=False
+    )
+    # Sum of squared deviations from the mean
+    m2: Mapped[float] = mapped_column(
+        Float, default=0.0, nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation of metric stats."""
+        return (
+            f"<ABTestMetricStats(test_id={self.test_id}, "
+            f"variant_id={self.variant_id}, metric={self.metric_name}, "
+            f"count={self.count})>"
+        )
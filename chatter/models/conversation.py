@@ -26,6 +26,10 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from chatter.models.base import Base, Keys
 from chatter.models.user import User  # Import User from correct module
+from chatter.utils.text_search import (
+    search_vector_column,
+    to_tsvector_sql,
+)
 
 if TYPE_CHECKING:
     from chatter.models.profile import Profile
@@ -84,6 +88,11 @@ class Conversation(Base):
         CheckConstraint("title != ''", name="check_title_not_empty"),
         Index("idx_user_status", "user_id", "status"),
         Index("idx_user_created", "user_id", "created_at"),
+        Index(
+            "idx_conversations_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
     )
 
     # Foreign keys
@@ -98,6 +107,17 @@ class Conversation(Base):
     # Conversation metadata
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # Full-text search (generated, GIN indexed)
+    search_vector: Mapped[Any] = mapped_column(
+        *search_vector_column(
+            f"{to_tsvector_sql('title', 'A')} || "
+            f"{to_tsvector_sql('description', 'B')}"
+        ),
+        nullable=True,
+        deferred=True,
+    )
+
     status: Mapped[ConversationStatus] = mapped_column(
         SQLEnum(ConversationStatus),
         default=ConversationStatus.ACTIVE,
@@ -281,6 +301,11 @@ class Message(Base):
             "sequence_number",
         ),
         Index("idx_conversation_role", "conversation_id", "role"),
+        Index(
+            "idx_messages_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
     )
 
     # Foreign keys
@@ -297,6 +322,13 @@ class Message(Base):
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
 
+    # Full-text search (generated, GIN indexed)
+    search_vector: Mapped[Any] = mapped_column(
+        *search_vector_column(to_tsvector_sql("content")),
+        nullable=True,
+        deferred=True,
+    )
+
     # Tool calling
     tool_calls: Mapped[list[dict[str, Any]] | None] = mapped_column(
         JSON, nullable=True
@@ -15,23 +15,31 @@ from sqlalchemy import (
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy import (
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    cast,
     event,
+    func,
+    literal,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 try:
-    from pgvector.sqlalchemy import Vector
+    from pgvector.sqlalchemy import BIT, HALFVEC, Vector
 
     PGVECTOR_AVAILABLE = True
 except ImportError:
-    Vector = None
+    BIT = HALFVEC = Vector = None
     PGVECTOR_AVAILABLE = False
 
 from chatter.models.base import Base, Keys
+from chatter.utils.text_search import (
+    search_vector_column,
+    to_tsvector_sql,
+)
 
 if TYPE_CHECKING:
     from chatter.models.user import User
@@ -310,6 +318,11 @@ class DocumentChunk(Base):
         CheckConstraint(
             "content != ''", name="check_content_not_empty"
         ),
+        Index(
+            "idx_document_chunks_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
     )
 
     # Foreign keys
@@ -330,6 +343,13 @@ class DocumentChunk(Base):
     )
     end_char: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Full-text search for the keyword leg of hybrid retrieval
+    search_vector: Mapped[Any] = mapped_column(
+        *search_vector_column(to_tsvector_sql("content")),
+        nullable=True,
+        deferred=True,
+    )
+
     # Metadata
     extra_metadata: Mapped[dict[str, Any] | None] = mapped_column(
         "extra_metadata", JSON, nullable=True
@@ -525,27 +545,45 @@ def normalize_embedding_to_fixed_dim(
         return raw_embedding[:target_dim]
 
 
-@event.listens_for(DocumentChunk.raw_embedding, 'set')
+def compact_vector_storage() -> bool:
+    """Whether chunks keep a single embedding copy (vector_storage_mode)."""
+    from chatter.config import settings
+
+    return settings.vector_storage_mode != "full"
+
+
+@event.listens_for(DocumentChunk.raw_embedding, 'set', retval=True)
 def update_computed_embedding(target, value, oldvalue, initiator):
     """
-    Event listener that automatically updates computed_embedding when raw_embedding is set.
-    This ensures computed_embedding is always normalized to 1536 dimensions.
+    Event listener that automatically updates the indexed embedding when raw_embedding is set.
+
+    In compact storage mode only ``embedding`` (normalized to 1536
+    dimensions) is kept; the raw vector is persisted only when it was
+    truncated and cannot be recovered from ``embedding``. In full mode
+    computed_embedding is also kept, normalized to 1536 dimensions.
     """
-    if value is not None:
-        # Store original dimension
-        target.raw_dim = len(value)
+    if value is None:
+        return value
 
-        # Create computed embedding (normalized to 1536)
-        target.computed_embedding = normalize_embedding_to_fixed_dim(
-            value, 1536
-        )
+    # Store original dimension
+    target.raw_dim = len(value)
+    normalized = normalize_embedding_to_fixed_dim(value, 1536)
 
-        # If the raw embedding is exactly 1536 dimensions, also set the main embedding
-        if len(value) == 1536:
-            target.embedding = value
-        else:
-            # Use computed embedding for the main embedding field
-            target.embedding = target.computed_embedding
+    if compact_vector_storage():
+        target.embedding = normalized
+        target.computed_embedding = None
+        return value if len(value) > 1536 else None
+
+    # Create computed embedding (normalized to 1536)
+    target.computed_embedding = normalized
+
+    # If the raw embedding is exactly 1536 dimensions, also set the main embedding
+    if len(value) == 1536:
+        target.embedding = value
+    else:
+        # Use computed embedding for the main embedding field
+        target.embedding = target.computed_embedding
+    return value
 
 
 @event.listens_for(DocumentChunk, 'before_insert')
@@ -555,6 +593,24 @@ def ensure_embedding_consistency(mapper, connection, target):
     Event listener to ensure embedding consistency before database operations.
     This handles cases where embeddings are set directly.
     """
+    if compact_vector_storage():
+        raw = target.raw_embedding
+        if raw is not None:
+            target.raw_dim = len(raw)
+            if target.embedding is None:
+                target.embedding = normalize_embedding_to_fixed_dim(
+                    raw, 1536
+                )
+            if len(raw) <= 1536:
+                # Recoverable from embedding, do not store it twice
+                target.raw_embedding = None
+        elif target.embedding is not None and target.raw_dim is None:
+            target.raw_dim = len(target.embedding)
+
+        if target.computed_embedding is not None:
+            target.computed_embedding = None
+        return
+
     # If raw_embedding is set but computed_embedding is not, compute it
     if target.raw_embedding and not target.computed_embedding:
         target.raw_dim = len(target.raw_embedding)
@@ -606,8 +662,55 @@ class HybridVectorSearchHelper:
             # Look for exact dimensional match in raw_embedding with raw_dim filter
             return 'raw_embedding'
         else:
-            # Use computed_embedding for consistent searches
-            return 'computed_embedding'
+            # Use the indexed normalized column for consistent searches
+            return HybridVectorSearchHelper.normalized_column()
+
+    @staticmethod
+    def normalized_column() -> str:
+        """
+        Name of the indexed column holding 1536-dim normalized vectors.
+
+        Returns:
+            'embedding' in compact storage mode, else 'computed_embedding'
+        """
+        if compact_vector_storage():
+            return 'embedding'
+        return 'computed_embedding'
+
+    @staticmethod
+    def quantized_distance(
+        column: Any, query_vector: list[float], precision: str
+    ) -> Any:
+        """
+        Build a cosine-ordering distance over a quantized copy of a column.
+
+        The expressions match the halfvec and binary HNSW expression
+        indexes on ``document_chunks.embedding``.
+
+        Args:
+            column: 1536-dim vector column
+            query_vector: Query vector normalized to 1536 dimensions
+            precision: 'full', 'half' or 'binary'
+
+        Returns:
+            SQL distance expression (smaller is closer)
+        """
+        if precision == 'half':
+            return cast(column, HALFVEC(1536)).cosine_distance(
+                literal(query_vector, HALFVEC(1536))
+            )
+        if precision == 'binary':
+            return cast(
+                func.binary_quantize(column), BIT(1536)
+            ).hamming_distance(
+                cast(
+                    func.binary_quantize(
+                        literal(query_vector, Vector(1536))
+                    ),
+                    BIT(1536),
+                )
+            )
+        return column.cosine_distance(query_vector)
 
     @staticmethod
     def prepare_query_vector(
@@ -659,6 +762,23 @@ class HybridVectorSearchHelper:
 def _add_hybrid_search_methods():
     """Add hybrid search methods to DocumentChunk class."""
 
+    def get_raw_embedding(self) -> list[float] | None:
+        """
+        Get the embedding at its original dimension.
+
+        Compact storage only persists raw_embedding for truncated
+        vectors; shorter vectors are recovered from the zero-padded
+        indexed embedding.
+
+        Returns:
+            Raw embedding vector or None
+        """
+        if self.raw_embedding is not None:
+            return self.raw_embedding
+        if self.embedding is None or not self.raw_dim:
+            return None
+        return [float(x) for x in self.embedding[: self.raw_dim]]
+
     def get_search_embedding(
         self, query_dim: int
     ) -> list[float] | None:
@@ -671,11 +791,11 @@ def _add_hybrid_search_methods():
         Returns:
             Best matching embedding vector or None
         """
-        if query_dim == 1536 and self.embedding:
+        if query_dim == 1536 and self.embedding is not None:
             return self.embedding
-        elif query_dim == self.raw_dim and self.raw_embedding:
-            return self.raw_embedding
-        elif self.computed_embedding:
+        elif query_dim == self.raw_dim:
+            return self.get_raw_embedding()
+        elif self.computed_embedding is not None:
             return self.computed_embedding
         else:
             return self.embedding
@@ -690,15 +810,12 @@ def _add_hybrid_search_methods():
         Returns:
             True if suitable embedding exists
         """
-        if target_dim == 1536:
-            return (
-                self.embedding is not None
-                or self.computed_embedding is not None
-            )
-        elif target_dim == self.raw_dim:
-            return self.raw_embedding is not None
-        else:
-            return self.computed_embedding is not None
+        if target_dim == self.raw_dim and target_dim != 1536:
+            return self.get_raw_embedding() is not None
+        return (
+            self.embedding is not None
+            or self.computed_embedding is not None
+        )
 
     def set_embedding_vector(
         self,
@@ -723,6 +840,7 @@ def _add_hybrid_search_methods():
         # Event listeners will handle computed_embedding and embedding updates
 
     # Add methods to DocumentChunk
+    DocumentChunk.get_raw_embedding = get_raw_embedding
     DocumentChunk.get_search_embedding = get_search_embedding
     DocumentChunk.has_embedding_for_dimension = (
         has_embedding_for_dimension
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 from sqlalchemy import JSON, Boolean, CheckConstraint, DateTime
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -16,6 +16,10 @@ from sqlalchemy.orm import (
 )
 
 from chatter.models.base import Base, Keys
+from chatter.utils.text_search import (
+    search_vector_column,
+    to_tsvector_sql,
+)
 
 if TYPE_CHECKING:
     from chatter.models.user import User
@@ -100,6 +104,11 @@ class Prompt(Base):
             "name != ''",
             name="check_name_not_empty",
         ),
+        Index(
+            "idx_prompts_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
     )
 
     # Foreign keys
@@ -125,6 +134,17 @@ class Prompt(Base):
 
     # Prompt content
     content: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Full-text search (generated, GIN indexed)
+    search_vector: Mapped[Any] = mapped_column(
+        *search_vector_column(
+            f"{to_tsvector_sql('name', 'A')} || "
+            f"{to_tsvector_sql('description', 'B')} || "
+            f"{to_tsvector_sql('content', 'C')}"
+        ),
+        nullable=True,
+        deferred=True,
+    )
     variables: Mapped[list[str] | None] = mapped_column(
         JSON, nullable=True
     )
@@ -90,6 +90,10 @@ class User(Base):
     api_key_name: Mapped[str | None] = mapped_column(
         String(100), nullable=True
     )
+    # Non-secret part of the API key, indexed for single-row lookups
+    api_key_prefix: Mapped[str | None] = mapped_column(
+        String(64), unique=True, nullable=True, index=True
+    )
 
     # Preferences
     default_llm_provider: Mapped[str | None] = mapped_column(
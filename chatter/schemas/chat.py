@@ -445,6 +445,9 @@ class ConversationListResponse(BaseModel):
     )
     limit: int = Field(..., description="Applied limit")
     offset: int = Field(..., description="Applied offset")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, if any"
+    )
 
 
 class ConversationDeleteResponse(BaseModel):
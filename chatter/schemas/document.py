@@ -141,7 +141,7 @@ class DocumentSearchRequest(BaseModel):
         ..., min_length=1, max_length=1000, description="Search query"
     )
     limit: int = Field(
-        10, ge=1, description="Maximum number of results"
+        10, ge=1, le=100, description="Maximum number of results"
     )
     score_threshold: float = Field(
         0.5, ge=0.0, le=1.0, description="Minimum similarity score"
@@ -210,6 +210,13 @@ class DocumentListRequest(ListRequestBase):
     offset: int = Field(
         0, ge=0, description="Number of results to skip"
     )
+    cursor: str | None = Field(
+        None,
+        description=(
+            "Cursor from a previous page's next_cursor; replaces offset "
+            "(requires sort_by created_at or updated_at)"
+        ),
+    )
     sort_by: str = Field("created_at", description="Sort field")
     sort_order: str = Field(
         "desc", pattern="^(asc|desc)$", description="Sort order"
@@ -251,6 +258,9 @@ class DocumentListResponse(BaseModel):
     )
     limit: int = Field(..., description="Applied limit")
     offset: int = Field(..., description="Applied offset")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page, if any"
+    )
 
 
 class DocumentChunkResponse(BaseModel):
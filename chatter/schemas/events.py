@@ -60,6 +60,9 @@ class EventType(str, Enum):
     AGENT_CREATED = "agent.created"
     AGENT_UPDATED = "agent.updated"
 
+    # Analytics events
+    ANALYTICS_DASHBOARD_UPDATED = "analytics.dashboard_updated"
+
     # System events
     SYSTEM_ALERT = "system.alert"
     SYSTEM_STATUS = "system.status"
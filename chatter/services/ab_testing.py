@@ -1,14 +1,27 @@
 """A/B testing infrastructure for prompts and models."""
 
+import asyncio
 import hashlib
+from collections import deque
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
-
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chatter.config import settings
+from chatter.models.ab_testing import (
+    ABTestMetricStats,
+    ABTestVariantStats,
+)
 from chatter.models.base import generate_ulid
+from chatter.services.ab_testing_store import ABTestStore
+from chatter.utils.database import get_session_maker
 from chatter.utils.logging import get_logger
+from chatter.utils.streaming_stats import HyperLogLog, RunningStats
 
 logger = get_logger(__name__)
 
@@ -173,20 +186,119 @@ class TestResult(BaseModel):
     )
 
 
+class VariantStats:
+    """Streaming event and metric totals for one test variant.
+
+    Updating and reading the totals costs the same no matter how many
+    events the variant has seen.
+    """
+
+    __slots__ = ("event_count", "users", "metrics")
+
+    def __init__(self):
+        self.event_count = 0
+        self.users = HyperLogLog()
+        self.metrics: dict[str, RunningStats] = {}
+
+    def add_event(
+        self, user_id: str, metrics: dict[str, float]
+    ) -> None:
+        """Count one event and its metric values."""
+        self.event_count += 1
+        self.users.add(user_id)
+        for name, value in metrics.items():
+            stats = self.metrics.get(name)
+            if stats is None:
+                stats = self.metrics[name] = RunningStats()
+            stats.add(value)
+
+    def merge(self, other: "VariantStats") -> None:
+        """Fold another variant's totals into this one."""
+        self.event_count += other.event_count
+        self.users.merge(other.users)
+        for name, other_stats in other.metrics.items():
+            stats = self.metrics.get(name)
+            if stats is None:
+                stats = self.metrics[name] = RunningStats()
+            stats.merge(other_stats)
+
+
 class ABTestManager:
     """Manages A/B tests for prompts, models, and configurations."""
 
-    def __init__(self):
-        """Initialize the A/B test manager."""
+    def __init__(self, store: ABTestStore | None = None):
+        """Initialize the A/B test manager.
+
+        Args:
+            store: Persistence for tests, assignments and events
+        """
+        # Cached test definitions; the store holds every worker's tests
         self.tests: dict[str, ABTest] = {}
+        self.store = store or ABTestStore()
+        self._flush_task: asyncio.Task | None = None
+        # Read-through cache of stored assignments
         self.assignments: dict[str, TestAssignment] = {}
         # Add index for faster user assignment lookups
         self.user_assignments: dict[str, dict[str, TestAssignment]] = (
             {}
         )  # user_id -> {test_id: assignment}
-        self.events: list[TestEvent] = []
         self.results: dict[str, TestResult] = {}
         self.max_events = 100000  # Limit event storage
+        # Most recent raw events; analysis uses variant_stats instead
+        self.events: deque[TestEvent] = deque(maxlen=self.max_events)
+        # test_id -> variant_id -> running totals
+        self.variant_stats: dict[str, dict[str, VariantStats]] = {}
+        # (test_id, variant_id) -> totals not yet persisted
+        self._pending_stats: dict[tuple[str, str], VariantStats] = {}
+
+    async def _get_test(self, test_id: str) -> ABTest | None:
+        """Get a test, loading it from the store if not cached.
+
+        Args:
+            test_id: Test ID
+
+        Returns:
+            Test or None if not found
+        """
+        test = self.tests.get(test_id)
+        if test is not None:
+            return test
+
+        # Created by another worker or before a restart
+        try:
+            definition = await self.store.load_test(test_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to load A/B test", test_id=test_id, error=str(e)
+            )
+            return None
+        if definition is None:
+            return None
+        test = self.tests[test_id] = ABTest.model_validate(definition)
+        return test
+
+    async def _save_test(self, test: ABTest) -> None:
+        """Store a test's definition for other workers and restarts.
+
+        Args:
+            test: Test to store
+        """
+        try:
+            await self.store.save_test(test)
+        except Exception as e:
+            logger.warning(
+                "Failed to persist A/B test",
+                test_id=test.id,
+                error=str(e),
+            )
+
+    async def load_tests(self) -> None:
+        """Replace the cached test definitions with the stored ones."""
+        definitions = await self.store.load_tests()
+        self.tests = {
+            definition["id"]: ABTest.model_validate(definition)
+            for definition in definitions
+        }
 
     def _validate_test_config(self, test: ABTest) -> list[str]:
         """Validate test configuration and return list of errors.
@@ -334,6 +446,7 @@ class ABTestManager:
             raise ValueError(error_msg)
 
         self.tests[test.id] = test
+        await self._save_test(test)
 
         logger.info(
             "Created A/B test",
@@ -354,7 +467,7 @@ class ABTestManager:
         Returns:
             True if started successfully, False otherwise
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return False
 
@@ -373,6 +486,7 @@ class ABTestManager:
             )
 
         test.updated_at = datetime.now(UTC)
+        await self._save_test(test)
 
         logger.info(f"Started A/B test {test_id}")
         return True
@@ -386,7 +500,7 @@ class ABTestManager:
         Returns:
             True if paused successfully, False otherwise
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return False
 
@@ -395,6 +509,7 @@ class ABTestManager:
 
         test.status = TestStatus.PAUSED
         test.updated_at = datetime.now(UTC)
+        await self._save_test(test)
 
         logger.info(f"Paused A/B test {test_id}")
         return True
@@ -408,7 +523,7 @@ class ABTestManager:
         Returns:
             True if stopped successfully, False otherwise
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return False
 
@@ -418,6 +533,7 @@ class ABTestManager:
         test.status = TestStatus.COMPLETED
         test.end_date = datetime.now(UTC)
         test.updated_at = datetime.now(UTC)
+        await self._save_test(test)
 
         # Generate final results
         await self._analyze_test_results(test_id)
@@ -443,7 +559,7 @@ class ABTestManager:
         Returns:
             Variant ID or None if not assigned
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test or test.status != TestStatus.RUNNING:
             return None
 
@@ -476,12 +592,25 @@ class ABTestManager:
                 variant_id=variant_id,
                 session_id=session_id,
             )
-            self.assignments[assignment.id] = assignment
-
-            # Update user assignments index
-            if user_id not in self.user_assignments:
-                self.user_assignments[user_id] = {}
-            self.user_assignments[user_id][test_id] = assignment
+            # Stored right away so that a worker assigning the same
+            # user concurrently settles on the same variant
+            try:
+                variant_id = await self.store.insert_assignment(
+                    assignment
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to persist A/B test assignment",
+                    test_id=test_id,
+                    user_id=user_id,
+                    error=str(e),
+                )
+                self.store.add_assignment(assignment)
+            if variant_id != assignment.variant_id:
+                assignment = assignment.model_copy(
+                    update={"variant_id": variant_id}
+                )
+            self._cache_assignment(assignment)
 
             logger.debug(
                 "Assigned user to variant",
@@ -531,10 +660,8 @@ class ABTestManager:
         )
 
         self.events.append(event)
-
-        # Limit event storage
-        if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events :]
+        self._record_stats(event)
+        self.store.add_event(event)
 
         logger.debug(
             "Recorded test event",
@@ -604,7 +731,7 @@ class ABTestManager:
         Returns:
             Variant configuration or None if not found
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return None
 
@@ -704,7 +831,7 @@ class ABTestManager:
 
         from chatter.core.cache_factory import get_general_cache
 
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return None
 
@@ -971,7 +1098,49 @@ class ABTestManager:
         """
         # Use indexed lookup for O(1) performance
         user_tests = self.user_assignments.get(user_id, {})
-        return user_tests.get(test_id)
+        assignment = user_tests.get(test_id)
+        if assignment is not None:
+            return assignment
+
+        # Fall back to assignments stored by other workers or before
+        # a restart
+        try:
+            row = await self.store.load_assignment(test_id, user_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to load A/B test assignment",
+                test_id=test_id,
+                user_id=user_id,
+                error=str(e),
+            )
+            return None
+        if row is None:
+            return None
+
+        assignment = TestAssignment(
+            id=row.id,
+            test_id=row.test_id,
+            user_id=row.user_id,
+            variant_id=row.variant_id,
+            session_id=row.session_id,
+            assigned_at=row.assigned_at,
+            metadata=row.extra_metadata or {},
+        )
+        self._cache_assignment(assignment)
+        return assignment
+
+    def _cache_assignment(self, assignment: TestAssignment) -> None:
+        """Add an assignment to the in-process indexes.
+
+        Args:
+            assignment: Assignment to cache
+        """
+        self.assignments[assignment.id] = assignment
+        if assignment.user_id not in self.user_assignments:
+            self.user_assignments[assignment.user_id] = {}
+        self.user_assignments[assignment.user_id][
+            assignment.test_id
+        ] = assignment
 
     async def _analyze_test_results(self, test_id: str) -> None:
         """Analyze test results and generate statistics.
@@ -979,93 +1148,32 @@ class ABTestManager:
         Args:
             test_id: Test ID
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return
 
-        # Get test events
-        test_events = [e for e in self.events if e.test_id == test_id]
+        # Read the running totals; cost is independent of event volume
+        await self._refresh_stats(test_id)
+        test_stats = self.variant_stats.get(test_id, {})
+        metric_names = [test.primary_metric.name] + [
+            metric.name for metric in test.secondary_metrics
+        ]
 
-        # Group by variant
         variant_results = {}
         for variant in test.variants:
-            variant_events = [
-                e for e in test_events if e.variant_id == variant.id
-            ]
-
-            # Calculate basic metrics
-            total_events = len(variant_events)
-            unique_users = len({e.user_id for e in variant_events})
+            stats = test_stats.get(variant.id)
 
-            # Calculate metric aggregations
             metrics = {}
-            if variant_events:
-                # Check if any events have the primary metric
-                metric_values = [
-                    e.metrics.get(test.primary_metric.name, 0)
-                    for e in variant_events
-                    if test.primary_metric.name in e.metrics
-                ]
-                if metric_values:
-                    metrics[test.primary_metric.name] = {
-                        "mean": sum(metric_values) / len(metric_values),
-                        "count": len(metric_values),
-                        "sum": sum(metric_values),
-                        "std": (
-                            (
-                                sum(
-                                    (
-                                        x
-                                        - sum(metric_values)
-                                        / len(metric_values)
-                                    )
-                                    ** 2
-                                    for x in metric_values
-                                )
-                                / len(metric_values)
-                            )
-                            ** 0.5
-                            if len(metric_values) > 1
-                            else 0.0
-                        ),
-                    }
-
-                # Calculate secondary metrics as well
-                for secondary_metric in test.secondary_metrics:
-                    secondary_values = [
-                        e.metrics.get(secondary_metric.name, 0)
-                        for e in variant_events
-                        if secondary_metric.name in e.metrics
-                    ]
-                    if secondary_values:
-                        metrics[secondary_metric.name] = {
-                            "mean": sum(secondary_values)
-                            / len(secondary_values),
-                            "count": len(secondary_values),
-                            "sum": sum(secondary_values),
-                            "std": (
-                                (
-                                    sum(
-                                        (
-                                            x
-                                            - sum(secondary_values)
-                                            / len(secondary_values)
-                                        )
-                                        ** 2
-                                        for x in secondary_values
-                                    )
-                                    / len(secondary_values)
-                                )
-                                ** 0.5
-                                if len(secondary_values) > 1
-                                else 0.0
-                            ),
-                        }
+            if stats is not None:
+                for metric_name in metric_names:
+                    metric_stats = stats.metrics.get(metric_name)
+                    if metric_stats is not None and metric_stats.count:
+                        metrics[metric_name] = metric_stats.summary()
 
             variant_results[variant.id] = {
                 "variant_name": variant.name,
-                "total_events": total_events,
-                "unique_users": unique_users,
+                "total_events": stats.event_count if stats else 0,
+                "unique_users": stats.users.count() if stats else 0,
                 "metrics": metrics,
             }
 
@@ -1266,6 +1374,305 @@ class ABTestManager:
 
         logger.info(f"Analyzed results for test {test_id}")
 
+    def _record_stats(self, event: TestEvent) -> None:
+        """Add an event to its variant's running and pending totals."""
+        key = (event.test_id, event.variant_id)
+        test_stats = self.variant_stats.setdefault(event.test_id, {})
+        totals = test_stats.get(event.variant_id)
+        if totals is None:
+            totals = test_stats[event.variant_id] = VariantStats()
+        pending = self._pending_stats.get(key)
+        if pending is None:
+            pending = self._pending_stats[key] = VariantStats()
+
+        totals.add_event(event.user_id, event.metrics)
+        pending.add_event(event.user_id, event.metrics)
+
+    async def start(self) -> None:
+        """Load stored tests and start periodically flushing writes."""
+        try:
+            await self.load_tests()
+        except Exception as e:
+            logger.error("Failed to load A/B tests", error=str(e))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and persist everything buffered."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Persist buffered assignments, events and statistics."""
+        await self.store.flush()
+        await self.flush_stats()
+
+    async def _flush_loop(self) -> None:
+        """Flush buffered writes every ``ab_test_flush_interval``.
+
+        Stored tests are reloaded at the same interval, which bounds
+        how long a test started, stopped or deleted by another worker
+        keeps its old state here.
+        """
+        while True:
+            await asyncio.sleep(settings.ab_test_flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("A/B test flush failed", error=str(e))
+            try:
+                await self.load_tests()
+            except Exception as e:
+                logger.error("A/B test reload failed", error=str(e))
+
+    async def flush_stats(self) -> None:
+        """Persist statistics recorded since the last flush.
+
+        Pending totals are merged into the stored ones under row locks,
+        so several workers can flush the same variants. On failure the
+        totals stay pending and are retried by the next flush.
+        """
+        if not self._pending_stats:
+            return
+
+        pending, self._pending_stats = self._pending_stats, {}
+        try:
+            session_maker = get_session_maker()
+            async with session_maker() as session:
+                await self._merge_persisted_stats(session, pending)
+                await session.commit()
+        except Exception as e:
+            logger.warning(
+                "Failed to persist A/B test statistics", error=str(e)
+            )
+            for key, stats in pending.items():
+                if key in self._pending_stats:
+                    self._pending_stats[key].merge(stats)
+                else:
+                    self._pending_stats[key] = stats
+
+    async def _merge_persisted_stats(
+        self,
+        session: AsyncSession,
+        pending: dict[tuple[str, str], VariantStats],
+    ) -> None:
+        """Merge pending totals into the stored rows.
+
+        Args:
+            session: Database session
+            pending: Totals to add, by (test_id, variant_id)
+        """
+        variant_keys = sorted(pending)
+        await session.execute(
+            pg_insert(ABTestVariantStats)
+            .values(
+                [
+                    {
+                        "id": generate_ulid(),
+                        "test_id": test_id,
+                        "variant_id": variant_id,
+                        "event_count": 0,
+                    }
+                    for test_id, variant_id in variant_keys
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=["test_id", "variant_id"]
+            )
+        )
+        variant_rows = await session.execute(
+            select(ABTestVariantStats)
+            .where(
+                tuple_(
+                    ABTestVariantStats.test_id,
+                    ABTestVariantStats.variant_id,
+                ).in_(variant_keys)
+            )
+            .order_by(
+                ABTestVariantStats.test_id,
+                ABTestVariantStats.variant_id,
+            )
+            .with_for_update()
+        )
+        for row in variant_rows.scalars():
+            stats = pending[(row.test_id, row.variant_id)]
+            users = (
+                HyperLogLog.from_bytes(row.user_sketch)
+                if row.user_sketch
+                else HyperLogLog()
+            )
+            users.merge(stats.users)
+            row.event_count += stats.event_count
+            row.user_sketch = users.to_bytes()
+
+        metric_keys = sorted(
+            (test_id, variant_id, metric_name)
+            for (test_id, variant_id), stats in pending.items()
+            for metric_name in stats.metrics
+        )
+        if not metric_keys:
+            return
+
+        await session.execute(
+            pg_insert(ABTestMetricStats)
+            .values(
+                [
+                    {
+                        "id": generate_ulid(),
+                        "test_id": test_id,
+                        "variant_id": variant_id,
+                        "metric_name": metric_name,
+                        "count": 0,
+                        "total": 0.0,
+                        "mean": 0.0,
+                        "m2": 0.0,
+                    }
+                    for test_id, variant_id, metric_name in metric_keys
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=["test_id", "variant_id", "metric_name"]
+            )
+        )
+        metric_rows = await session.execute(
+            select(ABTestMetricStats)
+            .where(
+                tuple_(
+                    ABTestMetricStats.test_id,
+                    ABTestMetricStats.variant_id,
+                    ABTestMetricStats.metric_name,
+                ).in_(metric_keys)
+            )
+            .order_by(
+                ABTestMetricStats.test_id,
+                ABTestMetricStats.variant_id,
+                ABTestMetricStats.metric_name,
+            )
+            .with_for_update()
+        )
+        for row in metric_rows.scalars():
+            stats = RunningStats(row.count, row.total, row.mean, row.m2)
+            stats.merge(
+                pending[(row.test_id, row.variant_id)].metrics[
+                    row.metric_name
+                ]
+            )
+            row.count = stats.count
+            row.total = stats.total
+            row.mean = stats.mean
+            row.m2 = stats.m2
+
+    async def _load_persisted_stats(
+        self, test_id: str
+    ) -> dict[str, VariantStats]:
+        """Load a test's stored totals.
+
+        Args:
+            test_id: Test ID
+
+        Returns:
+            Totals by variant ID
+        """
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            variant_rows = await session.execute(
+                select(ABTestVariantStats).where(
+                    ABTestVariantStats.test_id == test_id
+                )
+            )
+            metric_rows = await session.execute(
+                select(ABTestMetricStats).where(
+                    ABTestMetricStats.test_id == test_id
+                )
+            )
+
+            test_stats: dict[str, VariantStats] = {}
+            for row in variant_rows.scalars():
+                stats = test_stats.setdefault(
+                    row.variant_id, VariantStats()
+                )
+                stats.event_count = row.event_count
+                if row.user_sketch:
+                    stats.users = HyperLogLog.from_bytes(
+                        row.user_sketch
+                    )
+            for row in metric_rows.scalars():
+                stats = test_stats.setdefault(
+                    row.variant_id, VariantStats()
+                )
+                stats.metrics[row.metric_name] = RunningStats(
+                    row.count, row.total, row.mean, row.m2
+                )
+        return test_stats
+
+    async def _refresh_stats(self, test_id: str) -> None:
+        """Sync a test's totals with the store.
+
+        Flushes pending totals and reloads the test's stored ones, which
+        include events recorded by other workers and before a restart.
+        Keeps the in-process totals if the store is unavailable.
+
+        Args:
+            test_id: Test ID
+        """
+        await self.flush_stats()
+        try:
+            test_stats = await self._load_persisted_stats(test_id)
+        except Exception as e:
+            logger.warning(
+                "Using in-process A/B test statistics",
+                test_id=test_id,
+                error=str(e),
+            )
+            return
+
+        # Events recorded while loading (or a failed flush) are pending
+        for (pending_test_id, variant_id), stats in list(
+            self._pending_stats.items()
+        ):
+            if pending_test_id == test_id:
+                test_stats.setdefault(variant_id, VariantStats()).merge(
+                    stats
+                )
+        self.variant_stats[test_id] = test_stats
+
+    async def _delete_stats(self, test_id: str) -> None:
+        """Drop a test's in-process and stored totals.
+
+        Args:
+            test_id: Test ID
+        """
+        self.variant_stats.pop(test_id, None)
+        for key in [k for k in self._pending_stats if k[0] == test_id]:
+            del self._pending_stats[key]
+
+        try:
+            session_maker = get_session_maker()
+            async with session_maker() as session:
+                await session.execute(
+                    delete(ABTestMetricStats).where(
+                        ABTestMetricStats.test_id == test_id
+                    )
+                )
+                await session.execute(
+                    delete(ABTestVariantStats).where(
+                        ABTestVariantStats.test_id == test_id
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(
+                "Failed to delete A/B test statistics",
+                test_id=test_id,
+                error=str(e),
+            )
+
     async def _check_auto_stop_conditions(
         self, test_id: str, result: TestResult
     ) -> None:
@@ -1275,7 +1682,7 @@ class ABTestManager:
             test_id: Test ID
             result: Latest test results
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test or test.status != TestStatus.RUNNING:
             return
 
@@ -1315,6 +1722,7 @@ class ABTestManager:
             "Statistical significance reached"
         )
         test.metadata["significant_variants"] = significant_variants
+        await self._save_test(test)
 
         logger.info(
             f"Auto-stop conditions met for test {test_id}",
@@ -1396,7 +1804,7 @@ class ABTestManager:
         Returns:
             Dictionary with recommendations and insights
         """
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return {"error": "Test not found"}
 
@@ -1522,13 +1930,13 @@ class ABTestManager:
 
     async def get_test(self, test_id: str) -> ABTest | None:
         """Get a test by ID."""
-        return self.tests.get(test_id)
+        return await self._get_test(test_id)
 
     async def update_test(
         self, test_id: str, update_data: dict[str, Any]
     ) -> ABTest | None:
         """Update a test configuration."""
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if not test:
             return None
 
@@ -1538,12 +1946,13 @@ class ABTestManager:
                 setattr(test, field, value)
 
         self.tests[test_id] = test
+        await self._save_test(test)
         logger.info(f"Updated test {test_id}")
         return test
 
     async def delete_test(self, test_id: str) -> bool:
         """Delete a test and clean up all related data."""
-        if test_id in self.tests:
+        if await self._get_test(test_id) is not None:
             # Clean up test
             del self.tests[test_id]
 
@@ -1569,10 +1978,20 @@ class ABTestManager:
             for assignment_id in assignments_to_remove:
                 del self.assignments[assignment_id]
 
-            # Clean up events
-            self.events = [
-                e for e in self.events if e.test_id != test_id
-            ]
+            # Clean up events and statistics
+            self.events = deque(
+                (e for e in self.events if e.test_id != test_id),
+                maxlen=self.max_events,
+            )
+            await self._delete_stats(test_id)
+            try:
+                await self.store.delete_test(test_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to delete A/B test records",
+                    test_id=test_id,
+                    error=str(e),
+                )
 
             logger.info(
                 f"Deleted test {test_id} and cleaned up {len(assignments_to_remove)} assignments"
@@ -1582,10 +2001,11 @@ class ABTestManager:
 
     async def complete_test(self, test_id: str) -> bool:
         """Mark a test as completed."""
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if test:
             test.status = TestStatus.COMPLETED
             test.end_date = datetime.now(UTC)
+            await self._save_test(test)
             logger.info(f"Completed test {test_id}")
             return True
         return False
@@ -1599,7 +2019,7 @@ class ABTestManager:
         self, test_id: str, winner_variant: str | None = None
     ) -> bool:
         """End a test with optional winner selection."""
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         if test:
             test.status = TestStatus.COMPLETED
             test.end_date = datetime.now(UTC)
@@ -1608,6 +2028,7 @@ class ABTestManager:
                 if not test.metadata:
                     test.metadata = {}
                 test.metadata["winner_variant"] = winner_variant
+            await self._save_test(test)
             logger.info(f"Ended test {test_id}")
             return True
         return False
@@ -1616,7 +2037,7 @@ class ABTestManager:
         self, test_id: str
     ) -> dict[str, Any] | None:
         """Get test performance metrics."""
-        test = self.tests.get(test_id)
+        test = await self._get_test(test_id)
         result = self.results.get(test_id)
 
         if not test:
@@ -1632,8 +2053,11 @@ class ABTestManager:
                     if a.test_id == test_id
                 ]
             ),
-            "events_count": len(
-                [e for e in self.events if e.test_id == test_id]
+            "events_count": sum(
+                stats.event_count
+                for stats in self.variant_stats.get(
+                    test_id, {}
+                ).values()
             ),
             "start_date": test.start_date,
             "end_date": test.end_date,
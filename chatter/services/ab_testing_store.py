@@ -0,0 +1,337 @@
+"""Persistence for A/B test definitions, assignments and events."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from chatter.config import settings
+from chatter.models.ab_testing import (
+    ABTestAssignment,
+    ABTestDefinition,
+    ABTestEvent,
+)
+from chatter.utils.database import get_session_maker
+from chatter.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from chatter.services.ab_testing import (
+        ABTest,
+        TestAssignment,
+        TestEvent,
+    )
+
+logger = get_logger(__name__)
+
+
+class ABTestStore:
+    """Stores test definitions and batches assignment and event writes.
+
+    Test definitions and first assignments are written immediately, so
+    every worker sees them. Adding any other record only appends to an
+    in-memory buffer. The buffer is
+    flushed when it reaches ``batch_size`` records, when the owner's
+    periodic flush runs, and on shutdown. If the database is unavailable
+    the records stay buffered, up to ``max_buffered`` per kind, after
+    which the oldest are dropped.
+    """
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        max_buffered: int | None = None,
+    ):
+        """Initialize the store.
+
+        Args:
+            batch_size: Buffered records that trigger a flush
+            max_buffered: Maximum buffered records of each kind
+        """
+        self.batch_size = (
+            batch_size or settings.ab_test_flush_batch_size
+        )
+        self.max_buffered = (
+            max_buffered or settings.ab_test_max_buffered_writes
+        )
+        self._assignments: deque[dict[str, Any]] = deque()
+        self._events: deque[dict[str, Any]] = deque()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        # Size-triggered flushes pause after a failure until a flush
+        # (periodic or on shutdown) succeeds again
+        self._healthy = True
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered records."""
+        return len(self._assignments) + len(self._events)
+
+    @staticmethod
+    def _assignment_row(assignment: TestAssignment) -> dict[str, Any]:
+        return {
+            "id": assignment.id,
+            "test_id": assignment.test_id,
+            "user_id": assignment.user_id,
+            "variant_id": assignment.variant_id,
+            "session_id": assignment.session_id,
+            "assigned_at": assignment.assigned_at,
+            "extra_metadata": assignment.metadata or None,
+        }
+
+    def add_assignment(self, assignment: TestAssignment) -> None:
+        """Buffer an assignment for insertion."""
+        self._append(
+            self._assignments, self._assignment_row(assignment)
+        )
+
+    async def insert_assignment(
+        self, assignment: TestAssignment
+    ) -> str:
+        """Insert an assignment unless the user already has one.
+
+        Args:
+            assignment: New assignment
+
+        Returns:
+            Variant ID of the stored assignment: the given one, or the
+            one another worker stored first
+        """
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            variant_id = await session.scalar(
+                pg_insert(ABTestAssignment)
+                .values(self._assignment_row(assignment))
+                .on_conflict_do_nothing(
+                    index_elements=["test_id", "user_id"]
+                )
+                .returning(ABTestAssignment.variant_id)
+            )
+            if variant_id is None:
+                variant_id = await session.scalar(
+                    select(ABTestAssignment.variant_id).where(
+                        ABTestAssignment.test_id == assignment.test_id,
+                        ABTestAssignment.user_id == assignment.user_id,
+                    )
+                )
+            await session.commit()
+        return variant_id or assignment.variant_id
+
+    def add_event(self, event: TestEvent) -> None:
+        """Buffer an event for insertion."""
+        self._append(
+            self._events,
+            {
+                "id": event.id,
+                "test_id": event.test_id,
+                "variant_id": event.variant_id,
+                "user_id": event.user_id,
+                "session_id": event.session_id,
+                "event_type": event.event_type,
+                "event_data": event.event_data or None,
+                "metrics": event.metrics or None,
+                "timestamp": event.timestamp,
+            },
+        )
+
+    def _append(
+        self, buffer: deque[dict[str, Any]], row: dict[str, Any]
+    ) -> None:
+        """Buffer a row, dropping the oldest if the buffer is full."""
+        if len(buffer) >= self.max_buffered:
+            buffer.popleft()
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning(
+                    "A/B test write buffer full, dropping oldest",
+                    dropped=self.dropped,
+                )
+        buffer.append(row)
+
+        if self._healthy and self.pending >= self.batch_size:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start a background flush unless one is already running."""
+        task = self._flush_task
+        if task is not None and not task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_task = loop.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Insert all buffered records.
+
+        Records that fail to insert are put back in the buffer and
+        retried by the next flush.
+        """
+        async with self._flush_lock:
+            while self._assignments or self._events:
+                assignments = self._take(self._assignments)
+                events = self._take(self._events)
+                try:
+                    await self._insert(assignments, events)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to persist A/B test records",
+                        assignments=len(assignments),
+                        events=len(events),
+                        error=str(e),
+                    )
+                    self._restore(self._assignments, assignments)
+                    self._restore(self._events, events)
+                    self._healthy = False
+                    return
+            self._healthy = True
+
+    def _take(
+        self, buffer: deque[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Remove up to ``batch_size`` rows from a buffer."""
+        return [
+            buffer.popleft()
+            for _ in range(min(len(buffer), self.batch_size))
+        ]
+
+    def _restore(
+        self, buffer: deque[dict[str, Any]], rows: list[dict[str, Any]]
+    ) -> None:
+        """Put unflushed rows back at the front of a buffer."""
+        room = self.max_buffered - len(buffer)
+        if room < len(rows):
+            self.dropped += len(rows) - max(room, 0)
+            rows = rows[len(rows) - max(room, 0) :]
+        buffer.extendleft(reversed(rows))
+
+    async def _insert(
+        self,
+        assignments: list[dict[str, Any]],
+        events: list[dict[str, Any]],
+    ) -> None:
+        """Insert a batch of rows in one transaction."""
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            if assignments:
+                # Another worker may have assigned the user first; its
+                # assignment wins
+                await session.execute(
+                    pg_insert(ABTestAssignment).on_conflict_do_nothing(
+                        index_elements=["test_id", "user_id"]
+                    ),
+                    assignments,
+                )
+            if events:
+                await session.execute(insert(ABTestEvent), events)
+            await session.commit()
+
+    async def load_assignment(
+        self, test_id: str, user_id: str
+    ) -> ABTestAssignment | None:
+        """Load a stored assignment.
+
+        Args:
+            test_id: Test ID
+            user_id: User ID
+
+        Returns:
+            Stored assignment or None
+        """
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            result = await session.execute(
+                select(ABTestAssignment).where(
+                    ABTestAssignment.test_id == test_id,
+                    ABTestAssignment.user_id == user_id,
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def save_test(self, test: ABTest) -> None:
+        """Insert or update a test definition.
+
+        Args:
+            test: Test to store
+        """
+        values = {
+            "name": test.name,
+            "status": test.status.value,
+            "definition": test.model_dump(mode="json"),
+        }
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            await session.execute(
+                pg_insert(ABTestDefinition)
+                .values(id=test.id, **values)
+                .on_conflict_do_update(
+                    index_elements=["id"],
+                    set_={**values, "updated_at": func.now()},
+                )
+            )
+            await session.commit()
+
+    async def load_test(self, test_id: str) -> dict[str, Any] | None:
+        """Load a stored test definition.
+
+        Args:
+            test_id: Test ID
+
+        Returns:
+            Serialized test or None
+        """
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            return await session.scalar(
+                select(ABTestDefinition.definition).where(
+                    ABTestDefinition.id == test_id
+                )
+            )
+
+    async def load_tests(self) -> list[dict[str, Any]]:
+        """Load all stored test definitions.
+
+        Returns:
+            Serialized tests
+        """
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            result = await session.scalars(
+                select(ABTestDefinition.definition)
+            )
+            return list(result)
+
+    async def delete_test(self, test_id: str) -> None:
+        """Drop a test's definition and buffered and stored records.
+
+        Args:
+            test_id: Test ID
+        """
+        for buffer in (self._assignments, self._events):
+            kept = [row for row in buffer if row["test_id"] != test_id]
+            buffer.clear()
+            buffer.extend(kept)
+
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            await session.execute(
+                delete(ABTestEvent).where(
+                    ABTestEvent.test_id == test_id
+                )
+            )
+            await session.execute(
+                delete(ABTestAssignment).where(
+                    ABTestAssignment.test_id == test_id
+                )
+            )
+            await session.execute(
+                delete(ABTestDefinition).where(
+                    ABTestDefinition.id == test_id
+                )
+            )
+            await session.commit()
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from chatter.core.exceptions import NotFoundError, ValidationError
 from chatter.models.conversation import Conversation, ConversationStatus
 from chatter.schemas.chat import ConversationCreate, ConversationUpdate
+from chatter.utils.pagination import Keyset, paginate, sort_keyset
 from chatter.utils.performance import (
     ConversationQueryService,
     get_conversation_optimized,
@@ -173,13 +174,14 @@ class ConversationService:
         llm_model: str | None = None,
         tags: list[str] | None = None,
         enable_retrieval: bool | None = None,
+        cursor: str | None = None,
     ) -> tuple[Sequence[Conversation], int]:
         """List conversations for a user with filtering.
 
         Args:
             user_id: User ID
             limit: Maximum conversations to return
-            offset: Number of conversations to skip
+            offset: Number of conversations to skip (ignored with a cursor)
             sort_field: Field to sort by
             sort_order: Sort order (asc/desc)
             status: Filter by conversation status
@@ -187,9 +189,14 @@ class ConversationService:
             llm_model: Filter by LLM model
             tags: Filter by tags (must contain all specified tags)
             enable_retrieval: Filter by retrieval enabled status
+            cursor: Keyset cursor from a previous page; see
+                :meth:`keyset_for`
 
         Returns:
             Tuple of (list of conversations, total count)
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid for the ordering
         """
         try:
             # Build base query with filters for both count and data queries
@@ -239,19 +246,23 @@ class ConversationService:
 
             # Data query - add sorting and pagination
             data_query = base_query
+            keyset = self.keyset_for(sort_field, sort_order)
 
-            # Apply sorting
-            if sort_order.lower() == "desc":
-                data_query = data_query.order_by(
-                    getattr(Conversation, sort_field).desc()
-                )
-            else:
-                data_query = data_query.order_by(
-                    getattr(Conversation, sort_field).asc()
-                )
+            # Apply sorting for orderings without keyset support
+            if keyset is None:
+                if sort_order.lower() == "desc":
+                    data_query = data_query.order_by(
+                        getattr(Conversation, sort_field).desc()
+                    )
+                else:
+                    data_query = data_query.order_by(
+                        getattr(Conversation, sort_field).asc()
+                    )
 
             # Apply pagination
-            data_query = data_query.offset(offset).limit(limit)
+            data_query = paginate(
+                data_query, keyset, cursor=cursor, offset=offset
+            ).limit(limit)
 
             # Execute data query
             result = await self.session.execute(data_query)
@@ -264,6 +275,7 @@ class ConversationService:
                 total_count=total_count,
                 limit=limit,
                 offset=offset,
+                cursor=cursor is not None,
                 sort_field=sort_field,
                 sort_order=sort_order,
                 status=status,
@@ -283,6 +295,21 @@ class ConversationService:
             )
             raise
 
+    @staticmethod
+    def keyset_for(
+        sort_field: str = "updated_at", sort_order: str = "desc"
+    ) -> Keyset | None:
+        """Keyset used to paginate conversations in the given ordering.
+
+        Args:
+            sort_field: Field to sort by
+            sort_order: Sort order (asc/desc)
+
+        Returns:
+            Keyset, or None if the ordering does not support cursors
+        """
+        return sort_keyset(Conversation, sort_field, sort_order)
+
     async def update_conversation(
         self,
         conversation_id: str,
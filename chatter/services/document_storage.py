@@ -0,0 +1,184 @@
+"""Storage backends for uploaded document files.
+
+Backends read and write files in chunks without blocking the event
+loop. Documents record the location a backend returns when an upload
+is committed, and every later access goes through the backend with
+that location.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+
+from chatter.config import settings
+from chatter.models.base import generate_ulid
+from chatter.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class UploadWriter(ABC):
+    """An upload being written to storage.
+
+    Data is staged until ``commit`` stores it under its final name, so
+    a failed or rejected upload never becomes visible.
+    """
+
+    @abstractmethod
+    async def write(self, data: bytes) -> None:
+        """Append data to the upload."""
+
+    @abstractmethod
+    async def commit(self, name: str) -> str:
+        """Store the upload under a name.
+
+        An existing file of that name is replaced atomically.
+
+        Returns:
+            Location of the stored file
+        """
+
+    @abstractmethod
+    async def abort(self) -> None:
+        """Discard the upload."""
+
+
+class DocumentStorage(ABC):
+    """Where uploaded document files are kept."""
+
+    @abstractmethod
+    def create_upload(self) -> UploadWriter:
+        """Start writing a new upload."""
+
+    @abstractmethod
+    async def exists(self, location: str) -> bool:
+        """Whether a stored file exists."""
+
+    @abstractmethod
+    async def delete(self, location: str) -> None:
+        """Delete a stored file if it exists."""
+
+    @abstractmethod
+    def read(
+        self, location: str, chunk_size: int | None = None
+    ) -> AsyncIterator[bytes]:
+        """Read a stored file in chunks."""
+
+    def local_path(self, location: str) -> Path | None:
+        """Path of a stored file on local disk, if it has one.
+
+        Local files can be served by the web server or a proxy without
+        copying them through Python.
+        """
+        return None
+
+    def accel_redirect_uri(self, location: str) -> str | None:
+        """URI a proxy serves a stored file from, if configured.
+
+        With ``document_accel_redirect_prefix`` set, downloads answer
+        with an ``X-Accel-Redirect`` header and the proxy (e.g. nginx)
+        sends the file itself, including range requests.
+        """
+        return None
+
+
+class _LocalUploadWriter(UploadWriter):
+    """Upload staged in a hidden file next to its destination."""
+
+    def __init__(self, storage: LocalDocumentStorage):
+        self.storage = storage
+        self.temp_path = (
+            storage.root / f".upload-{generate_ulid()}.part"
+        )
+        self._file = None
+
+    async def write(self, data: bytes) -> None:
+        if self._file is None:
+            self._file = await aiofiles.open(self.temp_path, "wb")
+        await self._file.write(data)
+
+    async def commit(self, name: str) -> str:
+        if self._file is None:
+            # Empty uploads still produce a file
+            await self.write(b"")
+        await self._file.close()
+        path = self.storage.root / name
+        await aiofiles.os.replace(self.temp_path, path)
+        return str(path)
+
+    async def abort(self) -> None:
+        if self._file is not None:
+            await self._file.close()
+        try:
+            await aiofiles.os.remove(self.temp_path)
+        except FileNotFoundError:
+            pass
+
+
+class LocalDocumentStorage(DocumentStorage):
+    """Stores documents in a directory on local disk."""
+
+    def __init__(self, root: str | Path | None = None):
+        self.root = Path(root or settings.document_storage_path)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def create_upload(self) -> UploadWriter:
+        return _LocalUploadWriter(self)
+
+    async def exists(self, location: str) -> bool:
+        return await aiofiles.os.path.isfile(location)
+
+    async def delete(self, location: str) -> None:
+        try:
+            await aiofiles.os.remove(location)
+        except FileNotFoundError:
+            pass
+
+    async def read(
+        self, location: str, chunk_size: int | None = None
+    ) -> AsyncIterator[bytes]:
+        chunk_size = chunk_size or settings.file_chunk_size
+        async with aiofiles.open(location, "rb") as f:
+            while chunk := await f.read(chunk_size):
+                yield chunk
+
+    def local_path(self, location: str) -> Path | None:
+        return Path(location)
+
+    def accel_redirect_uri(self, location: str) -> str | None:
+        prefix = settings.document_accel_redirect_prefix
+        if not prefix:
+            return None
+        root = self.root.resolve()
+        try:
+            relative = Path(location).resolve().relative_to(root)
+        except ValueError:
+            return None
+        return f"{prefix.rstrip('/')}/{relative.as_posix()}"
+
+
+def create_document_storage() -> DocumentStorage:
+    """Create the storage selected by ``document_storage_backend``."""
+    backend = settings.document_storage_backend
+    if backend != "local":
+        logger.warning(
+            "Unknown document storage backend, using local",
+            backend=backend,
+        )
+    return LocalDocumentStorage()
+
+
+_document_storage: DocumentStorage | None = None
+
+
+def get_document_storage() -> DocumentStorage:
+    """Get the process-wide document storage."""
+    global _document_storage
+    if _document_storage is None:
+        _document_storage = create_document_storage()
+    return _document_storage
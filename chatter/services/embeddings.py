@@ -1,7 +1,9 @@
 """Embedding generation service."""
 
+import asyncio
 import hashlib
 import time
+from array import array
 from typing import Any
 
 import numpy as np
@@ -42,6 +44,12 @@ except ImportError:
     JOBLIB_AVAILABLE = False
 
 from chatter.config import get_settings, settings
+from chatter.core.cache import (
+    CacheConfig,
+    CacheInterface,
+    MemoryCache,
+    RedisCache,
+)
 from chatter.core.model_registry import ModelRegistryService
 from chatter.models.document import DocumentChunk
 from chatter.models.registry import ModelType, ProviderType
@@ -396,13 +404,147 @@ class DimensionalReductionEmbeddings(Embeddings):
         return self._reduce_vector(base_embedding)
 
 
+class EmbeddingCache:
+    """Content-addressed cache for embedding vectors.
+
+    Vectors are keyed by provider, model, embedding kind (document or
+    query) and the sha256 of the text, so identical chunks and repeated
+    queries are only ever sent to the provider once.
+
+    In-process backends hold vectors as float32 arrays, about 6 KB per
+    1536-dimension vector instead of about 49 KB as a list of floats.
+    pgvector stores float32 as well, so nothing stored is lost.
+    """
+
+    def __init__(
+        self,
+        cache: CacheInterface | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        """Initialize embedding cache.
+
+        Args:
+            cache: Backing cache; built from settings when omitted
+            ttl: Entry TTL in seconds (defaults to settings)
+        """
+        self.ttl = ttl or settings.embedding_cache_ttl
+        self._cache = cache or self._create_backend()
+        # Serializing backends need plain lists
+        self._compact = isinstance(self._cache, MemoryCache)
+
+    def _create_backend(self) -> CacheInterface:
+        """Create the backing cache from settings."""
+        config = CacheConfig(
+            default_ttl=self.ttl,
+            max_size=settings.embedding_cache_max_size,
+            eviction_policy="lru",
+            key_prefix="embeddings",
+            enable_stats=True,
+            disabled=settings.cache_disabled,
+        )
+        if settings.embedding_cache_backend == "redis":
+            return RedisCache(config)
+        return MemoryCache(config)
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the sha256 hex digest of a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def make_key(
+        provider: str, model: str, text_hash: str, kind: str = "doc"
+    ) -> str:
+        """Build the cache key for a text hash."""
+        return f"{provider}:{model}:{kind}:{text_hash}"
+
+    async def get_many(
+        self, keys: list[str]
+    ) -> dict[str, list[float]]:
+        """Look up several keys, returning only the hits."""
+        if not keys:
+            return {}
+        values = await asyncio.gather(
+            *(self._cache.get(key) for key in keys),
+            return_exceptions=True,
+        )
+        hits: dict[str, list[float]] = {}
+        for key, value in zip(keys, values, strict=True):
+            if isinstance(value, array) and value:
+                hits[key] = value.tolist()
+            elif isinstance(value, list) and value:
+                hits[key] = value
+        return hits
+
+    async def set_many(self, items: dict[str, list[float]]) -> None:
+        """Store several vectors; failures are logged and ignored."""
+        if not items:
+            return
+        if self._compact:
+            items = {
+                key: array("f", value) for key, value in items.items()
+            }
+        results = await asyncio.gather(
+            *(
+                self._cache.set(key, value, self.ttl)
+                for key, value in items.items()
+            ),
+            return_exceptions=True,
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            logger.warning(
+                "Failed to cache some embeddings",
+                failed=len(errors),
+                error=str(errors[0]),
+            )
+
+    async def clear(self) -> bool:
+        """Clear all cached embeddings."""
+        return await self._cache.clear()
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get backing cache statistics."""
+        return await self._cache.get_stats()
+
+
+_embedding_cache: EmbeddingCache | None = None
+_provider_semaphores: dict[str, asyncio.Semaphore] = {}
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Get the process-wide embedding cache, if enabled."""
+    global _embedding_cache
+    if not settings.embedding_cache_enabled:
+        return None
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache()
+    return _embedding_cache
+
+
+def _get_provider_semaphore(provider_name: str) -> asyncio.Semaphore:
+    """Get the in-flight limiter shared by all users of a provider."""
+    semaphore = _provider_semaphores.get(provider_name)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(
+            max(1, settings.embedding_max_concurrency)
+        )
+        _provider_semaphores[provider_name] = semaphore
+    return semaphore
+
+
 class EmbeddingService:
     """Service for generating text embeddings."""
 
-    def __init__(self, session: AsyncSession | None = None) -> None:
+    def __init__(
+        self,
+        session: AsyncSession | None = None,
+        cache: EmbeddingCache | None = None,
+    ) -> None:
         """Initialize embedding service."""
         self._session = session
         self._providers: dict[str, Embeddings] = {}
+        self._cache = cache or get_embedding_cache()
         # We'll load providers dynamically as needed
 
     async def _get_session(self) -> AsyncSession:
@@ -736,24 +878,31 @@ class EmbeddingService:
         """
         start_time = time.time()
 
-        # Get provider
-        if provider_name:
-            provider = await self.get_provider(provider_name)
-            if not provider:
-                raise EmbeddingError(
-                    f"Provider '{provider_name}' not available"
-                ) from None
-        else:
-            provider = await self.get_default_provider()
-            if not provider:
-                raise EmbeddingError(
-                    "No embedding providers available"
-                ) from None
-            provider_name = self._get_provider_name(provider)
+        provider, provider_name = await self._resolve_provider(
+            provider_name
+        )
 
         try:
-            # Generate embedding
-            embedding = await provider.aembed_query(text)
+            text_hash = EmbeddingCache.hash_text(text)
+            cache_key = EmbeddingCache.make_key(
+                provider_name,
+                self._get_cache_model_key(provider, provider_name),
+                text_hash,
+                kind="query",
+            )
+
+            # Serve repeated queries from the embedding cache
+            cached = (
+                await self._cache.get_many([cache_key])
+                if self._cache
+                else {}
+            )
+            embedding = cached.get(cache_key)
+            if embedding is None:
+                async with _get_provider_semaphore(provider_name):
+                    embedding = await provider.aembed_query(text)
+                if self._cache:
+                    await self._cache.set_many({cache_key: embedding})
 
             # Calculate usage info
             usage_info = {
@@ -764,7 +913,8 @@ class EmbeddingService:
                 "response_time_ms": int(
                     (time.time() - start_time) * 1000
                 ),
-                "text_hash": hashlib.sha256(text.encode()).hexdigest(),
+                "text_hash": text_hash,
+                "cached": cache_key in cached,
             }
 
             logger.debug(
@@ -788,27 +938,39 @@ class EmbeddingService:
                 f"Failed to generate embedding: {str(e)}"
             ) from e
 
-    async def generate_embeddings(
-        self,
-        texts: list[str],
-        provider_name: str | None = None,
-        batch_size: int = 100,
-    ) -> tuple[list[list[float]], dict[str, Any]]:
-        """Generate embeddings for multiple texts.
+    async def get_model_identity(
+        self, provider_name: str | None = None
+    ) -> tuple[str, str]:
+        """Get the provider and model that embed documents.
+
+        The model matches the ``model`` reported by
+        ``generate_embeddings`` and stored on chunks, so stored vectors
+        can be reused exactly when both are equal.
 
         Args:
-            texts: List of texts to embed
             provider_name: Specific provider to use (optional)
-            batch_size: Batch size for processing
 
         Returns:
-            Tuple of (embedding vectors list, usage info)
+            Tuple of (provider name, model identity)
 
         Raises:
-            EmbeddingError: If embedding generation fails
+            EmbeddingError: If no provider is available
         """
-        start_time = time.time()
+        provider, provider_name = await self._resolve_provider(
+            provider_name
+        )
+        return provider_name, self._get_cache_model_key(
+            provider, provider_name
+        )
 
+    async def _resolve_provider(
+        self, provider_name: str | None
+    ) -> tuple[Embeddings, str]:
+        """Get a provider instance and its name.
+
+        Raises:
+            EmbeddingError: If the provider is not available
+        """
         # Get provider
         if provider_name:
             provider = await self.get_provider(provider_name)
@@ -823,24 +985,121 @@ class EmbeddingService:
                     "No embedding providers available"
                 ) from None
             provider_name = self._get_provider_name(provider)
+        return provider, provider_name
+
+    async def generate_embeddings(
+        self,
+        texts: list[str],
+        provider_name: str | None = None,
+        batch_size: int = 100,
+        max_concurrency: int | None = None,
+    ) -> tuple[list[list[float]], dict[str, Any]]:
+        """Generate embeddings for multiple texts.
+
+        Texts already present in the embedding cache, and duplicates
+        within ``texts``, are not sent to the provider. The remaining
+        texts are embedded in batches that run concurrently, bounded by
+        ``max_concurrency`` for this call and by the per-provider
+        in-flight limit shared across the process.
+
+        Args:
+            texts: List of texts to embed
+            provider_name: Specific provider to use (optional)
+            batch_size: Batch size for processing
+            max_concurrency: Maximum concurrent batches for this call
+                (defaults to settings.embedding_max_concurrency)
+
+        Returns:
+            Tuple of (embedding vectors list, usage info)
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        start_time = time.time()
+
+        provider, provider_name = await self._resolve_provider(
+            provider_name
+        )
 
         try:
-            # Process in batches
-            all_embeddings = []
-            total_chars = 0
-
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i : i + batch_size]
-                batch_embeddings = await provider.aembed_documents(
-                    batch
+            model_key = self._get_cache_model_key(provider, provider_name)
+
+            # Deduplicate by content hash, keeping first-seen order
+            text_keys: list[str] = []
+            unique_texts: dict[str, str] = {}
+            for text in texts:
+                key = EmbeddingCache.make_key(
+                    provider_name,
+                    model_key,
+                    EmbeddingCache.hash_text(text),
+                )
+                text_keys.append(key)
+                unique_texts.setdefault(key, text)
+
+            vectors = (
+                await self._cache.get_many(list(unique_texts))
+                if self._cache
+                else {}
+            )
+            cache_hits = len(vectors)
+            pending = [
+                (key, text)
+                for key, text in unique_texts.items()
+                if key not in vectors
+            ]
+
+            # Embed the misses in concurrent, bounded batches
+            batches = [
+                pending[i : i + batch_size]
+                for i in range(0, len(pending), batch_size)
+            ]
+            call_limit = asyncio.Semaphore(
+                max(
+                    1,
+                    max_concurrency
+                    or settings.embedding_max_concurrency,
                 )
-                all_embeddings.extend(batch_embeddings)
-                total_chars += sum(len(text) for text in batch)
+            )
+            provider_limit = _get_provider_semaphore(provider_name)
+
+            async def embed_batch(
+                batch: list[tuple[str, str]],
+            ) -> list[list[float]]:
+                async with call_limit, provider_limit:
+                    return await provider.aembed_documents(
+                        [text for _, text in batch]
+                    )
+
+            results = await asyncio.gather(
+                *(embed_batch(batch) for batch in batches)
+            )
+
+            new_vectors: dict[str, list[float]] = {}
+            for batch, batch_embeddings in zip(
+                batches, results, strict=True
+            ):
+                if len(batch_embeddings) != len(batch):
+                    raise EmbeddingError(
+                        f"Provider returned {len(batch_embeddings)} "
+                        f"embeddings for {len(batch)} texts"
+                    )
+                for (key, _), embedding in zip(
+                    batch, batch_embeddings, strict=True
+                ):
+                    new_vectors[key] = embedding
+
+            if self._cache:
+                await self._cache.set_many(new_vectors)
+            vectors.update(new_vectors)
+
+            all_embeddings = [vectors[key] for key in text_keys]
+            total_chars = sum(len(text) for text in texts)
 
             # Calculate usage info
             usage_info = {
                 "provider": provider_name,
-                "model": self._get_model_name(provider_name),
+                # Exact model identity, including dimension reduction
+                "model": model_key,
                 "text_count": len(texts),
                 "total_characters": total_chars,
                 "embedding_dimensions": (
@@ -850,6 +1109,9 @@ class EmbeddingService:
                     (time.time() - start_time) * 1000
                 ),
                 "batch_size": batch_size,
+                "batch_count": len(batches),
+                "cache_hits": cache_hits,
+                "embedded_count": len(pending),
             }
 
             logger.info(
@@ -858,6 +1120,8 @@ class EmbeddingService:
                 text_count=len(texts),
                 total_characters=total_chars,
                 dimensions=usage_info["embedding_dimensions"],
+                cache_hits=cache_hits,
+                embedded_count=len(pending),
                 response_time_ms=usage_info["response_time_ms"],
             )
 
@@ -895,6 +1159,24 @@ class EmbeddingService:
         else:
             return "unknown"
 
+    def _get_cache_model_key(
+        self, provider: Embeddings, provider_name: str
+    ) -> str:
+        """Get the model identity used in embedding cache keys.
+
+        Includes the dimensional reduction settings, since they change
+        the stored vectors for the same base model.
+        """
+        base = getattr(provider, "base", provider)
+        model = (
+            getattr(base, "model", None)
+            or getattr(base, "model_name", None)
+            or self._get_model_name(provider_name)
+        )
+        if isinstance(provider, DimensionalReductionEmbeddings):
+            return f"{model}@{provider.strategy}{provider.target_dim}"
+        return str(model)
+
     def _get_model_name(self, provider_name: str) -> str:
         """Get model name for provider."""
         # For now, return generic model names since specific model settings
@@ -1057,10 +1339,10 @@ class EmbeddingService:
             )
             stats["total_chunks"] = int(total_result.scalar() or 0)
 
-            # Chunks with embeddings (using hybrid vector fields)
+            # Chunks with embeddings (the indexed vector is always set)
             embedded_result = await self._session.execute(
                 select(func.count(DocumentChunk.id)).where(
-                    DocumentChunk.raw_embedding.is_not(None)
+                    DocumentChunk.embedding.is_not(None)
                 )
             )
             stats["embedded_chunks"] = int(
@@ -0,0 +1,358 @@
+"""Bounded, fair scheduling of background document ingestion.
+
+Uploads queue documents here instead of starting a task each. A fixed
+number of ingests run at once, which bounds database connections and
+embedding load, and users take turns so one large upload batch cannot
+hold back everyone else. CPU-bound extraction and chunking run in a
+process pool, keeping the event loop responsive while files are parsed.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any
+
+from chatter.config import settings
+from chatter.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Latency samples kept per stage for percentiles
+STAGE_SAMPLES = 1000
+
+
+class IngestQueueFullError(Exception):
+    """No room to queue another document for processing."""
+
+    pass
+
+
+@dataclass(slots=True)
+class IngestJob:
+    """A document waiting for or undergoing processing."""
+
+    document_id: str
+    user_id: str
+    run: Callable[[], Awaitable[None]]
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class _StageStats:
+    """Running latency statistics of one ingest stage."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=STAGE_SAMPLES)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.samples.append(seconds)
+
+    def summary(self) -> dict[str, float | int]:
+        ordered = sorted(self.samples)
+        p95 = ordered[int(0.95 * (len(ordered) - 1))] if ordered else 0
+        return {
+            "count": self.count,
+            "avg_seconds": self.total / max(1, self.count),
+            "p95_seconds": p95,
+            "max_seconds": self.max,
+        }
+
+
+class IngestScheduler:
+    """Runs queued document ingests with bounded concurrency.
+
+    Jobs wait in one queue per user and workers take them round-robin
+    across users. Admission is checked before a document is stored, so
+    a full queue rejects the upload instead of leaving an orphaned
+    pending document.
+
+    Running jobs are tracked: ``stop`` lets them finish within
+    ``shutdown_timeout``, cancels the rest and reports every document
+    left unprocessed. The application records those documents and
+    queues them again on its next start, where processing resumes
+    after their committed chunk batches.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 2,
+        max_queue_size: int = 100,
+        max_queued_per_user: int = 20,
+        process_workers: int = 0,
+        shutdown_timeout: float = 30.0,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrent: Documents processed at once
+            max_queue_size: Maximum documents waiting in total
+            max_queued_per_user: Maximum documents one user may have
+                waiting
+            process_workers: Processes for extraction and chunking; 0
+                leaves them in this process
+            shutdown_timeout: Seconds ``stop`` waits for running jobs
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue_size = max_queue_size
+        self.max_queued_per_user = max_queued_per_user
+        self.process_workers = process_workers
+        self.shutdown_timeout = shutdown_timeout
+        self._queues: OrderedDict[str, deque[IngestJob]] = (
+            OrderedDict()
+        )
+        self._queued = 0
+        self._running: dict[asyncio.Task, IngestJob] = {}
+        self._workers: list[asyncio.Task] = []
+        self._available: asyncio.Semaphore | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._stopping = False
+        self._stages: dict[str, _StageStats] = {}
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of documents waiting for a worker."""
+        return self._queued
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are taking jobs."""
+        return bool(self._workers)
+
+    def check_capacity(self, user_id: str) -> None:
+        """Check that a user may queue another document.
+
+        Raises:
+            IngestQueueFullError: If the queue or the user's share of
+                it is full
+        """
+        if self._stopping:
+            detail = "Document processing is shutting down"
+        elif self._queued >= self.max_queue_size:
+            detail = "Document processing queue is full"
+        elif (
+            len(self._queues.get(user_id, ()))
+            >= self.max_queued_per_user
+        ):
+            detail = "Too many documents waiting for processing"
+        else:
+            return
+        self._rejected += 1
+        raise IngestQueueFullError(detail)
+
+    def submit(
+        self,
+        document_id: str,
+        user_id: str,
+        run: Callable[[], Awaitable[None]],
+    ) -> IngestJob:
+        """Queue a document for processing.
+
+        Capacity is not checked again here: the document is already
+        stored by the time it is submitted, so dropping it would only
+        strand it.
+
+        Args:
+            document_id: Document to process
+            user_id: Owner whose turn the job takes
+            run: Processes the document
+
+        Returns:
+            The queued job
+        """
+        job = IngestJob(
+            document_id=document_id, user_id=user_id, run=run
+        )
+        self._queues.setdefault(user_id, deque()).append(job)
+        self._queued += 1
+        self._submitted += 1
+        if self._workers:
+            self._available.release()
+        else:
+            # New workers start with a permit per queued job,
+            # including this one
+            self._ensure_workers()
+        return job
+
+    async def run_in_pool(
+        self, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Run a CPU-bound function in the extraction process pool.
+
+        Falls back to a thread when no process pool is configured.
+        """
+        if self.process_workers <= 0:
+            return await asyncio.to_thread(func, *args)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                # Forking a process running an event loop and database
+                # pools is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        executor = self._executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, func, *args
+            )
+        except BrokenProcessPool:
+            # A worker died, e.g. killed for memory; later documents
+            # get a fresh pool
+            if self._executor is executor:
+                self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def record_stages(self, timings: dict[str, float]) -> None:
+        """Record how long a document spent in each pipeline stage."""
+        for stage, seconds in timings.items():
+            self._record(stage, seconds)
+
+    async def start(self) -> None:
+        """Start the workers."""
+        self._stopping = False
+        self._ensure_workers()
+
+    async def stop(self) -> dict[str, list[str]]:
+        """Stop the workers, letting running jobs finish first.
+
+        Returns:
+            Document IDs left unprocessed, under ``interrupted`` for
+            jobs cancelled mid-run and ``queued`` for jobs never started
+        """
+        self._stopping = True
+        queued = [
+            job.document_id
+            for jobs in self._queues.values()
+            for job in jobs
+        ]
+        self._queues.clear()
+        self._queued = 0
+
+        interrupted: list[str] = []
+        if self._running:
+            _, pending = await asyncio.wait(
+                list(self._running), timeout=self.shutdown_timeout
+            )
+            interrupted = [
+                self._running[task].document_id for task in pending
+            ]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._available = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+        if interrupted or queued:
+            logger.warning(
+                "Document ingests left unprocessed at shutdown",
+                interrupted=interrupted,
+                queued=queued,
+            )
+        return {"interrupted": interrupted, "queued": queued}
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue, throughput and stage latency statistics."""
+        return {
+            "running": self.running,
+            "queue_depth": self._queued,
+            "max_queue_size": self.max_queue_size,
+            "queued_users": len(self._queues),
+            "active_jobs": len(self._running),
+            "max_concurrent": self.max_concurrent,
+            "process_workers": self.process_workers,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "stages": {
+                stage: stats.summary()
+                for stage, stats in self._stages.items()
+            },
+        }
+
+    def _ensure_workers(self) -> None:
+        """Start the workers if they are not running."""
+        if self._workers:
+            return
+        self._available = asyncio.Semaphore(self._queued)
+        self._workers = [
+            asyncio.create_task(self._work())
+            for _ in range(self.max_concurrent)
+        ]
+
+    def _next_job(self) -> IngestJob:
+        """Take the next job, rotating between users."""
+        user_id, jobs = self._queues.popitem(last=False)
+        job = jobs.popleft()
+        if jobs:
+            self._queues[user_id] = jobs
+        self._queued -= 1
+        return job
+
+    async def _work(self) -> None:
+        """Run queued jobs one at a time until cancelled."""
+        while True:
+            await self._available.acquire()
+            job = self._next_job()
+            started = time.monotonic()
+            self._record("queue_wait", started - job.submitted_at)
+
+            # Jobs run as their own tasks so stop() can wait for them
+            # with a timeout
+            task = asyncio.create_task(job.run())
+            self._running[task] = job
+            try:
+                await task
+                self._completed += 1
+                self._record("total", time.monotonic() - started)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failed += 1
+                logger.error(
+                    "Document ingest failed",
+                    document_id=job.document_id,
+                    error=str(e),
+                )
+            finally:
+                del self._running[task]
+
+    def _record(self, stage: str, seconds: float) -> None:
+        self._stages.setdefault(stage, _StageStats()).record(seconds)
+
+
+_ingest_scheduler = IngestScheduler(
+    max_concurrent=settings.ingest_max_concurrent,
+    max_queue_size=settings.ingest_queue_size,
+    max_queued_per_user=settings.ingest_max_queued_per_user,
+    process_workers=settings.ingest_process_workers,
+    shutdown_timeout=settings.ingest_shutdown_timeout,
+)
+
+
+def get_ingest_scheduler() -> IngestScheduler:
+    """Get the process-wide ingest scheduler."""
+    return _ingest_scheduler
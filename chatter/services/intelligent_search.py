@@ -3,7 +3,7 @@
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chatter.core.cache_factory import get_general_cache
@@ -11,6 +11,7 @@ from chatter.models.conversation import Conversation
 from chatter.models.document import Document
 from chatter.models.prompt import Prompt
 from chatter.services.embeddings import EmbeddingService
+from chatter.utils import text_search
 from chatter.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -39,7 +40,7 @@ class IntelligentSearchService:
 
         # Perform base semantic search
         base_results = await self._perform_base_search(
-            query, query_embedding, search_type, limit
+            query, query_embedding, search_type, limit, user_id
         )
 
         # Get personalized context
@@ -92,8 +93,13 @@ class IntelligentSearchService:
         query_embedding: list[float],
         search_type: str,
         limit: int,
+        user_id: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Perform base semantic search using vector store."""
+        """Perform base semantic search using vector store.
+
+        Conversations and prompts are matched with full-text search and
+        scored by their normalized ts_rank.
+        """
         results = []
 
         try:
@@ -120,24 +126,38 @@ class IntelligentSearchService:
                     )
 
             elif search_type == "conversations":
-                # Text search for conversations
+                tsquery = text_search.prefix_tsquery(query)
+                if tsquery is None:
+                    return results
+
+                # Full-text search for conversations
+                rank = text_search.rank(
+                    Conversation.search_vector, tsquery
+                ).label("rank")
                 stmt = (
-                    select(Conversation)
-                    .where(Conversation.title.ilike(f"%{query}%"))
-                    .order_by(desc(Conversation.updated_at))
+                    select(Conversation, rank)
+                    .where(
+                        text_search.matches(
+                            Conversation.search_vector, tsquery
+                        )
+                    )
+                    .order_by(desc(rank), desc(Conversation.updated_at))
                     .limit(limit)
                 )
+                if user_id:
+                    stmt = stmt.where(Conversation.user_id == user_id)
                 result = await self.session.execute(stmt)
-                conversations = result.scalars().all()
 
-                for conv in conversations:
+                for conv, conv_rank in result.all():
                     results.append(
                         {
                             "type": "conversation",
                             "id": conv.id,
                             "title": conv.title,
                             "content": conv.title,  # Could include first message
-                            "score": 0.8,  # Text match score
+                            "score": text_search.normalize_rank(
+                                conv_rank
+                            ),
                             "metadata": {
                                 "created_at": conv.created_at.isoformat(),
                                 "user_id": conv.user_id,
@@ -146,30 +166,44 @@ class IntelligentSearchService:
                     )
 
             elif search_type == "prompts":
-                # Text search for prompts
+                tsquery = text_search.prefix_tsquery(query)
+                if tsquery is None:
+                    return results
+
+                # Full-text search for prompts
+                rank = text_search.rank(
+                    Prompt.search_vector, tsquery
+                ).label("rank")
                 stmt = (
-                    select(Prompt)
+                    select(Prompt, rank)
                     .where(
-                        Prompt.name.ilike(f"%{query}%")
-                        | Prompt.template.ilike(f"%{query}%")
+                        text_search.matches(Prompt.search_vector, tsquery)
                     )
-                    .order_by(desc(Prompt.updated_at))
+                    .order_by(desc(rank), desc(Prompt.updated_at))
                     .limit(limit)
                 )
+                if user_id:
+                    stmt = stmt.where(
+                        or_(
+                            Prompt.owner_id == user_id,
+                            Prompt.is_public.is_(True),
+                        )
+                    )
                 result = await self.session.execute(stmt)
-                prompts = result.scalars().all()
 
-                for prompt in prompts:
+                for prompt, prompt_rank in result.all():
                     results.append(
                         {
                             "type": "prompt",
                             "id": prompt.id,
                             "name": prompt.name,
-                            "content": prompt.template,
-                            "score": 0.8,
+                            "content": prompt.content,
+                            "score": text_search.normalize_rank(
+                                prompt_rank
+                            ),
                             "metadata": {
                                 "created_at": prompt.created_at.isoformat(),
-                                "user_id": prompt.user_id,
+                                "user_id": prompt.owner_id,
                                 "variables": prompt.variables or [],
                             },
                         }
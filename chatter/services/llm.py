@@ -388,6 +388,11 @@ class LLMService:
                     provider_count=provider_count,
                 )
 
+        # Compiled workflow graphs hold LLM instances
+        from chatter.core.workflow_performance import get_workflow_cache
+
+        get_workflow_cache().compiled_graphs.clear()
+
     async def get_llm(
         self,
         provider: str | None = None,
@@ -5,15 +5,38 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import (
+    Insert,
+    and_,
+    desc,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 from chatter.core.exceptions import (
     AuthorizationError,
     NotFoundError,
     ValidationError,
 )
-from chatter.models.conversation import Message, MessageRole
+from chatter.models.base import generate_ulid
+from chatter.models.conversation import (
+    Conversation,
+    Message,
+    MessageRole,
+)
+from chatter.utils import text_search
+from chatter.utils.pagination import (
+    InvalidCursorError,
+    Keyset,
+    paginate,
+)
 from chatter.utils.performance import (
     QueryOptimizer,
     get_performance_metrics,
@@ -22,6 +45,101 @@ from chatter.utils.security_enhanced import get_secure_logger
 
 logger = get_secure_logger(__name__)
 
+# Messages are paginated in sequence order within a conversation
+MESSAGE_KEYSET = Keyset(Message.sequence_number)
+
+# Conversation aggregates returned alongside an appended message
+APPEND_CONVERSATION_COLUMNS = (
+    "updated_at",
+    "message_count",
+    "total_tokens",
+    "total_cost",
+)
+
+
+def build_append_message_statement(
+    conversation_id: str, user_id: str, values: dict[str, Any]
+) -> Insert:
+    """Build the single statement that appends a message.
+
+    A data-modifying CTE bumps the owner's conversation aggregates and
+    row-locks it; the INSERT takes its sequence number from the new
+    ``message_count`` so concurrent appends serialize. A count that is
+    behind the stored messages is first raised past the highest
+    sequence; the statement snapshot may miss a message committed by
+    the appender holding the lock, but that appender's count, read
+    from the locked row, covers it. No row is returned when the
+    conversation does not exist or belongs to another user.
+
+    Args:
+        conversation_id: Conversation ID
+        user_id: Owner user ID
+        values: Message column values, without ``sequence_number``
+
+    Returns:
+        INSERT ... RETURNING statement with the message columns and the
+        conversation aggregates prefixed with ``conversation_``
+    """
+    conversations = Conversation.__table__
+    messages = Message.__table__
+
+    tokens = values.get("total_tokens") or 0
+    cost = values.get("cost") or 0.0
+    last_sequence = (
+        select(func.max(messages.c.sequence_number))
+        .where(messages.c.conversation_id == conversation_id)
+        .scalar_subquery()
+    )
+    conversation_update = (
+        update(conversations)
+        .where(
+            conversations.c.id == conversation_id,
+            conversations.c.user_id == user_id,
+        )
+        .values(
+            updated_at=func.now(),
+            message_count=func.greatest(
+                conversations.c.message_count,
+                func.coalesce(last_sequence, -1) + 1,
+            )
+            + 1,
+            total_tokens=conversations.c.total_tokens + tokens,
+            total_cost=conversations.c.total_cost + cost,
+        )
+        .returning(
+            conversations.c.id,
+            *(conversations.c[key] for key in APPEND_CONVERSATION_COLUMNS),
+        )
+        .cte("conversation_update")
+    )
+
+    next_sequence = conversation_update.c.message_count - 1
+
+    names = list(values)
+    rows = select(
+        *(literal(values[name], messages.c[name].type) for name in names),
+        next_sequence,
+    ).select_from(conversation_update)
+
+    return (
+        insert(messages)
+        .from_select([*names, "sequence_number"], rows)
+        .add_cte(conversation_update)
+        .returning(
+            *(
+                column
+                for column in messages.c
+                if column.name != "search_vector"
+            ),
+            *(
+                select(conversation_update.c[key])
+                .scalar_subquery()
+                .label(f"conversation_{key}")
+                for key in APPEND_CONVERSATION_COLUMNS
+            ),
+        )
+    )
+
 
 class MessageService:
     """Service for managing messages within conversations with performance optimization."""
@@ -38,21 +156,28 @@ class MessageService:
         limit: int | None = None,
         offset: int = 0,
         include_system: bool = True,
+        cursor: str | None = None,
     ) -> Sequence[Message]:
         """Get messages for a conversation with access control and optimization.
 
+        Messages are returned in sequence order. Pass the cursor built by
+        ``MESSAGE_KEYSET.next_cursor`` from a full page to continue after
+        it without scanning the skipped messages.
+
         Args:
             conversation_id: Conversation ID
             user_id: User ID for access control
             limit: Optional limit on number of messages
-            offset: Number of messages to skip
+            offset: Number of messages to skip (ignored with a cursor)
             include_system: Whether to include system messages
+            cursor: Keyset cursor from a previous page
 
         Returns:
             List of messages
 
         Raises:
             AuthorizationError: If user doesn't have access to conversation
+            InvalidCursorError: If the cursor is invalid
         """
         async with self.performance_monitor.measure_query(
             "get_conversation_messages"
@@ -68,11 +193,13 @@ class MessageService:
                     conversation_id, user_id, include_messages=False
                 )
 
-                # Build optimized query for messages
-                query = (
-                    select(Message)
-                    .where(Message.conversation_id == conversation_id)
-                    .order_by(Message.created_at)
+                # Build optimized query for messages, ordered along the
+                # (conversation_id, sequence_number) index
+                query = select(Message).where(
+                    Message.conversation_id == conversation_id
+                )
+                query = paginate(
+                    query, MESSAGE_KEYSET, cursor=cursor, offset=offset
                 )
 
                 # Apply query optimization with eager loading
@@ -87,9 +214,6 @@ class MessageService:
                         Message.role != MessageRole.SYSTEM
                     )
 
-                if offset > 0:
-                    query = query.offset(offset)
-
                 if limit is not None:
                     query = query.limit(limit)
 
@@ -103,11 +227,12 @@ class MessageService:
                     message_count=len(messages),
                     limit=limit,
                     offset=offset,
+                    cursor=cursor is not None,
                 )
 
                 return messages
 
-            except NotFoundError:
+            except (NotFoundError, InvalidCursorError):
                 # Re-raise the original error to avoid misleading authorization errors
                 raise
             except Exception as e:
@@ -130,9 +255,15 @@ class MessageService:
         output_tokens: int | None = None,
         cost: float | None = None,
         provider: str | None = None,
+        response_time_ms: int | None = None,
     ) -> Message:
         """Add a new message to a conversation.
 
+        The access check, sequence number assignment, insert and the
+        conversation's ``updated_at``/``message_count``/``total_tokens``/
+        ``total_cost`` update run as one statement, so concurrent writers
+        cannot lose aggregate updates or reuse a sequence number.
+
         Args:
             conversation_id: Conversation ID
             user_id: User ID (for access control)
@@ -143,6 +274,7 @@ class MessageService:
             output_tokens: Optional output token count
             cost: Optional cost
             provider: Optional provider name
+            response_time_ms: Optional response time in milliseconds
 
         Returns:
             Created message
@@ -155,51 +287,41 @@ class MessageService:
             "add_message_to_conversation"
         ):
             try:
-                # Verify user has access to conversation
-                from chatter.services.conversation import (
-                    ConversationService,
-                )
-
-                conv_service = ConversationService(self.session)
-                conversation = await conv_service.get_conversation(
-                    conversation_id, user_id, include_messages=False
-                )
-
-                # Get the next sequence number for this conversation
-                next_seq_query = (
-                    select(Message.sequence_number)
-                    .where(Message.conversation_id == conversation_id)
-                    .order_by(desc(Message.sequence_number))
-                    .limit(1)
-                )
-
-                result = await self.session.execute(next_seq_query)
-                last_sequence = result.scalar()
-                next_sequence = (
-                    0 if last_sequence is None else last_sequence + 1
-                )
+                total_tokens = None
+                if input_tokens is not None or output_tokens is not None:
+                    total_tokens = (input_tokens or 0) + (
+                        output_tokens or 0
+                    )
 
-                # Create the message
-                message = Message(
-                    conversation_id=conversation_id,
-                    role=role,
-                    content=content,
-                    extra_metadata=metadata or {},
-                    prompt_tokens=input_tokens,
-                    completion_tokens=output_tokens,
-                    cost=cost,
-                    provider_used=provider,
-                    sequence_number=next_sequence,
+                statement = build_append_message_statement(
+                    conversation_id,
+                    user_id,
+                    {
+                        "id": generate_ulid(),
+                        "conversation_id": conversation_id,
+                        "role": role,
+                        "content": content,
+                        "extra_metadata": metadata or {},
+                        "prompt_tokens": input_tokens,
+                        "completion_tokens": output_tokens,
+                        "total_tokens": total_tokens,
+                        "cost": cost,
+                        "provider_used": provider,
+                        "response_time_ms": response_time_ms,
+                        "retry_count": 0,
+                        "rating_count": 0,
+                    },
                 )
+                result = await self.session.execute(statement)
+                row = result.mappings().one_or_none()
+                if row is None:
+                    raise NotFoundError(
+                        "Conversation not found or not accessible",
+                        resource_type="conversation",
+                        resource_id=conversation_id,
+                    )
 
-                self.session.add(message)
-                await self.session.flush()
-                await self.session.refresh(message)
-
-                # Update conversation's updated_at timestamp
-                conversation.updated_at = message.created_at
-
-                # Ensure the message and conversation changes are committed to the database
+                message = self._attach_appended_message(row)
                 await self.session.commit()
 
                 logger.info(
@@ -218,6 +340,7 @@ class MessageService:
                     "Access denied to conversation"
                 ) from e
             except Exception as e:
+                await self.session.rollback()
                 logger.error(
                     "Failed to add message to conversation",
                     conversation_id=conversation_id,
@@ -229,6 +352,33 @@ class MessageService:
                     f"Failed to add message: {e}"
                 ) from e
 
+    def _attach_appended_message(self, row: Any) -> Message:
+        """Turn an appended message row into a persistent Message.
+
+        Also refreshes the aggregates of the conversation if it is
+        already loaded in this session.
+        """
+        message = Message(
+            **{
+                attr.key: row[attr.columns[0].name]
+                for attr in Message.__mapper__.column_attrs
+                if attr.columns[0].name in row
+            }
+        )
+        make_transient_to_detached(message)
+        self.session.add(message)
+
+        conversation = self.session.identity_map.get(
+            identity_key(Conversation, row["conversation_id"])
+        )
+        if conversation is not None:
+            for key in APPEND_CONVERSATION_COLUMNS:
+                set_committed_value(
+                    conversation, key, row[f"conversation_{key}"]
+                )
+
+        return message
+
     async def delete_message(
         self, conversation_id: str, message_id: str, user_id: str
     ) -> None:
@@ -492,16 +642,27 @@ class MessageService:
                 conversation_id, user_id, include_messages=False
             )
 
-            # Search messages
+            # Search messages, best matches first
+            tsquery = text_search.prefix_tsquery(search_term)
+            if tsquery is None:
+                return []
+
             query = (
                 select(Message)
                 .where(
                     and_(
                         Message.conversation_id == conversation_id,
-                        Message.content.ilike(f"%{search_term}%"),
+                        text_search.matches(
+                            Message.search_vector, tsquery
+                        ),
                     )
                 )
-                .order_by(desc(Message.created_at))
+                .order_by(
+                    desc(
+                        text_search.rank(Message.search_vector, tsquery)
+                    ),
+                    desc(Message.created_at),
+                )
                 .limit(limit)
             )
 
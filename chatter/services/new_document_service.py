@@ -7,16 +7,17 @@ NO backwards compatibility - completely new design.
 import hashlib
 import mimetypes
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from fastapi import UploadFile
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, delete, desc, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chatter.config import settings
 from chatter.core.embedding_pipeline import EmbeddingPipeline
-from chatter.models.base import generate_ulid
+from chatter.core.retrieval_cache import get_retrieval_cache
 from chatter.models.document import (
     Document,
     DocumentChunk,
@@ -28,10 +29,33 @@ from chatter.schemas.document import (
     DocumentListRequest,
     DocumentSearchRequest,
 )
+from chatter.services.document_storage import get_document_storage
+from chatter.services.ingest_scheduler import (
+    IngestQueueFullError,
+    get_ingest_scheduler,
+)
 from chatter.utils.logging import get_logger
+from chatter.utils.pagination import (
+    InvalidCursorError,
+    Keyset,
+    paginate,
+    sort_keyset,
+)
 
 logger = get_logger(__name__)
 
+# processing_error of documents a shutdown left unprocessed; they are
+# queued again when the application next starts
+INTERRUPTED_ERROR = "Processing interrupted by shutdown"
+
+# Documents whose committed chunks are kept when processed again, so
+# processing resumes after them
+_RESUMABLE_STATUSES = (
+    DocumentStatus.PENDING,
+    DocumentStatus.PROCESSING,
+    DocumentStatus.FAILED,
+)
+
 
 class DocumentServiceError(Exception):
     """Document service error."""
@@ -45,8 +69,7 @@ class NewDocumentService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.pipeline = EmbeddingPipeline(session)
-        self.storage_path = Path(settings.document_storage_path)
-        self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.storage = get_document_storage()
 
     async def create_document(
         self,
@@ -66,12 +89,16 @@ class NewDocumentService:
 
         Raises:
             DocumentServiceError: If creation fails
+            IngestQueueFullError: If the processing queue is full
         """
+        scheduler = get_ingest_scheduler()
+        # Reject before storing anything the queue could not process
+        scheduler.check_capacity(user_id)
+
         try:
             # Memory-efficient file processing using streaming
             hasher = hashlib.sha256()
             file_size = 0
-            CHUNK_SIZE = 64 * 1024  # 64KB chunks for better performance
 
             # Validate file extension early
             file_ext = (
@@ -92,44 +119,53 @@ class NewDocumentService:
                 upload_file.filename, mime_type
             )
 
-            # Generate unique filename and prepare path
-            unique_filename = f"{generate_ulid()}.{file_ext}"
-            file_path = self.storage_path / unique_filename
-
-            # Stream file directly to disk while hashing (memory efficient)
+            # Stream to storage while hashing; the upload is stored
+            # under its content hash once the hash is known
+            upload = self.storage.create_upload()
             await upload_file.seek(0)
 
             try:
-                with open(file_path, "wb") as f:
-                    while True:
-                        chunk = await upload_file.read(CHUNK_SIZE)
-                        if not chunk:
-                            break
-
-                        # Check size incrementally
-                        file_size += len(chunk)
-                        if file_size > settings.max_file_size:
-                            # Clean up and fail
-                            f.close()
-                            try:
-                                file_path.unlink()
-                            except OSError:
-                                pass
-                            raise DocumentServiceError(
-                                f"File too large: {file_size} bytes"
-                            )
-
-                        # Hash and write
-                        hasher.update(chunk)
-                        f.write(chunk)
+                while chunk := await upload_file.read(
+                    settings.file_chunk_size
+                ):
+                    # Check size incrementally
+                    file_size += len(chunk)
+                    if file_size > settings.max_file_size:
+                        raise DocumentServiceError(
+                            f"File too large: {file_size} bytes"
+                        )
+
+                    # Hash and write
+                    hasher.update(chunk)
+                    await upload.write(chunk)
 
                 file_hash = hasher.hexdigest()
 
+                # An owner holds each file once (uq_document_owner_hash)
+                existing_id = await self.session.scalar(
+                    select(Document.id).where(
+                        Document.owner_id == user_id,
+                        Document.file_hash == file_hash,
+                    )
+                )
+                if existing_id:
+                    raise DocumentServiceError(
+                        f"Document already uploaded: {existing_id}"
+                    )
+
+                # Identical files share one stored copy; replacing it
+                # with the same bytes is atomic and keeps it present.
+                # Held until the document is committed, so a delete of
+                # the last document sharing the file cannot remove it
+                # in between
+                await self._lock_file_hash(file_hash)
+                stored_filename = f"{file_hash}.{file_ext}"
+                file_path = await upload.commit(stored_filename)
+
             except Exception as e:
                 # Clean up on error
                 try:
-                    if file_path.exists():
-                        file_path.unlink()
+                    await upload.abort()
                 except OSError:
                     pass
                 raise e
@@ -137,9 +173,9 @@ class NewDocumentService:
             # Create document record
             document = Document(
                 owner_id=user_id,
-                filename=unique_filename,
+                filename=stored_filename,
                 original_filename=upload_file.filename,
-                file_path=str(file_path),
+                file_path=file_path,
                 file_size=file_size,
                 file_hash=file_hash,
                 mime_type=mime_type,
@@ -167,11 +203,15 @@ class NewDocumentService:
                 user_id=user_id,
             )
 
-            # Start processing asynchronously using file path (not content)
-            import asyncio
-
-            asyncio.create_task(
-                self._process_document_async(document.id, file_path)
+            # Queue processing using file path (not content)
+            scheduler.submit(
+                document.id,
+                user_id,
+                partial(
+                    self._process_document_async,
+                    document.id,
+                    self.storage.local_path(file_path),
+                ),
             )
 
             return document
@@ -184,6 +224,16 @@ class NewDocumentService:
                 f"Failed to create document: {e}"
             ) from e
 
+    async def _lock_file_hash(self, file_hash: str) -> None:
+        """Serialize changes to a stored file until the next commit.
+
+        Args:
+            file_hash: Content hash naming the stored file
+        """
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(file_hash)))
+        )
+
     async def get_document(
         self, document_id: str, user_id: str
     ) -> Document | None:
@@ -238,6 +288,10 @@ class NewDocumentService:
 
         Returns:
             Tuple of (documents, total_count)
+
+        Raises:
+            InvalidCursorError: If ``list_request.cursor`` is invalid for
+                the requested ordering
         """
         try:
             # Base query with access control
@@ -268,17 +322,24 @@ class NewDocumentService:
             total_count = count_result.scalar()
 
             # Apply sorting and pagination
-            sort_column = getattr(
-                Document, list_request.sort_by, Document.created_at
+            keyset = self.keyset_for(
+                list_request.sort_by, list_request.sort_order
             )
-            if list_request.sort_order == "desc":
-                query = query.order_by(desc(sort_column))
-            else:
-                query = query.order_by(sort_column)
+            if keyset is None:
+                sort_column = getattr(
+                    Document, list_request.sort_by, Document.created_at
+                )
+                if list_request.sort_order == "desc":
+                    query = query.order_by(desc(sort_column))
+                else:
+                    query = query.order_by(sort_column)
 
-            query = query.offset(list_request.offset).limit(
-                list_request.limit
-            )
+            query = paginate(
+                query,
+                keyset,
+                cursor=list_request.cursor,
+                offset=list_request.offset,
+            ).limit(list_request.limit)
 
             # Execute query
             result = await self.session.execute(query)
@@ -286,10 +347,27 @@ class NewDocumentService:
 
             return documents, total_count
 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             logger.error("Failed to list documents", error=str(e))
             return [], 0
 
+    @staticmethod
+    def keyset_for(
+        sort_by: str = "created_at", sort_order: str = "desc"
+    ) -> Keyset | None:
+        """Keyset used to paginate documents in the given ordering.
+
+        Args:
+            sort_by: Sort field
+            sort_order: Sort order (asc/desc)
+
+        Returns:
+            Keyset, or None if the ordering does not support cursors
+        """
+        return sort_keyset(Document, sort_by, sort_order)
+
     async def search_documents(
         self, user_id: str, search_request: DocumentSearchRequest
     ) -> list[tuple[DocumentChunk, float, Document]]:
@@ -303,61 +381,38 @@ class NewDocumentService:
             List of (chunk, similarity_score, document) tuples
         """
         try:
-            # Get accessible document IDs
-            accessible_docs_result = await self.session.execute(
-                select(Document.id).where(
+            # The vector search itself is scoped to the user's own and
+            # public documents; only type and tag filters need ids
+            document_ids = None
+            if search_request.document_types or search_request.tags:
+                id_query = select(Document.id).where(
                     or_(
-                        Document.owner_id == user_id, Document.is_public
+                        Document.owner_id == user_id,
+                        Document.is_public,
                     )
                 )
-            )
-            accessible_doc_ids = [
-                doc_id for (doc_id,) in accessible_docs_result.all()
-            ]
-
-            if not accessible_doc_ids:
-                return []
-
-            # Apply document type filter
-            if search_request.document_types:
-                filtered_docs_result = await self.session.execute(
-                    select(Document.id).where(
-                        and_(
-                            Document.id.in_(accessible_doc_ids),
-                            Document.document_type.in_(
-                                search_request.document_types
-                            ),
+                if search_request.document_types:
+                    id_query = id_query.where(
+                        Document.document_type.in_(
+                            search_request.document_types
                         )
                     )
-                )
-                accessible_doc_ids = [
-                    doc_id for (doc_id,) in filtered_docs_result.all()
-                ]
-
-            # Apply tags filter
-            if search_request.tags:
-                for tag in search_request.tags:
-                    filtered_docs_result = await self.session.execute(
-                        select(Document.id).where(
-                            and_(
-                                Document.id.in_(accessible_doc_ids),
-                                Document.tags.contains([tag]),
-                            )
-                        )
+                for tag in search_request.tags or []:
+                    id_query = id_query.where(
+                        Document.tags.contains([tag])
                     )
-                    accessible_doc_ids = [
-                        doc_id
-                        for (doc_id,) in filtered_docs_result.all()
-                    ]
-
-            if not accessible_doc_ids:
-                return []
+                document_ids = list(
+                    (await self.session.execute(id_query)).scalars()
+                )
+                if not document_ids:
+                    return []
 
             # Perform semantic search
             chunk_results = await self.pipeline.search_documents(
                 query=search_request.query,
                 limit=search_request.limit,
-                document_ids=accessible_doc_ids,
+                document_ids=document_ids,
+                owner_id=user_id,
             )
 
             # Filter by score threshold and get document info
@@ -420,10 +475,22 @@ class NewDocumentService:
             if not document:
                 return False
 
-            # Delete file from storage
-            if document.file_path and Path(document.file_path).exists():
+            # Delete file from storage unless another document with the
+            # same content still uses it, or an upload committing the
+            # same content is about to
+            if document.file_hash:
+                await self._lock_file_hash(document.file_hash)
+            shared = await self.session.scalar(
+                select(func.count())
+                .select_from(Document)
+                .where(
+                    Document.file_path == document.file_path,
+                    Document.id != document.id,
+                )
+            )
+            if document.file_path and not shared:
                 try:
-                    Path(document.file_path).unlink()
+                    await self.storage.delete(document.file_path)
                 except OSError as e:
                     logger.warning(
                         "Failed to delete file",
@@ -432,8 +499,12 @@ class NewDocumentService:
                     )
 
             # Delete document (cascades to chunks)
+            is_public = document.is_public
             await self.session.delete(document)
             await self.session.commit()
+            get_retrieval_cache().invalidate_document(
+                document_id, user_id, is_public
+            )
 
             logger.info(
                 "Document deleted",
@@ -456,12 +527,19 @@ class NewDocumentService:
     ) -> bool:
         """Reprocess a document through the embedding pipeline.
 
+        Processed documents start over. Documents whose processing
+        failed or never finished keep their committed chunks and resume
+        after them.
+
         Args:
             document_id: Document ID
             user_id: Requesting user ID
 
         Returns:
             True if reprocessing started successfully
+
+        Raises:
+            IngestQueueFullError: If the processing queue is full
         """
         try:
             # Get document with ownership check
@@ -478,32 +556,42 @@ class NewDocumentService:
             if not document:
                 return False
 
+            scheduler = get_ingest_scheduler()
+            scheduler.check_capacity(user_id)
+
             # Check if file exists
-            if (
-                not document.file_path
-                or not Path(document.file_path).exists()
+            if not document.file_path or not await self.storage.exists(
+                document.file_path
             ):
                 logger.error(
                     "Document file not found", document_id=document_id
                 )
                 return False
 
-            # Delete existing chunks
-            await self.session.execute(
-                select(DocumentChunk).where(
-                    DocumentChunk.document_id == document_id
+            if document.status not in _RESUMABLE_STATUSES:
+                # Delete existing chunks so processing restarts instead
+                # of resuming from them
+                await self.session.execute(
+                    delete(DocumentChunk).where(
+                        DocumentChunk.document_id == document_id
+                    )
                 )
-            )
+                document.chunk_count = 0
+            is_public = document.is_public
             await self.session.commit()
+            get_retrieval_cache().invalidate_document(
+                document_id, user_id, is_public
+            )
 
-            # Read file and start processing with dedicated session
-            with open(document.file_path, "rb") as f:
-                file_content = f.read()
-
-            import asyncio
-
-            asyncio.create_task(
-                self._process_document_async(document.id, file_content)
+            # Queue processing with dedicated session
+            scheduler.submit(
+                document.id,
+                user_id,
+                partial(
+                    self._process_document_async,
+                    document.id,
+                    self.storage.local_path(document.file_path),
+                ),
             )
 
             logger.info(
@@ -511,6 +599,8 @@ class NewDocumentService:
             )
             return True
 
+        except IngestQueueFullError:
+            raise
         except Exception as e:
             logger.error(
                 "Failed to start document reprocessing",
@@ -519,6 +609,78 @@ class NewDocumentService:
             )
             return False
 
+    async def mark_interrupted(self, document_ids: list[str]) -> int:
+        """Record documents a shutdown left unprocessed.
+
+        Args:
+            document_ids: Documents interrupted or still queued, as
+                reported by ``IngestScheduler.stop``
+
+        Returns:
+            Number of documents marked
+        """
+        if not document_ids:
+            return 0
+        result = await self.session.execute(
+            update(Document)
+            .where(
+                Document.id.in_(document_ids),
+                Document.status.in_(
+                    [DocumentStatus.PENDING, DocumentStatus.PROCESSING]
+                ),
+            )
+            .values(
+                status=DocumentStatus.FAILED,
+                processing_error=INTERRUPTED_ERROR,
+            )
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def resume_interrupted(self) -> int:
+        """Queue documents the last shutdown left unprocessed.
+
+        Each document is claimed by an atomic update, so when several
+        workers start at once only one of them queues it. Processing
+        resumes after the chunks committed before the shutdown.
+
+        Returns:
+            Number of documents queued
+        """
+        result = await self.session.execute(
+            update(Document)
+            .where(
+                Document.status == DocumentStatus.FAILED,
+                Document.processing_error == INTERRUPTED_ERROR,
+            )
+            .values(
+                status=DocumentStatus.PENDING, processing_error=None
+            )
+            .returning(
+                Document.id, Document.owner_id, Document.file_path
+            )
+        )
+        claimed = result.all()
+        await self.session.commit()
+
+        scheduler = get_ingest_scheduler()
+        for document_id, owner_id, file_path in claimed:
+            scheduler.submit(
+                document_id,
+                owner_id,
+                partial(
+                    self._process_document_async,
+                    document_id,
+                    self.storage.local_path(file_path),
+                ),
+            )
+        if claimed:
+            logger.info(
+                "Queued documents interrupted by shutdown",
+                count=len(claimed),
+            )
+        return len(claimed)
+
     async def get_document_stats(self, user_id: str) -> dict[str, Any]:
         """Get document statistics for user.
 
@@ -657,14 +819,15 @@ class NewDocumentService:
     async def get_document_file_path(
         self, document_id: str, user_id: str
     ) -> str | None:
-        """Get document file path for download.
+        """Get the stored file location for download.
 
         Args:
             document_id: Document ID
             user_id: User ID (for ownership check)
 
         Returns:
-            File path if document exists and user owns it, None otherwise
+            Storage location if the file exists and user owns the
+            document, None otherwise
         """
         try:
             result = await self.session.execute(
@@ -680,16 +843,15 @@ class NewDocumentService:
             if not document or not document.file_path:
                 return None
 
-            file_path = Path(document.file_path)
-            if not file_path.exists():
+            if not await self.storage.exists(document.file_path):
                 logger.warning(
-                    "Document file not found on disk",
+                    "Document file not found in storage",
                     document_id=document_id,
-                    file_path=str(file_path),
+                    file_path=document.file_path,
                 )
                 return None
 
-            return str(file_path)
+            return document.file_path
 
         except Exception as e:
             logger.error(
@@ -746,18 +908,39 @@ class NewDocumentService:
         """Process document asynchronously with dedicated session using file path."""
         from chatter.utils.database import get_session_maker
 
+        scheduler = get_ingest_scheduler()
         # Create a fresh session for background processing to avoid session state issues
         session_maker = get_session_maker()
         async with session_maker() as processing_session:
             try:
-                # Create a new pipeline with the dedicated session
+                # Create a new pipeline with the dedicated session;
+                # parsing runs in the scheduler's process pool
                 processing_pipeline = EmbeddingPipeline(
-                    processing_session
+                    processing_session,
+                    offload=(
+                        scheduler.run_in_pool
+                        if scheduler.process_workers > 0
+                        else None
+                    ),
                 )
                 # Pass file path instead of file content for memory efficiency
                 success = await processing_pipeline.process_document_from_file(
                     document_id, file_path
                 )
+                scheduler.record_stages(
+                    processing_pipeline.stage_timings
+                )
+
+                # Cached retrievals predate the document's chunks
+                document = await processing_session.get(
+                    Document, document_id
+                )
+                if document is not None:
+                    get_retrieval_cache().invalidate_document(
+                        document_id,
+                        document.owner_id,
+                        document.is_public,
+                    )
 
                 if success:
                     logger.info(
@@ -1,21 +1,238 @@
 """Real-time analytics service for streaming dashboard updates and intelligent notifications."""
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
 
+from pydantic_core import to_jsonable_python
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from chatter.config import settings
 from chatter.core.analytics import AnalyticsService
 from chatter.core.cache_factory import get_general_cache
 from chatter.models.base import generate_ulid
-from chatter.schemas.analytics import IntegratedDashboardStats
+from chatter.schemas.analytics import (
+    AnalyticsTimeRange,
+    IntegratedDashboardStats,
+)
 from chatter.schemas.events import Event, EventType
 from chatter.services.sse_events import sse_service
+from chatter.utils.database import get_session_maker
 from chatter.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+DashboardComputer = Callable[[str], Awaitable[dict[str, Any]]]
+
+_MISSING = object()
+
+
+def dashboard_patch(
+    previous: dict[str, Any], current: dict[str, Any]
+) -> dict[str, Any]:
+    """Build a JSON merge patch (RFC 7386) between two snapshots.
+
+    Nested objects are compared key by key; any other changed value,
+    lists included, is replaced whole. Removed keys map to None.
+
+    Args:
+        previous: Snapshot the client already has
+        current: New snapshot
+
+    Returns:
+        Patch that turns ``previous`` into ``current``, empty if they
+        are equal
+    """
+    patch: dict[str, Any] = {}
+    for key, value in current.items():
+        old = previous.get(key, _MISSING)
+        if old == value:
+            continue
+        if isinstance(old, dict) and isinstance(value, dict):
+            patch[key] = dashboard_patch(old, value)
+        else:
+            patch[key] = value
+    for key in previous.keys() - current.keys():
+        patch[key] = None
+    return patch
+
+
+def _count_values(value: Any) -> int:
+    """Count the leaf values of a snapshot or patch."""
+    if isinstance(value, dict):
+        return sum(_count_values(item) for item in value.values())
+    return 1
+
+
+class DashboardScheduler:
+    """Computes live dashboards for all subscribers on one schedule.
+
+    A single task refreshes each subscribed user's dashboard once per
+    interval, and a refresh already running for a user is shared
+    instead of repeated. Updates are published as merge-patch deltas
+    when little changed. A full snapshot is sent first, whenever most
+    values changed and every ``full_every`` updates so clients that
+    missed a delta catch up. The task exits once nobody is subscribed.
+    """
+
+    def __init__(
+        self,
+        compute: DashboardComputer,
+        interval: float | None = None,
+        delta_ratio: float | None = None,
+        full_every: int | None = None,
+    ):
+        self.compute = compute
+        self.interval = (
+            interval
+            if interval is not None
+            else settings.analytics_dashboard_update_interval
+        )
+        self.delta_ratio = (
+            delta_ratio
+            if delta_ratio is not None
+            else settings.analytics_dashboard_delta_ratio
+        )
+        self.full_every = max(
+            1,
+            (
+                full_every
+                if full_every is not None
+                else settings.analytics_dashboard_full_every
+            ),
+        )
+        self.subscribers: set[str] = set()
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._sequences: dict[str, int] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the update task is running."""
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, user_id: str) -> None:
+        """Start sending dashboard updates to a user."""
+        if user_id in self.subscribers:
+            return
+        self.subscribers.add(user_id)
+        # Give the new subscriber a snapshot without waiting a whole
+        # interval
+        self._start_refresh(user_id)
+        self.ensure_running()
+
+    async def unsubscribe(self, user_id: str) -> None:
+        """Stop sending dashboard updates to a user."""
+        self.subscribers.discard(user_id)
+        self._snapshots.pop(user_id, None)
+        self._sequences.pop(user_id, None)
+        if not self.subscribers:
+            await self.stop()
+
+    def ensure_running(self) -> None:
+        """Start the update task if there are subscribers."""
+        if self.subscribers and not self.running:
+            self._task = asyncio.create_task(
+                self._run(), name="real_time_dashboards"
+            )
+
+    async def stop(self) -> None:
+        """Stop the update task and any refresh in progress."""
+        task, self._task = self._task, None
+        tasks = [task] if task else []
+        tasks.extend(self._refreshing.values())
+        for pending in tasks:
+            pending.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def refresh(self, user_id: str) -> None:
+        """Recompute and publish a user's dashboard."""
+        await asyncio.shield(self._start_refresh(user_id))
+
+    def _start_refresh(self, user_id: str) -> asyncio.Task:
+        """Start a refresh for a user, or return the one running."""
+        task = self._refreshing.get(user_id)
+        if task is None:
+            task = asyncio.create_task(self._refresh(user_id))
+            self._refreshing[user_id] = task
+            task.add_done_callback(
+                lambda _: self._refreshing.pop(user_id, None)
+            )
+        return task
+
+    async def _run(self) -> None:
+        """Refresh every subscriber once per interval."""
+        loop = asyncio.get_running_loop()
+        while self.subscribers:
+            await asyncio.sleep(self.interval)
+            started = loop.time()
+            for user_id in list(self.subscribers):
+                if user_id in self.subscribers:
+                    await self.refresh(user_id)
+            logger.debug(
+                f"Refreshed {len(self.subscribers)} real-time "
+                f"dashboards in {loop.time() - started:.2f}s"
+            )
+
+    async def _refresh(self, user_id: str) -> None:
+        """Compute a user's dashboard and publish what changed."""
+        try:
+            snapshot = await self.compute(user_id)
+            if user_id not in self.subscribers:
+                return
+            data = self._build_update(user_id, snapshot)
+            if data is None:
+                return
+            await sse_service.broadcast_event(
+                Event(
+                    type=EventType.ANALYTICS_DASHBOARD_UPDATED,
+                    data=data,
+                    user_id=user_id,
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Error updating real-time dashboard for user "
+                f"{user_id}: {e}"
+            )
+
+    def _build_update(
+        self, user_id: str, snapshot: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Event data for a new snapshot, or None if nothing changed."""
+        previous = self._snapshots.get(user_id)
+        patch = (
+            dashboard_patch(previous, snapshot)
+            if previous is not None
+            else None
+        )
+        if patch == {}:
+            return None
+
+        sequence = self._sequences.get(user_id, 0) + 1
+        self._snapshots[user_id] = snapshot
+        self._sequences[user_id] = sequence
+
+        data: dict[str, Any] = {
+            "sequence": sequence,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "user_id": user_id,
+        }
+        if (
+            patch is not None
+            and sequence % self.full_every != 0
+            and _count_values(patch)
+            <= self.delta_ratio * _count_values(snapshot)
+        ):
+            data["update"] = "delta"
+            data["changes"] = patch
+        else:
+            data["update"] = "full"
+            data.update(snapshot)
+        return data
+
 
 class RealTimeAnalyticsService:
     """Service for real-time analytics streaming and intelligent notifications."""
@@ -24,7 +241,7 @@ class RealTimeAnalyticsService:
         self.session = session
         self.analytics_service = AnalyticsService(session)
         self.cache = get_general_cache()
-        self._update_tasks: dict[str, asyncio.Task] = {}
+        self.dashboards = DashboardScheduler(self._compute_dashboard)
         self._notification_thresholds = {
             "high_cpu_usage": 80.0,
             "low_cache_hit_rate": 70.0,
@@ -34,85 +251,50 @@ class RealTimeAnalyticsService:
 
     async def start_real_time_dashboard(self, user_id: str) -> None:
         """Start real-time dashboard updates for a user."""
-        task_key = f"dashboard_{user_id}"
-
-        if task_key in self._update_tasks:
+        if user_id in self.dashboards.subscribers:
             logger.debug(
                 f"Real-time dashboard already running for user {user_id}"
             )
             return
 
-        # Create background task for periodic updates
-        task = asyncio.create_task(
-            self._dashboard_update_loop(user_id),
-            name=f"real_time_dashboard_{user_id}",
-        )
-        self._update_tasks[task_key] = task
+        self.dashboards.subscribe(user_id)
         logger.info(
             f"Started real-time dashboard updates for user {user_id}"
         )
 
     async def stop_real_time_dashboard(self, user_id: str) -> None:
         """Stop real-time dashboard updates for a user."""
-        task_key = f"dashboard_{user_id}"
-
-        if task_key in self._update_tasks:
-            task = self._update_tasks.pop(task_key)
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        if user_id in self.dashboards.subscribers:
+            await self.dashboards.unsubscribe(user_id)
             logger.info(
                 f"Stopped real-time dashboard updates for user {user_id}"
             )
 
-    async def _dashboard_update_loop(self, user_id: str) -> None:
-        """Background loop for sending dashboard updates via SSE."""
-        try:
-            while True:
-                # Get fresh analytics data
-                try:
-                    dashboard_stats = (
-                        await self.analytics_service.get_integrated_dashboard_stats()
-                    )
-                    chart_data = (
-                        await self.analytics_service.get_chart_ready_data()
-                    )
-
-                    # Create update event
-                    event = Event(
-                        id=generate_ulid(),
-                        type=EventType.ANALYTICS,
-                        data={
-                            "dashboard_stats": dashboard_stats.model_dump(),
-                            "chart_data": chart_data.model_dump(),
-                            "timestamp": datetime.now(UTC).isoformat(),
-                            "user_id": user_id,
-                        },
-                    )
-
-                    # Send to user via SSE
-                    await sse_service.send_event_to_user(user_id, event)
-
-                    # Check for notification-worthy changes
-                    await self._check_for_alerts(
-                        dashboard_stats, user_id
-                    )
-
-                except Exception as e:
-                    logger.error(
-                        f"Error in dashboard update loop for user {user_id}: {e}"
-                    )
-
-                # Wait for next update (configurable interval)
-                await asyncio.sleep(30)  # Update every 30 seconds
-
-        except asyncio.CancelledError:
-            logger.debug(
-                f"Dashboard update loop cancelled for user {user_id}"
+    async def _compute_dashboard(self, user_id: str) -> dict[str, Any]:
+        """Compute a user's dashboard snapshot.
+
+        Runs in the background, so it uses its own session rather than
+        the one of the request that created this service.
+        """
+        session_maker = get_session_maker()
+        async with session_maker() as session:
+            analytics_service = AnalyticsService(session)
+            dashboard_stats = (
+                await analytics_service.get_integrated_dashboard_stats(
+                    user_id
+                )
+            )
+            chart_data = await analytics_service.get_chart_ready_data(
+                user_id, AnalyticsTimeRange()
             )
-            raise
+
+        # Check for notification-worthy changes
+        await self._check_for_alerts(dashboard_stats, user_id)
+
+        return {
+            "dashboard_stats": to_jsonable_python(dashboard_stats),
+            "chart_data": to_jsonable_python(chart_data),
+        }
 
     async def _check_for_alerts(
         self, stats: IntegratedDashboardStats, user_id: str
@@ -163,14 +345,15 @@ class RealTimeAnalyticsService:
         for alert in alerts:
             event = Event(
                 id=generate_ulid(),
-                type=EventType.NOTIFICATION,
+                type=EventType.SYSTEM_ALERT,
                 data={
                     "alert": alert,
                     "timestamp": datetime.now(UTC).isoformat(),
                     "user_id": user_id,
                 },
+                user_id=user_id,
             )
-            await sse_service.send_event_to_user(user_id, event)
+            await sse_service.broadcast_event(event)
 
     async def _get_cache_performance(self) -> dict[str, Any] | None:
         """Get current cache performance metrics.
@@ -349,13 +532,10 @@ class RealTimeAnalyticsService:
         ]
 
     async def cleanup_inactive_tasks(self) -> None:
-        """Clean up tasks for disconnected users."""
-        current_tasks = list(self._update_tasks.keys())
-        for task_key in current_tasks:
-            task = self._update_tasks[task_key]
-            if task.done() or task.cancelled():
-                self._update_tasks.pop(task_key, None)
-                logger.debug(f"Cleaned up completed task: {task_key}")
+        """Restart dashboard updates if their task stopped early."""
+        if self.dashboards.subscribers and not self.dashboards.running:
+            logger.warning("Restarting real-time dashboard updates")
+            self.dashboards.ensure_running()
 
 
 # Global service instance
@@ -1,6 +1,8 @@
 """Server-Sent Events (SSE) service for real-time updates."""
 
 import asyncio
+import json
+from collections import deque
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
 from typing import Any
@@ -8,6 +10,13 @@ from typing import Any
 from chatter.config import settings
 from chatter.models.base import generate_ulid
 from chatter.schemas.events import Event, EventType, validate_event_data
+from chatter.services.sse_pubsub import (
+    BROADCAST_CHANNEL,
+    EventBus,
+    create_event_bus,
+    event_channel,
+    user_channel,
+)
 from chatter.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -15,80 +24,202 @@ logger = get_logger(__name__)
 # Import unified event system
 
 
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+
+
+class SSEMessage:
+    """An event queued for delivery, with its encoded SSE frames.
+
+    A broadcast queues the same message on every recipient, and each
+    frame variant is encoded on first use, so an event is serialized
+    once however many connections receive it.
+    """
+
+    __slots__ = ("event", "_frames")
+
+    def __init__(self, event: Event):
+        self.event = event
+        self._frames: dict[bool, bytes] = {}
+
+    @property
+    def is_keepalive(self) -> bool:
+        """Whether this is a keepalive rather than a real event."""
+        return self.event.type == EventType.SYSTEM_STATUS and bool(
+            self.event.data.get("keepalive", False)
+        )
+
+    def frame(self, include_user: bool = False) -> bytes:
+        """Encoded SSE frame for the event.
+
+        Args:
+            include_user: Include the event's user_id, as the admin
+                stream does
+        """
+        frame = self._frames.get(include_user)
+        if frame is None:
+            event = self.event
+            payload = {
+                "id": event.id,
+                "type": event.type.value,
+                "data": event.data,
+                "timestamp": event.timestamp.isoformat(),
+            }
+            if include_user:
+                payload["user_id"] = event.user_id
+            payload["metadata"] = event.metadata
+            frame = (
+                f"id: {event.id}\n"
+                f"event: {event.type.value}\n"
+                f"data: {json.dumps(payload)}\n\n"
+            ).encode()
+            self._frames[include_user] = frame
+        return frame
+
+
 class SSEConnection:
-    """Represents an active SSE connection."""
+    """Represents an active SSE connection.
 
-    def __init__(self, connection_id: str, user_id: str | None = None):
+    Messages wait in a bounded queue. When a client falls behind and
+    the queue is full, ``overflow_policy`` decides what happens to a
+    new message: ``drop_oldest`` discards the oldest queued message,
+    ``coalesce`` replaces the oldest queued message of the same event
+    type (dropping the oldest if there is none) and ``disconnect``
+    closes the connection.
+    """
+
+    def __init__(
+        self,
+        connection_id: str,
+        user_id: str | None = None,
+        overflow_policy: str | None = None,
+    ):
         self.connection_id = connection_id
         self.user_id = user_id
         self.connected_at = datetime.now(UTC)
         self.last_activity = datetime.now(UTC)
-        # Bounded queue to prevent memory issues with slow clients
-        self._queue: asyncio.Queue[Event] = asyncio.Queue(
-            maxsize=settings.sse_queue_maxsize
+        self.max_queue_size = max(1, settings.sse_queue_maxsize)
+        self.overflow_policy = (
+            overflow_policy or settings.sse_overflow_policy
         )
+        if self.overflow_policy not in OVERFLOW_POLICIES:
+            logger.warning(
+                "Unknown SSE overflow policy, using drop_oldest",
+                policy=self.overflow_policy,
+            )
+            self.overflow_policy = "drop_oldest"
+        self._queue: deque[SSEMessage] = deque()
+        self._ready = asyncio.Event()
         self._closed = False
-        self._dropped_events = 0
+        self.dropped_events = 0
+        self.coalesced_events = 0
+        self.max_queue_depth = 0
+        self.slow_consumer = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the connection has been closed."""
+        return self._closed
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of messages waiting to be sent."""
+        return len(self._queue)
+
+    def enqueue(self, message: SSEMessage) -> bool:
+        """Queue a message without waiting.
+
+        Returns:
+            False if the connection is closed, including when it was
+            closed for falling behind
+        """
+        if self._closed:
+            return False
+        if len(self._queue) >= self.max_queue_size:
+            if not self._overflow(message):
+                return False
+        else:
+            self._queue.append(message)
+        self.max_queue_depth = max(
+            self.max_queue_depth, len(self._queue)
+        )
+        self.last_activity = datetime.now(UTC)
+        self._ready.set()
+        return True
+
+    def _overflow(self, message: SSEMessage) -> bool:
+        """Apply the overflow policy to a message for a full queue."""
+        if self.overflow_policy == "disconnect":
+            self.dropped_events += 1
+            self.slow_consumer = True
+            logger.warning(
+                "Disconnecting slow SSE client",
+                connection_id=self.connection_id,
+                queued_events=len(self._queue),
+            )
+            self.close()
+            return False
+
+        if self.overflow_policy == "coalesce":
+            event_type = message.event.type
+            for index, queued in enumerate(self._queue):
+                if queued.event.type == event_type:
+                    del self._queue[index]
+                    self._queue.append(message)
+                    self.coalesced_events += 1
+                    return True
+
+        self._queue.popleft()
+        self._queue.append(message)
+        self.dropped_events += 1
+        # Log the first drop and then every 100th to keep a stalled
+        # client from flooding the logs
+        if self.dropped_events % 100 == 1:
+            logger.warning(
+                "SSE client is slow, dropping oldest events",
+                connection_id=self.connection_id,
+                dropped_events=self.dropped_events,
+            )
+        return True
 
     async def send_event(self, event: Event) -> None:
         """Queue an event to be sent to this connection."""
-        if not self._closed:
-            try:
-                # Try to put event in queue without blocking
-                self._queue.put_nowait(event)
-                self.last_activity = datetime.now(UTC)
-            except asyncio.QueueFull:
-                # Queue is full, drop the event and track it
-                self._dropped_events += 1
-                logger.warning(
-                    "Event queue full, dropping event",
-                    connection_id=self.connection_id,
-                    event_type=event.type.value,
-                    dropped_events=self._dropped_events,
-                )
-                # Optionally, we could drop oldest events instead
-                if (
-                    self._dropped_events % 10 == 0
-                ):  # Log every 10th drop
-                    logger.error(
-                        "Client appears to be slow, many events dropped",
-                        connection_id=self.connection_id,
-                        total_dropped=self._dropped_events,
-                    )
-            except Exception as e:
-                logger.error(
-                    "Failed to queue event for connection",
-                    connection_id=self.connection_id,
-                    error=str(e),
-                )
+        self.enqueue(SSEMessage(event))
 
-    async def get_events(self) -> AsyncGenerator[Event, None]:
-        """Get events from the queue as they arrive."""
+    async def get_messages(self) -> AsyncGenerator[SSEMessage, None]:
+        """Get queued messages as they arrive.
+
+        A keepalive message is produced whenever nothing arrives within
+        ``sse_keepalive_timeout`` seconds.
+        """
         while not self._closed:
+            if self._queue:
+                yield self._queue.popleft()
+                continue
+            self._ready.clear()
             try:
-                # Wait for an event with configurable timeout
-                event = await asyncio.wait_for(
-                    self._queue.get(),
+                await asyncio.wait_for(
+                    self._ready.wait(),
                     timeout=float(settings.sse_keepalive_timeout),
                 )
-                yield event
             except TimeoutError:
-                # Send keepalive/heartbeat
-                yield Event(
-                    type=EventType.SYSTEM_STATUS,
-                    data={"status": "connected", "keepalive": True},
-                )
-            except Exception as e:
-                logger.error(
-                    "Error getting events for connection",
-                    connection_id=self.connection_id,
-                    error=str(e),
+                yield SSEMessage(
+                    Event(
+                        type=EventType.SYSTEM_STATUS,
+                        data={"status": "connected", "keepalive": True},
+                    )
                 )
-                break
+
+    async def get_events(self) -> AsyncGenerator[Event, None]:
+        """Get events from the queue as they arrive."""
+        async for message in self.get_messages():
+            yield message.event
 
     def close(self) -> None:
         """Close the connection."""
+        if self._closed:
+            return
         self._closed = True
+        self._ready.set()
         logger.info(
             "SSE connection closed",
             connection_id=self.connection_id,
@@ -97,9 +228,16 @@ class SSEConnection:
 
 
 class SSEEventService:
-    """Service for managing Server-Sent Events connections and broadcasting."""
+    """Service for managing Server-Sent Events connections and broadcasting.
+
+    Events are published on an event bus and every worker delivers them
+    to its own connections, so clients receive events produced by any
+    worker. Each worker subscribes only to the users it has
+    connections for.
+    """
 
-    def __init__(self):
+    def __init__(self, bus: EventBus | None = None):
+        self.bus = bus or create_event_bus()
         self.connections: dict[str, SSEConnection] = {}
         self.user_connections: dict[str, set[str]] = (
             {}
@@ -110,10 +248,16 @@ class SSEEventService:
             settings.sse_max_connections_per_user
         )
         self.max_total_connections = settings.sse_max_total_connections
+        # Totals carried over from closed connections
+        self.dropped_events = 0
+        self.coalesced_events = 0
+        self.slow_consumer_disconnects = 0
 
     async def start(self) -> None:
         """Start the SSE service."""
         logger.info("Starting SSE event service")
+        self.bus.subscribe(BROADCAST_CHANNEL)
+        await self.bus.start(self._deliver_local)
         self._cleanup_task = asyncio.create_task(
             self._cleanup_inactive_connections()
         )
@@ -128,9 +272,13 @@ class SSEEventService:
             except asyncio.CancelledError:
                 pass
 
+        await self.bus.stop()
+
         # Close all connections
         for connection in list(self.connections.values()):
             connection.close()
+        for user_id in self.user_connections:
+            self.bus.unsubscribe(user_channel(user_id))
         self.connections.clear()
         self.user_connections.clear()
 
@@ -167,6 +315,7 @@ class SSEEventService:
         if user_id:
             if user_id not in self.user_connections:
                 self.user_connections[user_id] = set()
+                self.bus.subscribe(user_channel(user_id))
             self.user_connections[user_id].add(connection_id)
 
         logger.info(
@@ -203,8 +352,15 @@ class SSEEventService:
                 )
                 if not self.user_connections[connection.user_id]:
                     del self.user_connections[connection.user_id]
+                    self.bus.unsubscribe(
+                        user_channel(connection.user_id)
+                    )
 
             connection.close()
+            self.dropped_events += connection.dropped_events
+            self.coalesced_events += connection.coalesced_events
+            if connection.slow_consumer:
+                self.slow_consumer_disconnects += 1
             logger.info(
                 "Closed SSE connection",
                 connection_id=connection_id,
@@ -213,7 +369,13 @@ class SSEEventService:
             )
 
     async def broadcast_event(self, event: Event) -> None:
-        """Broadcast an event to all relevant connections."""
+        """Broadcast an event to all relevant connections.
+
+        The event is published once on the event bus, which hands it to
+        every worker with interested connections. If the bus is not
+        running or publishing fails, only this worker's connections
+        receive it.
+        """
         logger.info(
             "Broadcasting event",
             event_type=event.type.value,
@@ -221,54 +383,54 @@ class SSEEventService:
             user_specific=event.user_id is not None,
         )
 
-        # Send event to connections efficiently without building lists
-        send_count = 0
-        error_count = 0
+        if self.bus.running:
+            try:
+                await self.bus.publish(event_channel(event), event)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Failed to publish event, delivering locally",
+                    event_type=event.type.value,
+                    event_id=event.id,
+                    error=str(e),
+                )
+
+        await self._deliver_local(event)
+
+    async def _deliver_local(self, event: Event) -> None:
+        """Send an event to this worker's relevant connections.
 
+        The event is wrapped in a single message shared by every
+        recipient, so it is encoded once and delivery costs one queue
+        operation per connection.
+        """
         if event.user_id:
-            # Send to specific user's connections
-            if event.user_id in self.user_connections:
-                connection_ids = list(
-                    self.user_connections[event.user_id]
-                )  # Create snapshot
-                for connection_id in connection_ids:
-                    connection = self.connections.get(connection_id)
-                    if connection:
-                        try:
-                            await connection.send_event(event)
-                            send_count += 1
-                        except Exception as e:
-                            error_count += 1
-                            logger.warning(
-                                "Failed to send event to connection",
-                                connection_id=connection_id,
-                                event_type=event.type.value,
-                                error=str(e),
-                            )
+            connections = [
+                self.connections[connection_id]
+                for connection_id in self.user_connections.get(
+                    event.user_id, ()
+                )
+                if connection_id in self.connections
+            ]
         else:
-            # Broadcast to all connections (stream without building list)
-            connection_items = list(
-                self.connections.items()
-            )  # Snapshot for safety
-            for connection_id, connection in connection_items:
-                try:
-                    await connection.send_event(event)
-                    send_count += 1
-                except Exception as e:
-                    error_count += 1
-                    logger.warning(
-                        "Failed to send event to connection",
-                        connection_id=connection_id,
-                        event_type=event.type.value,
-                        error=str(e),
-                    )
-
-        if send_count > 0 or error_count > 0:
+            connections = list(self.connections.values())
+
+        message = SSEMessage(event)
+        slow = [
+            connection
+            for connection in connections
+            if not connection.enqueue(message)
+            and connection.slow_consumer
+        ]
+        for connection in slow:
+            self.close_connection(connection.connection_id)
+
+        if connections:
             logger.debug(
                 "Event broadcast complete",
                 event_type=event.type.value,
-                sent=send_count,
-                errors=error_count,
+                sent=len(connections) - len(slow),
+                disconnected=len(slow),
             )
 
     async def trigger_event(
@@ -353,6 +515,8 @@ class SSEEventService:
 
     def get_stats(self) -> dict[str, Any]:
         """Get service statistics."""
+        connections = list(self.connections.values())
+        depths = [c.queue_depth for c in connections]
         return {
             "total_connections": len(self.connections),
             "user_connections": len(self.user_connections),
@@ -360,6 +524,13 @@ class SSEEventService:
                 user_id: len(connection_ids)
                 for user_id, connection_ids in self.user_connections.items()
             },
+            "queued_events": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "dropped_events": self.dropped_events
+            + sum(c.dropped_events for c in connections),
+            "coalesced_events": self.coalesced_events
+            + sum(c.coalesced_events for c in connections),
+            "slow_consumer_disconnects": self.slow_consumer_disconnects,
         }
 
 
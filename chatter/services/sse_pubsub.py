@@ -0,0 +1,265 @@
+"""Pub/sub transports that fan SSE events out across worker processes.
+
+Every worker subscribes to the broadcast channel and to one channel per
+user with a connection on that worker. Events are published once and
+each subscribed worker delivers them to its own local connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+import redis.asyncio as redis
+
+from chatter.config import settings
+from chatter.schemas.events import Event
+from chatter.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+EventHandler = Callable[[Event], Awaitable[None]]
+
+BROADCAST_CHANNEL = "broadcast"
+
+
+def user_channel(user_id: str) -> str:
+    """Channel carrying one user's events."""
+    return f"user:{user_id}"
+
+
+def event_channel(event: Event) -> str:
+    """Channel an event is published on."""
+    if event.user_id:
+        return user_channel(event.user_id)
+    return BROADCAST_CHANNEL
+
+
+class EventBus(ABC):
+    """Transport delivering published events to subscribed workers."""
+
+    def __init__(self):
+        self.channels: set[str] = set()
+        self._handler: EventHandler | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the bus is delivering events."""
+        return self._handler is not None
+
+    async def start(self, handler: EventHandler) -> None:
+        """Start delivering events for subscribed channels.
+
+        Args:
+            handler: Called with every event received on a channel
+        """
+        self._handler = handler
+
+    async def stop(self) -> None:
+        """Stop delivering events."""
+        self._handler = None
+
+    def subscribe(self, channel: str) -> None:
+        """Receive events published on a channel."""
+        self.channels.add(channel)
+
+    def unsubscribe(self, channel: str) -> None:
+        """Stop receiving events published on a channel."""
+        self.channels.discard(channel)
+
+    @abstractmethod
+    async def publish(self, channel: str, event: Event) -> None:
+        """Publish an event to every worker subscribed to a channel."""
+
+    async def _dispatch(self, event: Event) -> None:
+        """Hand a received event to the handler."""
+        if self._handler is None:
+            return
+        try:
+            await self._handler(event)
+        except Exception as e:
+            logger.error(
+                "Failed to deliver SSE event",
+                event_id=event.id,
+                error=str(e),
+            )
+
+
+class InMemoryEventHub:
+    """Connects in-memory buses, standing in for a message broker."""
+
+    def __init__(self):
+        self.buses: set[InMemoryEventBus] = set()
+
+    async def publish(self, channel: str, event: Event) -> None:
+        """Deliver an event to every running bus on the channel."""
+        for bus in list(self.buses):
+            if bus.running and channel in bus.channels:
+                await bus._dispatch(event)
+
+
+class InMemoryEventBus(EventBus):
+    """Event bus whose subscribers live in the same process.
+
+    Buses sharing a hub behave like workers sharing a broker, which
+    lets tests exercise cross-worker delivery without Redis. Without a
+    hub the bus only delivers to its own subscriber.
+    """
+
+    def __init__(self, hub: InMemoryEventHub | None = None):
+        super().__init__()
+        self.hub = hub or InMemoryEventHub()
+
+    async def start(self, handler: EventHandler) -> None:
+        await super().start(handler)
+        self.hub.buses.add(self)
+
+    async def stop(self) -> None:
+        self.hub.buses.discard(self)
+        await super().stop()
+
+    async def publish(self, channel: str, event: Event) -> None:
+        await self.hub.publish(channel, event)
+
+
+class RedisEventBus(EventBus):
+    """Event bus backed by Redis pub/sub.
+
+    A listener task keeps one subscription connection open and
+    reconnects with backoff if it drops. Channel changes made while
+    disconnected are applied on reconnect.
+    """
+
+    def __init__(
+        self, redis_url: str | None = None, prefix: str | None = None
+    ):
+        super().__init__()
+        self.redis_url = redis_url or settings.redis_url
+        self.prefix = prefix or settings.sse_pubsub_channel_prefix
+        self._client: redis.Redis | None = None
+        self._pubsub = None
+        self._listener: asyncio.Task | None = None
+        self._commands: set[asyncio.Task] = set()
+
+    def _key(self, channel: str) -> str:
+        return f"{self.prefix}:{channel}"
+
+    async def start(self, handler: EventHandler) -> None:
+        await super().start(handler)
+        self._client = redis.from_url(
+            self.redis_url,
+            socket_connect_timeout=settings.redis_connect_timeout,
+        )
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        await super().stop()
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def subscribe(self, channel: str) -> None:
+        if channel in self.channels:
+            return
+        super().subscribe(channel)
+        if self._pubsub is not None:
+            self._run(self._pubsub.subscribe(self._key(channel)))
+
+    def unsubscribe(self, channel: str) -> None:
+        if channel not in self.channels:
+            return
+        super().unsubscribe(channel)
+        if self._pubsub is not None:
+            self._run(self._pubsub.unsubscribe(self._key(channel)))
+
+    def _run(self, command: Awaitable) -> None:
+        """Run a subscription change in the background."""
+
+        async def run() -> None:
+            try:
+                await command
+            except Exception as e:
+                # The listener resubscribes from self.channels when it
+                # reconnects
+                logger.warning(
+                    "SSE pub/sub subscription change failed",
+                    error=str(e),
+                )
+
+        task = asyncio.create_task(run())
+        self._commands.add(task)
+        task.add_done_callback(self._commands.discard)
+
+    async def publish(self, channel: str, event: Event) -> None:
+        if self._client is None:
+            raise RuntimeError("Redis event bus is not started")
+        await self._client.publish(
+            self._key(channel), event.model_dump_json()
+        )
+
+    async def _listen(self) -> None:
+        """Receive published events until stopped."""
+        backoff = 1.0
+        while True:
+            pubsub = self._client.pubsub(
+                ignore_subscribe_messages=True
+            )
+            try:
+                # Publish the connection first so channels added while
+                # subscribing are not missed
+                self._pubsub = pubsub
+                await pubsub.subscribe(
+                    *(self._key(c) for c in list(self.channels))
+                )
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        event = Event.model_validate_json(
+                            message["data"]
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            "Ignoring malformed SSE event",
+                            error=str(e),
+                        )
+                        continue
+                    await self._dispatch(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    "SSE pub/sub connection lost, reconnecting",
+                    error=str(e),
+                    retry_in=backoff,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                self._pubsub = None
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+def create_event_bus() -> EventBus:
+    """Create the event bus selected by ``sse_pubsub_backend``."""
+    backend = settings.sse_pubsub_backend
+    if backend == "redis":
+        return RedisEventBus()
+    if backend != "local":
+        logger.warning(
+            "Unknown SSE pub/sub backend, using local",
+            backend=backend,
+        )
+    return InMemoryEventBus()
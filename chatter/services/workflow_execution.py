@@ -249,30 +249,20 @@ class WorkflowExecutionService:
             user_id=user_id,
         )
         
-        # Create and save message
-        message = await self._create_and_save_message(
-            conversation=conversation,
-            content=result.response,
+        # Append the message and update conversation aggregates together
+        message = await self.message_service.add_message_to_conversation(
+            conversation_id=conversation.id,
+            user_id=user_id,
             role=MessageRole.ASSISTANT,
+            content=result.response,
             metadata=result.metadata,
-            prompt_tokens=result.prompt_tokens,
-            completion_tokens=result.completion_tokens,
+            input_tokens=result.prompt_tokens,
+            output_tokens=result.completion_tokens,
             cost=result.cost,
-            provider_used=request.provider,
+            provider=request.provider,
             response_time_ms=result.execution_time_ms,
         )
-        
-        # Update conversation aggregates
-        from chatter.services.conversation import ConversationService
-        conversation_service = ConversationService(self.session)
-        await conversation_service.update_conversation_aggregates(
-            conversation_id=conversation.id,
-            user_id=user_id,
-            tokens_delta=result.tokens_used,
-            cost_delta=result.cost,
-            message_count_delta=1,
-        )
-        
+
         return conversation, message
 
     async def execute_chat_workflow_streaming(
@@ -761,77 +751,6 @@ class WorkflowExecutionService:
 
         return AIMessage(content="No response generated")
 
-    async def _create_and_save_message(
-        self,
-        conversation: Conversation,
-        content: str,
-        role: MessageRole,
-        metadata: dict[str, Any] | None = None,
-        prompt_tokens: int | None = None,
-        completion_tokens: int | None = None,
-        cost: float | None = None,
-        provider_used: str | None = None,
-        response_time_ms: int | None = None,
-    ) -> Message:
-        """Create and save a message to the conversation with token statistics."""
-        from datetime import datetime
-
-        from sqlalchemy import func, select
-
-        # Get proper sequence number from conversation message count
-        query = select(func.count(Message.id)).where(
-            Message.conversation_id == conversation.id
-        )
-        result = await self.session.execute(query)
-        message_count = result.scalar() or 0
-        sequence_number = message_count + 1
-
-        # Calculate total tokens
-        total_tokens = None
-        if prompt_tokens is not None or completion_tokens is not None:
-            total_tokens = (prompt_tokens or 0) + (
-                completion_tokens or 0
-            )
-
-        # Create message object with all fields including token statistics
-        message = Message(
-            id=generate_ulid(),
-            conversation_id=conversation.id,
-            role=role,
-            content=content,
-            sequence_number=sequence_number,
-            rating_count=0,
-            extra_metadata=metadata or {},
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            total_tokens=total_tokens,
-            cost=cost,
-            provider_used=provider_used,
-            response_time_ms=response_time_ms,
-        )
-
-        # The Base class will automatically set created_at and updated_at
-        # But to be safe, let's explicitly set created_at if it's not set
-        if (
-            not hasattr(message, 'created_at')
-            or message.created_at is None
-        ):
-            message.created_at = datetime.now(UTC)
-
-        # Save to database via session
-        try:
-            self.session.add(message)
-            await self.session.commit()
-            logger.debug(
-                f"Saved message {message.id} to database with tokens: {total_tokens}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to save message to database: {e}")
-            await self.session.rollback()
-            # Don't fail the entire workflow execution for message saving issues
-
-        return message
-
     async def _get_or_create_conversation(
         self, user_id: str, request: ChatRequest
     ) -> Conversation:
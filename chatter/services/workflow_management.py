@@ -56,6 +56,12 @@ class WorkflowManagementService:
             workflow_cache = get_workflow_cache()
             await workflow_cache.clear_all()
 
+            # Drop compiled graphs built from the changed workflow
+            if workflow_id:
+                workflow_cache.compiled_graphs.invalidate(workflow_id)
+            else:
+                workflow_cache.compiled_graphs.clear()
+
             logger.debug(
                 "Invalidated workflow caches",
                 workflow_id=workflow_id,
@@ -782,6 +788,9 @@ class WorkflowManagementService:
             await self.session.commit()
             await self.session.refresh(template)
 
+            # Invalidate workflow caches after update
+            await self._invalidate_workflow_caches(template_id)
+
             logger.info(f"Updated workflow template {template_id}")
             return template
 
@@ -816,6 +825,9 @@ class WorkflowManagementService:
             await self.session.delete(template)
             await self.session.commit()
 
+            # Invalidate workflow caches after deletion
+            await self._invalidate_workflow_caches(template_id)
+
             logger.info(f"Deleted workflow template {template_id}")
             return True
 
@@ -614,6 +614,7 @@ class ConfigurableSeeder(DatabaseSeeder):
                 title=conv_data["title"],
                 description=conv_data.get("description", ""),
                 status=ConversationStatus.ACTIVE,
+                message_count=len(conv_data.get("messages", [])),
             )
 
             self.session.add(conversation)
@@ -0,0 +1,206 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset pagination makes Postgres walk and discard every skipped row, so
+deep pages get slower the further a client scrolls. Keyset pagination
+instead continues after the last row of the previous page with a
+``WHERE (sort, id) > (:last_sort, :last_id)`` predicate that an index
+on the ordering columns answers directly.
+
+Cursors are opaque, URL-safe strings carrying the ordering they were
+issued for and the last row's key values.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from chatter.core.exceptions import ValidationError
+
+
+class InvalidCursorError(ValidationError):
+    """Raised when a pagination cursor is malformed or does not match."""
+
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message, field_errors={"cursor": message})
+
+
+class Keyset:
+    """Ordering columns of a keyset-paginated query.
+
+    All columns sort in the same direction and must be non-nullable; the
+    last column must make the ordering unique (usually the primary key).
+    """
+
+    def __init__(
+        self, *columns: InstrumentedAttribute, descending: bool = False
+    ):
+        if not columns:
+            raise ValueError("Keyset needs at least one column")
+        self.columns = columns
+        self.descending = descending
+        self._fingerprint = ",".join(
+            [column.key for column in columns]
+            + ["desc" if descending else "asc"]
+        )
+
+    def apply(self, query: Select, cursor: str | None = None) -> Select:
+        """Order a query by the keyset and continue after a cursor.
+
+        Args:
+            query: Query to paginate
+            cursor: Cursor from a previous page, if any
+
+        Returns:
+            Ordered query, filtered to rows after the cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued
+                for a different ordering
+        """
+        query = query.order_by(
+            *(
+                column.desc() if self.descending else column.asc()
+                for column in self.columns
+            )
+        )
+        if cursor is None:
+            return query
+
+        values = self.decode(cursor)
+        if len(self.columns) == 1:
+            key, value = self.columns[0], values[0]
+        else:
+            key, value = tuple_(*self.columns), tuple_(*values)
+        return query.where(key < value if self.descending else key > value)
+
+    def cursor_for(self, item: Any) -> str:
+        """Build the cursor that continues after ``item``."""
+        values = [
+            self._encode_value(getattr(item, column.key))
+            for column in self.columns
+        ]
+        payload = json.dumps(
+            {"k": self._fingerprint, "v": values}, separators=(",", ":")
+        )
+        return (
+            base64.urlsafe_b64encode(payload.encode())
+            .decode()
+            .rstrip("=")
+        )
+
+    def next_cursor(self, items: list[Any], limit: int) -> str | None:
+        """Cursor for the page after ``items``, or None if it was the last.
+
+        A page shorter than ``limit`` is the last one.
+        """
+        if not items or len(items) < limit:
+            return None
+        return self.cursor_for(items[-1])
+
+    def decode(self, cursor: str) -> list[Any]:
+        """Decode a cursor into key values for this keyset.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or was issued
+                for a different ordering
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            fingerprint, values = payload["k"], payload["v"]
+        except (ValueError, TypeError, KeyError) as e:
+            raise InvalidCursorError() from e
+
+        if fingerprint != self._fingerprint or not isinstance(
+            values, list
+        ):
+            raise InvalidCursorError(
+                "Pagination cursor does not match the requested ordering"
+            )
+        if len(values) != len(self.columns):
+            raise InvalidCursorError()
+
+        try:
+            return [
+                self._decode_value(column, value)
+                for column, value in zip(
+                    self.columns, values, strict=True
+                )
+            ]
+        except (ValueError, TypeError) as e:
+            raise InvalidCursorError() from e
+
+    @staticmethod
+    def _encode_value(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    @staticmethod
+    def _decode_value(column: InstrumentedAttribute, value: Any) -> Any:
+        if value is None:
+            raise ValueError("Keyset values cannot be null")
+        if isinstance(column.type, DateTime):
+            return datetime.fromisoformat(value)
+        return value
+
+
+# Non-nullable sort fields that support cursor pagination
+CURSOR_SORT_FIELDS = ("created_at", "updated_at")
+
+
+def sort_keyset(
+    model: Any, sort_field: str, sort_order: str = "desc"
+) -> Keyset | None:
+    """Keyset for a ``(sort_field, id)`` ordering of a model.
+
+    Args:
+        model: Mapped class with an ``id`` primary key
+        sort_field: Column to sort by
+        sort_order: 'asc' or 'desc'
+
+    Returns:
+        Keyset, or None if the field does not support cursors
+    """
+    if sort_field not in CURSOR_SORT_FIELDS:
+        return None
+    return Keyset(
+        getattr(model, sort_field),
+        model.id,
+        descending=sort_order.lower() == "desc",
+    )
+
+
+def paginate(
+    query: Select,
+    keyset: Keyset | None,
+    cursor: str | None = None,
+    offset: int = 0,
+) -> Select:
+    """Apply cursor or offset pagination to an unordered query.
+
+    With a cursor the query continues after it; otherwise it is ordered
+    by the keyset (if any) and skips ``offset`` rows. The caller applies
+    the limit.
+
+    Raises:
+        InvalidCursorError: If a cursor is given for an ordering that
+            does not support cursors, or does not match it
+    """
+    if cursor is not None:
+        if keyset is None:
+            raise InvalidCursorError(
+                "Cursor pagination requires sorting by "
+                + " or ".join(CURSOR_SORT_FIELDS)
+            )
+        return keyset.apply(query, cursor)
+
+    if keyset is not None:
+        query = keyset.apply(query)
+    if offset > 0:
+        query = query.offset(offset)
+    return query
@@ -20,6 +20,7 @@ from chatter.models.conversation import Conversation, Message
 from chatter.models.document import Document
 from chatter.models.registry import ModelDef, ModelType, Provider
 from chatter.models.user import User
+from chatter.utils import text_search
 from chatter.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -1161,15 +1162,15 @@ class DatabaseIndexManager:
             """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversations_user_status_updated
                ON conversations(user_id, status, updated_at DESC)
                -- Optimizes user conversation listing""",
-            """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversations_search
-               ON conversations USING GIN(to_tsvector('english', title))
+            """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_conversations_search_vector
+               ON conversations USING GIN(search_vector)
                -- Enables full-text search on conversation titles""",
             # Message optimization indexes
             """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_conversation_created
                ON messages(conversation_id, created_at DESC)
                -- Optimizes message ordering within conversations""",
-            """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_search
-               ON messages USING GIN(to_tsvector('english', content))
+            """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_search_vector
+               ON messages USING GIN(search_vector)
                -- Enables full-text search on message content""",
             # Document optimization indexes
             """CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_documents_owner_created
@@ -1546,28 +1547,44 @@ class ConversationQueryService:
         async with self.performance_monitor.measure_query(
             "search_conversations"
         ):
-            # Search in conversation title or message content
+            tsquery = text_search.prefix_tsquery(search_term)
+            if tsquery is None:
+                return []
+
+            # Search in conversation title or message content using
+            # the GIN-indexed search vectors
+            message_match = (
+                select(Message.id)
+                .where(
+                    and_(
+                        Message.conversation_id == Conversation.id,
+                        text_search.matches(
+                            Message.search_vector, tsquery
+                        ),
+                    )
+                )
+                .exists()
+            )
             query = (
                 select(Conversation)
-                .join(
-                    Message,
-                    Message.conversation_id == Conversation.id,
-                    isouter=True,
-                )
                 .where(
                     and_(
                         Conversation.user_id == user_id,
                         Conversation.status != "deleted",
                         or_(
-                            Conversation.title.ilike(
-                                f"%{search_term}%"
+                            text_search.matches(
+                                Conversation.search_vector, tsquery
                             ),
-                            Message.content.ilike(f"%{search_term}%"),
+                            message_match,
                         ),
                     )
                 )
-                .distinct()
-                .order_by(Conversation.updated_at.desc())
+                .order_by(
+                    text_search.rank(
+                        Conversation.search_vector, tsquery
+                    ).desc(),
+                    Conversation.updated_at.desc(),
+                )
                 .limit(limit)
             )
 
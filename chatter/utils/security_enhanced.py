@@ -1,6 +1,8 @@
 """Enhanced security utilities for authentication and authorization."""
 
 import base64
+import hashlib
+import hmac
 import os
 import re
 import secrets
@@ -171,6 +173,50 @@ def generate_secure_api_key(length: int = 32) -> tuple[str, str]:
     return api_key, hashed_key.decode()
 
 
+API_KEY_SCHEME = "chatter_api_"
+
+
+def get_api_key_prefix(api_key: str) -> str | None:
+    """Extract the non-secret lookup prefix of an API key.
+
+    Keys look like ``chatter_api_<timestamp>_<salt>_<secret>``. The
+    timestamp and salt identify the key without revealing the secret,
+    so they are stored in clear and indexed for lookups.
+
+    Args:
+        api_key: Plain text API key
+
+    Returns:
+        Lookup prefix, or None if the key is not in the expected format
+    """
+    if not api_key.startswith(API_KEY_SCHEME):
+        return None
+    parts = api_key[len(API_KEY_SCHEME) :].split("_", 2)
+    if len(parts) != 3 or not all(parts):
+        return None
+    timestamp, salt, _ = parts
+    if not timestamp.isdigit() or len(salt) != 16:
+        return None
+    return f"{API_KEY_SCHEME}{timestamp}_{salt}"
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Compute a keyed hash of an API key for in-memory lookups.
+
+    Unlike the stored bcrypt hash this is cheap to compute, so it can
+    key a cache of recently verified API keys.
+
+    Args:
+        api_key: Plain text API key
+
+    Returns:
+        Hex HMAC-SHA256 digest of the key
+    """
+    return hmac.new(
+        settings.secret_key.encode(), api_key.encode(), hashlib.sha256
+    ).hexdigest()
+
+
 def verify_api_key_secure(plain_key: str, hashed_key: str) -> bool:
     """Verify API key using bcrypt.
 
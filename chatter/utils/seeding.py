@@ -1175,6 +1175,7 @@ Keep the summary {length} and focused on {focus_area}.""",
                 title=conv_data["title"],
                 description=conv_data["description"],
                 status=ConversationStatus.ACTIVE,
+                message_count=len(conv_data["messages"]),
             )
 
             self.session.add(conversation)
@@ -1461,6 +1462,7 @@ All API requests require authentication using JWT tokens.
                 title=conv_data["title"],
                 description=conv_data["description"],
                 status=ConversationStatus.ACTIVE,
+                message_count=len(conv_data["messages"]),
             )
 
             self.session.add(conversation)
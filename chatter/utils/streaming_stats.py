@@ -0,0 +1,148 @@
+"""Constant-size streaming statistics accumulators.
+
+Both accumulators update in O(1) per observation, use a fixed amount of
+memory regardless of how many observations they have seen, and can be
+merged, so partial results from several processes (or from before a
+restart) combine into the same totals as a single pass.
+"""
+
+import hashlib
+import math
+
+
+class RunningStats:
+    """Count, sum, mean and variance of a stream of numbers.
+
+    Uses Welford's update for single values and Chan et al.'s parallel
+    formula for merging, both of which avoid the cancellation error of
+    the naive sum-of-squares approach.
+    """
+
+    __slots__ = ("count", "total", "mean", "m2")
+
+    def __init__(
+        self,
+        count: int = 0,
+        total: float = 0.0,
+        mean: float = 0.0,
+        m2: float = 0.0,
+    ):
+        self.count = count
+        self.total = total
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Fold another accumulator's observations into this one."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count = other.count
+            self.total = other.total
+            self.mean = other.mean
+            self.m2 = other.m2
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += (
+            other.m2 + delta * delta * self.count * other.count / count
+        )
+        self.total += other.total
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        """Population variance."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return math.sqrt(max(self.variance, 0.0))
+
+    def summary(self) -> dict[str, float]:
+        """Summary in the shape used by A/B test results."""
+        return {
+            "mean": self.mean,
+            "count": self.count,
+            "sum": self.total,
+            "std": self.std,
+        }
+
+
+class HyperLogLog:
+    """Approximate distinct counter.
+
+    With the default precision of 12 the sketch is 4 KiB and the
+    standard error is about 1.6%; small cardinalities are counted
+    almost exactly via linear counting.
+    """
+
+    __slots__ = ("precision", "registers")
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: str) -> None:
+        """Add one value to the sketch."""
+        digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        width = 64 - self.precision
+        index = hashed >> width
+        remainder = hashed & ((1 << width) - 1)
+        rank = width - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Fold another sketch of the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError(
+                "Cannot merge sketches of different precision"
+            )
+        self.registers = bytearray(
+            max(a, b)
+            for a, b in zip(
+                self.registers, other.registers, strict=True
+            )
+        )
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        m = len(self.registers)
+        zeros = self.registers.count(0)
+        if zeros == m:
+            return 0
+
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch registers."""
+        return bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        """Restore a sketch serialized with :meth:`to_bytes`."""
+        precision = len(data).bit_length() - 1
+        if len(data) != 1 << precision:
+            raise ValueError("Invalid HyperLogLog register count")
+        sketch = cls(precision)
+        sketch.registers = bytearray(data)
+        return sketch
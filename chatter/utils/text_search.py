@@ -0,0 +1,107 @@
+"""PostgreSQL full-text search helpers.
+
+Searchable tables carry a generated ``search_vector`` tsvector column
+with a GIN index (see the ``fulltext_search_indexes`` migration). These
+helpers build the matching tsquery and ranking expressions so every
+search path uses the same text search configuration.
+"""
+
+import re
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.schema import Computed
+
+# Text search configuration used by generated columns and queries
+SEARCH_CONFIG = "english"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_vector_column(expression: str) -> tuple[Any, Computed]:
+    """Build the type and generated expression for a search_vector column.
+
+    Args:
+        expression: SQL expression producing the tsvector
+
+    Returns:
+        Arguments for ``mapped_column``
+    """
+    return TSVECTOR(), Computed(expression, persisted=True)
+
+
+def to_tsvector_sql(column: str, weight: str | None = None) -> str:
+    """Build a to_tsvector SQL expression for a (nullable) column."""
+    vector = (
+        f"to_tsvector('{SEARCH_CONFIG}'::regconfig, "
+        f"coalesce({column}, ''))"
+    )
+    if weight:
+        return f"setweight({vector}, '{weight}')"
+    return vector
+
+
+def prefix_tsquery(search_term: str) -> ColumnElement[Any] | None:
+    """Build a tsquery matching all words of a search term as prefixes.
+
+    Only word characters are kept, so the query text is always valid
+    tsquery syntax regardless of user input.
+
+    Args:
+        search_term: Raw user search term
+
+    Returns:
+        tsquery expression, or None if the term has no searchable words
+    """
+    tokens = _TOKEN_RE.findall(search_term.lower())
+    if not tokens:
+        return None
+
+    return func.to_tsquery(
+        literal_column(f"'{SEARCH_CONFIG}'::regconfig"),
+        " & ".join(f"{token}:*" for token in tokens),
+    )
+
+
+def any_words_tsquery(search_term: str) -> ColumnElement[Any] | None:
+    """Build a tsquery matching any word of a search term.
+
+    Suited to ranking free-form questions, where requiring every word
+    would discard most relevant passages.
+
+    Args:
+        search_term: Raw user search term
+
+    Returns:
+        tsquery expression, or None if the term has no searchable words
+    """
+    tokens = _TOKEN_RE.findall(search_term.lower())
+    if not tokens:
+        return None
+
+    return func.to_tsquery(
+        literal_column(f"'{SEARCH_CONFIG}'::regconfig"),
+        " | ".join(tokens),
+    )
+
+
+def matches(
+    search_vector: Any, tsquery: ColumnElement[Any]
+) -> ColumnElement[bool]:
+    """Build a ``search_vector @@ tsquery`` condition."""
+    return search_vector.bool_op("@@")(tsquery)
+
+
+def rank(
+    search_vector: Any, tsquery: ColumnElement[Any]
+) -> ColumnElement[float]:
+    """Build a ts_rank expression for ordering matches."""
+    return func.ts_rank(search_vector, tsquery)
+
+
+def normalize_rank(value: float | None) -> float:
+    """Map an unbounded ts_rank value into the [0, 1) score range."""
+    if not value or value < 0:
+        return 0.0
+    return value / (value + 1.0)
@@ -3,7 +3,7 @@
 This is the primary rate limiting implementation for the Chatter platform.
 It provides:
 
-- Sliding window rate limiting algorithm
+- Sliding window counter rate limiting algorithm (O(1) per request)
 - Redis backend with memory fallback
 - Multiple rate limits per key (e.g., hourly + daily)
 - FastAPI middleware with endpoint-specific limits
@@ -16,8 +16,8 @@ Use this module directly via:
 """
 
 import asyncio
+import math
 import time
-from collections import defaultdict, deque
 from collections.abc import Callable
 from typing import Any
 
@@ -51,8 +51,36 @@ class RateLimitExceeded(Exception):
         self.remaining = remaining
 
 
+# Atomically read the current and previous window counters and, when
+# the weighted estimate leaves room, consume one request from the
+# current window. Returns {allowed, current, previous}.
+_SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local limit = tonumber(ARGV[1])
+local weight = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local consume = tonumber(ARGV[4])
+if consume == 1 and previous * weight + current + 1 <= limit then
+    current = redis.call('INCR', KEYS[1])
+    if current == 1 then
+        redis.call('EXPIRE', KEYS[1], ttl)
+    end
+    return {1, current, previous}
+end
+return {0, current, previous}
+"""
+
+
 class SlidingWindowRateLimiter:
-    """Sliding window rate limiter with memory and cache backend support."""
+    """Sliding window counter rate limiter with memory and cache backends.
+
+    Each key keeps only two counters: requests in the current fixed
+    window and in the previous one. The number of requests in the
+    sliding window is estimated by weighting the previous window by how
+    much of it still overlaps the sliding window, so every check costs
+    O(1) time and memory regardless of the limit size.
+    """
 
     def __init__(
         self,
@@ -74,52 +102,170 @@ class SlidingWindowRateLimiter:
         self.cache_service = cache_service
         self.use_cache = use_cache and cache_service is not None
 
-        # Memory fallback storage
-        self._memory_storage: dict[str, deque] = defaultdict(deque)
+        # Memory fallback storage: key -> [window_index, current, previous]
+        self._memory_storage: dict[str, list[int]] = {}
         self._lock = asyncio.Lock()
 
-    async def _get_requests_from_cache(self, key: str) -> list[float]:
-        """Get request timestamps from cache."""
-        if not self.use_cache:
-            return []
+    def _window_position(self, current_time: float) -> tuple[int, float]:
+        """Get the current window index and the previous window's weight."""
+        window_index = int(current_time // self.window_seconds)
+        elapsed = current_time - window_index * self.window_seconds
+        return window_index, 1.0 - elapsed / self.window_seconds
+
+    def _roll_counters(
+        self, state: list[int] | None, window_index: int
+    ) -> tuple[int, int]:
+        """Get (current, previous) counts for a window index."""
+        if not state:
+            return 0, 0
+        stored_index, current, previous = state
+        if stored_index == window_index:
+            return current, previous
+        if stored_index == window_index - 1:
+            return 0, current
+        return 0, 0
+
+    async def _get_redis_client(self):
+        """Get a raw Redis client from the cache service, if it has one."""
+        get_client = getattr(self.cache_service, "get_client", None)
+        if get_client is None:
+            return None
+        try:
+            return await get_client()
+        except Exception as e:
+            logger.warning(f"Cache client error for rate limiting: {e}")
+            return None
+
+    async def _check_redis(
+        self,
+        client,
+        key: str,
+        window_index: int,
+        weight: float,
+        consume: bool,
+    ) -> tuple[bool, int, int] | None:
+        """Run the sliding window check atomically in Redis."""
+        try:
+            result = await client.eval(
+                _SLIDING_WINDOW_SCRIPT,
+                2,
+                self.cache_service.make_key(
+                    "rate_limit", key, window_index
+                ),
+                self.cache_service.make_key(
+                    "rate_limit", key, window_index - 1
+                ),
+                self.limit,
+                weight,
+                # Keep the counter while it can still be a previous window
+                self.window_seconds * 2 + 60,
+                1 if consume else 0,
+            )
+            allowed, current, previous = (int(v) for v in result)
+            return bool(allowed), current, previous
+        except Exception as e:
+            logger.warning(
+                f"Cache eval error for rate limit key {key}: {e}"
+            )
+            return None
 
+    async def _check_cache(
+        self, key: str, window_index: int, weight: float, consume: bool
+    ) -> tuple[bool, int, int] | None:
+        """Run the sliding window check through the generic cache API."""
+        cache_key = f"rate_limit:{key}"
         try:
-            data = await self.cache_service.get(f"rate_limit:{key}")
-            if data and isinstance(data, list):
-                return [float(ts) for ts in data]
+            state = await self.cache_service.get(cache_key)
         except Exception as e:
             logger.warning(
                 f"Cache get error for rate limit key {key}: {e}"
             )
+            return None
 
-        return []
+        if not isinstance(state, list) or len(state) != 3:
+            state = None
+        current, previous = self._roll_counters(state, window_index)
+        allowed = previous * weight + current + 1 <= self.limit
 
-    async def _store_requests_to_cache(
-        self, key: str, requests: list[float]
-    ) -> None:
-        """Store request timestamps to cache."""
-        if not self.use_cache:
-            return
+        if consume and allowed:
+            current += 1
+            try:
+                await self.cache_service.set(
+                    cache_key,
+                    [window_index, current, previous],
+                    self.window_seconds * 2 + 60,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Cache set error for rate limit key {key}: {e}"
+                )
 
-        try:
-            # Store with expiration slightly longer than window (convert to seconds)
-            expire_seconds = self.window_seconds + 60
-            await self.cache_service.set(
-                f"rate_limit:{key}", requests, expire_seconds
+        return allowed, current, previous
+
+    def _check_memory(
+        self, key: str, window_index: int, weight: float, consume: bool
+    ) -> tuple[bool, int, int]:
+        """Run the sliding window check against in-process counters."""
+        current, previous = self._roll_counters(
+            self._memory_storage.get(key), window_index
+        )
+        allowed = previous * weight + current + 1 <= self.limit
+
+        if consume and allowed:
+            current += 1
+            self._memory_storage[key] = [window_index, current, previous]
+
+        return allowed, current, previous
+
+    async def _check(
+        self, key: str, current_time: float, consume: bool
+    ) -> tuple[bool, int, int, float]:
+        """Check a key, consuming a request when allowed and requested."""
+        window_index, weight = self._window_position(current_time)
+
+        result = None
+        if self.use_cache:
+            if hasattr(self.cache_service, "get_client"):
+                client = await self._get_redis_client()
+                if client is not None:
+                    result = await self._check_redis(
+                        client, key, window_index, weight, consume
+                    )
+            else:
+                result = await self._check_cache(
+                    key, window_index, weight, consume
+                )
+
+        if result is None:
+            # Cache unavailable, fall back to memory
+            result = self._check_memory(
+                key, window_index, weight, consume
             )
-        except Exception as e:
-            logger.warning(
-                f"Cache set error for rate limit key {key}: {e}"
+
+        allowed, current, previous = result
+        return allowed, current, previous, weight
+
+    def _retry_after(
+        self, current: int, previous: int, current_time: float
+    ) -> int:
+        """Seconds until the weighted count drops below the limit."""
+        window_index, _ = self._window_position(current_time)
+        window_start = window_index * self.window_seconds
+
+        if current + 1 <= self.limit and previous > 0:
+            # Wait for enough of the previous window to slide out
+            fraction = 1.0 - (self.limit - current - 1) / previous
+            wait_until = window_start + fraction * self.window_seconds
+        elif current > 0:
+            # The current window becomes the previous one next window
+            fraction = max(0.0, 1.0 - (self.limit - 1) / current)
+            wait_until = (
+                window_start + (1 + fraction) * self.window_seconds
             )
+        else:
+            wait_until = window_start + self.window_seconds
 
-    async def _clean_old_requests(
-        self, requests: list[float], current_time: float
-    ) -> list[float]:
-        """Remove requests outside the time window."""
-        cutoff_time = current_time - self.window_seconds
-        return [
-            req_time for req_time in requests if req_time > cutoff_time
-        ]
+        return max(1, math.ceil(wait_until - current_time))
 
     async def is_allowed(self, key: str) -> tuple[bool, dict[str, Any]]:
         """Check if request is allowed and return metadata.
@@ -136,90 +282,83 @@ class SlidingWindowRateLimiter:
         current_time = time.time()
 
         async with self._lock:
-            # Try to get from cache first, fallback to memory
-            if self.use_cache:
-                requests = await self._get_requests_from_cache(key)
-                if not requests:
-                    # Fallback to memory if cache miss
-                    requests = list(self._memory_storage[key])
-            else:
-                requests = list(self._memory_storage[key])
-
-            # Clean old requests
-            requests = await self._clean_old_requests(
-                requests, current_time
+            allowed, current, previous, weight = await self._check(
+                key, current_time, consume=True
             )
 
-            # Calculate metadata
-            remaining = max(0, self.limit - len(requests))
-            reset_time = int(current_time + self.window_seconds)
-            retry_after = self.window_seconds if remaining == 0 else 0
-
-            metadata = {
-                "remaining": remaining,
-                "reset_time": reset_time,
-                "retry_after": retry_after,
-                "limit": self.limit,
-                "window": self.window_seconds,
-            }
-
-            # Check if request is allowed
-            if len(requests) >= self.limit:
-                return False, metadata
-
-            # Add current request
-            requests.append(current_time)
-
-            # Store updated requests
-            if self.use_cache:
-                await self._store_requests_to_cache(key, requests)
-            else:
-                self._memory_storage[key] = deque(requests)
-
-            # Update metadata
-            metadata["remaining"] = max(0, self.limit - len(requests))
+        used = previous * weight + current
+        metadata = {
+            "remaining": max(0, int(self.limit - used)),
+            "reset_time": int(current_time + self.window_seconds),
+            "retry_after": (
+                0
+                if allowed
+                else self._retry_after(current, previous, current_time)
+            ),
+            "limit": self.limit,
+            "window": self.window_seconds,
+        }
 
-            return True, metadata
+        return allowed, metadata
 
     async def get_status(self, key: str) -> dict[str, Any]:
         """Get current rate limit status without consuming a request."""
         current_time = time.time()
 
         async with self._lock:
-            # Get requests from cache or memory
-            if self.use_cache:
-                requests = await self._get_requests_from_cache(key)
-                if not requests:
-                    requests = list(self._memory_storage[key])
-            else:
-                requests = list(self._memory_storage[key])
-
-            # Clean old requests
-            requests = await self._clean_old_requests(
-                requests, current_time
+            _, current, previous, weight = await self._check(
+                key, current_time, consume=False
             )
 
-            return {
-                "remaining": max(0, self.limit - len(requests)),
-                "reset_time": int(current_time + self.window_seconds),
-                "limit": self.limit,
-                "window": self.window_seconds,
-                "used": len(requests),
-            }
+        used = previous * weight + current
+        return {
+            "remaining": max(0, int(self.limit - used)),
+            "reset_time": int(current_time + self.window_seconds),
+            "limit": self.limit,
+            "window": self.window_seconds,
+            "used": math.ceil(used),
+        }
 
     async def reset(self, key: str) -> None:
         """Reset rate limit for a specific key."""
         async with self._lock:
             if self.use_cache:
                 try:
-                    await self.cache_service.delete(f"rate_limit:{key}")
+                    client = await self._get_redis_client()
+                    if client is not None:
+                        window_index, _ = self._window_position(
+                            time.time()
+                        )
+                        await client.delete(
+                            self.cache_service.make_key(
+                                "rate_limit", key, window_index
+                            ),
+                            self.cache_service.make_key(
+                                "rate_limit", key, window_index - 1
+                            ),
+                        )
+                    else:
+                        await self.cache_service.delete(
+                            f"rate_limit:{key}"
+                        )
                 except Exception as e:
                     logger.warning(
                         f"Cache delete error for key {key}: {e}"
                     )
 
-            if key in self._memory_storage:
-                del self._memory_storage[key]
+            self._memory_storage.pop(key, None)
+
+    def prune(self) -> int:
+        """Drop in-memory counters that no longer affect any decision."""
+        window_index, _ = self._window_position(time.time())
+        stale = [
+            key
+            for key, state in self._memory_storage.items()
+            if state[0] < window_index - 1
+        ]
+        for key in stale:
+            del self._memory_storage[key]
+        return len(stale)
 
 
 class UnifiedRateLimiter:
@@ -347,9 +486,9 @@ class UnifiedRateLimiter:
 
     async def cleanup_old_limiters(self, max_age: int = 3600) -> None:
         """Clean up old unused limiters to prevent memory leaks."""
-        # This would be called periodically by a background task
-        # For now, we rely on the cache TTL to clean up old data
-        pass
+        # Cached counters expire via TTL; only memory needs pruning
+        for limiter in list(self._limiters.values()):
+            limiter.prune()
 
 
 class UnifiedRateLimitMiddleware(BaseHTTPMiddleware):
@@ -69,6 +69,9 @@ export enum SSEEventType {
   PLUGIN_STOPPED = 'plugin.stopped',
   PLUGIN_ERROR = 'plugin.error',
 
+  // Analytics Events
+  ANALYTICS_DASHBOARD_UPDATED = 'analytics.dashboard_updated',
+
   // System Events
   SYSTEM_ALERT = 'system.alert',
   SYSTEM_STATUS = 'system.status',
@@ -400,6 +403,9 @@ export const STATIC_EVENT_TYPES = [
   'agent.created',
   'agent.updated',
 
+  // Analytics events
+  'analytics.dashboard_updated',
+
   // System events
   'system.alert',
   'system.status',
@@ -1157,6 +1157,7 @@ class ConversationsApi:
         conversation_id: Annotated[str, Field(min_length=1, strict=True, description="Conversation ID")],
         limit: Annotated[Optional[Annotated[int, Field(strict=True, ge=1)]], Field(description="Number of results per page")] = None,
         offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of results to skip")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1180,6 +1181,8 @@ class ConversationsApi:
         :type limit: int
         :param offset: Number of results to skip
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1206,6 +1209,7 @@ class ConversationsApi:
             conversation_id=conversation_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1233,6 +1237,7 @@ class ConversationsApi:
         conversation_id: Annotated[str, Field(min_length=1, strict=True, description="Conversation ID")],
         limit: Annotated[Optional[Annotated[int, Field(strict=True, ge=1)]], Field(description="Number of results per page")] = None,
         offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of results to skip")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1256,6 +1261,8 @@ class ConversationsApi:
         :type limit: int
         :param offset: Number of results to skip
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1282,6 +1289,7 @@ class ConversationsApi:
             conversation_id=conversation_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1309,6 +1317,7 @@ class ConversationsApi:
         conversation_id: Annotated[str, Field(min_length=1, strict=True, description="Conversation ID")],
         limit: Annotated[Optional[Annotated[int, Field(strict=True, ge=1)]], Field(description="Number of results per page")] = None,
         offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of results to skip")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1332,6 +1341,8 @@ class ConversationsApi:
         :type limit: int
         :param offset: Number of results to skip
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1358,6 +1369,7 @@ class ConversationsApi:
             conversation_id=conversation_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1380,6 +1392,7 @@ class ConversationsApi:
         conversation_id,
         limit,
         offset,
+        cursor,
         _request_auth,
         _content_type,
         _headers,
@@ -1412,6 +1425,10 @@ class ConversationsApi:
             
             _query_params.append(('offset', offset))
             
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -1459,6 +1476,7 @@ class ConversationsApi:
         enable_retrieval: Annotated[Optional[StrictBool], Field(description="Filter by retrieval enabled status")] = None,
         limit: Annotated[Optional[Annotated[int, Field(strict=True, ge=1)]], Field(description="Maximum number of results")] = None,
         offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of results to skip")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         sort_by: Annotated[Optional[StrictStr], Field(description="Sort field")] = None,
         sort_order: Annotated[Optional[Annotated[str, Field(strict=True)]], Field(description="Sort order")] = None,
         _request_timeout: Union[
@@ -1492,6 +1510,8 @@ class ConversationsApi:
         :type limit: int
         :param offset: Number of results to skip
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param sort_by: Sort field
         :type sort_by: str
         :param sort_order: Sort order
@@ -1526,6 +1546,7 @@ class ConversationsApi:
             enable_retrieval=enable_retrieval,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             sort_by=sort_by,
             sort_order=sort_order,
             _request_auth=_request_auth,
@@ -1559,6 +1580,7 @@ class ConversationsApi:
         enable_retrieval: Annotated[Optional[StrictBool], Field(description="Filter by retrieval enabled status")] = None,
         limit: Annotated[Optional[Annotated[int, Field(strict=True, ge=1)]], Field(description="Maximum number of results")] = None,
         offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of results to skip")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         sort_by: Annotated[Optional[StrictStr], Field(description="Sort field")] = None,
         sort_order: Annotated[Optional[Annotated[str, Field(strict=True)]], Field(description="Sort order")] = None,
         _request_timeout: Union[
@@ -1592,6 +1614,8 @@ class ConversationsApi:
         :type limit: int
         :param offset: Number of results to skip
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param sort_by: Sort field
         :type sort_by: str
         :param sort_order: Sort order
@@ -1626,6 +1650,7 @@ class ConversationsApi:
             enable_retrieval=enable_retrieval,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             sort_by=sort_by,
             sort_order=sort_order,
             _request_auth=_request_auth,
@@ -1659,6 +1684,7 @@ class ConversationsApi:
         enable_retrieval: Annotated[Optional[StrictBool], Field(description="Filter by retrieval enabled status")] = None,
         limit: Annotated[Optional[Annotated[int, Field(strict=True, ge=1)]], Field(description="Maximum number of results")] = None,
         offset: Annotated[Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Number of results to skip")] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         sort_by: Annotated[Optional[StrictStr], Field(description="Sort field")] = None,
         sort_order: Annotated[Optional[Annotated[str, Field(strict=True)]], Field(description="Sort order")] = None,
         _request_timeout: Union[
@@ -1692,6 +1718,8 @@ class ConversationsApi:
         :type limit: int
         :param offset: Number of results to skip
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param sort_by: Sort field
         :type sort_by: str
         :param sort_order: Sort order
@@ -1726,6 +1754,7 @@ class ConversationsApi:
             enable_retrieval=enable_retrieval,
             limit=limit,
             offset=offset,
+            cursor=cursor,
             sort_by=sort_by,
             sort_order=sort_order,
             _request_auth=_request_auth,
@@ -1754,6 +1783,7 @@ class ConversationsApi:
         enable_retrieval,
         limit,
         offset,
+        cursor,
         sort_by,
         sort_order,
         _request_auth,
@@ -1807,6 +1837,10 @@ class ConversationsApi:
             
             _query_params.append(('offset', offset))
             
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         if sort_by is not None:
             
             _query_params.append(('sort_by', sort_by))
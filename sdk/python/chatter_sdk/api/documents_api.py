@@ -2724,6 +2724,7 @@ class DocumentsApi:
         self,
         limit: Optional[StrictInt] = None,
         offset: Optional[StrictInt] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2745,6 +2746,8 @@ class DocumentsApi:
         :type limit: int
         :param offset:
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2770,6 +2773,7 @@ class DocumentsApi:
         _param = self._list_documents_get_api_v1_documents_get_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2796,6 +2800,7 @@ class DocumentsApi:
         self,
         limit: Optional[StrictInt] = None,
         offset: Optional[StrictInt] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2817,6 +2822,8 @@ class DocumentsApi:
         :type limit: int
         :param offset:
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2842,6 +2849,7 @@ class DocumentsApi:
         _param = self._list_documents_get_api_v1_documents_get_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2868,6 +2876,7 @@ class DocumentsApi:
         self,
         limit: Optional[StrictInt] = None,
         offset: Optional[StrictInt] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2889,6 +2898,8 @@ class DocumentsApi:
         :type limit: int
         :param offset:
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2914,6 +2925,7 @@ class DocumentsApi:
         _param = self._list_documents_get_api_v1_documents_get_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2935,6 +2947,7 @@ class DocumentsApi:
         self,
         limit,
         offset,
+        cursor,
         _request_auth,
         _content_type,
         _headers,
@@ -2965,6 +2978,10 @@ class DocumentsApi:
             
             _query_params.append(('offset', offset))
             
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -3007,6 +3024,7 @@ class DocumentsApi:
         self,
         limit: Optional[StrictInt] = None,
         offset: Optional[StrictInt] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -3028,6 +3046,8 @@ class DocumentsApi:
         :type limit: int
         :param offset:
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -3053,6 +3073,7 @@ class DocumentsApi:
         _param = self._list_documents_get_api_v1_documents_get_0_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -3079,6 +3100,7 @@ class DocumentsApi:
         self,
         limit: Optional[StrictInt] = None,
         offset: Optional[StrictInt] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -3100,6 +3122,8 @@ class DocumentsApi:
         :type limit: int
         :param offset:
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -3125,6 +3149,7 @@ class DocumentsApi:
         _param = self._list_documents_get_api_v1_documents_get_0_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -3151,6 +3176,7 @@ class DocumentsApi:
         self,
         limit: Optional[StrictInt] = None,
         offset: Optional[StrictInt] = None,
+        cursor: Annotated[Optional[StrictStr], Field(description="Cursor from a previous page; continues after it instead of skipping offset results")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -3172,6 +3198,8 @@ class DocumentsApi:
         :type limit: int
         :param offset:
         :type offset: int
+        :param cursor: Cursor from a previous page; continues after it instead of skipping offset results
+        :type cursor: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -3197,6 +3225,7 @@ class DocumentsApi:
         _param = self._list_documents_get_api_v1_documents_get_0_serialize(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -3218,6 +3247,7 @@ class DocumentsApi:
         self,
         limit,
         offset,
+        cursor,
         _request_auth,
         _content_type,
         _headers,
@@ -3248,6 +3278,10 @@ class DocumentsApi:
             
             _query_params.append(('offset', offset))
             
+        if cursor is not None:
+            
+            _query_params.append(('cursor', cursor))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
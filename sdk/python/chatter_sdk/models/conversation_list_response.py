@@ -18,7 +18,7 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, Field, StrictInt
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr
 from typing import Any, ClassVar, Dict, List
 from chatter_sdk.models.conversation_response import ConversationResponse
 from typing import Optional, Set
@@ -32,7 +32,8 @@ class ConversationListResponse(BaseModel):
     total_count: StrictInt = Field(description="Total number of conversations")
     limit: StrictInt = Field(description="Applied limit")
     offset: StrictInt = Field(description="Applied offset")
-    __properties: ClassVar[List[str]] = ["conversations", "total_count", "limit", "offset"]
+    next_cursor: Optional[StrictStr] = Field(default=None, description="Cursor for the next page, if any")
+    __properties: ClassVar[List[str]] = ["conversations", "total_count", "limit", "offset", "next_cursor"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -80,6 +81,11 @@ class ConversationListResponse(BaseModel):
                 if _item_conversations:
                     _items.append(_item_conversations.to_dict())
             _dict['conversations'] = _items
+        # set to None if next_cursor (nullable) is None
+        # and model_fields_set contains the field
+        if self.next_cursor is None and "next_cursor" in self.model_fields_set:
+            _dict['next_cursor'] = None
+
         return _dict
 
     @classmethod
@@ -95,7 +101,8 @@ class ConversationListResponse(BaseModel):
             "conversations": [ConversationResponse.from_dict(_item) for _item in obj["conversations"]] if obj.get("conversations") is not None else None,
             "total_count": obj.get("total_count"),
             "limit": obj.get("limit"),
-            "offset": obj.get("offset")
+            "offset": obj.get("offset"),
+            "next_cursor": obj.get("next_cursor")
         })
         return _obj
 
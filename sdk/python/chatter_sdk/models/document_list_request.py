@@ -36,9 +36,10 @@ class DocumentListRequest(BaseModel):
     owner_id: Optional[StrictStr] = None
     limit: Optional[Annotated[int, Field(strict=True, ge=1)]] = Field(default=50, description="Maximum number of results")
     offset: Optional[Annotated[int, Field(strict=True, ge=0)]] = Field(default=0, description="Number of results to skip")
+    cursor: Optional[StrictStr] = Field(default=None, description="Cursor from a previous page's next_cursor; replaces offset (requires sort_by created_at or updated_at)")
     sort_by: Optional[StrictStr] = Field(default='created_at', description="Sort field")
     sort_order: Optional[Annotated[str, Field(strict=True)]] = Field(default='desc', description="Sort order")
-    __properties: ClassVar[List[str]] = ["status", "document_type", "tags", "owner_id", "limit", "offset", "sort_by", "sort_order"]
+    __properties: ClassVar[List[str]] = ["status", "document_type", "tags", "owner_id", "limit", "offset", "cursor", "sort_by", "sort_order"]
 
     @field_validator('sort_order')
     def sort_order_validate_regular_expression(cls, value):
@@ -109,6 +110,11 @@ class DocumentListRequest(BaseModel):
         if self.owner_id is None and "owner_id" in self.model_fields_set:
             _dict['owner_id'] = None
 
+        # set to None if cursor (nullable) is None
+        # and model_fields_set contains the field
+        if self.cursor is None and "cursor" in self.model_fields_set:
+            _dict['cursor'] = None
+
         return _dict
 
     @classmethod
@@ -127,6 +133,7 @@ class DocumentListRequest(BaseModel):
             "owner_id": obj.get("owner_id"),
             "limit": obj.get("limit") if obj.get("limit") is not None else 50,
             "offset": obj.get("offset") if obj.get("offset") is not None else 0,
+            "cursor": obj.get("cursor"),
             "sort_by": obj.get("sort_by") if obj.get("sort_by") is not None else 'created_at',
             "sort_order": obj.get("sort_order") if obj.get("sort_order") is not None else 'desc'
         })
@@ -491,6 +491,11 @@ def setup_test_environment():
                 # If settings creation fails, don't fail the test
                 pass
 
+    # Drop retrieval results cached by earlier tests
+    from chatter.core.retrieval_cache import get_retrieval_cache
+
+    get_retrieval_cache().clear()
+
     yield
 
     # Restore original environment
@@ -0,0 +1,173 @@
+"""Tests for streaming A/B test statistics."""
+
+import statistics
+from collections import deque
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from chatter.services import ab_testing
+from chatter.services.ab_testing import ABTestManager, VariantStats
+from chatter.services.ab_testing_store import ABTestStore
+from chatter.utils.streaming_stats import HyperLogLog, RunningStats
+
+
+class TestAccumulators:
+    """Accumulators match exact results and merge losslessly."""
+
+    def test_running_stats_match_exact_values(self):
+        """Welford updates and merges match a two-pass computation."""
+        values = [float(v) for v in (3, 7, 7, 19, 24, 1, 5, 12)]
+        left, right = RunningStats(), RunningStats()
+        for value in values[:3]:
+            left.add(value)
+        for value in values[3:]:
+            right.add(value)
+        left.merge(right)
+
+        assert left.count == len(values)
+        assert left.total == pytest.approx(sum(values))
+        assert left.mean == pytest.approx(statistics.mean(values))
+        assert left.std == pytest.approx(statistics.pstdev(values))
+
+    def test_sketch_counts_distinct_users(self):
+        """Repeated users are counted once and sketches merge."""
+        first, second = HyperLogLog(), HyperLogLog()
+        for i in range(100):
+            first.add(f"user-{i % 40}")
+        for i in range(20, 60):
+            second.add(f"user-{i}")
+
+        assert first.count() == 40
+        first.merge(second)
+        assert first.count() == 60
+        restored = HyperLogLog.from_bytes(first.to_bytes())
+        assert restored.count() == 60
+
+
+@pytest.fixture
+async def running_test():
+    store = Mock(spec=ABTestStore)
+    store.load_assignment = AsyncMock(return_value=None)
+    store.insert_assignment = AsyncMock(
+        side_effect=lambda assignment: assignment.variant_id
+    )
+    manager = ABTestManager(store=store)
+    test_id = await manager.create_test(
+        name="Prompt test",
+        description="Compare prompts",
+        test_type=ab_testing.TestType.PROMPT,
+        variants=[
+            {"name": "control", "is_control": True},
+            {"name": "candidate"},
+        ],
+        primary_metric={
+            "name": "satisfaction",
+            "metric_type": "user_satisfaction",
+        },
+        created_by="user-1",
+    )
+    await manager.start_test(test_id)
+    return manager, test_id
+
+
+class TestManagerStats:
+    """The manager keeps per-variant totals instead of rescanning."""
+
+    @pytest.mark.asyncio
+    async def test_results_come_from_running_totals(self, running_test):
+        """Results count every event even after raw events roll off."""
+        manager, test_id = running_test
+        manager.events = deque(maxlen=5)
+
+        scores: dict[str, list[float]] = {}
+        for i in range(30):
+            user_id = f"user-{i % 10}"
+            variant_id = await manager.assign_variant(test_id, user_id)
+            score = float(i % 7)
+            scores.setdefault(variant_id, []).append(score)
+            await manager.record_event(
+                test_id,
+                user_id,
+                "rated",
+                metrics={"satisfaction": score},
+            )
+
+        with patch(
+            "chatter.services.ab_testing.get_session_maker",
+            side_effect=RuntimeError("database unavailable"),
+        ):
+            result = await manager.analyze_test(test_id)
+
+        assert len(manager.events) == 5
+        total = sum(
+            data["total_events"]
+            for data in result.variant_results.values()
+        )
+        assert total == 30
+        for variant_id, values in scores.items():
+            data = result.variant_results[variant_id]
+            metric = data["metrics"]["satisfaction"]
+            assert metric["count"] == len(values)
+            assert metric["mean"] == pytest.approx(
+                statistics.mean(values)
+            )
+            assert metric["std"] == pytest.approx(
+                statistics.pstdev(values)
+            )
+        users = sum(
+            data["unique_users"]
+            for data in result.variant_results.values()
+        )
+        assert users == 10
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_pending_totals(
+        self, running_test
+    ):
+        """Totals that could not be persisted are retried later."""
+        manager, test_id = running_test
+        await manager.assign_variant(test_id, "user-1")
+        await manager.record_event(
+            test_id, "user-1", "rated", metrics={"satisfaction": 4.0}
+        )
+
+        with patch(
+            "chatter.services.ab_testing.get_session_maker",
+            side_effect=RuntimeError("database unavailable"),
+        ):
+            await manager.flush_stats()
+
+        [pending] = manager._pending_stats.values()
+        assert pending.event_count == 1
+        assert pending.metrics["satisfaction"].total == 4.0
+
+    @pytest.mark.asyncio
+    async def test_refresh_combines_stored_and_pending(
+        self, running_test
+    ):
+        """Stored totals from other workers merge with pending ones."""
+        manager, test_id = running_test
+        variant_id = await manager.assign_variant(test_id, "user-1")
+        await manager.record_event(
+            test_id, "user-1", "rated", metrics={"satisfaction": 2.0}
+        )
+
+        stored = VariantStats()
+        stored.add_event("user-2", {"satisfaction": 4.0})
+        stored.add_event("user-3", {"satisfaction": 6.0})
+
+        with (
+            patch.object(manager, "flush_stats", AsyncMock()),
+            patch.object(
+                manager,
+                "_load_persisted_stats",
+                AsyncMock(return_value={variant_id: stored}),
+            ),
+        ):
+            await manager._refresh_stats(test_id)
+
+        stats = manager.variant_stats[test_id][variant_id]
+        assert stats.event_count == 3
+        assert stats.users.count() == 3
+        assert stats.metrics["satisfaction"].mean == pytest.approx(4.0)
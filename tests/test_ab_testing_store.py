@@ -0,0 +1,245 @@
+"""Tests for A/B test persistence."""
+
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from chatter.services import ab_testing
+from chatter.services.ab_testing import ABTestManager
+from chatter.services.ab_testing import TestAssignment as Assignment
+from chatter.services.ab_testing import TestEvent as Event
+from chatter.services.ab_testing_store import ABTestStore
+
+
+def _event(i: int = 0, test_id: str = "test-1") -> Event:
+    return Event(
+        test_id=test_id,
+        variant_id="variant-1",
+        user_id=f"user-{i}",
+        event_type="rated",
+        metrics={"satisfaction": 1.0},
+    )
+
+
+def _store() -> Mock:
+    store = Mock(spec=ABTestStore)
+    store.load_assignment = AsyncMock(return_value=None)
+    store.load_test = AsyncMock(return_value=None)
+    store.insert_assignment = AsyncMock(
+        side_effect=lambda assignment: assignment.variant_id
+    )
+    return store
+
+
+async def _running_test(manager: ABTestManager) -> str:
+    test_id = await manager.create_test(
+        name="Prompt test",
+        description="Compare prompts",
+        test_type=ab_testing.TestType.PROMPT,
+        variants=[
+            {"name": "control", "is_control": True},
+            {"name": "candidate"},
+        ],
+        primary_metric={
+            "name": "satisfaction",
+            "metric_type": "user_satisfaction",
+        },
+        created_by="user-1",
+    )
+    await manager.start_test(test_id)
+    return test_id
+
+
+class TestWriteBehindBuffer:
+    """Writes are buffered and inserted in batches."""
+
+    @pytest.mark.asyncio
+    async def test_adding_records_does_not_touch_database(self):
+        """Below the batch size records only sit in the buffer."""
+        store = ABTestStore(batch_size=10, max_buffered=100)
+        with patch.object(store, "_insert", AsyncMock()) as insert:
+            for i in range(5):
+                store.add_event(_event(i))
+            await asyncio.sleep(0)
+
+        insert.assert_not_called()
+        assert store.pending == 5
+
+    @pytest.mark.asyncio
+    async def test_full_batch_triggers_background_flush(self):
+        """Reaching the batch size inserts the batch in one call."""
+        store = ABTestStore(batch_size=3, max_buffered=100)
+        with patch.object(store, "_insert", AsyncMock()) as insert:
+            for i in range(3):
+                store.add_event(_event(i))
+            await store._flush_task
+
+        insert.assert_awaited_once()
+        assignments, events = insert.await_args.args
+        assert assignments == []
+        assert [row["user_id"] for row in events] == [
+            "user-0",
+            "user-1",
+            "user-2",
+        ]
+        assert store.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_records_in_order(self):
+        """Records that fail to insert are retried by the next flush."""
+        store = ABTestStore(batch_size=10, max_buffered=100)
+        store.add_assignment(
+            Assignment(test_id="test-1", user_id="u", variant_id="v")
+        )
+        for i in range(3):
+            store.add_event(_event(i))
+
+        with patch.object(
+            store, "_insert", AsyncMock(side_effect=OSError("down"))
+        ):
+            await store.flush()
+        assert store.pending == 4
+
+        with patch.object(store, "_insert", AsyncMock()) as insert:
+            await store.flush()
+        assignments, events = insert.await_args.args
+        assert len(assignments) == 1
+        assert [row["user_id"] for row in events] == [
+            "user-0",
+            "user-1",
+            "user-2",
+        ]
+
+    def test_buffer_is_bounded(self):
+        """A full buffer drops its oldest records."""
+        store = ABTestStore(batch_size=100, max_buffered=3)
+        for i in range(5):
+            store.add_event(_event(i))
+
+        assert store.pending == 3
+        assert store.dropped == 2
+        assert [row["user_id"] for row in store._events] == [
+            "user-2",
+            "user-3",
+            "user-4",
+        ]
+
+
+class TestAssignmentReadThrough:
+    """Assignments are looked up in-process first, then in the store."""
+
+    @pytest.mark.asyncio
+    async def test_stored_assignment_is_loaded_once(self):
+        """A stored assignment is reused instead of reassigning."""
+        store = Mock(spec=ABTestStore)
+        store.load_assignment = AsyncMock(
+            return_value=SimpleNamespace(
+                id="a-1",
+                test_id="test-1",
+                user_id="user-1",
+                variant_id="variant-2",
+                session_id=None,
+                assigned_at=datetime.now(UTC),
+                extra_metadata=None,
+            )
+        )
+        manager = ABTestManager(store=store)
+        manager.tests["test-1"] = Mock(
+            status=ab_testing.TestStatus.RUNNING
+        )
+
+        first = await manager.assign_variant("test-1", "user-1")
+        second = await manager.assign_variant("test-1", "user-1")
+
+        assert first == second == "variant-2"
+        store.load_assignment.assert_awaited_once_with(
+            "test-1", "user-1"
+        )
+        store.add_assignment.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_new_assignment_is_stored_and_events_buffered(self):
+        """First assignments are stored at once; events are buffered."""
+        store = _store()
+        manager = ABTestManager(store=store)
+        test_id = await _running_test(manager)
+
+        variant_id = await manager.assign_variant(test_id, "user-9")
+        await manager.record_event(test_id, "user-9", "rated")
+
+        [assignment] = store.insert_assignment.await_args.args
+        [event] = store.add_event.call_args.args
+        assert assignment.variant_id == event.variant_id == variant_id
+        store.add_assignment.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_assignment_stored_first_by_another_worker_wins(
+        self,
+    ):
+        """Workers racing to assign a user settle on one variant."""
+        store = _store()
+        manager = ABTestManager(store=store)
+        test_id = await _running_test(manager)
+        variants = [v.id for v in manager.tests[test_id].variants]
+        stored = []
+
+        async def insert_assignment(assignment):
+            stored.append(
+                next(v for v in variants if v != assignment.variant_id)
+            )
+            return stored[-1]
+
+        store.insert_assignment = AsyncMock(
+            side_effect=insert_assignment
+        )
+
+        variant_id = await manager.assign_variant(test_id, "user-9")
+        await manager.record_event(test_id, "user-9", "rated")
+
+        [event] = store.add_event.call_args.args
+        assert [variant_id] == stored
+        assert event.variant_id == variant_id
+
+
+class TestDefinitionPersistence:
+    """Tests created on one worker are served by every worker."""
+
+    @pytest.mark.asyncio
+    async def test_other_worker_loads_stored_test(self):
+        """A worker that did not create a test loads it on first use."""
+        creator_store = _store()
+        creator = ABTestManager(store=creator_store)
+        test_id = await _running_test(creator)
+        [stored] = creator_store.save_test.await_args.args
+
+        store = _store()
+        store.load_test = AsyncMock(
+            return_value=stored.model_dump(mode="json")
+        )
+        worker = ABTestManager(store=store)
+
+        assert await worker.assign_variant(test_id, "user-9")
+        assert await worker.assign_variant(test_id, "user-8")
+        store.load_test.assert_awaited_once_with(test_id)
+
+    @pytest.mark.asyncio
+    async def test_start_replaces_cached_tests(self):
+        """Starting loads the stored tests, dropping deleted ones."""
+        creator = ABTestManager(store=_store())
+        test_id = await _running_test(creator)
+
+        store = _store()
+        definition = creator.tests[test_id].model_dump(mode="json")
+        store.load_tests = AsyncMock(return_value=[definition])
+        worker = ABTestManager(store=store)
+        worker.tests["deleted"] = Mock()
+
+        await worker.load_tests()
+
+        assert list(worker.tests) == [test_id]
+        assert worker.tests[test_id].status == (
+            ab_testing.TestStatus.RUNNING
+        )
@@ -0,0 +1,176 @@
+"""Tests for prefix-indexed API key authentication."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from chatter.core import auth
+from chatter.core.auth import AuthService
+from chatter.utils.security_enhanced import (
+    api_key_fingerprint,
+    generate_secure_api_key,
+    get_api_key_prefix,
+)
+
+
+def _result(user=None, users=()):
+    result = Mock()
+    result.scalar_one_or_none.return_value = user
+    result.scalars.return_value.all.return_value = list(users)
+    return result
+
+
+@pytest.fixture(autouse=True)
+def clear_verified_keys():
+    auth._verified_api_keys.clear()
+    auth._rejected_api_keys.clear()
+    yield
+    auth._verified_api_keys.clear()
+    auth._rejected_api_keys.clear()
+
+
+class TestApiKeyPrefix:
+    """Keys carry a non-secret prefix used for lookups."""
+
+    def test_prefix_excludes_secret(self):
+        """The prefix identifies a key without its secret."""
+        api_key, _ = generate_secure_api_key()
+        prefix = get_api_key_prefix(api_key)
+
+        assert prefix is not None
+        assert api_key.startswith(prefix + "_")
+        assert len(api_key) > len(prefix) + 32
+
+    def test_malformed_keys_have_no_prefix(self):
+        """Keys in another format fall back to the legacy lookup."""
+        assert get_api_key_prefix("not-a-chatter-key") is None
+        assert get_api_key_prefix("chatter_api_123") is None
+        assert get_api_key_prefix("chatter_api_abc_0011_x") is None
+
+
+class TestApiKeyLookup:
+    """Lookups read one indexed row and verify one hash."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_verifies_single_row_then_caches(self):
+        """A verified key is served from the cache afterwards."""
+        api_key = "chatter_api_1700000000_0123456789abcdef_secret"
+        user = SimpleNamespace(
+            id="user-1",
+            api_key="hash",
+            api_key_prefix=get_api_key_prefix(api_key),
+        )
+        session = Mock()
+        session.execute = AsyncMock(return_value=_result(user=user))
+        service = AuthService(session)
+
+        with (
+            patch.object(
+                auth, "verify_api_key_secure", return_value=True
+            ) as verify,
+            patch.object(
+                service, "_get_principal", AsyncMock(return_value=user)
+            ),
+        ):
+            assert await service.get_user_by_api_key(api_key) is user
+            assert await service.get_user_by_api_key(api_key) is user
+
+        verify.assert_called_once_with(api_key, "hash")
+        session.execute.assert_awaited_once()
+        assert api_key_fingerprint(api_key) in auth._verified_api_keys
+
+    @pytest.mark.asyncio
+    async def test_revoked_key_is_not_served_from_cache(self):
+        """A cached key stops working once the stored key is gone."""
+        api_key = "chatter_api_1700000000_0123456789abcdef_secret"
+        revoked = SimpleNamespace(
+            id="user-1", api_key=None, api_key_prefix=None
+        )
+        auth._cache_verified_api_key(
+            api_key_fingerprint(api_key), "user-1"
+        )
+        session = Mock()
+        session.execute = AsyncMock(return_value=_result())
+        service = AuthService(session)
+
+        with patch.object(
+            service, "_get_principal", AsyncMock(return_value=revoked)
+        ):
+            assert await service.get_user_by_api_key(api_key) is None
+
+        assert not auth._verified_api_keys
+
+    @pytest.mark.asyncio
+    async def test_legacy_key_records_its_prefix(self):
+        """Keys without a stored prefix are found and backfilled."""
+        api_key = "chatter_api_1700000000_0123456789abcdef_secret"
+        others = [
+            SimpleNamespace(
+                id=f"user-{i:03d}",
+                api_key=f"hash-{i}",
+                api_key_prefix=None,
+            )
+            for i in range(auth._LEGACY_API_KEY_BATCH)
+        ]
+        legacy = SimpleNamespace(
+            id="user-999", api_key="legacy-hash", api_key_prefix=None
+        )
+        session = Mock()
+        session.execute = AsyncMock(
+            side_effect=[
+                _result(),
+                _result(users=others),
+                _result(users=[legacy]),
+            ]
+        )
+        session.commit = AsyncMock()
+        session.refresh = AsyncMock()
+        service = AuthService(session)
+
+        with (
+            patch.object(
+                auth,
+                "verify_api_key_secure",
+                side_effect=lambda key, hashed: hashed == "legacy-hash",
+            ),
+            patch.object(
+                auth.settings, "api_key_legacy_lookup_limit", 1000
+            ),
+        ):
+            found = await service.get_user_by_api_key(api_key)
+
+        assert found is legacy
+        assert legacy.api_key_prefix == get_api_key_prefix(api_key)
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_forged_key_checks_bounded_rows_once(self):
+        """An unknown key costs a bounded number of checks, once."""
+        forged = "chatter_api_1700000000_0123456789abcdef_x"
+        legacy = [
+            SimpleNamespace(
+                id=f"user-{i}", api_key=f"hash-{i}", api_key_prefix=None
+            )
+            for i in range(3)
+        ]
+        session = Mock()
+        session.execute = AsyncMock(
+            side_effect=[_result(), _result(users=legacy)]
+        )
+        service = AuthService(session)
+
+        with (
+            patch.object(
+                auth, "verify_api_key_secure", return_value=False
+            ) as verify,
+            patch.object(
+                auth.settings, "api_key_legacy_lookup_limit", 3
+            ),
+        ):
+            assert await service.get_user_by_api_key(forged) is None
+            assert await service.get_user_by_api_key(forged) is None
+
+        assert verify.call_count == 3
+        # The prefix lookup and one legacy batch, on the first call only
+        assert session.execute.await_count == 2
@@ -0,0 +1,162 @@
+"""Tests for the cached authenticated principal."""
+
+import json
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from chatter.core.auth import AuthService
+from chatter.core.cache import CacheConfig, MultiTierCache
+from chatter.core.token_manager import TokenManager
+from chatter.models.user import User
+from chatter.utils.problem import AuthenticationProblem
+
+
+class FakeRedis:
+    """Minimal shared Redis: string values, expiry ignored."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def setex(self, key: str, ttl: int, value: str) -> bool:
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return int(self.data.pop(key, None) is not None)
+
+
+def _worker_cache(redis: FakeRedis) -> MultiTierCache:
+    """A worker's multi-tier cache on top of the shared Redis."""
+    cache = MultiTierCache(CacheConfig(key_prefix="general"))
+    cache.l2_cache.redis = redis
+    cache.l2_cache._connected = True
+    return cache
+
+
+def _user(**overrides) -> User:
+    fields = {
+        "id": "user-1",
+        "email": "user@example.com",
+        "username": "user",
+        "hashed_password": "secret-hash",
+        "is_active": True,
+        "is_verified": True,
+        "is_superuser": False,
+        "created_at": datetime(2025, 1, 1, tzinfo=UTC),
+        "updated_at": datetime(2025, 1, 2, tzinfo=UTC),
+    }
+    fields.update(overrides)
+    return User(**fields)
+
+
+@pytest.fixture
+def auth_env():
+    redis = FakeRedis()
+    token_manager = TokenManager(_worker_cache(redis))
+    service = AuthService(Mock())
+    payload = {"sub": "user-1", "jti": "jti-1", "type": "access"}
+    with (
+        patch(
+            "chatter.core.token_manager.get_token_manager",
+            AsyncMock(return_value=token_manager),
+        ),
+        patch("chatter.core.auth.verify_token", return_value=payload),
+    ):
+        yield service, token_manager, redis
+
+
+class TestPrincipalCache:
+    """Repeated requests are served from the principal cache."""
+
+    @pytest.mark.asyncio
+    async def test_steady_state_skips_database(self, auth_env):
+        """Only the first request loads the user."""
+        service, _, redis = auth_env
+        get_user = AsyncMock(return_value=_user())
+        with patch.object(service, "get_user_by_id", get_user):
+            first = await service.get_current_user("token")
+            second = await service.get_current_user("token")
+
+        get_user.assert_awaited_once_with("user-1")
+        assert second.id == first.id == "user-1"
+        assert second.created_at == first.created_at
+        assert second.hashed_password is None
+        cached = json.loads(redis.data["general:principal:user-1"])
+        assert "hashed_password" not in cached
+
+    @pytest.mark.asyncio
+    async def test_revocation_applies_across_workers(self, auth_env):
+        """A token revoked on one worker is rejected on another."""
+        service, _, redis = auth_env
+        other_worker = TokenManager(_worker_cache(redis))
+        with patch.object(
+            service, "get_user_by_id", AsyncMock(return_value=_user())
+        ):
+            await service.get_current_user("token")
+            await other_worker.revoke_token("jti-1")
+
+            with pytest.raises(AuthenticationProblem):
+                await service.get_current_user("token")
+
+    @pytest.mark.asyncio
+    async def test_invalidation_applies_across_workers(self, auth_env):
+        """A user deactivated on one worker is rejected on another."""
+        service, _, redis = auth_env
+        other_worker = TokenManager(_worker_cache(redis))
+        get_user = AsyncMock(return_value=_user())
+        with patch.object(service, "get_user_by_id", get_user):
+            await service.get_current_user("token")
+
+            get_user.return_value = _user(is_active=False)
+            await other_worker.invalidate_principal("user-1")
+
+            with pytest.raises(AuthenticationProblem):
+                await service.get_current_user("token")
+
+        assert get_user.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_principal_is_not_recached(self, auth_env):
+        """A user loaded before an invalidation is not cached."""
+        _, token_manager, redis = auth_env
+        stale = {"id": "user-1", "is_active": True}
+
+        await token_manager.invalidate_principal("user-1")
+        await token_manager.cache_principal("user-1", stale)
+
+        principal, revoked = await token_manager.get_principal(
+            "user-1", "jti-1"
+        )
+        assert principal is None
+        assert not revoked
+
+    @pytest.mark.asyncio
+    async def test_revoking_all_tokens_drops_principal(self, auth_env):
+        """Revoking all of a user's tokens drops their principal."""
+        _, token_manager, redis = auth_env
+        other_worker = TokenManager(_worker_cache(redis))
+        await token_manager.cache_principal(
+            "user-1", {"id": "user-1", "is_active": True}
+        )
+
+        await other_worker.revoke_all_user_tokens("user-1")
+
+        principal, _ = await token_manager.get_principal("user-1")
+        assert principal is None
@@ -0,0 +1,145 @@
+"""Tests for the bounded in-memory LangGraph checkpointer."""
+
+import time
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import StateGraph
+
+from chatter.core.checkpointer import (
+    BoundedMemorySaver,
+    SQLiteCheckpointSpillStore,
+)
+
+
+class CounterState(TypedDict):
+    """Minimal graph state."""
+
+    count: int
+
+
+def _build_app(checkpointer):
+    graph = StateGraph(CounterState)
+    graph.add_node("inc", lambda state: {"count": state["count"] + 1})
+    graph.set_entry_point("inc")
+    graph.set_finish_point("inc")
+    return graph.compile(checkpointer=checkpointer)
+
+
+async def _run(app, thread_id: str, count: int = 0):
+    return await app.ainvoke(
+        {"count": count}, {"configurable": {"thread_id": thread_id}}
+    )
+
+
+class TestBoundedMemorySaver:
+    """Test TTL, budget and spill behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_occupancy(self):
+        """Stats reflect stored threads and bytes."""
+        saver = BoundedMemorySaver()
+        app = _build_app(saver)
+
+        await _run(app, "t1")
+        await _run(app, "t2")
+
+        stats = saver.get_stats()
+        assert stats["threads"] == 2
+        assert stats["checkpoints"] > 0
+        assert stats["bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_thread_budget_evicts_lru(self):
+        """Oldest threads are evicted when over the thread budget."""
+        saver = BoundedMemorySaver(max_threads=2)
+        app = _build_app(saver)
+
+        for thread_id in ("t1", "t2", "t3"):
+            await _run(app, thread_id)
+
+        assert set(saver.storage) == {"t2", "t3"}
+        assert not any(key[0] == "t1" for key in saver.blobs)
+        assert not any(key[0] == "t1" for key in saver.writes)
+        assert saver.get_stats()["evicted_threads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_byte_budget_keeps_current_thread(self):
+        """The thread being written is never evicted."""
+        saver = BoundedMemorySaver(max_bytes=1)
+        app = _build_app(saver)
+
+        await _run(app, "t1")
+        await _run(app, "t2")
+
+        assert list(saver.storage) == ["t2"]
+
+    @pytest.mark.asyncio
+    async def test_idle_threads_expire(self):
+        """Threads idle longer than the TTL are dropped."""
+        saver = BoundedMemorySaver(thread_ttl=0)
+        app = _build_app(saver)
+
+        await _run(app, "t1")
+        time.sleep(0.01)
+        await _run(app, "t2")
+
+        assert "t1" not in saver.storage
+        assert saver.get_stats()["expired_threads"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_bytes_return_to_zero_after_delete(self):
+        """Deleting all threads releases all accounted bytes."""
+        saver = BoundedMemorySaver()
+        app = _build_app(saver)
+
+        await _run(app, "t1")
+        saver.delete_thread("t1")
+
+        stats = saver.get_stats()
+        assert stats["threads"] == 0
+        assert stats["bytes"] == 0
+        assert not saver.blobs and not saver.writes
+
+    @pytest.mark.asyncio
+    async def test_spilled_thread_is_restored(self, tmp_path):
+        """Evicted threads spill to SQLite and come back on access."""
+        store = SQLiteCheckpointSpillStore(str(tmp_path / "spill.db"))
+        saver = BoundedMemorySaver(max_threads=1, spill_store=store)
+        app = _build_app(saver)
+
+        await _run(app, "t1", count=41)
+        await _run(app, "t2")
+        assert "t1" not in saver.storage
+        assert store.count() == 1
+
+        state = await app.aget_state({"configurable": {"thread_id": "t1"}})
+
+        assert state.values["count"] == 42
+        assert "t1" in saver.storage
+        stats = saver.get_stats()
+        assert stats["spilled_threads"] >= 1
+        assert stats["restored_threads"] == 1
+
+
+class TestSQLiteCheckpointSpillStore:
+    """The spill store stays bounded by its TTL."""
+
+    def test_spilling_prunes_expired_threads(self, tmp_path):
+        """Spilling prunes expired threads at most once per interval."""
+        store = SQLiteCheckpointSpillStore(
+            str(tmp_path / "spill.db"), ttl=60
+        )
+        store.save("old", "{}")
+        store._conn.execute(
+            "UPDATE checkpoint_threads SET spilled_at = ?",
+            (time.time() - 120,),
+        )
+
+        store.save("new", "{}")
+        assert store.count() == 2
+
+        store._next_prune = 0.0
+        store.save("newer", "{}")
+        assert store.count() == 2
+        assert store.pop("old") is None
@@ -0,0 +1,127 @@
+"""Tests for compact chunk vector storage and quantized search."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from chatter.core.embedding_pipeline import SimpleVectorStore
+from chatter.models.document import (
+    DocumentChunk,
+    ensure_embedding_consistency,
+)
+
+
+def _chunk() -> DocumentChunk:
+    return DocumentChunk(
+        document_id="doc", content="text", chunk_index=0, content_hash="h"
+    )
+
+
+def _compile(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def storage_mode():
+    """Switch vector_storage_mode for a test."""
+    with patch("chatter.config.settings") as mock_settings:
+
+        def set_mode(mode: str):
+            mock_settings.vector_storage_mode = mode
+
+        set_mode("compact")
+        yield set_mode
+
+
+class TestCompactStorage:
+    """Compact mode keeps a single indexed vector."""
+
+    def test_1536_vector_stored_once(self, storage_mode):
+        """Full-size vectors only populate the indexed column."""
+        chunk = _chunk()
+        chunk.set_embedding_vector([0.5] * 1536, provider="openai")
+
+        assert len(chunk.embedding) == 1536
+        assert chunk.raw_embedding is None
+        assert chunk.computed_embedding is None
+        assert chunk.raw_dim == 1536
+
+    def test_short_vector_recovered_from_padding(self, storage_mode):
+        """Shorter vectors are recovered from the zero-padded column."""
+        chunk = _chunk()
+        chunk.set_embedding_vector([0.25] * 768)
+
+        assert chunk.raw_embedding is None
+        assert chunk.raw_dim == 768
+        assert chunk.embedding[768:] == [0.0] * 768
+        assert chunk.get_raw_embedding() == [0.25] * 768
+        assert chunk.has_embedding_for_dimension(768)
+        assert chunk.get_search_embedding(768) == [0.25] * 768
+
+    def test_truncated_vector_keeps_raw_copy(self, storage_mode):
+        """Vectors longer than 1536 keep their raw form."""
+        chunk = _chunk()
+        chunk.set_embedding_vector([0.1] * 3072)
+
+        assert chunk.raw_embedding == [0.1] * 3072
+        assert len(chunk.embedding) == 1536
+        assert chunk.computed_embedding is None
+
+    def test_before_insert_drops_redundant_copies(self, storage_mode):
+        """Directly assigned copies are compacted before insert."""
+        storage_mode("full")
+        chunk = _chunk()
+        chunk.set_embedding_vector([0.3] * 1536)
+        storage_mode("compact")
+
+        ensure_embedding_consistency(None, None, chunk)
+
+        assert chunk.embedding == [0.3] * 1536
+        assert chunk.raw_embedding is None
+        assert chunk.computed_embedding is None
+
+    def test_full_mode_keeps_all_copies(self, storage_mode):
+        """Full mode keeps the previous three-column layout."""
+        storage_mode("full")
+        chunk = _chunk()
+        chunk.set_embedding_vector([0.25] * 768)
+
+        assert chunk.raw_embedding == [0.25] * 768
+        assert len(chunk.computed_embedding) == 1536
+        assert chunk.embedding == chunk.computed_embedding
+
+
+class TestQuantizedSearch:
+    """Quantized candidates are rescored at full precision."""
+
+    def _candidates(self, precision: str) -> str:
+        nearest = SimpleVectorStore(Mock())._vector_candidates(
+            DocumentChunk.embedding,
+            [0.1] * 1536,
+            [],
+            5,
+            precision=precision,
+            rescore_factor=4,
+        )
+        return _compile(nearest.element)
+
+    def test_full_precision_orders_by_cosine(self):
+        """Full precision uses a single HNSW cosine ordering."""
+        sql = self._candidates("full")
+        assert "ORDER BY document_chunks.embedding <=>" in sql
+        assert "nearest_candidates" not in sql
+
+    def test_half_precision_rescores(self):
+        """Halfvec candidates are reordered by full cosine distance."""
+        sql = self._candidates("half")
+        assert "CAST(document_chunks.embedding AS HALFVEC(1536)) <=>" in sql
+        assert "ORDER BY nearest_candidates.distance" in sql
+
+    def test_binary_precision_rescores(self):
+        """Binary candidates use hamming distance on quantized bits."""
+        sql = self._candidates("binary")
+        assert (
+            "CAST(binary_quantize(document_chunks.embedding) AS BIT(1536)) <~>"
+        ) in sql
+        assert "ORDER BY nearest_candidates.distance" in sql
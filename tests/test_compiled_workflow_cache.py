@@ -0,0 +1,162 @@
+"""Tests for the compiled workflow graph cache."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from chatter.core.langgraph import LangGraphWorkflowManager
+from chatter.core.workflow_graph_builder import (
+    WorkflowDefinition,
+    create_simple_workflow_definition,
+)
+from chatter.core.workflow_performance import CompiledWorkflowCache
+
+
+class FakeLLM:
+    """LLM stand-in exposing LangChain-style identifying params."""
+
+    def __init__(self, model: str = "gpt-test", temperature: float = 0.1):
+        self.model = model
+        self.temperature = temperature
+
+    @property
+    def _identifying_params(self):
+        return {"model": self.model, "temperature": self.temperature}
+
+    def bind_tools(self, tools):
+        return self
+
+
+def _definition(system_message: str = "hi") -> WorkflowDefinition:
+    return create_simple_workflow_definition(system_message=system_message)
+
+
+class TestCompiledWorkflowCache:
+    """Unit tests for CompiledWorkflowCache."""
+
+    def test_structural_hash_is_stable(self):
+        """Equal definitions hash equally; changes alter the hash."""
+        assert _definition().structural_hash() == _definition().structural_hash()
+        assert (
+            _definition("a").structural_hash()
+            != _definition("b").structural_hash()
+        )
+
+    def test_key_uses_llm_identity_not_instance(self):
+        """Separate LLM instances with equal params share a key."""
+        cache = CompiledWorkflowCache()
+        key1 = cache.make_key("h", llm=FakeLLM())
+        key2 = cache.make_key("h", llm=FakeLLM())
+        key3 = cache.make_key("h", llm=FakeLLM(temperature=0.9))
+
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_key_for_unknown_llm_is_per_instance(self):
+        """LLMs without identifying params never share graphs."""
+        cache = CompiledWorkflowCache()
+        assert cache.make_key("h", llm=Mock()) != cache.make_key(
+            "h", llm=Mock()
+        )
+
+    def test_lru_eviction_and_stats(self):
+        """Least recently used entries are evicted first."""
+        cache = CompiledWorkflowCache(max_size=2)
+        cache.put("a", "app-a")
+        cache.put("b", "app-b")
+        assert cache.get("a") == "app-a"
+        cache.put("c", "app-c")
+
+        assert cache.get("b") is None
+        assert cache.get("c") == "app-c"
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["cache_hits"] == 2
+        assert stats["cache_misses"] == 1
+
+    def test_invalidate_by_tag(self):
+        """Invalidating a tag drops only the entries built from it."""
+        cache = CompiledWorkflowCache()
+        cache.put("a", "app-a", tags=["template-1"])
+        cache.put("b", "app-b", tags=["template-2"])
+
+        assert cache.invalidate("template-1") == 1
+        assert cache.get("a") is None
+        assert cache.get("b") == "app-b"
+
+    def test_disabled_cache_stores_nothing(self):
+        """A disabled cache always misses."""
+        cache = CompiledWorkflowCache(enabled=False)
+        cache.put("a", "app-a")
+        assert cache.get("a") is None
+
+
+class TestWorkflowManagerGraphCache:
+    """Tests for compiled graph reuse in the workflow manager."""
+
+    @pytest.fixture
+    def compiled_cache(self):
+        """Provide an isolated compiled graph cache."""
+        cache = CompiledWorkflowCache(max_size=8)
+        workflow_cache = Mock()
+        workflow_cache.compiled_graphs = cache
+        with patch(
+            "chatter.core.workflow_performance.get_workflow_cache",
+            return_value=workflow_cache,
+        ):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_same_definition_reuses_compiled_graph(
+        self, compiled_cache
+    ):
+        """Building the same workflow twice compiles it once."""
+        manager = LangGraphWorkflowManager()
+
+        with patch.object(
+            manager.graph_builder,
+            "build_graph",
+            wraps=manager.graph_builder.build_graph,
+        ) as build_graph:
+            app1 = await manager.create_workflow_from_definition(
+                _definition(), llm=FakeLLM(), user_id="u1"
+            )
+            app2 = await manager.create_workflow_from_definition(
+                _definition(), llm=FakeLLM(), user_id="u2"
+            )
+
+        assert app1 is app2
+        assert build_graph.call_count == 1
+        assert compiled_cache.get_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_definition_builds_new_graph(
+        self, compiled_cache
+    ):
+        """A structurally different definition is compiled again."""
+        manager = LangGraphWorkflowManager()
+
+        app1 = await manager.create_workflow_from_definition(
+            _definition("a"), llm=FakeLLM()
+        )
+        app2 = await manager.create_workflow_from_definition(
+            _definition("b"), llm=FakeLLM()
+        )
+
+        assert app1 is not app2
+
+    @pytest.mark.asyncio
+    async def test_cache_tags_invalidate(self, compiled_cache):
+        """Invalidating the source ID forces a rebuild."""
+        manager = LangGraphWorkflowManager()
+
+        app1 = await manager.create_workflow_from_definition(
+            _definition(), llm=FakeLLM(), cache_tags=["tmpl-1"]
+        )
+        compiled_cache.invalidate("tmpl-1")
+        app2 = await manager.create_workflow_from_definition(
+            _definition(), llm=FakeLLM(), cache_tags=["tmpl-1"]
+        )
+
+        assert app1 is not app2
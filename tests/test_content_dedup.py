@@ -0,0 +1,278 @@
+"""Tests for content-addressed uploads and chunk embedding reuse."""
+
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from fastapi import UploadFile
+
+from chatter.core.embedding_pipeline import (
+    EmbeddingPipeline,
+    SimpleVectorStore,
+    _content_hash,
+)
+from chatter.models.document import DocumentChunk, DocumentType
+from chatter.schemas.document import DocumentCreate
+from chatter.services.document_storage import LocalDocumentStorage
+from chatter.services.new_document_service import (
+    DocumentServiceError,
+    NewDocumentService,
+)
+
+
+def _document(**kwargs):
+    values = {
+        "id": "doc",
+        "document_type": DocumentType.TEXT,
+        "file_hash": "f" * 64,
+        "chunk_size": 500,
+        "chunk_overlap": 50,
+        "chunk_count": 0,
+    }
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+def _result(rows=None, first=None):
+    result = MagicMock()
+    result.all.return_value = rows or []
+    result.first.return_value = first
+    result.__iter__.return_value = iter(rows or [])
+    return result
+
+
+def _pipeline(session) -> EmbeddingPipeline:
+    with patch("chatter.core.embedding_pipeline.EmbeddingService"):
+        pipeline = EmbeddingPipeline(session)
+    pipeline.embedding_service.get_model_identity = AsyncMock(
+        return_value=("openai", "text-embedding-3-small")
+    )
+    return pipeline
+
+
+class TestEmbeddingReuse:
+    """Stored vectors replace provider calls for known chunks."""
+
+    @pytest.mark.asyncio
+    async def test_known_chunks_are_not_embedded(self):
+        """Only chunks without a stored vector reach the provider."""
+        session = AsyncMock()
+        session.add_all = Mock()
+        session.expunge = Mock()
+        pipeline = _pipeline(session)
+        known, new = "known chunk text", "new chunk text"
+        pipeline.vector_store.find_embeddings = AsyncMock(
+            return_value={_content_hash(known): [0.5] * 8}
+        )
+        pipeline.embedding_service.generate_embeddings = AsyncMock(
+            return_value=([[0.25] * 8], {"provider": "openai"})
+        )
+        pipeline.vector_store.store_embeddings_no_commit = AsyncMock(
+            return_value=True
+        )
+
+        await pipeline._store_chunk_batch(
+            _document(), [(0, known), (1, new)]
+        )
+
+        embed = pipeline.embedding_service.generate_embeddings
+        embed.assert_awaited_once_with([new])
+        store = pipeline.vector_store.store_embeddings_no_commit
+        _, vectors, _ = store.await_args.args
+        assert vectors == [[0.5] * 8, [0.25] * 8]
+
+    @pytest.mark.asyncio
+    async def test_stored_vectors_keep_original_dimension(self):
+        """Padded compact vectors are cut back to their raw size."""
+        session = AsyncMock()
+        session.execute.return_value = _result(
+            rows=[
+                SimpleNamespace(
+                    content_hash="h1",
+                    embedding=[0.1] * 4 + [0.0] * 1532,
+                    raw_embedding=None,
+                    raw_dim=4,
+                )
+            ]
+        )
+
+        vectors = await SimpleVectorStore(session).find_embeddings(
+            ["h1", "h2"], "openai", "text-embedding-3-small"
+        )
+
+        assert vectors == {"h1": [0.1] * 4}
+
+
+class TestDuplicateDocuments:
+    """Identical files reuse chunks instead of being processed again."""
+
+    @pytest.mark.asyncio
+    async def test_copies_chunks_of_identical_document(self):
+        """Chunks and vectors are copied from a processed duplicate."""
+        session = AsyncMock()
+        session.add_all = Mock()
+        session.expunge = Mock()
+        rows = [
+            SimpleNamespace(
+                chunk_index=i,
+                content=f"chunk {i}",
+                content_hash=_content_hash(f"chunk {i}"),
+                token_count=2,
+                embedding=[0.1] * 1536,
+                raw_embedding=None,
+                raw_dim=1536,
+            )
+            for i in range(3)
+        ]
+        session.execute.side_effect = [
+            _result(first=SimpleNamespace(id="src", extracted_text="t")),
+            _result(rows=rows),
+            _result(),
+        ]
+        pipeline = _pipeline(session)
+        document = _document()
+
+        copied = await pipeline._copy_duplicate_chunks(document)
+
+        assert copied == (3, "t")
+        [chunks] = session.add_all.call_args.args
+        assert [chunk.content for chunk in chunks] == [
+            "chunk 0",
+            "chunk 1",
+            "chunk 2",
+        ]
+        assert all(
+            isinstance(chunk, DocumentChunk)
+            and chunk.document_id == "doc"
+            and chunk.embedding_model == "text-embedding-3-small"
+            for chunk in chunks
+        )
+        assert document.chunk_count == 3
+
+    @pytest.mark.asyncio
+    async def test_without_duplicate_nothing_is_copied(self):
+        """Documents with new content go through normal processing."""
+        session = AsyncMock()
+        session.execute.return_value = _result()
+
+        copied = await _pipeline(session)._copy_duplicate_chunks(
+            _document()
+        )
+
+        assert copied is None
+        assert session.execute.await_count == 1
+
+
+class TestContentAddressedUploads:
+    """Identical uploads share one stored file."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        session = AsyncMock()
+        session.add = Mock()
+        session.scalar.return_value = None
+        with (
+            patch(
+                "chatter.services.new_document_service."
+                "get_document_storage",
+                return_value=LocalDocumentStorage(tmp_path),
+            ),
+            patch(
+                "chatter.services.new_document_service.EmbeddingPipeline"
+            ),
+            patch(
+                "chatter.services.new_document_service."
+                "get_ingest_scheduler"
+            ),
+        ):
+            yield NewDocumentService(session), tmp_path
+
+    @staticmethod
+    def _upload(data: bytes) -> UploadFile:
+        return UploadFile(file=io.BytesIO(data), filename="notes.txt")
+
+    @pytest.mark.asyncio
+    async def test_identical_files_share_storage(self, service):
+        """Two owners uploading the same bytes share one file."""
+        service, storage = service
+
+        first = await service.create_document(
+            "user-1", self._upload(b"same bytes"), DocumentCreate()
+        )
+        second = await service.create_document(
+            "user-2", self._upload(b"same bytes"), DocumentCreate()
+        )
+
+        assert first.file_path == second.file_path
+        assert first.filename == f"{first.file_hash}.txt"
+        assert [p.name for p in storage.iterdir()] == [first.filename]
+
+    @pytest.mark.asyncio
+    async def test_owner_duplicate_is_rejected(self, service):
+        """Re-uploading one's own file names the existing document."""
+        service, storage = service
+        service.session.scalar.return_value = "doc-1"
+
+        with pytest.raises(DocumentServiceError, match="doc-1"):
+            await service.create_document(
+                "user-1", self._upload(b"same bytes"), DocumentCreate()
+            )
+
+        assert list(storage.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_file_is_committed_under_hash_lock(self, service):
+        """An upload stores its file only while holding the hash lock."""
+        service, storage = service
+        calls = []
+        service._lock_file_hash = AsyncMock(
+            side_effect=lambda file_hash: calls.append(
+                ("lock", list(storage.iterdir()))
+            )
+        )
+        service.session.commit.side_effect = lambda: calls.append(
+            ("commit", [p.name for p in storage.iterdir()])
+        )
+
+        document = await service.create_document(
+            "user-1", self._upload(b"same bytes"), DocumentCreate()
+        )
+
+        service._lock_file_hash.assert_awaited_once_with(
+            document.file_hash
+        )
+        assert calls == [
+            ("lock", []),
+            ("commit", [document.filename]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_delete_checks_sharing_under_hash_lock(self, service):
+        """Deleting takes the hash lock before counting other users."""
+        service, _ = service
+        document = _document(
+            file_path="f.txt", owner_id="user-1", is_public=False
+        )
+        service.session.execute.return_value = Mock(
+            scalar_one_or_none=Mock(return_value=document)
+        )
+        service.session.delete = AsyncMock()
+        calls = []
+        service._lock_file_hash = AsyncMock(
+            side_effect=lambda file_hash: calls.append("lock")
+        )
+        service.session.scalar.side_effect = lambda query: (
+            calls.append("count") or 0
+        )
+        service.storage.delete = AsyncMock(
+            side_effect=lambda path: calls.append("unlink")
+        )
+
+        with patch(
+            "chatter.services.new_document_service.get_retrieval_cache"
+        ):
+            assert await service.delete_document("doc", "user-1")
+
+        service._lock_file_hash.assert_awaited_once_with("f" * 64)
+        assert calls == ["lock", "count", "unlink"]
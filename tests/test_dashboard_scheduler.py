@@ -0,0 +1,152 @@
+"""Tests for shared real-time dashboard computation."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from chatter.schemas.events import EventType
+from chatter.services.real_time_analytics import (
+    DashboardScheduler,
+    dashboard_patch,
+)
+
+
+def _snapshot(conversations: int = 1, tokens: int = 10) -> dict:
+    return {
+        "dashboard_stats": {
+            "agents": {"conversations_today": conversations},
+            "system": {"cpu_usage": 5.0, "memory_usage": 20.0},
+        },
+        "chart_data": {
+            "token_usage_data": [tokens],
+            "conversation_chart_data": [1, 2],
+        },
+    }
+
+
+@pytest.fixture
+def published():
+    with patch(
+        "chatter.services.real_time_analytics.sse_service"
+        ".broadcast_event",
+        AsyncMock(),
+    ) as broadcast:
+        yield broadcast
+
+
+class TestDashboardPatch:
+    """Snapshots are diffed as JSON merge patches."""
+
+    def test_only_changed_values_are_included(self):
+        """Unchanged branches are left out of the patch."""
+        patch_ = dashboard_patch(_snapshot(1), _snapshot(2))
+
+        assert patch_ == {
+            "dashboard_stats": {"agents": {"conversations_today": 2}}
+        }
+
+    def test_removed_keys_map_to_none(self):
+        """Keys missing from the new snapshot are removed."""
+        assert dashboard_patch({"a": 1, "b": 2}, {"a": 1}) == {
+            "b": None
+        }
+        assert dashboard_patch(_snapshot(), _snapshot()) == {}
+
+
+class TestDashboardScheduler:
+    """One computation per user per interval, fanned out as updates."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_computation(
+        self, published
+    ):
+        """Overlapping refreshes for a user reuse the running one."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def compute(user_id):
+            started.set()
+            await release.wait()
+            return _snapshot()
+
+        compute_mock = AsyncMock(side_effect=compute)
+        scheduler = DashboardScheduler(compute_mock, interval=3600)
+        scheduler.subscribe("user-1")
+        await started.wait()
+        waiters = [
+            asyncio.create_task(scheduler.refresh("user-1"))
+            for _ in range(3)
+        ]
+        release.set()
+        await asyncio.gather(*waiters)
+        await scheduler.stop()
+
+        compute_mock.assert_awaited_once_with("user-1")
+        published.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_updates_are_full_then_delta(self, published):
+        """Small changes are sent as deltas, unchanged ones not at all."""
+        compute = AsyncMock(
+            side_effect=[_snapshot(1), _snapshot(1), _snapshot(2)]
+        )
+        scheduler = DashboardScheduler(
+            compute, interval=3600, delta_ratio=0.5, full_every=10
+        )
+        scheduler.subscribers.add("user-1")
+
+        for _ in range(3):
+            await scheduler.refresh("user-1")
+
+        first, second = [
+            call.args[0] for call in published.await_args_list
+        ]
+        assert first.type == EventType.ANALYTICS_DASHBOARD_UPDATED
+        assert first.user_id == "user-1"
+        assert first.data["update"] == "full"
+        assert first.data["chart_data"]["token_usage_data"] == [10]
+        assert second.data["update"] == "delta"
+        assert second.data["sequence"] == 2
+        assert second.data["changes"] == {
+            "dashboard_stats": {"agents": {"conversations_today": 2}}
+        }
+
+    @pytest.mark.asyncio
+    async def test_large_change_and_resync_send_full(self, published):
+        """Mostly-changed snapshots and periodic resyncs are full."""
+        compute = AsyncMock(
+            side_effect=[
+                _snapshot(1, 10),
+                {"dashboard_stats": {}, "chart_data": {}},
+                _snapshot(3, 10),
+            ]
+        )
+        scheduler = DashboardScheduler(
+            compute, interval=3600, delta_ratio=0.5, full_every=3
+        )
+        scheduler.subscribers.add("user-1")
+
+        for _ in range(3):
+            await scheduler.refresh("user-1")
+
+        updates = [
+            call.args[0].data["update"]
+            for call in published.await_args_list
+        ]
+        assert updates == ["full", "full", "full"]
+
+    @pytest.mark.asyncio
+    async def test_no_work_without_subscribers(self, published):
+        """The update task stops once the last subscriber leaves."""
+        compute = AsyncMock(return_value=_snapshot())
+        scheduler = DashboardScheduler(compute, interval=0.01)
+        scheduler.subscribe("user-1")
+        await asyncio.sleep(0.05)
+        await scheduler.unsubscribe("user-1")
+        calls = compute.await_count
+        await asyncio.sleep(0.05)
+
+        assert calls >= 2
+        assert compute.await_count == calls
+        assert not scheduler.running
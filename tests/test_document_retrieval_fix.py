@@ -85,6 +85,7 @@ async def test_document_chunk_retriever_ainvoke():
             limit=5,
             document_ids=["doc1"],
             prefer_exact_match=True,
+            owner_id="test_user",
         )
 
 
@@ -0,0 +1,70 @@
+"""Tests for document file storage backends."""
+
+from unittest.mock import patch
+
+import pytest
+
+from chatter.services.document_storage import LocalDocumentStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalDocumentStorage(tmp_path / "documents")
+
+
+class TestLocalDocumentStorage:
+    """Uploads are staged, committed atomically and read in chunks."""
+
+    @pytest.mark.asyncio
+    async def test_commit_stores_upload_under_name(self, storage):
+        """Committed uploads appear under their name only."""
+        upload = storage.create_upload()
+        await upload.write(b"hello ")
+        await upload.write(b"world")
+
+        location = await upload.commit("abc.txt")
+
+        assert location == str(storage.root / "abc.txt")
+        assert await storage.exists(location)
+        assert [p.name for p in storage.root.iterdir()] == ["abc.txt"]
+        chunks = [c async for c in storage.read(location, chunk_size=4)]
+        assert chunks == [b"hell", b"o wo", b"rld"]
+
+    @pytest.mark.asyncio
+    async def test_abort_leaves_nothing_behind(self, storage):
+        """Aborted uploads are removed."""
+        upload = storage.create_upload()
+        await upload.write(b"partial")
+
+        await upload.abort()
+
+        assert list(storage.root.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_commit_replaces_identical_file(self, storage):
+        """Committing an existing name keeps a single copy."""
+        for _ in range(2):
+            upload = storage.create_upload()
+            await upload.write(b"same")
+            location = await upload.commit("same.txt")
+
+        await storage.delete(location)
+        await storage.delete(location)
+
+        assert list(storage.root.iterdir()) == []
+
+    def test_accel_redirect_uri(self, storage):
+        """Stored files map into the proxy's internal location."""
+        location = str(storage.root / "abc.txt")
+        with patch(
+            "chatter.services.document_storage.settings."
+            "document_accel_redirect_prefix",
+            "/protected-documents/",
+        ):
+            assert (
+                storage.accel_redirect_uri(location)
+                == "/protected-documents/abc.txt"
+            )
+            assert storage.accel_redirect_uri("/etc/passwd") is None
+
+        assert storage.accel_redirect_uri(location) is None
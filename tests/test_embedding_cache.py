@@ -0,0 +1,202 @@
+"""Tests for cached, concurrent batch embedding generation."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from chatter.core.cache import CacheConfig, MemoryCache
+from chatter.services.embeddings import (
+    EmbeddingCache,
+    EmbeddingError,
+    EmbeddingService,
+)
+
+
+class FakeProvider:
+    """Embedding provider that records every text it is asked for."""
+
+    model = "fake-embedding-model"
+
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[list[str]] = []
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def aembed_documents(self, texts):
+        self.calls.append(list(texts))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return [[float(len(t)), 1.0] for t in texts]
+
+    async def aembed_query(self, text):
+        self.calls.append([text])
+        return [float(len(text)), 2.0]
+
+
+@pytest.fixture
+def embedding_cache():
+    """Create an isolated in-memory embedding cache."""
+    return EmbeddingCache(
+        cache=MemoryCache(CacheConfig(max_size=100, key_prefix="emb")),
+        ttl=60,
+    )
+
+
+@pytest.fixture
+def provider():
+    """Create a fake provider."""
+    return FakeProvider(delay=0.01)
+
+
+@pytest.fixture
+def service(embedding_cache, provider):
+    """Create an embedding service wired to the fake provider."""
+    svc = EmbeddingService(cache=embedding_cache)
+    svc.get_provider = AsyncMock(return_value=provider)
+    return svc
+
+
+class TestGenerateEmbeddings:
+    """Test batch embedding generation."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self, service):
+        """Embeddings are returned in the order of the input texts."""
+        texts = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+        embeddings, usage = await service.generate_embeddings(
+            texts, provider_name="fake", batch_size=2
+        )
+
+        assert [e[0] for e in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert usage["batch_count"] == 3
+        assert usage["embedded_count"] == 5
+
+    @pytest.mark.asyncio
+    async def test_duplicates_embedded_once(self, service, provider):
+        """Duplicate texts in one call reach the provider only once."""
+        embeddings, usage = await service.generate_embeddings(
+            ["same", "other", "same"], provider_name="fake"
+        )
+
+        sent = [text for call in provider.calls for text in call]
+        assert sorted(sent) == ["other", "same"]
+        assert embeddings[0] == embeddings[2]
+        assert usage["embedded_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_texts_skip_provider(self, service, provider):
+        """A second call for the same texts is served from cache."""
+        await service.generate_embeddings(
+            ["one", "two"], provider_name="fake"
+        )
+        provider.calls.clear()
+
+        embeddings, usage = await service.generate_embeddings(
+            ["two", "three", "one"], provider_name="fake"
+        )
+
+        assert provider.calls == [["three"]]
+        assert usage["cache_hits"] == 2
+        assert [e[0] for e in embeddings] == [3.0, 5.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_with_cap(
+        self, service, provider
+    ):
+        """Batches run in parallel but never beyond the cap."""
+        texts = [f"text-{i}" for i in range(12)]
+
+        await service.generate_embeddings(
+            texts, provider_name="fake", batch_size=2, max_concurrency=3
+        )
+
+        assert len(provider.calls) == 6
+        assert 1 < provider.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_mismatched_batch_raises(self, service, provider):
+        """A provider returning the wrong count raises EmbeddingError."""
+        provider.aembed_documents = AsyncMock(return_value=[[1.0]])
+
+        with pytest.raises(EmbeddingError):
+            await service.generate_embeddings(
+                ["a", "b"], provider_name="fake"
+            )
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, provider):
+        """Without a cache every call reaches the provider."""
+        with patch(
+            "chatter.services.embeddings.get_embedding_cache",
+            return_value=None,
+        ):
+            svc = EmbeddingService()
+        svc.get_provider = AsyncMock(return_value=provider)
+
+        await svc.generate_embeddings(["x"], provider_name="fake")
+        await svc.generate_embeddings(["x"], provider_name="fake")
+
+        assert provider.calls == [["x"], ["x"]]
+
+
+class TestGenerateEmbedding:
+    """Test single query embedding generation."""
+
+    @pytest.mark.asyncio
+    async def test_query_cached(self, service, provider):
+        """Repeated queries are embedded once."""
+        first, usage1 = await service.generate_embedding(
+            "hello", provider_name="fake"
+        )
+        second, usage2 = await service.generate_embedding(
+            "hello", provider_name="fake"
+        )
+
+        assert first == second
+        assert provider.calls == [["hello"]]
+        assert usage1["cached"] is False
+        assert usage2["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_query_and_document_keys_differ(
+        self, service, provider
+    ):
+        """Query and document embeddings are cached separately."""
+        await service.generate_embedding("hello", provider_name="fake")
+        await service.generate_embeddings(
+            ["hello"], provider_name="fake"
+        )
+
+        assert provider.calls == [["hello"], ["hello"]]
+
+
+class TestEmbeddingCacheStorage:
+    """Tests for how cached vectors are held."""
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_holds_float32_arrays(
+        self, embedding_cache
+    ):
+        """In-process vectors are compact but read back as lists."""
+        await embedding_cache.set_many({"k": [0.5, -1.25, 3.0]})
+
+        stored = await embedding_cache._cache.get("k")
+        hits = await embedding_cache.get_many(["k", "missing"])
+
+        assert stored.typecode == "f"
+        assert hits == {"k": [0.5, -1.25, 3.0]}
+
+    @pytest.mark.asyncio
+    async def test_serializing_backend_holds_lists(self):
+        """Backends that serialize values are given plain lists."""
+        backend = AsyncMock()
+        cache = EmbeddingCache(cache=backend, ttl=60)
+
+        await cache.set_many({"k": [0.5, 1.0]})
+
+        backend.set.assert_awaited_once_with("k", [0.5, 1.0], 60)
@@ -0,0 +1,135 @@
+"""Tests for hybrid vector + keyword retrieval."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from chatter.core.custom_retriever import DocumentChunkRetriever
+from chatter.core.embedding_pipeline import SimpleVectorStore
+
+
+def _sql(**kwargs) -> str:
+    params = {
+        "query_text": "reset my password",
+        "query_embedding": [0.1] * 1536,
+        "limit": 5,
+    }
+    params.update(kwargs)
+    query = SimpleVectorStore(Mock())._build_hybrid_query(**params)
+    return str(
+        query.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": False},
+        )
+    )
+
+
+class TestHybridQuery:
+    """The fused query runs in a single statement."""
+
+    def test_both_legs_fused_with_rrf(self):
+        """Vector and keyword legs are ranked and fully outer joined."""
+        sql = _sql()
+
+        assert "WITH vector_leg AS" in sql
+        assert "keyword_leg AS" in sql
+        assert "fused AS" in sql
+        assert "FULL OUTER JOIN keyword_leg" in sql
+        assert "row_number() OVER (ORDER BY vector_hits.distance)" in sql
+        assert "document_chunks.embedding <=>" in sql
+        assert "document_chunks.search_vector @@ to_tsquery" in sql
+        assert "ORDER BY fused.score DESC" in sql
+
+    def test_non_1536_query_uses_indexed_normalized_column(self):
+        """Other dimensions search the HNSW-indexed normalized column."""
+        with patch(
+            "chatter.models.document.compact_vector_storage",
+            return_value=False,
+        ):
+            sql = _sql(query_embedding=[0.1] * 768)
+        assert "document_chunks.computed_embedding <=>" in sql
+
+        with patch(
+            "chatter.models.document.compact_vector_storage",
+            return_value=True,
+        ):
+            sql = _sql(query_embedding=[0.1] * 768)
+        assert "document_chunks.embedding <=>" in sql
+        assert "computed_embedding" not in sql
+
+    def test_document_filter_applies_to_both_legs(self):
+        """Document filters restrict both candidate sets."""
+        sql = _sql(document_ids=["d1"])
+        assert sql.count("document_chunks.document_id IN") == 2
+
+    def test_keyword_leg_can_be_disabled(self):
+        """A zero keyword weight leaves only the vector leg."""
+        sql = _sql(keyword_weight=0)
+        assert "keyword_leg" not in sql
+        assert "vector_leg" in sql
+
+    def test_query_without_words_is_vector_only(self):
+        """Queries with no searchable words skip the keyword leg."""
+        assert "keyword_leg" not in _sql(query_text="?!")
+
+    @pytest.mark.asyncio
+    async def test_hybrid_search_returns_scores(self):
+        """Rows come back as (chunk, fused score) in one round trip."""
+        chunk = Mock()
+        session = AsyncMock()
+        session.execute.return_value = Mock(
+            all=Mock(return_value=[(chunk, 0.03)])
+        )
+
+        store = SimpleVectorStore(session)
+        with patch.object(store, "_tune_vector_search", AsyncMock()):
+            results = await store.hybrid_search(
+                "reset password", [0.1] * 1536, limit=3
+            )
+
+        assert results == [(chunk, 0.03)]
+        session.execute.assert_awaited_once()
+
+
+class TestRetrieverHybridMode:
+    """The retriever exposes hybrid mode and its weights."""
+
+    @pytest.mark.asyncio
+    async def test_hybrid_mode_passes_weights(self):
+        """Hybrid retrievers call hybrid_search with their weights."""
+        embeddings = AsyncMock()
+        embeddings.aembed_query.return_value = [0.1] * 1536
+        chunk = Mock(content="text", document_id="d1", chunk_index=0)
+        store = AsyncMock()
+        store.hybrid_search.return_value = [(chunk, 0.5)]
+
+        async def sessions():
+            yield AsyncMock()
+
+        with (
+            patch(
+                "chatter.core.custom_retriever.get_session_generator",
+                return_value=sessions(),
+            ),
+            patch(
+                "chatter.core.custom_retriever.SimpleVectorStore",
+                return_value=store,
+            ),
+        ):
+            retriever = DocumentChunkRetriever(
+                embeddings,
+                k=3,
+                search_mode="hybrid",
+                vector_weight=0.7,
+                keyword_weight=0.3,
+            )
+            documents = await retriever.ainvoke("reset password")
+
+        kwargs = store.hybrid_search.await_args.kwargs
+        assert kwargs["query_text"] == "reset password"
+        assert kwargs["vector_weight"] == 0.7
+        assert kwargs["keyword_weight"] == 0.3
+        assert kwargs["limit"] == 3
+        store.search_similar.assert_not_called()
+        assert documents[0].metadata["search_mode"] == "hybrid"
@@ -0,0 +1,132 @@
+"""Tests for bounded, fair document ingest scheduling."""
+
+import asyncio
+
+import pytest
+
+from chatter.services.ingest_scheduler import (
+    IngestQueueFullError,
+    IngestScheduler,
+)
+
+
+def _recorder(order: list[str], name: str, gate=None):
+    async def run() -> None:
+        if gate is not None:
+            await gate.wait()
+        order.append(name)
+
+    return run
+
+
+class TestIngestScheduler:
+    """Queued ingests run bounded, in turn, and are tracked."""
+
+    @pytest.mark.asyncio
+    async def test_users_take_turns(self):
+        """A user's backlog does not hold back other users."""
+        scheduler = IngestScheduler(max_concurrent=1)
+        order: list[str] = []
+        for i in range(3):
+            scheduler.submit(
+                f"a{i}", "user-a", _recorder(order, f"a{i}")
+            )
+        scheduler.submit("b0", "user-b", _recorder(order, "b0"))
+
+        while len(order) < 4:
+            await asyncio.sleep(0)
+        await scheduler.stop()
+
+        assert order == ["a0", "b0", "a1", "a2"]
+        stats = scheduler.get_stats()
+        assert stats["completed"] == 4
+        assert stats["stages"]["queue_wait"]["count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrent ingests run at once."""
+        scheduler = IngestScheduler(max_concurrent=2)
+        gate = asyncio.Event()
+        order: list[str] = []
+        for i in range(5):
+            scheduler.submit(
+                f"doc-{i}", f"user-{i}", _recorder(order, str(i), gate)
+            )
+        await asyncio.sleep(0.01)
+
+        stats = scheduler.get_stats()
+        assert stats["active_jobs"] == 2
+        assert stats["queue_depth"] == 3
+
+        gate.set()
+        while len(order) < 5:
+            await asyncio.sleep(0)
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_workers_survive_draining_queue(self):
+        """Workers started by submit get one permit per job."""
+        scheduler = IngestScheduler(max_concurrent=2)
+        order: list[str] = []
+        for i in range(3):
+            scheduler.submit(
+                f"doc-{i}", "user-a", _recorder(order, str(i))
+            )
+
+        while len(order) < 3:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+        assert all(not worker.done() for worker in scheduler._workers)
+        assert scheduler._available._value == 0
+        await scheduler.stop()
+
+    def test_admission_is_bounded(self):
+        """Full queues reject documents before they are stored."""
+        scheduler = IngestScheduler(
+            max_queue_size=3, max_queued_per_user=2
+        )
+        # Fill the queue without workers picking jobs up
+        scheduler._ensure_workers = lambda: None
+        scheduler._available = asyncio.Semaphore(0)
+        for i in range(2):
+            scheduler.submit(f"a{i}", "user-a", _recorder([], "a"))
+
+        with pytest.raises(IngestQueueFullError):
+            scheduler.check_capacity("user-a")
+        scheduler.check_capacity("user-b")
+
+        scheduler.submit("b0", "user-b", _recorder([], "b"))
+        with pytest.raises(IngestQueueFullError):
+            scheduler.check_capacity("user-c")
+        assert scheduler.get_stats()["rejected"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_reports_unfinished_documents(self):
+        """Shutdown waits, then cancels and reports what is left."""
+        scheduler = IngestScheduler(
+            max_concurrent=1, shutdown_timeout=0.01
+        )
+        never = asyncio.Event()
+        scheduler.submit("slow", "user-a", _recorder([], "s", never))
+        scheduler.submit("next", "user-a", _recorder([], "n"))
+        await asyncio.sleep(0)
+
+        report = await scheduler.stop()
+
+        assert report == {"interrupted": ["slow"], "queued": ["next"]}
+        assert not scheduler.running
+        with pytest.raises(IngestQueueFullError):
+            scheduler.check_capacity("user-a")
+
+    @pytest.mark.asyncio
+    async def test_stage_timings_are_reported(self):
+        """Pipeline stage latencies show up in the stats."""
+        scheduler = IngestScheduler()
+        scheduler.record_stages({"extract": 2.0, "embed": 1.0})
+        scheduler.record_stages({"extract": 4.0, "embed": 1.0})
+
+        extract = scheduler.get_stats()["stages"]["extract"]
+        assert extract["count"] == 2
+        assert extract["avg_seconds"] == 3.0
+        assert extract["max_seconds"] == 4.0
@@ -0,0 +1,124 @@
+"""Tests for keyset (cursor) pagination."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from chatter.models.conversation import Conversation, Message
+from chatter.models.document import Document
+from chatter.services.conversation import ConversationService
+from chatter.services.message import MESSAGE_KEYSET
+from chatter.utils.pagination import (
+    InvalidCursorError,
+    Keyset,
+    paginate,
+    sort_keyset,
+)
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def _conversation(minute: int, conversation_id: str):
+    return SimpleNamespace(
+        id=conversation_id,
+        updated_at=datetime(2024, 1, 1, 12, minute, tzinfo=UTC),
+    )
+
+
+class TestCursorEncoding:
+    """Cursors round-trip and are bound to their ordering."""
+
+    def test_round_trip_preserves_values(self):
+        """Decoding a cursor yields the last row's key values."""
+        keyset = sort_keyset(Conversation, "updated_at", "desc")
+        item = _conversation(30, "conv-9")
+
+        values = keyset.decode(keyset.cursor_for(item))
+
+        assert values == [item.updated_at, "conv-9"]
+
+    def test_cursor_is_url_safe(self):
+        """Cursors can be passed as query parameters unescaped."""
+        cursor = MESSAGE_KEYSET.cursor_for(
+            SimpleNamespace(sequence_number=1234)
+        )
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_cursor_for_other_ordering_is_rejected(self):
+        """A cursor only continues the ordering it was issued for."""
+        item = _conversation(30, "conv-9")
+        cursor = sort_keyset(Conversation, "updated_at", "desc").cursor_for(
+            item
+        )
+
+        with pytest.raises(InvalidCursorError):
+            sort_keyset(Conversation, "updated_at", "asc").decode(cursor)
+        with pytest.raises(InvalidCursorError):
+            sort_keyset(Conversation, "created_at", "desc").decode(cursor)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "e30"])
+    def test_malformed_cursor_is_rejected(self, cursor):
+        """Garbage cursors raise a validation error, not a 500."""
+        with pytest.raises(InvalidCursorError):
+            MESSAGE_KEYSET.decode(cursor)
+
+    def test_next_cursor_only_for_full_pages(self):
+        """A short page is the last one."""
+        keyset = Keyset(Message.sequence_number)
+        rows = [SimpleNamespace(sequence_number=i) for i in range(3)]
+
+        assert keyset.next_cursor(rows, limit=5) is None
+        assert keyset.next_cursor([], limit=5) is None
+        assert keyset.decode(keyset.next_cursor(rows, limit=3)) == [2]
+
+
+class TestKeysetQueries:
+    """Cursors become index-friendly row comparisons."""
+
+    def test_descending_tuple_comparison(self):
+        """Multi-column keysets compare a row tuple."""
+        keyset = sort_keyset(Conversation, "updated_at", "desc")
+        cursor = keyset.cursor_for(_conversation(30, "conv-9"))
+
+        sql = _sql(keyset.apply(select(Conversation), cursor))
+
+        assert "(conversations.updated_at, conversations.id) < " in sql
+        assert (
+            "ORDER BY conversations.updated_at DESC, conversations.id DESC"
+            in sql
+        )
+        assert "OFFSET" not in sql
+
+    def test_message_keyset_uses_sequence_number(self):
+        """Messages continue after the last sequence number."""
+        cursor = MESSAGE_KEYSET.cursor_for(
+            SimpleNamespace(sequence_number=41)
+        )
+
+        sql = _sql(paginate(select(Message), MESSAGE_KEYSET, cursor=cursor))
+
+        assert "messages.sequence_number >" in sql
+        assert "ORDER BY messages.sequence_number ASC" in sql
+
+    def test_offset_mode_still_supported(self):
+        """Without a cursor the keyset orders and offset skips."""
+        keyset = sort_keyset(Document, "created_at", "asc")
+
+        sql = _sql(paginate(select(Document), keyset, offset=20))
+
+        assert "ORDER BY documents.created_at ASC, documents.id ASC" in sql
+        assert "OFFSET" in sql
+
+    def test_cursor_requires_keyset_ordering(self):
+        """Sort fields without keyset support reject cursors."""
+        assert ConversationService.keyset_for("title", "asc") is None
+
+        with pytest.raises(InvalidCursorError):
+            paginate(select(Conversation), None, cursor="abc")
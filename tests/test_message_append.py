@@ -0,0 +1,104 @@
+"""Tests for the single-statement message append path."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from chatter.core.exceptions import AuthorizationError
+from chatter.models.conversation import MessageRole
+from chatter.services.message import (
+    MessageService,
+    build_append_message_statement,
+)
+
+
+def _sql() -> str:
+    statement = build_append_message_statement(
+        "conv-1",
+        "user-1",
+        {
+            "id": "msg-1",
+            "conversation_id": "conv-1",
+            "role": MessageRole.USER,
+            "content": "hello",
+            "total_tokens": 12,
+            "cost": 0.5,
+        },
+    )
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestAppendStatement:
+    """The append runs as one data-modifying CTE statement."""
+
+    def test_update_cte_precedes_insert(self):
+        """The aggregate update is a top-level CTE of the INSERT."""
+        sql = _sql()
+
+        assert sql.startswith("WITH conversation_update AS")
+        assert "UPDATE conversations SET" in sql
+        assert "INSERT INTO messages" in sql
+        assert sql.index("UPDATE conversations") < sql.index(
+            "INSERT INTO messages"
+        )
+
+    def test_aggregates_are_incremented_in_sql(self):
+        """Counters are bumped relative to the locked row."""
+        sql = _sql()
+
+        assert (
+            "message_count=(greatest(conversations.message_count,"
+            in sql
+        )
+        assert "total_tokens=(conversations.total_tokens +" in sql
+        assert "total_cost=(conversations.total_cost +" in sql
+        assert "conversations.user_id =" in sql
+
+    def test_sequence_comes_from_locked_count(self):
+        """The sequence number uses the returned message count."""
+        sql = _sql()
+
+        assert "conversation_update.message_count - " in sql
+        assert "RETURNING messages.id" in sql
+        assert "AS conversation_message_count" in sql
+
+    def test_count_behind_stored_messages_is_raised(self):
+        """A lagging count is raised past the highest sequence.
+
+        The raised count is written to the locked row, so an append
+        waiting on the lock numbers after it even though its own
+        snapshot cannot see the message just committed.
+        """
+        sql = _sql()
+        update = sql[
+            sql.index("UPDATE conversations") : sql.index("RETURNING")
+        ]
+
+        assert "greatest(conversations.message_count, " in update
+        assert "max(messages.sequence_number)" in update
+        assert "max(messages.sequence_number)" not in sql[
+            sql.index("INSERT INTO messages") :
+        ]
+
+
+class TestAddMessageToConversation:
+    """add_message_to_conversation needs a single round trip."""
+
+    @pytest.mark.asyncio
+    async def test_missing_conversation_is_denied(self):
+        """No returned row means the conversation is not accessible."""
+        session = AsyncMock()
+        session.execute.return_value = Mock(
+            mappings=Mock(
+                return_value=Mock(one_or_none=Mock(return_value=None))
+            )
+        )
+
+        with pytest.raises(AuthorizationError):
+            await MessageService(session).add_message_to_conversation(
+                "conv-1", "user-2", MessageRole.USER, "hello"
+            )
+
+        session.execute.assert_awaited_once()
+        session.commit.assert_not_awaited()
@@ -0,0 +1,130 @@
+"""Tests for owner-scoped vector search."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from chatter.core import embedding_pipeline
+from chatter.core.custom_retriever import DocumentChunkRetriever
+from chatter.core.embedding_pipeline import SimpleVectorStore
+
+
+def _compile(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _result(rows=(), scalar=None):
+    result = Mock()
+    result.all.return_value = list(rows)
+    result.scalar_one_or_none.return_value = scalar
+    return result
+
+
+@pytest.fixture(autouse=True)
+def reset_iterative_scan_support():
+    embedding_pipeline._iterative_scan_supported = None
+    yield
+    embedding_pipeline._iterative_scan_supported = None
+
+
+class TestOwnerScope:
+    """Searches only see the owner's and public documents."""
+
+    def test_hybrid_query_filters_both_legs_by_owner(self):
+        """The owner filter restricts vector and keyword candidates."""
+        query = SimpleVectorStore(Mock())._build_hybrid_query(
+            "reset my password", [0.1] * 1536, 5, owner_id="user-1"
+        )
+        sql = _compile(query)
+
+        assert sql.count("documents.owner_id = ") == 2
+        assert sql.count("documents.is_public") == 2
+
+    @pytest.mark.asyncio
+    async def test_search_tunes_index_then_filters_by_owner(self):
+        """Search settings are set in the same transaction first."""
+        session = AsyncMock()
+        session.execute.side_effect = [
+            _result(scalar="0.8.0"),
+            _result(),
+            _result(),
+        ]
+
+        await SimpleVectorStore(session).search_similar(
+            [0.1] * 1536, limit=5, owner_id="user-1"
+        )
+
+        _, tune, search = [
+            _compile(call.args[0])
+            for call in session.execute.await_args_list
+        ]
+        assert tune.count("set_config(") == 2
+        assert "documents.owner_id = " in search
+
+    @pytest.mark.asyncio
+    async def test_old_pgvector_skips_iterative_scan(self):
+        """Iterative scans are only requested where supported."""
+        session = AsyncMock()
+        session.execute.side_effect = [
+            _result(scalar="0.7.4"),
+            _result(),
+            _result(),
+        ]
+        store = SimpleVectorStore(session)
+
+        await store._tune_vector_search(5)
+        await store._tune_vector_search(5)
+
+        version, first, second = session.execute.await_args_list
+        assert _compile(first.args[0]).count("set_config(") == 1
+        assert _compile(second.args[0]).count("set_config(") == 1
+
+    @pytest.mark.asyncio
+    async def test_large_limit_clamps_ef_search(self):
+        """ef_search never exceeds the largest value pgvector takes."""
+        session = AsyncMock()
+        session.execute.side_effect = [
+            _result(scalar="0.8.0"),
+            _result(),
+        ]
+
+        await SimpleVectorStore(session)._tune_vector_search(5000)
+
+        tune = session.execute.await_args_list[-1].args[0]
+        params = tune.compile(dialect=postgresql.dialect()).params
+        assert "1000" in params.values()
+        assert "5000" not in params.values()
+
+
+class TestRetrieverOwnerScope:
+    """The retriever passes its user through as the owner."""
+
+    @pytest.mark.asyncio
+    async def test_user_id_scopes_search(self):
+        """Retrievers search only the user's accessible documents."""
+        embeddings = AsyncMock()
+        embeddings.aembed_query.return_value = [0.1] * 1536
+        store = AsyncMock()
+        store.search_similar.return_value = []
+
+        async def sessions():
+            yield AsyncMock()
+
+        with (
+            patch(
+                "chatter.core.custom_retriever.get_session_generator",
+                return_value=sessions(),
+            ),
+            patch(
+                "chatter.core.custom_retriever.SimpleVectorStore",
+                return_value=store,
+            ),
+        ):
+            retriever = DocumentChunkRetriever(
+                embeddings, user_id="user-1", search_mode="vector"
+            )
+            await retriever.ainvoke("reset password")
+
+        kwargs = store.search_similar.await_args.kwargs
+        assert kwargs["owner_id"] == "user-1"
@@ -0,0 +1,149 @@
+"""Tests for concurrent tool call execution in EnhancedToolExecutor."""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from chatter.core.enhanced_tool_executor import (
+    EnhancedToolExecutor,
+    ToolExecutionConfig,
+    ToolExecutionTracker,
+)
+
+
+class SleepyTool:
+    """Async tool that sleeps before answering."""
+
+    def __init__(self, name: str, delay: float, result: str = "ok"):
+        self.name = name
+        self.delay = delay
+        self.result = result
+        self.active = 0
+        self.max_active = 0
+
+    async def ainvoke(self, args):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return f"{self.result}:{args.get('q', '')}"
+
+
+def _message(*calls) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": name, "args": {"q": str(i)}, "id": f"call-{i}"}
+            for i, name in enumerate(calls)
+        ],
+    )
+
+
+class TestParallelToolExecution:
+    """Concurrent execution keeps sequential semantics."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_bounded_by_slowest_tool(self):
+        """Independent calls overlap instead of running back to back."""
+        tools = [SleepyTool("slow", 0.2), SleepyTool("fast", 0.05)]
+        executor = EnhancedToolExecutor(ToolExecutionConfig())
+
+        start = time.perf_counter()
+        result = await executor.execute_tools(
+            {"metadata": {}}, tools, _message("slow", "fast", "slow")
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.4
+        assert result["tool_call_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_messages_keep_tool_call_order(self):
+        """ToolMessages follow the order of the tool calls."""
+        tools = [SleepyTool("slow", 0.1, "s"), SleepyTool("fast", 0, "f")]
+        executor = EnhancedToolExecutor(ToolExecutionConfig())
+
+        result = await executor.execute_tools(
+            {"metadata": {}}, tools, _message("slow", "fast")
+        )
+
+        messages = result["messages"]
+        assert [m.tool_call_id for m in messages] == ["call-0", "call-1"]
+        assert [m.content for m in messages] == ["s:0", "f:1"]
+        tracker = result["_tool_tracker"]
+        assert [e["tool_name"] for e in tracker.execution_history] == [
+            "slow",
+            "fast",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        """No more than max_parallel_calls tools run at once."""
+        tool = SleepyTool("lookup", 0.05)
+        executor = EnhancedToolExecutor(
+            ToolExecutionConfig(max_parallel_calls=2)
+        )
+
+        await executor.execute_tools(
+            {"metadata": {}}, [tool], _message(*["lookup"] * 5)
+        )
+
+        assert tool.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_per_tool_timeout(self):
+        """A slow tool times out without affecting the others."""
+        tools = [SleepyTool("slow", 1.0), SleepyTool("fast", 0)]
+        executor = EnhancedToolExecutor(
+            ToolExecutionConfig(tool_timeouts={"slow": 0.05})
+        )
+
+        result = await executor.execute_tools(
+            {"metadata": {}}, tools, _message("slow", "fast")
+        )
+
+        slow, fast = result["messages"]
+        assert "timed out" in slow.content
+        assert fast.content == "ok:1"
+        summary = result["metadata"]["tool_execution_summary"]
+        assert summary["failed_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode(self):
+        """Parallel execution can be disabled."""
+        tool = SleepyTool("lookup", 0.01)
+        executor = EnhancedToolExecutor(
+            ToolExecutionConfig(parallel_execution=False)
+        )
+
+        await executor.execute_tools(
+            {"metadata": {}}, [tool], _message("lookup", "lookup")
+        )
+
+        assert tool.max_active == 1
+
+    @pytest.mark.asyncio
+    async def test_tracker_limits_still_apply(self):
+        """A tracker that reached its limit finalizes the turn."""
+        config = ToolExecutionConfig(max_total_calls=2)
+        tracker = ToolExecutionTracker(config)
+        executor = EnhancedToolExecutor(config)
+        tools = [SleepyTool("lookup", 0)]
+
+        first = await executor.execute_tools(
+            {"metadata": {"_tool_tracker": tracker}},
+            tools,
+            _message("lookup", "lookup"),
+        )
+        second = await executor.execute_tools(
+            {"metadata": {"_tool_tracker": tracker}},
+            tools,
+            _message("lookup"),
+        )
+
+        assert first["tool_call_count"] == 2
+        assert second["metadata"]["tool_execution_finalized"] is True
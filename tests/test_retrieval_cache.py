@@ -0,0 +1,121 @@
+"""Tests for the retrieval result cache."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from chatter.core.custom_retriever import DocumentChunkRetriever
+from chatter.core.retrieval_cache import (
+    PUBLIC_DOCUMENTS_TAG,
+    RetrievalCache,
+    document_tag,
+    owner_tag,
+)
+
+SCOPE = RetrievalCache.make_scope(owner_id="user-1", k=5)
+
+
+class TestRetrievalCache:
+    """Results are reused per normalized query and scope."""
+
+    def test_normalized_query_hits(self):
+        """Case, spacing and trailing punctuation do not matter."""
+        cache = RetrievalCache()
+        cache.put("How do I reset my password?", SCOPE, ["doc"])
+
+        assert cache.get("how do i  reset my password", SCOPE) == [
+            "doc"
+        ]
+        other = RetrievalCache.make_scope(owner_id="user-2", k=5)
+        assert cache.get("How do I reset my password?", other) is None
+
+    def test_near_duplicate_needs_threshold(self):
+        """Similar embeddings hit only above the threshold."""
+        cache = RetrievalCache(similarity_threshold=0.95)
+        cache.put("reset password", SCOPE, ["doc"], [1.0, 0.0])
+
+        assert cache.get_similar([0.99, 0.05], SCOPE) == ["doc"]
+        assert cache.get_similar([0.5, 0.5], SCOPE) is None
+        assert RetrievalCache().get_similar([1.0, 0.0], SCOPE) is None
+
+    def test_expired_and_evicted_entries_miss(self):
+        """Entries expire after the TTL and the LRU one is evicted."""
+        cache = RetrievalCache(max_size=2, ttl=60)
+        with patch(
+            "chatter.core.retrieval_cache.time.monotonic",
+            return_value=0.0,
+        ) as now:
+            cache.put("a", SCOPE, [1])
+            cache.put("b", SCOPE, [2])
+            cache.get("a", SCOPE)
+            cache.put("c", SCOPE, [3])
+
+            assert cache.get("b", SCOPE) is None
+            assert cache.get("a", SCOPE) == [1]
+            now.return_value = 61.0
+            assert cache.get("a", SCOPE) is None
+
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_document_changes_invalidate_dependent_entries(self):
+        """Only entries that could include the document are dropped."""
+        cache = RetrievalCache()
+        for query, owner in (("own", "user-1"), ("other", "user-2")):
+            cache.put(
+                query,
+                SCOPE,
+                [owner],
+                tags={owner_tag(owner), PUBLIC_DOCUMENTS_TAG},
+            )
+        cache.put("pinned", SCOPE, [3], tags={document_tag("doc-9")})
+
+        assert cache.invalidate_document("doc-1", "user-1") == 1
+        assert cache.get("other", SCOPE) == ["user-2"]
+        assert cache.invalidate_document("doc-2", "user-3", True) == 1
+        assert cache.get("pinned", SCOPE) == [3]
+        assert cache.invalidate_document("doc-9", "user-3") == 1
+
+
+class TestRetrieverCaching:
+    """Repeated questions skip embedding and search."""
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_served_from_cache(self):
+        """Only the first call embeds the query and searches."""
+        embeddings = AsyncMock()
+        embeddings.model = "text-embedding-3-small"
+        embeddings.aembed_query.return_value = [0.1] * 1536
+        chunk = Mock(content="text", document_id="d1", chunk_index=0)
+        store = AsyncMock()
+        store.search_similar.return_value = [(chunk, 0.9)]
+        cache = RetrievalCache()
+
+        async def sessions():
+            while True:
+                yield AsyncMock()
+
+        with (
+            patch(
+                "chatter.core.custom_retriever.get_session_generator",
+                side_effect=sessions,
+            ),
+            patch(
+                "chatter.core.custom_retriever.SimpleVectorStore",
+                return_value=store,
+            ),
+            patch(
+                "chatter.core.custom_retriever.get_retrieval_cache",
+                return_value=cache,
+            ),
+        ):
+            retriever = DocumentChunkRetriever(
+                embeddings, user_id="user-1", search_mode="vector"
+            )
+            first = await retriever.ainvoke("Reset password?")
+            second = await retriever.ainvoke("reset password")
+
+        assert [d.page_content for d in second] == ["text"]
+        assert second[0].metadata == first[0].metadata
+        embeddings.aembed_query.assert_awaited_once()
+        store.search_similar.assert_awaited_once()
+        assert cache.invalidate_document("d1", "user-9") == 1
@@ -0,0 +1,124 @@
+"""Tests for shared SSE frames and slow-client overflow policies."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from chatter.schemas.events import Event, EventType
+from chatter.services.sse_events import (
+    SSEConnection,
+    SSEEventService,
+    SSEMessage,
+)
+from chatter.services.sse_pubsub import InMemoryEventBus
+
+
+def _event(
+    event_type=EventType.JOB_STARTED, n: int = 0, user_id="user-1"
+) -> Event:
+    return Event(type=event_type, data={"n": n}, user_id=user_id)
+
+
+def _connection(policy: str, maxsize: int = 2) -> SSEConnection:
+    with patch(
+        "chatter.services.sse_events.settings.sse_queue_maxsize",
+        maxsize,
+    ):
+        return SSEConnection("conn-1", "user-1", overflow_policy=policy)
+
+
+def _queued(connection: SSEConnection) -> list[int]:
+    return [message.event.data["n"] for message in connection._queue]
+
+
+class TestSharedFrames:
+    """A broadcast is encoded once for every recipient."""
+
+    def test_frame_matches_sse_format(self):
+        """Frames carry the id, event name and JSON payload."""
+        event = _event()
+        frame = SSEMessage(event).frame().decode()
+
+        head, data = frame.rstrip("\n").rsplit("\n", 1)
+        assert head == f"id: {event.id}\nevent: job.started"
+        payload = json.loads(data.removeprefix("data: "))
+        assert payload["data"] == {"n": 0}
+        assert "user_id" not in payload
+        admin = SSEMessage(event).frame(include_user=True).decode()
+        assert '"user_id": "user-1"' in admin
+
+    @pytest.mark.asyncio
+    async def test_broadcast_shares_one_message(self):
+        """Every connection queues the same encoded message."""
+        service = SSEEventService(bus=InMemoryEventBus())
+        ids = [service.create_connection() for _ in range(3)]
+
+        with patch(
+            "chatter.services.sse_events.json.dumps",
+            side_effect=json.dumps,
+        ) as dumps:
+            await service.broadcast_event(_event(user_id=None))
+            messages = [
+                service.get_connection(i)._queue[0] for i in ids
+            ]
+            frames = {m.frame() for m in messages}
+
+        assert all(m is messages[0] for m in messages)
+        assert len(frames) == 1
+        dumps.assert_called_once()
+
+
+class TestOverflowPolicies:
+    """A full queue applies the configured policy."""
+
+    def test_drop_oldest(self):
+        """The oldest message makes room for the new one."""
+        connection = _connection("drop_oldest")
+        for n in range(4):
+            assert connection.enqueue(SSEMessage(_event(n=n)))
+
+        assert _queued(connection) == [2, 3]
+        assert connection.dropped_events == 2
+
+    def test_coalesce_replaces_same_type(self):
+        """A queued event of the same type is superseded."""
+        connection = _connection("coalesce")
+        connection.enqueue(SSEMessage(_event(n=0)))
+        connection.enqueue(
+            SSEMessage(_event(EventType.JOB_COMPLETED, n=1))
+        )
+        connection.enqueue(SSEMessage(_event(n=2)))
+
+        assert _queued(connection) == [1, 2]
+        assert connection.coalesced_events == 1
+        assert connection.dropped_events == 0
+
+    @pytest.mark.asyncio
+    async def test_disconnect_slow_consumer(self):
+        """A client that falls behind is closed and removed."""
+        service = SSEEventService(bus=InMemoryEventBus())
+        with (
+            patch(
+                "chatter.services.sse_events.settings"
+                ".sse_overflow_policy",
+                "disconnect",
+            ),
+            patch(
+                "chatter.services.sse_events.settings"
+                ".sse_queue_maxsize",
+                1,
+            ),
+        ):
+            connection_id = service.create_connection("user-1")
+        connection = service.get_connection(connection_id)
+
+        await service.broadcast_event(_event(n=0))
+        assert service.get_stats()["queued_events"] == 1
+        await service.broadcast_event(_event(n=1))
+
+        assert connection.closed
+        assert service.get_connection(connection_id) is None
+        stats = service.get_stats()
+        assert stats["slow_consumer_disconnects"] == 1
+        assert stats["dropped_events"] == 1
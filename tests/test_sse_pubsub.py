@@ -0,0 +1,99 @@
+"""Tests for cross-worker SSE event fan-out."""
+
+import pytest
+
+from chatter.schemas.events import EventType
+from chatter.services.sse_events import SSEEventService
+from chatter.services.sse_pubsub import (
+    BROADCAST_CHANNEL,
+    InMemoryEventBus,
+    InMemoryEventHub,
+    user_channel,
+)
+
+JOB_DATA = {
+    "job_id": "job-1",
+    "job_name": "backup",
+    "status": "started",
+}
+
+
+def _queued(service: SSEEventService, connection_id: str) -> list:
+    queue = service.get_connection(connection_id)._queue
+    events = [message.event for message in queue]
+    queue.clear()
+    return events
+
+
+@pytest.fixture
+async def workers():
+    hub = InMemoryEventHub()
+    first = SSEEventService(bus=InMemoryEventBus(hub))
+    second = SSEEventService(bus=InMemoryEventBus(hub))
+    await first.start()
+    await second.start()
+    yield first, second
+    await first.stop()
+    await second.stop()
+
+
+class TestCrossWorkerFanOut:
+    """Events reach connections on every worker exactly once."""
+
+    @pytest.mark.asyncio
+    async def test_user_event_reaches_other_worker(self, workers):
+        """A user's event is delivered where the user is connected."""
+        first, second = workers
+        remote = second.create_connection(user_id="user-1")
+        other = first.create_connection(user_id="user-2")
+
+        await first.trigger_event(
+            EventType.JOB_STARTED, JOB_DATA, user_id="user-1"
+        )
+
+        [event] = _queued(second, remote)
+        assert event.data["job_id"] == "job-1"
+        assert _queued(first, other) == []
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_every_worker_once(self, workers):
+        """Events without a user reach all connections."""
+        first, second = workers
+        local = first.create_connection(user_id="user-1")
+        remote = second.create_connection()
+
+        await second.trigger_event(
+            EventType.TOOL_SERVER_STARTED,
+            {"server_id": "s-1", "server_name": "tools"},
+        )
+
+        assert len(_queued(first, local)) == 1
+        assert len(_queued(second, remote)) == 1
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_follow_connections(self, workers):
+        """A worker listens to a user only while connected."""
+        first, _ = workers
+        first_id = first.create_connection(user_id="user-1")
+        second_id = first.create_connection(user_id="user-1")
+        assert first.bus.channels == {
+            BROADCAST_CHANNEL,
+            user_channel("user-1"),
+        }
+
+        first.close_connection(first_id)
+        assert user_channel("user-1") in first.bus.channels
+        first.close_connection(second_id)
+        assert first.bus.channels == {BROADCAST_CHANNEL}
+
+    @pytest.mark.asyncio
+    async def test_unstarted_service_delivers_locally(self):
+        """Without a running bus events still reach local clients."""
+        service = SSEEventService(bus=InMemoryEventBus())
+        connection_id = service.create_connection(user_id="user-1")
+
+        await service.trigger_event(
+            EventType.JOB_STARTED, JOB_DATA, user_id="user-1"
+        )
+
+        assert len(_queued(service, connection_id)) == 1
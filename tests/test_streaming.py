@@ -1,16 +1,20 @@
 """Tests for streaming service."""
 
 import asyncio
+import json
 import time
 from unittest.mock import patch
 
 import pytest
 
+from chatter.schemas.chat import StreamingChatChunk
 from chatter.services.streaming import (
     StreamingError,
     StreamingEvent,
     StreamingEventType,
     StreamingService,
+    TokenCoalescer,
+    encode_sse_chunk,
 )
 
 
@@ -777,3 +781,87 @@ class TestStreamingServiceIntegration:
             stream1_info["correlation_id"]
             != stream2_info["correlation_id"]
         )
+
+
+class TestTokenCoalescer:
+    """Test token batching for streamed responses."""
+
+    def test_flushes_on_size(self):
+        """Tokens are held until the size budget is reached."""
+        coalescer = TokenCoalescer(interval=60.0, max_chars=10)
+
+        assert coalescer.add("Hello") is None
+        assert coalescer.add(", ") is None
+        assert coalescer.add("world") == "Hello, world"
+        assert coalescer.flush() is None
+
+    def test_flushes_on_interval(self):
+        """Tokens held longer than the interval are released."""
+        coalescer = TokenCoalescer(interval=0.05, max_chars=1000)
+
+        with patch(
+            "chatter.services.streaming.time.monotonic",
+            side_effect=[100.0, 100.01, 100.06],
+        ):
+            assert coalescer.add("a") is None
+            assert coalescer.add("b") == "ab"
+
+    def test_zero_budget_passes_tokens_through(self):
+        """A zero interval emits every token immediately."""
+        coalescer = TokenCoalescer(interval=0, max_chars=1000)
+
+        assert coalescer.add("a") == "a"
+        assert coalescer.add("b") == "b"
+
+    @pytest.mark.asyncio
+    async def test_token_before_pause_is_flushed_on_time(self):
+        """A held token is released while the stream is idle."""
+        coalescer = TokenCoalescer(interval=0.01, max_chars=1000)
+        resume = asyncio.Event()
+
+        async def updates():
+            yield "a"
+            await resume.wait()
+            yield "b"
+
+        received = []
+        async for update in coalescer.watch(updates()):
+            if update is None:
+                received.append(coalescer.flush())
+                resume.set()
+                continue
+            received.append(coalescer.add(update))
+
+        assert received[:2] == [None, "a"]
+        received.append(coalescer.flush())
+        assert "".join(filter(None, received)) == "ab"
+
+    @pytest.mark.asyncio
+    async def test_watch_passes_updates_through_when_idle(self):
+        """Without held tokens every update is passed straight on."""
+        coalescer = TokenCoalescer(interval=60.0, max_chars=1)
+
+        async def updates():
+            for token in ("a", "b"):
+                yield token
+
+        received = [
+            coalescer.add(update)
+            async for update in coalescer.watch(updates())
+        ]
+
+        assert received == ["a", "b"]
+        assert coalescer.remaining() is None
+
+    def test_encode_matches_model_dump(self):
+        """Encoded frames carry the same payload as model_dump()."""
+        chunk = StreamingChatChunk(
+            type="token", content="hi", metadata={"event": "x"}
+        )
+
+        frame = encode_sse_chunk(chunk)
+
+        assert frame.startswith(b"data: ")
+        assert frame.endswith(b"\n\n")
+        assert json.loads(frame[6:]) == chunk.model_dump()
+
@@ -0,0 +1,335 @@
+"""Tests for streaming, checkpointed document ingestion."""
+
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from chatter.core.embedding_pipeline import (
+    DocumentChunker,
+    EmbeddingPipeline,
+    _CheckpointMismatchError,
+    _content_hash,
+    extract_and_chunk,
+)
+from chatter.models.document import DocumentStatus, DocumentType
+from chatter.services.new_document_service import NewDocumentService
+
+TEXT = " ".join(
+    f"Sentence number {i} talks about streaming." for i in range(400)
+)
+
+
+def _document(**kwargs):
+    values = {
+        "id": "doc",
+        "document_type": DocumentType.TEXT,
+        "chunk_size": 500,
+        "chunk_overlap": 50,
+        "chunk_count": 0,
+    }
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+async def _segments(text: str, size: int):
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
+async def _collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+def _pipeline(session=None) -> EmbeddingPipeline:
+    with patch("chatter.core.embedding_pipeline.EmbeddingService"):
+        pipeline = EmbeddingPipeline(session or AsyncMock())
+
+    async def generate(texts):
+        return [[0.1] * 1536 for _ in texts], {"provider": "test"}
+
+    pipeline.embedding_service.generate_embeddings = AsyncMock(
+        side_effect=generate
+    )
+    pipeline.embedding_service.get_model_identity = AsyncMock(
+        return_value=("test", "test-model")
+    )
+    pipeline.vector_store.store_embeddings_no_commit = AsyncMock(
+        return_value=True
+    )
+    pipeline.text_extractor.iter_text_from_file = Mock(
+        side_effect=lambda document, path: _segments(TEXT, 700)
+    )
+    return pipeline
+
+
+class TestIterChunks:
+    """Chunks are produced incrementally from text segments."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_cover_text(self):
+        """Streaming chunks respect the size limit and keep all text."""
+        chunker = DocumentChunker()
+        document = _document()
+
+        chunks = await _collect(
+            chunker.iter_chunks(document, _segments(TEXT, 700))
+        )
+
+        assert len(chunks) > 10
+        assert all(len(chunk) <= document.chunk_size for chunk in chunks)
+        assert "Sentence number 0 " in chunks[0]
+        assert "Sentence number 399 " in chunks[-1]
+
+    @pytest.mark.asyncio
+    async def test_chunking_is_deterministic(self):
+        """The same segments always produce the same chunks."""
+        chunker = DocumentChunker()
+
+        first = await _collect(
+            chunker.iter_chunks(_document(), _segments(TEXT, 700))
+        )
+        second = await _collect(
+            chunker.iter_chunks(_document(), _segments(TEXT, 700))
+        )
+
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_worker_chunks_match_streamed_chunks(self, tmp_path):
+        """Extraction in a worker process yields the same chunks."""
+        path = tmp_path / "doc.txt"
+        path.write_text(TEXT, encoding="utf-8")
+        spool = tmp_path / "chunks.jsonl"
+
+        text, count = extract_and_chunk(
+            str(path), DocumentType.TEXT, 500, 50, str(spool), 100
+        )
+        chunks = [
+            json.loads(line)
+            for line in spool.read_text(encoding="utf-8").splitlines()
+        ]
+        streamed = await _collect(
+            DocumentChunker().iter_chunks(
+                _document(), _segments(TEXT, len(TEXT))
+            )
+        )
+
+        assert text == TEXT[:100]
+        assert count == len(chunks)
+        assert chunks == streamed
+
+
+class TestIngestStream:
+    """Chunks are embedded and committed in bounded micro-batches."""
+
+    @pytest.mark.asyncio
+    async def test_commits_each_batch(self):
+        """Every micro-batch is committed on its own."""
+        session = AsyncMock()
+        session.add_all = Mock()
+        session.expunge = Mock()
+        pipeline = _pipeline(session)
+        document = _document()
+
+        with patch(
+            "chatter.core.embedding_pipeline.settings",
+            ingest_batch_size=4,
+            ingest_max_pending_batches=1,
+            ingest_extracted_text_max_chars=len(TEXT),
+        ):
+            count, text = await pipeline._ingest_stream(
+                document, Mock(), 0, None
+            )
+
+        batches = pipeline.embedding_service.generate_embeddings.await_count
+        assert text == TEXT
+        assert batches == -(-count // 4)
+        assert session.commit.await_count == batches
+        assert document.chunk_count == count
+
+    @pytest.mark.asyncio
+    async def test_stored_text_is_bounded(self):
+        """Only a prefix of the text is kept; all of it is chunked."""
+        session = AsyncMock()
+        session.add_all = Mock()
+        session.expunge = Mock()
+        pipeline = _pipeline(session)
+        chunks = await _collect(
+            DocumentChunker().iter_chunks(_document(), _segments(TEXT, 700))
+        )
+
+        with patch(
+            "chatter.core.embedding_pipeline.settings",
+            ingest_batch_size=100,
+            ingest_max_pending_batches=1,
+            ingest_extracted_text_max_chars=1000,
+        ):
+            count, text = await pipeline._ingest_stream(
+                _document(), Mock(), 0, None
+            )
+
+        assert count == len(chunks)
+        assert text == TEXT[:1000]
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_committed_chunks(self):
+        """Resuming only embeds chunks after the checkpoint."""
+        session = AsyncMock()
+        session.add_all = Mock()
+        session.expunge = Mock()
+        pipeline = _pipeline(session)
+        chunks = await _collect(
+            DocumentChunker().iter_chunks(_document(), _segments(TEXT, 700))
+        )
+
+        with patch(
+            "chatter.core.embedding_pipeline.settings",
+            ingest_batch_size=100,
+            ingest_max_pending_batches=1,
+            ingest_extracted_text_max_chars=len(TEXT),
+        ):
+            count, _ = await pipeline._ingest_stream(
+                _document(), Mock(), 5, _content_hash(chunks[4])
+            )
+
+        embedded = pipeline.embedding_service.generate_embeddings.await_args
+        assert count == len(chunks)
+        assert embedded.args[0] == chunks[5:]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_checkpoint_is_detected(self):
+        """A changed document cannot resume from old chunks."""
+        pipeline = _pipeline()
+
+        with pytest.raises(_CheckpointMismatchError):
+            await pipeline._ingest_stream(
+                _document(), Mock(), 5, "not-the-hash"
+            )
+
+        pipeline.embedding_service.generate_embeddings.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_offloaded_extraction(self):
+        """With an offload, the file is extracted and chunked through it."""
+        session = AsyncMock()
+        session.add_all = Mock()
+        session.expunge = Mock()
+        chunks = ["first chunk", "second\nchunk", "third chunk"]
+
+        async def offload(func, *args):
+            spool = args[4]
+            with open(spool, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(c) + "\n" for c in chunks)
+            return "full text", len(chunks)
+
+        offload = AsyncMock(side_effect=offload)
+        with patch("chatter.core.embedding_pipeline.EmbeddingService"):
+            pipeline = EmbeddingPipeline(session, offload=offload)
+        pipeline.embedding_service.generate_embeddings = AsyncMock(
+            return_value=([[0.1] * 1536] * 3, {"provider": "test"})
+        )
+        pipeline.embedding_service.get_model_identity = AsyncMock(
+            return_value=("test", "test-model")
+        )
+        pipeline.vector_store.store_embeddings_no_commit = AsyncMock(
+            return_value=True
+        )
+
+        count, text = await pipeline._ingest_stream(
+            _document(), "/tmp/doc.txt", 0, None
+        )
+
+        assert (count, text) == (3, "full text")
+        embedded = pipeline.embedding_service.generate_embeddings
+        assert embedded.await_args.args[0] == chunks
+        func, path, document_type, *_ = offload.await_args.args
+        assert func is extract_and_chunk
+        assert (path, document_type) == ("/tmp/doc.txt", DocumentType.TEXT)
+        # The spool file is removed once read
+        assert not os.path.exists(offload.await_args.args[5])
+        assert set(pipeline.stage_timings) == {"extract", "embed", "store"}
+
+
+class TestResumeProcessing:
+    """Unfinished documents resume after their committed chunks."""
+
+    @pytest.fixture
+    def service(self):
+        session = AsyncMock()
+        storage = Mock()
+        storage.exists = AsyncMock(return_value=True)
+        storage.local_path = Mock(side_effect=lambda location: location)
+        scheduler = Mock()
+        with (
+            patch(
+                "chatter.services.new_document_service.EmbeddingPipeline"
+            ),
+            patch(
+                "chatter.services.new_document_service."
+                "get_document_storage",
+                return_value=storage,
+            ),
+            patch(
+                "chatter.services.new_document_service."
+                "get_ingest_scheduler",
+                return_value=scheduler,
+            ),
+        ):
+            yield NewDocumentService(session), scheduler
+
+    @pytest.mark.parametrize(
+        ("status", "restarts"),
+        [
+            (DocumentStatus.PROCESSED, True),
+            (DocumentStatus.FAILED, False),
+            (DocumentStatus.PROCESSING, False),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_reprocess_keeps_unfinished_chunks(
+        self, service, status, restarts
+    ):
+        """Only finished documents have their chunks deleted."""
+        service, scheduler = service
+        document = _document(
+            status=status,
+            chunk_count=7,
+            file_path="/data/doc.txt",
+            is_public=False,
+        )
+        result = Mock()
+        result.scalar_one_or_none.return_value = document
+        service.session.execute.return_value = result
+
+        assert await service.reprocess_document("doc", "user-1")
+
+        # The lookup, plus the chunk deletion when starting over
+        assert service.session.execute.await_count == 1 + restarts
+        assert document.chunk_count == (0 if restarts else 7)
+        scheduler.submit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_interrupted_documents_are_queued_again(
+        self, service
+    ):
+        """Documents a shutdown left unprocessed are queued on start."""
+        service, scheduler = service
+        result = Mock()
+        result.all.return_value = [
+            ("doc-1", "user-1", "/data/a.txt"),
+            ("doc-2", "user-2", "/data/b.txt"),
+        ]
+        service.session.execute.return_value = result
+
+        assert await service.resume_interrupted() == 2
+
+        # Claimed in one committed update before anything is queued
+        service.session.execute.assert_awaited_once()
+        service.session.commit.assert_awaited_once()
+        queued = [
+            call.args[:2] for call in scheduler.submit.call_args_list
+        ]
+        assert queued == [("doc-1", "user-1"), ("doc-2", "user-2")]
@@ -0,0 +1,121 @@
+"""Tests for full-text search query building and ranking."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from chatter.models.conversation import Conversation, Message
+from chatter.models.prompt import Prompt
+from chatter.utils import text_search
+
+
+def _compile(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+class TestTextSearchHelpers:
+    """Query building helpers."""
+
+    def test_prefix_tsquery_sanitizes_input(self):
+        """Only word characters reach the tsquery text."""
+        tsquery = text_search.prefix_tsquery("Hello, wor' & !|ld")
+        sql = _compile(select(tsquery))
+
+        assert "to_tsquery('english'::regconfig" in sql
+        assert "'hello:* & wor:* & ld:*'" in sql
+
+    def test_prefix_tsquery_without_words(self):
+        """Terms with no searchable words produce no query."""
+        assert text_search.prefix_tsquery(" !? ") is None
+
+    def test_match_and_rank_use_search_vector(self):
+        """Matching uses @@ and ranking uses ts_rank on the vector."""
+        tsquery = text_search.prefix_tsquery("python")
+        stmt = (
+            select(Message.id)
+            .where(text_search.matches(Message.search_vector, tsquery))
+            .order_by(
+                text_search.rank(Message.search_vector, tsquery).desc()
+            )
+        )
+        sql = _compile(stmt)
+
+        assert "messages.search_vector @@ to_tsquery" in sql
+        assert "ts_rank(messages.search_vector" in sql
+        assert "ILIKE" not in sql.upper()
+
+    def test_normalize_rank(self):
+        """Ranks map monotonically into [0, 1)."""
+        assert text_search.normalize_rank(None) == 0.0
+        assert text_search.normalize_rank(0.0) == 0.0
+        assert 0 < text_search.normalize_rank(0.1) < (
+            text_search.normalize_rank(0.5)
+        ) < 1
+
+    def test_search_vector_is_deferred(self):
+        """Selecting a model does not load its search vector."""
+        sql = _compile(select(Conversation))
+        assert "search_vector" not in sql
+
+    @pytest.mark.parametrize(
+        "model", [Conversation, Message, Prompt]
+    )
+    def test_models_have_indexed_search_vector(self, model):
+        """Each searchable table has a generated, GIN indexed vector."""
+        column = model.__table__.c.search_vector
+
+        assert "to_tsvector('english'::regconfig" in str(
+            column.computed.sqltext
+        )
+        assert column.computed.persisted is True
+        index = next(
+            index
+            for index in model.__table__.indexes
+            if index.name == f"idx_{model.__tablename__}_search_vector"
+        )
+        assert index.dialect_options["postgresql"]["using"] == "gin"
+
+
+class TestIntelligentSearchRanking:
+    """Base search returns ts_rank based scores."""
+
+    @pytest.mark.asyncio
+    async def test_conversation_scores_use_rank(self):
+        """Conversation scores come from ts_rank, not a constant."""
+        from chatter.services.intelligent_search import (
+            IntelligentSearchService,
+        )
+
+        conv = MagicMock(
+            id="c1", title="Python tips", user_id="u1"
+        )
+        conv.created_at.isoformat.return_value = "2025-01-01T00:00:00"
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(
+            all=MagicMock(return_value=[(conv, 0.25)])
+        )
+
+        with (
+            patch(
+                "chatter.services.intelligent_search.EmbeddingService"
+            ),
+            patch(
+                "chatter.services.intelligent_search.get_general_cache"
+            ),
+        ):
+            service = IntelligentSearchService(session)
+            results = await service._perform_base_search(
+                "pyth", [], "conversations", 5, user_id="u1"
+            )
+
+        assert results[0]["score"] == pytest.approx(0.2)
+        sql = _compile(session.execute.await_args.args[0])
+        assert "conversations.user_id = 'u1'" in sql
+        assert "ts_rank" in sql
@@ -0,0 +1,152 @@
+"""Tests for the sliding window counter rate limiter."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from chatter.core.cache import CacheConfig, MemoryCache
+from chatter.utils.unified_rate_limiter import (
+    RateLimitExceeded,
+    SlidingWindowRateLimiter,
+    UnifiedRateLimiter,
+)
+
+MODULE = "chatter.utils.unified_rate_limiter.time.time"
+
+
+class TestSlidingWindowRateLimiter:
+    """Sliding window counter behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_limit_within_window(self):
+        """Requests beyond the limit in one window are rejected."""
+        limiter = SlidingWindowRateLimiter(limit=3, window_seconds=60)
+
+        with patch(MODULE, return_value=600.0):
+            results = [
+                (await limiter.is_allowed("k"))[0] for _ in range(4)
+            ]
+            status = await limiter.get_status("k")
+
+        assert results == [True, True, True, False]
+        assert status["used"] == 3
+        assert status["remaining"] == 0
+
+    @pytest.mark.asyncio
+    async def test_previous_window_is_weighted(self):
+        """The previous window counts in proportion to its overlap."""
+        limiter = SlidingWindowRateLimiter(limit=4, window_seconds=60)
+
+        with patch(MODULE, return_value=600.0):
+            for _ in range(4):
+                await limiter.is_allowed("k")
+
+        # Halfway through the next window, half the old requests count
+        with patch(MODULE, return_value=690.0):
+            results = [
+                (await limiter.is_allowed("k"))[0] for _ in range(3)
+            ]
+
+        assert results == [True, True, False]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_when_blocked(self):
+        """Blocked requests get a positive retry_after."""
+        limiter = SlidingWindowRateLimiter(limit=2, window_seconds=60)
+
+        with patch(MODULE, return_value=600.0):
+            await limiter.is_allowed("k")
+            await limiter.is_allowed("k")
+            allowed, metadata = await limiter.is_allowed("k")
+
+        assert allowed is False
+        assert 0 < metadata["retry_after"] <= 120
+
+    @pytest.mark.asyncio
+    async def test_state_is_constant_size(self):
+        """Memory per key does not grow with the number of requests."""
+        limiter = SlidingWindowRateLimiter(limit=100000, window_seconds=86400)
+
+        for _ in range(1000):
+            await limiter.is_allowed("k")
+
+        assert len(limiter._memory_storage["k"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_backend(self):
+        """Counters round-trip through a generic cache service."""
+        cache = MemoryCache(CacheConfig(max_size=100))
+        limiter = SlidingWindowRateLimiter(
+            limit=2, window_seconds=60, cache_service=cache
+        )
+
+        results = [(await limiter.is_allowed("k"))[0] for _ in range(3)]
+
+        assert results == [True, True, False]
+        assert len(await cache.get("rate_limit:k")) == 3
+
+        await limiter.reset("k")
+        assert (await limiter.is_allowed("k"))[0] is True
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_uses_atomic_script(self):
+        """Redis-backed caches evaluate one script per check."""
+        client = AsyncMock()
+        client.eval.return_value = [1, 1, 0]
+        cache = AsyncMock()
+        cache.get_client.return_value = client
+        cache.make_key = lambda *parts: ":".join(str(p) for p in parts)
+        limiter = SlidingWindowRateLimiter(
+            limit=5, window_seconds=60, cache_service=cache
+        )
+
+        with patch(MODULE, return_value=600.0):
+            allowed, metadata = await limiter.is_allowed("k")
+
+        assert allowed is True
+        assert metadata["remaining"] == 4
+        args = client.eval.await_args.args
+        assert args[1:4] == (2, "rate_limit:k:10", "rate_limit:k:9")
+        cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_redis_falls_back_to_memory(self):
+        """A disconnected Redis cache degrades to in-process counters."""
+        cache = AsyncMock()
+        cache.get_client.return_value = None
+        limiter = SlidingWindowRateLimiter(
+            limit=1, window_seconds=60, cache_service=cache
+        )
+
+        results = [(await limiter.is_allowed("k"))[0] for _ in range(2)]
+
+        assert results == [True, False]
+
+
+class TestUnifiedRateLimiter:
+    """Public API is unchanged."""
+
+    @pytest.mark.asyncio
+    async def test_check_rate_limit_raises(self):
+        """Exceeding the limit raises RateLimitExceeded."""
+        limiter = UnifiedRateLimiter()
+
+        status = await limiter.check_rate_limit("k", limit=1, window=60)
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await limiter.check_rate_limit("k", limit=1, window=60)
+
+        assert status["remaining"] == 0
+        assert exc_info.value.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_cleanup_prunes_stale_counters(self):
+        """Counters older than the previous window are pruned."""
+        limiter = UnifiedRateLimiter()
+
+        with patch(MODULE, return_value=600.0):
+            await limiter.check_rate_limit("k", limit=5, window=60)
+        with patch(MODULE, return_value=800.0):
+            await limiter.cleanup_old_limiters()
+
+        for window_limiter in limiter._limiters.values():
+            assert window_limiter._memory_storage == {}
@@ -0,0 +1,50 @@
+"""Tests for SQL-side similarity scoring in SimpleVectorStore."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from chatter.core.embedding_pipeline import SimpleVectorStore
+
+
+def _executed_sql(session: AsyncMock) -> str:
+    query = session.execute.await_args.args[0]
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestSearchSimilar:
+    """search_similar scores in SQL and skips the vectors."""
+
+    @pytest.mark.asyncio
+    async def test_similarity_comes_from_sql_distance(self):
+        """Scores are 1 - cosine distance from the query."""
+        chunk = Mock()
+        session = AsyncMock()
+        session.execute.return_value = Mock(
+            all=Mock(return_value=[(chunk, 0.25)])
+        )
+
+        results = await SimpleVectorStore(session).search_similar(
+            [0.1] * 1536, limit=3
+        )
+
+        assert results == [(chunk, 0.75)]
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_vectors_are_not_selected(self):
+        """Only the slim projection and the distance are loaded."""
+        session = AsyncMock()
+        session.execute.return_value = Mock(all=Mock(return_value=[]))
+
+        await SimpleVectorStore(session).search_similar(
+            [0.1] * 1536, limit=3, document_ids=["d1"]
+        )
+
+        select_list = _executed_sql(session).split(" FROM ", 1)[0]
+        assert "document_chunks.content" in select_list
+        assert "nearest.distance" in select_list
+        assert "document_chunks.embedding" not in select_list
+        assert "raw_embedding" not in select_list
+        assert "computed_embedding" not in select_list